@@ -5,6 +5,7 @@ from django.db.models import Exists, OuterRef, Q
 
 from ..page.models import Page
 from ..product.models import Product, ProductVariant
+from ..product.utils.attributes import update_products_attribute_value_ids
 from .models import (
     AssignedPageAttributeValue,
     AssignedProductAttributeValue,
@@ -49,6 +50,11 @@ def associate_attribute_values_to_instance(
     # Associate the attribute and the passed values
     _associate_attribute_to_instance(instance, attr_val_map)
 
+    if isinstance(instance, Product):
+        update_products_attribute_value_ids([instance.pk])
+    elif isinstance(instance, ProductVariant):
+        update_products_attribute_value_ids([instance.product_id])
+
 
 def validate_attribute_owns_values(attr_val_map: dict[int, list]) -> None:
     if not attr_val_map:
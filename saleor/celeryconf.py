@@ -37,6 +37,7 @@ app.autodiscover_tasks(
     packages=[
         "saleor.order.migrations.tasks",
         "saleor.account.migrations.tasks",
+        "saleor.product.migrations.tasks",
     ],
     related_name="saleor3_22",
 )
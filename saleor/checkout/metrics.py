@@ -0,0 +1,39 @@
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_EXPIRED_CHECKOUTS = meter.create_metric(
+    "saleor.checkout.expired.count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of expired checkouts deleted or skipped by the cleanup.",
+)
+METRIC_EXPIRED_CHECKOUTS_BATCH_DURATION = meter.create_metric(
+    "saleor.checkout.expired.batch.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of deleting a single batch of expired checkouts.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+METRIC_EXPIRED_CHECKOUTS_LAG = meter.create_metric(
+    "saleor.checkout.expired.lag",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Age of the most recently processed expired checkout.",
+)
+
+
+def record_expired_checkouts(status: str, amount: int) -> None:
+    if amount:
+        meter.record(
+            METRIC_EXPIRED_CHECKOUTS,
+            amount,
+            unit=Unit.REQUEST,
+            attributes={"status": status},
+        )
+
+
+def record_expired_checkouts_lag(lag: float) -> None:
+    meter.record(METRIC_EXPIRED_CHECKOUTS_LAG, lag, unit=Unit.SECOND)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 09:28
+
+import django.db.models.functions.comparison
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("checkout", "0080_merge_20250527_1210"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="checkout",
+            index=models.Index(
+                django.db.models.functions.comparison.Greatest(
+                    "last_change", "last_transaction_modified_at"
+                ),
+                condition=models.Q(
+                    ("authorize_status__in", ["partial", "full"]),
+                    ("automatically_refundable", True),
+                ),
+                name="checkout_release_funds_idx",
+            ),
+        ),
+    ]
@@ -9,6 +9,7 @@ from uuid import uuid4
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.utils.encoding import smart_str
 from django_countries.fields import Country, CountryField
@@ -226,6 +227,21 @@ class Checkout(models.Model):
 
     class Meta:
         ordering = ("-last_change", "pk")
+        indexes = [
+            # Queue of the checkouts waiting for automatic release of their funds,
+            # keyed on the time the checkout becomes due.
+            models.Index(
+                Greatest("last_change", "last_transaction_modified_at"),
+                name="checkout_release_funds_idx",
+                condition=models.Q(
+                    automatically_refundable=True,
+                    authorize_status__in=[
+                        CheckoutAuthorizeStatus.PARTIAL,
+                        CheckoutAuthorizeStatus.FULL,
+                    ],
+                ),
+            ),
+        ]
         permissions = (
             (CheckoutPermissions.MANAGE_CHECKOUTS.codename, "Manage checkouts"),
             (CheckoutPermissions.HANDLE_CHECKOUTS.codename, "Handle checkouts"),
@@ -1,27 +1,38 @@
+import datetime
 import logging
 from decimal import Decimal
+from uuid import UUID
 
 import graphene
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db.models import Exists, OuterRef, Q, QuerySet, Subquery
-from django.db.utils import DatabaseError, IntegrityError
+from django.db.utils import DatabaseError, IntegrityError, OperationalError
 from django.utils import timezone
 
 from ..account.models import User
 from ..app.models import App
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..core.telemetry import meter
 from ..payment.models import TransactionItem
 from ..plugins.manager import get_plugins_manager
 from .complete_checkout import complete_checkout
 from .fetch import fetch_checkout_info, fetch_checkout_lines
+from .metrics import (
+    METRIC_EXPIRED_CHECKOUTS_BATCH_DURATION,
+    record_expired_checkouts,
+    record_expired_checkouts_lag,
+)
 from .models import Checkout, CheckoutLine
-from .utils import delete_checkouts
+from .utils import delete_expired_checkouts_in_bulk
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
+# PostgreSQL error code raised when "lock_timeout" is exceeded.
+LOCK_NOT_AVAILABLE = "55P03"
+
 
 @app.task
 def delete_expired_checkouts(
@@ -29,6 +40,7 @@ def delete_expired_checkouts(
     batch_count: int = 5,
     invocation_count: int = 1,
     invocation_limit: int = 500,
+    last_change_cursor: list[str] | None = None,
 ) -> tuple[int, bool]:
     """Delete inactive checkouts from the database.
 
@@ -42,6 +54,12 @@ def delete_expired_checkouts(
     - All anonymous and users checkouts after 6h of inactivity
       if there are no lines associated, refer to ``settings.EMPTY_CHECKOUTS_TIMEDELTA``.
 
+    Checkouts are walked in ``(last_change, pk)`` order so every batch reads
+    the next range of the ``last_change`` index instead of rescanning the table.
+    Batches that can't acquire row locks within
+    ``settings.EXPIRED_CHECKOUTS_DELETE_LOCK_TIMEOUT`` are skipped and picked up
+    by the next run of the task.
+
     :param batch_size: The maximum row count that can be deleted per ``DELETE FROM``
         SQL statement. Around 13.5 KB of memory will be utilized by the Celery
         worker per row, thus 2000 will be using around 27 MB.
@@ -51,6 +69,8 @@ def delete_expired_checkouts(
     :param invocation_count: How many times the task re-triggered itself up.
     :param invocation_limit: The maximum times the task can re-trigger itself up
         in order to limit how long it may run.
+    :param last_change_cursor: The ``last_change`` (ISO format) and the pk of
+        the last checkout processed by the previous invocation.
 
     :return: A tuple containing row count deleted (int)
              and whether there is more to delete (bool).
@@ -87,24 +107,66 @@ def delete_expired_checkouts(
         )
     )
 
-    qs: QuerySet[Checkout] = Checkout.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(
-        (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
-        & ~Q(Exists(with_transactions))
+    # Upper bound of the walked range, none of the checkouts changed later
+    # can match any of the predicates.
+    last_change_limit = now - min(
+        settings.ANONYMOUS_CHECKOUTS_TIMEDELTA,
+        settings.USER_CHECKOUTS_TIMEDELTA,
+        settings.EMPTY_CHECKOUTS_TIMEDELTA,
+    )
+    qs: QuerySet[Checkout] = (
+        Checkout.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(
+            Q(last_change__lt=last_change_limit)
+            & (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
+            & ~Q(Exists(with_transactions))
+        )
+        .order_by("last_change", "pk")
     )
-    qs = qs.only("pk").order_by()[:batch_size]
+
+    cursor: tuple[datetime.datetime, UUID] | None = None
+    if last_change_cursor:
+        cursor_last_change, cursor_pk = last_change_cursor
+        cursor = (datetime.datetime.fromisoformat(cursor_last_change), UUID(cursor_pk))
 
     total_deleted: int = 0
     has_more: bool = True
     for _batch_number in range(batch_count):
-        checkout_ids = list(qs.values_list("pk", flat=True))
-        with allow_writer():
-            deleted_count = delete_checkouts(checkout_ids)
+        batch_qs = qs
+        if cursor:
+            batch_qs = qs.filter(
+                Q(last_change__gt=cursor[0])
+                | Q(last_change=cursor[0], pk__gt=cursor[1])
+            )
+        batch = list(batch_qs.values_list("pk", "last_change")[:batch_size])
+        if not batch:
+            has_more = False
+            break
+
+        checkout_ids = [pk for pk, _last_change in batch]
+        last_pk, last_change = batch[-1]
+        with meter.record_duration(METRIC_EXPIRED_CHECKOUTS_BATCH_DURATION):
+            try:
+                with allow_writer():
+                    deleted_count = delete_expired_checkouts_in_bulk(
+                        checkout_ids, last_change
+                    )
+            except OperationalError as e:
+                if getattr(e.__cause__, "sqlstate", None) != LOCK_NOT_AVAILABLE:
+                    raise
+                task_logger.warning(
+                    "Lock timeout exceeded, skipping %d expired checkouts.",
+                    len(checkout_ids),
+                )
+                deleted_count = 0
+        record_expired_checkouts("deleted", deleted_count)
+        record_expired_checkouts("skipped", len(checkout_ids) - deleted_count)
+        record_expired_checkouts_lag((now - last_change).total_seconds())
         total_deleted += deleted_count
+        cursor = (last_change, last_pk)
 
-        # Stop deleting inactive checkouts if there was no match.
-        if deleted_count < batch_size:
+        # Stop deleting inactive checkouts if there was no more matches.
+        if len(batch) < batch_size:
             has_more = False
             break
 
@@ -119,6 +181,9 @@ def delete_expired_checkouts(
                 batch_count=batch_count,
                 invocation_count=invocation_count + 1,
                 invocation_limit=invocation_limit,
+                last_change_cursor=[cursor[0].isoformat(), str(cursor[1])]
+                if cursor
+                else None,
             )
         else:
             task_logger.warning("Invocation limit reached, aborting task")
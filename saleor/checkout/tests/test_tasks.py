@@ -7,23 +7,28 @@ from uuid import UUID
 import graphene
 import pytest
 from celery.exceptions import Retry as CeleryTaskRetryError
-from django.db.utils import DatabaseError, IntegrityError
+from django.conf import settings
+from django.db.utils import DatabaseError, IntegrityError, OperationalError
 from django.utils import timezone
+from psycopg.errors import LockNotAvailable
 
 from ...core.taxes import zero_money
+from ...discount.models import CheckoutLineDiscount
 from ...order import OrderEvents
 from ...order.models import Order
 from ...plugins.manager import get_plugins_manager
 from ...product.models import ProductChannelListing, ProductVariantChannelListing
+from ...warehouse.models import PreorderReservation, Reservation
 from .. import calculations
 from ..fetch import fetch_checkout_info, fetch_checkout_lines
-from ..models import Checkout, CheckoutLine
+from ..models import Checkout, CheckoutLine, CheckoutMetadata
 from ..payment_utils import update_checkout_payment_statuses
 from ..tasks import (
     automatic_checkout_completion_task,
     delete_expired_checkouts,
     task_logger,
 )
+from ..utils import delete_expired_checkouts_in_bulk
 
 
 def test_delete_expired_anonymous_checkouts(checkouts_list, variant, customer_user):
@@ -483,6 +488,119 @@ def test_delete_expired_checkouts_no_checkouts_to_delete(checkout):
     assert Checkout.objects.count() == checkout_count
 
 
+def test_delete_expired_checkouts_deletes_line_dependencies(
+    checkout_line_with_reservation_in_many_stocks, customer_user
+):
+    # given
+    checkout_line = checkout_line_with_reservation_in_many_stocks
+    checkout = checkout_line.checkout
+    checkout.metadata_storage.store_value_in_metadata({"key": "value"})
+    checkout.metadata_storage.save(update_fields=["metadata"])
+    checkout.user = customer_user
+    checkout.save(update_fields=["user"])
+    Checkout.objects.update(
+        last_change=timezone.now()
+        - settings.USER_CHECKOUTS_TIMEDELTA
+        - datetime.timedelta(days=1)
+    )
+    assert Reservation.objects.filter(checkout_line=checkout_line).exists()
+
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
+
+    # then
+    assert (deleted_count, has_more) == (1, False)
+    assert not Checkout.objects.exists()
+    assert not CheckoutLine.objects.exists()
+    assert not CheckoutMetadata.objects.exists()
+    assert not Reservation.objects.exists()
+
+
+def test_delete_expired_checkouts_in_bulk_covers_line_relations():
+    """Ensure new relations to checkout lines are deleted by the set-based cleanup."""
+    # when
+    related_models = {
+        relation.related_model
+        for relation in CheckoutLine._meta.related_objects
+        if not relation.many_to_many
+    }
+
+    # then
+    assert related_models == {Reservation, PreorderReservation, CheckoutLineDiscount}
+
+
+def test_delete_expired_checkouts_skips_checkout_changed_after_selection(
+    checkout, channel_USD
+):
+    # given
+    last_change = timezone.now() - datetime.timedelta(hours=7)
+    Checkout.objects.update(last_change=last_change)
+
+    # when
+    checkout.save(update_fields=["last_change"])
+    deleted_count = delete_expired_checkouts_in_bulk([checkout.pk], last_change)
+
+    # then
+    assert deleted_count == 0
+    assert Checkout.objects.filter(pk=checkout.pk).exists()
+
+
+@mock.patch("saleor.checkout.tasks.delete_expired_checkouts_in_bulk")
+def test_delete_expired_checkouts_skips_batch_on_lock_timeout(
+    mocked_delete: mock.MagicMock, checkout
+):
+    # given
+    lock_error = OperationalError("canceling statement due to lock timeout")
+    lock_error.__cause__ = LockNotAvailable()
+    mocked_delete.side_effect = lock_error
+    Checkout.objects.update(last_change=timezone.now() - datetime.timedelta(hours=7))
+
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
+
+    # then
+    assert (deleted_count, has_more) == (0, False)
+    assert Checkout.objects.filter(pk=checkout.pk).exists()
+
+
+@mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
+def test_delete_expired_checkouts_resumes_from_cursor(
+    mocked_task: mock.MagicMock, channel_USD
+):
+    # given
+    Checkout.objects.bulk_create(
+        [
+            Checkout(
+                currency=channel_USD.currency_code,
+                channel=channel_USD,
+                token=UUID(int=checkout_id),
+            )
+            for checkout_id in range(3)
+        ]
+    )
+    last_change = timezone.now() - datetime.timedelta(hours=7)
+    Checkout.objects.update(last_change=last_change)
+
+    # when
+    delete_expired_checkouts(batch_size=1, batch_count=1)
+    cursor = mocked_task.call_args.kwargs["last_change_cursor"]
+    # the first checkout is back, it must not be visited again by this cleanup
+    Checkout.objects.create(
+        currency=channel_USD.currency_code,
+        channel=channel_USD,
+        token=UUID(int=0),
+        last_change=last_change,
+    )
+    deleted_count, has_more = delete_expired_checkouts(
+        batch_size=2, batch_count=1, last_change_cursor=cursor
+    )
+
+    # then
+    assert cursor == [last_change.isoformat(), str(UUID(int=0))]
+    assert (deleted_count, has_more) == (2, True)
+    assert list(Checkout.objects.values_list("pk", flat=True)) == [UUID(int=0)]
+
+
 @mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
 def test_delete_checkouts_until_done(mocked_task: mock.MagicMock, channel_USD):
     """Ensure the task deletes all inactive checkouts from the database.
@@ -532,7 +650,9 @@ def test_delete_checkouts_until_done(mocked_task: mock.MagicMock, channel_USD):
     )
 
     # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    mocked_task.assert_called_once_with(
+        **task_params, invocation_count=2, last_change_cursor=mock.ANY
+    )
     mocked_task.reset_mock()
 
     # Ensure we delete the remaining, and we do not trigger anymore task.
@@ -583,7 +703,9 @@ def test_aborts_deleting_checkouts_when_invocation_count_exhausted(
     assert has_more is True
 
     # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    mocked_task.assert_called_once_with(
+        **task_params, invocation_count=2, last_change_cursor=mock.ANY
+    )
     mocked_task.reset_mock()
 
     # Invocation #2, should delete 1 checkout and should stop there (has_more=True
@@ -1,5 +1,6 @@
 """Checkout-related utility functions."""
 
+import datetime
 from collections.abc import Iterable
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, Union, cast
@@ -8,7 +9,7 @@ from uuid import UUID
 import graphene
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import prefetch_related_objects
 from django.utils import timezone
 from prices import Money
@@ -33,7 +34,13 @@ from ..core.utils.translations import get_translation
 from ..core.weight import zero_weight
 from ..discount import DiscountType, VoucherType
 from ..discount.interface import fetch_voucher_info
-from ..discount.models import CheckoutDiscount, NotApplicable, Voucher, VoucherCode
+from ..discount.models import (
+    CheckoutDiscount,
+    CheckoutLineDiscount,
+    NotApplicable,
+    Voucher,
+    VoucherCode,
+)
 from ..discount.utils.checkout import (
     create_checkout_discount_objects_for_order_promotions,
     create_checkout_line_discount_objects_for_catalogue_promotions,
@@ -57,8 +64,9 @@ from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
 from ..shipping.utils import convert_to_shipping_method_data
 from ..warehouse.availability import check_stock_and_preorder_quantity
-from ..warehouse.models import Warehouse
+from ..warehouse.models import PreorderReservation, Reservation, Warehouse
 from ..warehouse.reservations import reserve_stocks_and_preorders
+from ..warehouse.variant_availability import invalidate_reserved_variants_availability
 from . import AddressType, base_calculations, calculations
 from .error_codes import CheckoutErrorCode
 from .lock_objects import checkout_lines_qs_select_for_update
@@ -140,6 +148,9 @@ def checkout_lines_bulk_update(
 def checkout_lines_bulk_delete(line_pks_to_delete: list[UUID]):
     """Delete CheckoutLines with lock applied on them."""
     with transaction.atomic():
+        invalidate_reserved_variants_availability(
+            Reservation.objects.filter(checkout_line_id__in=line_pks_to_delete)
+        )
         CheckoutLine.objects.filter(
             id__in=checkout_lines_qs_select_for_update()
             .filter(pk__in=line_pks_to_delete)
@@ -150,6 +161,11 @@ def checkout_lines_bulk_delete(line_pks_to_delete: list[UUID]):
 def delete_checkouts(checkout_pks_to_delete: list[UUID]) -> int:
     """Delete a checkouts with lock applied on them."""
     with transaction.atomic():
+        invalidate_reserved_variants_availability(
+            Reservation.objects.filter(
+                checkout_line__checkout_id__in=checkout_pks_to_delete
+            )
+        )
         CheckoutLine.objects.filter(
             id__in=CheckoutLine.objects.order_by("id")
             .select_for_update()
@@ -162,6 +178,61 @@ def delete_checkouts(checkout_pks_to_delete: list[UUID]) -> int:
     return deleted_count
 
 
+def delete_expired_checkouts_in_bulk(
+    checkout_pks: list[UUID], last_change_until: datetime.datetime
+) -> int:
+    """Delete expired checkouts using set-based statements.
+
+    The checkout lines and the rows that depend on them are removed with
+    ``DELETE ... USING`` statements instead of being collected by the ORM.
+    Checkouts modified after ``last_change_until`` or locked by other
+    transactions are skipped. Waiting for row locks is bounded by
+    ``settings.EXPIRED_CHECKOUTS_DELETE_LOCK_TIMEOUT``, when exceeded
+    the database raises ``OperationalError`` and nothing is deleted.
+    """
+    lock_timeout = settings.EXPIRED_CHECKOUTS_DELETE_LOCK_TIMEOUT
+    line_table = CheckoutLine._meta.db_table
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('lock_timeout', %s, true)",
+            [f"{int(lock_timeout.total_seconds() * 1000)}ms"],
+        )
+        checkout_pks = list(
+            Checkout.objects.order_by("pk")
+            .select_for_update(skip_locked=True)
+            .filter(pk__in=checkout_pks, last_change__lte=last_change_until)
+            .values_list("pk", flat=True)
+        )
+        if not checkout_pks:
+            return 0
+
+        invalidate_reserved_variants_availability(
+            Reservation.objects.filter(checkout_line__checkout_id__in=checkout_pks)
+        )
+        for model, field_name in [
+            (Reservation, "checkout_line"),
+            (PreorderReservation, "checkout_line"),
+            (CheckoutLineDiscount, "line"),
+        ]:
+            column = model._meta.get_field(field_name).column
+            cursor.execute(
+                f"DELETE FROM {model._meta.db_table} AS dependent "
+                f"USING {line_table} AS line "
+                f"WHERE dependent.{column} = line.id "
+                "AND line.checkout_id = ANY(%s)",
+                [checkout_pks],
+            )
+        for model in [CheckoutLine, CheckoutMetadata]:
+            cursor.execute(
+                f"DELETE FROM {model._meta.db_table} WHERE checkout_id = ANY(%s)",
+                [checkout_pks],
+            )
+        # Remaining relations are few per checkout and some of them have to be
+        # detached rather than deleted, leave them to the ORM collector.
+        deleted_count, _ = Checkout.objects.filter(pk__in=checkout_pks).delete()
+    return deleted_count
+
+
 def get_user_checkout(
     user: User,
     checkout_queryset=None,
@@ -263,6 +334,7 @@ def add_variant_to_checkout(
 
     if new_quantity == 0:
         if line is not None:
+            invalidate_reserved_variants_availability(line.reservations.all())
             line.delete()
     elif line is None:
         checkout.lines.create(
@@ -4,6 +4,7 @@ import gc
 from django.apps import AppConfig
 from django.conf import settings
 from django.db.models import CharField, TextField
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 from ..core.telemetry import initialize_telemetry
@@ -20,11 +21,26 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.connect_config_snapshot_signals()
         initialize_telemetry()
         getattr(get_resolver(settings.ROOT_URLCONF), "url_patterns")
         gc.collect()
         gc.freeze()
 
+    def connect_config_snapshot_signals(self) -> None:
+        from .config_snapshot import (
+            CONFIG_SNAPSHOT_MODELS,
+            invalidate_config_snapshot_on_change,
+        )
+
+        for sender in CONFIG_SNAPSHOT_MODELS:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    invalidate_config_snapshot_on_change,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_config_snapshot_{sender.__name__}",
+                )
+
     def validate_jwt_manager(self) -> None:
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
         if not jwt_manager_path:
@@ -0,0 +1,168 @@
+"""Process-level snapshot of rarely changing configuration entities.
+
+Sites, channels, tax configurations, tax rates and warehouses are read by almost
+every API request, while they change only when the store is reconfigured.
+The snapshot keeps them in the memory of the process, so dataloaders can skip
+the database. Every change to the snapshotted models bumps a generation number
+stored in the cache; a process that sees a different generation than the one
+of its snapshot drops the snapshot and reloads it on demand.
+"""
+
+import copy
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+
+from ..channel.models import Channel
+from ..site.models import SiteSettings
+from ..tax.models import TaxClass, TaxClassCountryRate, TaxConfiguration
+from ..warehouse.models import Warehouse
+
+CONFIG_SNAPSHOT_GENERATION_CACHE_KEY = "config_snapshot_generation"
+
+
+def _load_sites_by_id(database_connection_name: str) -> dict:
+    sites = Site.objects.using(database_connection_name).select_related("settings")
+    return {site.pk: site for site in sites}
+
+
+def _load_sites_by_domain(database_connection_name: str) -> dict:
+    sites = Site.objects.using(database_connection_name).select_related("settings")
+    return {site.domain.lower(): site for site in sites}
+
+
+def _load_channels_by_id(database_connection_name: str) -> dict:
+    return Channel.objects.using(database_connection_name).in_bulk()
+
+
+def _load_channels_by_slug(database_connection_name: str) -> dict:
+    return Channel.objects.using(database_connection_name).in_bulk(field_name="slug")
+
+
+def _load_tax_configurations_by_channel_id(database_connection_name: str) -> dict:
+    return TaxConfiguration.objects.using(database_connection_name).in_bulk(
+        field_name="channel_id"
+    )
+
+
+def _load_tax_class_country_rates_by_tax_class_id(
+    database_connection_name: str,
+) -> dict:
+    rates_by_tax_class_id = defaultdict(list)
+    for rate in TaxClassCountryRate.objects.using(database_connection_name):
+        rates_by_tax_class_id[rate.tax_class_id].append(rate)
+    return dict(rates_by_tax_class_id)
+
+
+def _load_warehouses_by_id(database_connection_name: str) -> dict:
+    return Warehouse.objects.using(database_connection_name).in_bulk()
+
+
+CONFIG_SNAPSHOT_SECTIONS: dict[str, Callable[[str], dict]] = {
+    "sites_by_id": _load_sites_by_id,
+    "sites_by_domain": _load_sites_by_domain,
+    "channels_by_id": _load_channels_by_id,
+    "channels_by_slug": _load_channels_by_slug,
+    "tax_configurations_by_channel_id": _load_tax_configurations_by_channel_id,
+    "tax_class_country_rates_by_tax_class_id": (
+        _load_tax_class_country_rates_by_tax_class_id
+    ),
+    "warehouses_by_id": _load_warehouses_by_id,
+}
+
+# Changes of these models invalidate the snapshot.
+CONFIG_SNAPSHOT_MODELS = [
+    Site,
+    SiteSettings,
+    Channel,
+    TaxConfiguration,
+    TaxClass,
+    TaxClassCountryRate,
+    Warehouse,
+]
+
+
+class ConfigSnapshot:
+    def __init__(self):
+        self.generation: int | None = None
+        self.sections: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def get_section(self, name: str) -> dict:
+        generation = get_config_snapshot_generation()
+        with self.lock:
+            if generation != self.generation:
+                self.generation = generation
+                self.sections = {}
+            if name not in self.sections:
+                # The snapshot is read from the writer, as replicas may not yet
+                # have the changes that bumped the generation.
+                self.sections[name] = CONFIG_SNAPSHOT_SECTIONS[name](
+                    settings.DATABASE_CONNECTION_DEFAULT_NAME
+                )
+            return self.sections[name]
+
+    def clear(self):
+        with self.lock:
+            self.generation = None
+            self.sections = {}
+
+
+config_snapshot = ConfigSnapshot()
+
+
+def get_config_snapshot_generation() -> int:
+    generation = cache.get(CONFIG_SNAPSHOT_GENERATION_CACHE_KEY)
+    if generation is None:
+        # Start from a unique value, so processes that still hold a snapshot
+        # from before the key was evicted do not consider it up to date.
+        cache.add(CONFIG_SNAPSHOT_GENERATION_CACHE_KEY, time.time_ns())
+        generation = cache.get(CONFIG_SNAPSHOT_GENERATION_CACHE_KEY)
+    return generation
+
+
+def get_config_snapshot_values(
+    section: str,
+    keys: Iterable,
+    database_connection_name: str,
+    default: Any = None,
+) -> list | None:
+    """Return copies of the snapshotted objects for the given keys.
+
+    Return None when the snapshot can't be used and the values have to be
+    loaded from the database. The snapshot is used only for reads that would
+    go to the replica; operations that write to the database read fresh data.
+    """
+    if not settings.CONFIG_SNAPSHOT_ENABLED:
+        return None
+    if database_connection_name != settings.DATABASE_CONNECTION_REPLICA_NAME:
+        return None
+    values = config_snapshot.get_section(section)
+    return [copy.deepcopy(values.get(key, default)) for key in keys]
+
+
+def invalidate_config_snapshot():
+    """Bump the snapshot generation once the current transaction is committed.
+
+    Must be called by the code that changes the snapshotted models without
+    sending model signals, like bulk or queryset updates.
+    """
+
+    def bump_generation():
+        try:
+            cache.incr(CONFIG_SNAPSHOT_GENERATION_CACHE_KEY)
+        except ValueError:
+            cache.set(CONFIG_SNAPSHOT_GENERATION_CACHE_KEY, time.time_ns(), None)
+
+    transaction.on_commit(bump_generation)
+
+
+def invalidate_config_snapshot_on_change(sender, **kwargs):
+    invalidate_config_snapshot()
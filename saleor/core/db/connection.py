@@ -1,6 +1,7 @@
 import logging
 import traceback
-from contextlib import contextmanager
+from collections.abc import Callable
+from contextlib import ExitStack, contextmanager
 
 from django.conf import settings
 from django.core.management.color import color_style
@@ -54,6 +55,30 @@ def allow_writer():
             setattr(default_connection, "_allow_writer", False)
 
 
+@contextmanager
+def call_on_each_query(callback: Callable[[], None]):
+    """Call the callback for every SQL query executed on any database connection."""
+    # Aliases can share the same underlying connection (e.g. the fake replica used
+    # in tests), in which case the wrapper is nested and must count the query once.
+    executing = False
+
+    def wrapper(execute, sql, params, many, context):
+        nonlocal executing
+        if executing:
+            return execute(sql, params, many, context)
+        callback()
+        executing = True
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            executing = False
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(wrapper))
+        yield
+
+
 @contextmanager
 def allow_writer_in_context(context: SaleorContext):
     """Context manager that allows write access to the default database connection in a context (SaleorContext).
@@ -1,16 +1,84 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from ...models import SearchIndexRebuildShard
 from ...search_tasks import (
+    SEARCH_INDEXES,
+    get_search_index_rebuild_checkpoints,
+    rebuild_search_index_shard,
+    rebuild_search_index_shard_task,
+    resume_search_index_rebuild,
     set_order_search_document_values,
     set_product_search_document_values,
     set_user_search_document_values,
+    start_search_index_rebuild,
 )
 
 
+def _rebuild_shard(
+    index_name: str, shard: int, run_id: str
+) -> tuple[str, int, SearchIndexRebuildShard]:
+    rebuild_search_index_shard(index_name, shard, run_id)
+    return (
+        index_name,
+        shard,
+        SearchIndexRebuildShard.objects.get(index_name=index_name, shard=shard),
+    )
+
+
 class Command(BaseCommand):
-    help = "Populate search indexes."
+    help = (
+        "Populate search indexes. With --rebuild, rebuild the search values of all "
+        "rows in parallel shards, which can be resumed with --resume."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild the search values of all rows, not only the missing ones.",
+        )
+        parser.add_argument(
+            "--index",
+            action="append",
+            choices=list(SEARCH_INDEXES),
+            help="Search index to rebuild, all by default. Can be used many times.",
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=4,
+            help="Number of shards processed concurrently for each index.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the previous rebuild from the saved checkpoints.",
+        )
+        parser.add_argument(
+            "--local",
+            action="store_true",
+            help="Process the shards in a local process pool instead of Celery.",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Show the progress of the rebuild.",
+        )
 
     def handle(self, *args, **options):
+        index_names = options["index"] or list(SEARCH_INDEXES)
+        if options["status"]:
+            self.show_status(index_names)
+            return
+        if options["rebuild"] or options["resume"]:
+            self.rebuild(index_names, options)
+            return
+
         # Update products
         self.stdout.write("Updating products")
         set_product_search_document_values.delay()
@@ -22,3 +90,76 @@ class Command(BaseCommand):
         # Update users
         self.stdout.write("Updating users")
         set_user_search_document_values.delay()
+
+    def rebuild(self, index_names, options):
+        if options["shards"] < 1:
+            raise CommandError("The number of shards must be positive.")
+
+        shards = []
+        for index_name in index_names:
+            if options["resume"]:
+                if not get_search_index_rebuild_checkpoints(index_name):
+                    self.stderr.write(
+                        f"{index_name}: no rebuild to resume, start it with --rebuild"
+                    )
+                    continue
+                run_id, index_shards = resume_search_index_rebuild(index_name)
+            else:
+                run_id, index_shards = start_search_index_rebuild(
+                    index_name, options["shards"]
+                )
+            self.stdout.write(
+                f"Rebuilding {index_name} search index in {len(index_shards)} shards"
+            )
+            shards += [(index_name, shard, run_id) for shard in index_shards]
+
+        if not options["local"]:
+            for index_name, shard, run_id in shards:
+                rebuild_search_index_shard_task.delay(index_name, shard, run_id)
+            self.stdout.write("Use --status to follow the progress.")
+            return
+
+        if not shards:
+            return
+        started_at = time.monotonic()
+        total_rows = 0
+        # Connections can't be shared with the forked processes
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=min(len(shards), options["shards"]),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = [
+                executor.submit(_rebuild_shard, index_name, shard, run_id)
+                for index_name, shard, run_id in shards
+            ]
+            for future in as_completed(futures):
+                index_name, shard, checkpoint = future.result()
+                total_rows += checkpoint.rows
+                progress = self.format_progress(checkpoint)
+                self.stdout.write(f"Rebuilt {index_name} shard {shard}: {progress}")
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(
+            f"Rebuilt {total_rows} rows in {elapsed:.1f}s "
+            f"({total_rows / elapsed if elapsed else 0:.1f} rows/sec)"
+        )
+
+    def show_status(self, index_names):
+        for index_name in index_names:
+            checkpoints = get_search_index_rebuild_checkpoints(index_name)
+            if not checkpoints:
+                self.stdout.write(f"{index_name}: no rebuild started")
+                continue
+            done = sum(checkpoint.done for checkpoint in checkpoints.values())
+            self.stdout.write(f"{index_name}: {done}/{len(checkpoints)} shards done")
+            for shard, checkpoint in checkpoints.items():
+                self.stdout.write(
+                    f"  shard {shard}: {self.format_progress(checkpoint)}"
+                )
+
+    @staticmethod
+    def format_progress(checkpoint: SearchIndexRebuildShard) -> str:
+        rows, seconds = checkpoint.rows, checkpoint.seconds
+        status = "done" if checkpoint.done else f"next key {checkpoint.next_key}"
+        rows_per_second = rows / seconds if seconds else 0
+        return f"{rows} rows, {rows_per_second:.1f} rows/sec, {status}"
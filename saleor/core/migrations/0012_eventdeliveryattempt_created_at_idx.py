@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 11:06
+
+from django.contrib.postgres.indexes import BTreeIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="eventdeliveryattempt",
+            index=BTreeIndex(
+                fields=["created_at"], name="event_attempt_created_at_idx"
+            ),
+        ),
+    ]
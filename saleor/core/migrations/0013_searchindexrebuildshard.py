@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_eventdeliveryattempt_created_at_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexRebuildShard",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("index_name", models.CharField(max_length=32)),
+                ("shard", models.PositiveIntegerField()),
+                ("run_id", models.UUIDField()),
+                ("next_key", models.BigIntegerField()),
+                ("end_key", models.BigIntegerField()),
+                ("rows", models.PositiveBigIntegerField(default=0)),
+                ("seconds", models.FloatField(default=0)),
+                ("done", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("index_name", "shard")},
+            },
+        ),
+    ]
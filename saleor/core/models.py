@@ -2,7 +2,7 @@ import datetime
 from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from django.contrib.postgres.indexes import GinIndex, PostgresIndex
+from django.contrib.postgres.indexes import BTreeIndex, GinIndex, PostgresIndex
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
@@ -239,3 +239,28 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            BTreeIndex(fields=["created_at"], name="event_attempt_created_at_idx"),
+        ]
+
+
+class SearchIndexRebuildShard(models.Model):
+    """Checkpoint of a shard of the search index rebuild.
+
+    The shard is processed only by the tasks of the rebuild with the same `run_id`,
+    the tasks of the previous rebuild of the index stop at their next batch.
+    """
+
+    index_name = models.CharField(max_length=32)
+    shard = models.PositiveIntegerField()
+    run_id = models.UUIDField()
+    # the next and the end key of the key range of the shard
+    next_key = models.BigIntegerField()
+    end_key = models.BigIntegerField()
+    rows = models.PositiveBigIntegerField(default=0)
+    seconds = models.FloatField(default=0)
+    done = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = (("index_name", "shard"),)
@@ -1,20 +1,28 @@
-from typing import Any
+import datetime
+import math
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Max, Min, Model, QuerySet
+from django.utils import timezone
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from ..order.models import Order
-from ..order.search import prepare_order_search_vector_value
+from ..order.search import prepare_orders_search_vector_values
 from ..product.models import Product
 from ..product.search import (
     PRODUCT_FIELDS_TO_PREFETCH,
     prepare_product_search_vector_value,
 )
+from .models import SearchIndexRebuildShard
 from .postgres import FlatConcatSearchVector
 
 task_logger = get_task_logger(__name__)
@@ -63,12 +71,22 @@ def set_order_search_document_values(
     database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
     updated_count: int = 0,
     order_number: int = 0,
+    order_number_to: int | None = None,
 ) -> None:
     """Update search document values for orders.
 
     If `update_all` is False, it will update only orders with search_vector=None.
+    Only orders with number in `order_number` (inclusive) - `order_number_to`
+    (exclusive) range are updated, which allows running the update in shards.
+
+    The values are built from the fields projections of the orders relations and
+    written in a single UPDATE statement per batch without locking the orders.
+    The vectors of orders modified in the meantime are rebuilt from the writer
+    before moving to the next batch.
     """
     lookup: dict[str, Any] = {"number__gte": order_number}
+    if order_number_to is not None:
+        lookup["number__lt"] = order_number_to
     if not update_all:
         lookup["search_vector"] = None
 
@@ -78,46 +96,79 @@ def set_order_search_document_values(
         .order_by("number")
     )
 
-    numbers = list(orders_qs.values_list("number", flat=True)[:ORDER_BATCH_SIZE])
-    if not numbers:
+    started_at = timezone.now()
+    orders = list(orders_qs.values_list("id", "number")[:ORDER_BATCH_SIZE])
+    if not orders:
         task_logger.info("No orders to update.")
         return
 
-    with allow_writer():
-        orders = (
-            Order.objects.filter(number__in=numbers)
-            .prefetch_related(
-                "user",
-                "billing_address",
-                "shipping_address",
-                "payments",
-                "discounts",
-                "lines",
-                "payment_transactions__events",
-                "invoices",
-                "events",
-            )
-            .order_by("pk")
-        )
-        with transaction.atomic():
-            _orders_lock = list(orders.select_for_update(of=(["self"])))
-            updated_count += set_search_vector_values(
-                list(orders), prepare_order_search_vector_value
-            )
+    updated_count += set_orders_search_vector_values(
+        [order_id for order_id, _number in orders],
+        database_connection_name,
+        started_at,
+    )
 
     task_logger.info("Updated %d orders", updated_count)
 
-    if len(numbers) < ORDER_BATCH_SIZE:
+    if len(orders) < ORDER_BATCH_SIZE:
         task_logger.info("Setting order search document values finished.")
         return
 
-    del orders
-
     set_order_search_document_values.delay(
-        update_all, database_connection_name, updated_count, order_number=numbers[-1]
+        update_all,
+        database_connection_name,
+        updated_count,
+        order_number=orders[-1][1] + 1,
+        order_number_to=order_number_to,
     )
 
 
+def get_shard_ranges(
+    qs: QuerySet, key_field: str, shard_count: int
+) -> list[tuple[int, int]]:
+    """Split the values of the integer `key_field` of the rows into equal ranges.
+
+    Return up to `shard_count` ranges of the start (inclusive) and end (exclusive)
+    keys, or no ranges when there are no rows.
+    """
+    keys = qs.aggregate(min_key=Min(key_field), max_key=Max(key_field))
+    if keys["min_key"] is None:
+        return []
+    min_key, max_key = keys["min_key"], keys["max_key"] + 1
+    shard_size = max(math.ceil((max_key - min_key) / shard_count), 1)
+    return [
+        (shard_start, min(shard_start + shard_size, max_key))
+        for shard_start in range(min_key, max_key, shard_size)
+    ]
+
+
+@app.task
+def set_order_search_document_values_in_shards(
+    shard_count: int = 4,
+    update_all: bool = False,
+    database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+) -> None:
+    """Update search document values for orders in parallel.
+
+    The order numbers are split into `shard_count` equal ranges and each range is
+    updated by a separate chain of `set_order_search_document_values` tasks.
+    """
+    shard_ranges = get_shard_ranges(
+        Order.objects.using(database_connection_name), "number", shard_count
+    )
+    if not shard_ranges:
+        task_logger.info("No orders to update.")
+        return
+
+    for shard_start, shard_end in shard_ranges:
+        set_order_search_document_values.delay(
+            update_all,
+            database_connection_name,
+            order_number=shard_start,
+            order_number_to=shard_end,
+        )
+
+
 @app.task
 def set_product_search_document_values(updated_count: int = 0) -> None:
     products = list(
@@ -148,6 +199,44 @@ def set_product_search_document_values(updated_count: int = 0) -> None:
     set_product_search_document_values.delay(updated_count)
 
 
+def set_orders_search_vector_values(
+    order_ids: list, database_connection_name: str, started_at: datetime.datetime
+) -> int:
+    """Update search vectors of the orders.
+
+    Vectors built from `database_connection_name` are written only to orders not
+    modified since `started_at`, as the read data might be outdated for the rest.
+    The vectors of the orders modified in the meantime are rebuilt from the writer.
+    """
+    search_vectors = prepare_orders_search_vector_values(
+        order_ids, database_connection_name
+    )
+    with allow_writer():
+        updated_count = Order.objects.filter(updated_at__lt=started_at).bulk_update(
+            _get_orders_with_search_vectors(search_vectors), ["search_vector"]
+        )
+        modified_order_ids = list(
+            Order.objects.filter(
+                id__in=order_ids, updated_at__gte=started_at
+            ).values_list("id", flat=True)
+        )
+        if modified_order_ids:
+            search_vectors = prepare_orders_search_vector_values(
+                modified_order_ids, settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
+            updated_count += Order.objects.bulk_update(
+                _get_orders_with_search_vectors(search_vectors), ["search_vector"]
+            )
+    return updated_count
+
+
+def _get_orders_with_search_vectors(search_vectors: dict) -> list[Order]:
+    return [
+        Order(id=order_id, search_vector=FlatConcatSearchVector(*vectors))
+        for order_id, vectors in search_vectors.items()
+    ]
+
+
 def set_search_document_values(instances: list, prepare_search_document_func):
     if not instances:
         return 0
@@ -173,3 +262,190 @@ def set_search_vector_values(
     Model.objects.bulk_update(instances, ["search_vector"])
 
     return len(instances)
+
+
+# Number of batches processed by a single invocation of the rebuild shard task.
+SEARCH_INDEX_REBUILD_BATCH_COUNT = 20
+
+
+def _rebuild_users_search_values(pks: list[int]) -> int:
+    users = list(
+        User.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(pk__in=pks)
+        .prefetch_related("addresses")
+    )
+    with allow_writer():
+        return set_search_document_values(users, prepare_user_search_document_value)
+
+
+def _rebuild_orders_search_values(pks: list[UUID]) -> int:
+    return set_orders_search_vector_values(
+        pks, settings.DATABASE_CONNECTION_REPLICA_NAME, timezone.now()
+    )
+
+
+def _rebuild_products_search_values(pks: list[int]) -> int:
+    products = list(
+        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(pk__in=pks)
+        .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
+    )
+    if not products:
+        return 0
+    with allow_writer():
+        return set_search_vector_values(products, prepare_product_search_vector_value)
+
+
+class SearchIndex(NamedTuple):
+    model: type[Model]
+    # Integer field used to split the rows into shards and to checkpoint progress
+    key_field: str
+    batch_size: int
+    rebuild_func: Callable[[list], int]
+
+
+SEARCH_INDEXES = {
+    "products": SearchIndex(Product, "id", BATCH_SIZE, _rebuild_products_search_values),
+    "orders": SearchIndex(
+        Order, "number", ORDER_BATCH_SIZE, _rebuild_orders_search_values
+    ),
+    "users": SearchIndex(User, "id", BATCH_SIZE, _rebuild_users_search_values),
+}
+
+
+def start_search_index_rebuild(
+    index_name: str, shard_count: int
+) -> tuple[str, list[int]]:
+    """Split the rows of the search index into shards and reset their checkpoints.
+
+    Return the run id of the rebuild and the shards to process. The checkpoints of
+    the previous rebuild of the index are replaced, so its shard tasks that are
+    still running stop at their next batch.
+    """
+    index = SEARCH_INDEXES[index_name]
+    shard_ranges = get_shard_ranges(
+        index.model.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME),
+        index.key_field,
+        shard_count,
+    )
+    run_id = uuid4()
+    with transaction.atomic():
+        SearchIndexRebuildShard.objects.filter(index_name=index_name).delete()
+        SearchIndexRebuildShard.objects.bulk_create(
+            [
+                SearchIndexRebuildShard(
+                    index_name=index_name,
+                    shard=shard,
+                    run_id=run_id,
+                    next_key=shard_start,
+                    end_key=shard_end,
+                )
+                for shard, (shard_start, shard_end) in enumerate(shard_ranges)
+            ]
+        )
+    return str(run_id), list(range(len(shard_ranges)))
+
+
+def resume_search_index_rebuild(index_name: str) -> tuple[str, list[int]]:
+    """Take over the unfinished shards of the search index rebuild.
+
+    Return the new run id of the rebuild and the shards to process. The shard
+    tasks of the previous run that are still running stop at their next batch,
+    so a shard is never processed by two task chains at once.
+    """
+    run_id = uuid4()
+    with transaction.atomic():
+        shards = list(
+            SearchIndexRebuildShard.objects.select_for_update()
+            .filter(index_name=index_name, done=False)
+            .order_by("shard")
+            .values_list("shard", flat=True)
+        )
+        SearchIndexRebuildShard.objects.filter(
+            index_name=index_name, shard__in=shards
+        ).update(run_id=run_id)
+    return str(run_id), shards
+
+
+def get_search_index_rebuild_checkpoints(
+    index_name: str,
+) -> dict[int, SearchIndexRebuildShard]:
+    """Return the checkpoints of the rebuild shards, empty when no rebuild started."""
+    return {
+        checkpoint.shard: checkpoint
+        for checkpoint in SearchIndexRebuildShard.objects.filter(
+            index_name=index_name
+        ).order_by("shard")
+    }
+
+
+def rebuild_search_index_shard(
+    index_name: str, shard: int, run_id: str, max_batches: int | None = None
+) -> bool:
+    """Rebuild the search values of a shard, starting from its checkpoint.
+
+    Each batch is processed with the checkpoint row locked and is saved together
+    with it, so the rebuild can be resumed after a crash. Return whether the
+    shard is done or was taken over by another run.
+    """
+    index = SEARCH_INDEXES[index_name]
+    qs = index.model.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).order_by(
+        index.key_field
+    )
+    batch_number = 0
+    while max_batches is None or batch_number < max_batches:
+        batch_number += 1
+        with allow_writer(), transaction.atomic():
+            checkpoint = (
+                SearchIndexRebuildShard.objects.select_for_update()
+                .filter(index_name=index_name, shard=shard, run_id=run_id)
+                .first()
+            )
+            if checkpoint is None:
+                task_logger.info(
+                    "Shard %d of %s search index rebuild was taken over by "
+                    "another run.",
+                    shard,
+                    index_name,
+                )
+                return True
+            if checkpoint.done:
+                return True
+
+            batch_started_at = time.monotonic()
+            rows = list(
+                qs.filter(
+                    **{
+                        f"{index.key_field}__gte": checkpoint.next_key,
+                        f"{index.key_field}__lt": checkpoint.end_key,
+                    }
+                ).values_list(index.key_field, "pk")[: index.batch_size]
+            )
+            if rows:
+                index.rebuild_func([pk for _key, pk in rows])
+                checkpoint.next_key = rows[-1][0] + 1
+                checkpoint.rows += len(rows)
+                checkpoint.seconds += time.monotonic() - batch_started_at
+            checkpoint.done = len(rows) < index.batch_size
+            checkpoint.save(
+                update_fields=["next_key", "rows", "seconds", "done", "updated_at"]
+            )
+        task_logger.info(
+            "Rebuilt %d %s search values in shard %d (%.1f rows/sec).",
+            checkpoint.rows,
+            index_name,
+            shard,
+            checkpoint.rows / checkpoint.seconds if checkpoint.seconds else 0,
+        )
+        if checkpoint.done:
+            break
+    return checkpoint.done
+
+
+@app.task
+def rebuild_search_index_shard_task(index_name: str, shard: int, run_id: str) -> None:
+    """Rebuild the search values of a shard, re-scheduling itself until it's done."""
+    if not rebuild_search_index_shard(
+        index_name, shard, run_id, max_batches=SEARCH_INDEX_REBUILD_BATCH_COUNT
+    ):
+        rebuild_search_index_shard_task.delay(index_name, shard, run_id)
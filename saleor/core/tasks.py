@@ -10,8 +10,8 @@ from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
-from . import private_storage
-from .models import EventDelivery, EventPayload
+from . import EventDeliveryStatus, private_storage
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -92,6 +92,42 @@ def delete_event_payloads_task(expiration_date=None):
             task_logger.error("Task invocation time limit reached, aborting task")
 
 
+# Number of batches deleted by a single invocation of the delivery attempts deletion
+# task. Each batch is a single DELETE statement running in its own transaction.
+EVENT_DELIVERY_ATTEMPT_DELETE_BATCH_COUNT = 10
+
+
+@app.task
+def delete_event_delivery_attempts_task(expiration_date=None):
+    """Delete the delivery attempts older than `EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD`.
+
+    The oldest attempts are deleted first, in batches, until the task time limit is
+    reached. The attempts to delete are selected from the writer within the DELETE
+    statement, so a lagging replica doesn't return the attempts already deleted.
+    """
+    expiration_date = (
+        expiration_date
+        or timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
+    )
+    delete_period = timezone.now() - settings.EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD
+    attempts_to_delete = (
+        EventDeliveryAttempt.objects.filter(created_at__lt=delete_period)
+        .exclude(delivery__status=EventDeliveryStatus.PENDING)
+        .order_by("created_at")
+    )
+    for _ in range(EVENT_DELIVERY_ATTEMPT_DELETE_BATCH_COUNT):
+        if expiration_date <= timezone.now():
+            task_logger.error("Task invocation time limit reached, aborting task")
+            return
+        with allow_writer():
+            deleted_count, _ = EventDeliveryAttempt.objects.filter(
+                pk__in=attempts_to_delete.values("pk")[:BATCH_SIZE]
+            ).delete()
+        if deleted_count < BATCH_SIZE:
+            return
+    delete_event_delivery_attempts_task.delay(expiration_date)
+
+
 @app.task
 def delete_files_from_storage_task(paths):
     for path in paths:
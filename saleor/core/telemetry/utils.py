@@ -33,6 +33,10 @@ class Unit(Enum):
     MILLISECOND = "ms"
     NANOSECOND = "ns"
     REQUEST = "{request}"
+    CALL = "{call}"
+    QUERY = "{query}"
+    KEY = "{key}"
+    BATCH = "{batch}"
     BYTE = "By"
     COST = "{cost}"
 
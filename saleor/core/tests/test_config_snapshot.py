@@ -0,0 +1,128 @@
+import pytest
+from django.conf import settings as django_settings
+
+from ...graphql.channel.dataloaders import ChannelBySlugLoader
+from ...graphql.context import get_context_value
+from ...tax.models import TaxClassCountryRate
+from ..config_snapshot import config_snapshot, get_config_snapshot_values
+
+REPLICA = django_settings.DATABASE_CONNECTION_REPLICA_NAME
+WRITER = django_settings.DATABASE_CONNECTION_DEFAULT_NAME
+
+
+@pytest.fixture(autouse=True)
+def clear_config_snapshot():
+    config_snapshot.clear()
+    yield
+    config_snapshot.clear()
+
+
+def test_get_config_snapshot_values_loads_section_once(
+    channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+    get_config_snapshot_values("channels_by_slug", [channel_USD.slug], REPLICA)
+
+    # when
+    with django_assert_num_queries(0):
+        channels = get_config_snapshot_values(
+            "channels_by_slug", [channel_USD.slug, "unknown"], REPLICA
+        )
+
+    # then
+    assert channels[0] == channel_USD
+    assert channels[0] is not channel_USD
+    assert channels[1] is None
+
+
+def test_get_config_snapshot_values_returns_copies(channel_USD, settings):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+    [channel] = get_config_snapshot_values("channels_by_id", [channel_USD.pk], REPLICA)
+
+    # when
+    channel.name = "Changed"
+    [channel] = get_config_snapshot_values("channels_by_id", [channel_USD.pk], REPLICA)
+
+    # then
+    assert channel.name == channel_USD.name
+
+
+def test_get_config_snapshot_values_disabled(channel_USD, settings):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = False
+
+    # when
+    channels = get_config_snapshot_values("channels_by_id", [channel_USD.pk], REPLICA)
+
+    # then
+    assert channels is None
+
+
+def test_get_config_snapshot_values_not_used_for_writer(channel_USD, settings):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+
+    # when
+    channels = get_config_snapshot_values("channels_by_id", [channel_USD.pk], WRITER)
+
+    # then
+    assert channels is None
+
+
+def test_config_snapshot_invalidated_on_save(
+    channel_USD, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+    get_config_snapshot_values("channels_by_id", [channel_USD.pk], REPLICA)
+
+    # when
+    channel_USD.name = "New name"
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    [channel] = get_config_snapshot_values("channels_by_id", [channel_USD.pk], REPLICA)
+    assert channel.name == "New name"
+
+
+def test_config_snapshot_invalidated_on_delete(
+    tax_classes, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+    tax_class = tax_classes[0]
+    [rates] = get_config_snapshot_values(
+        "tax_class_country_rates_by_tax_class_id", [tax_class.pk], REPLICA, []
+    )
+    assert rates
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        TaxClassCountryRate.objects.filter(tax_class=tax_class).delete()
+
+    # then
+    [rates] = get_config_snapshot_values(
+        "tax_class_country_rates_by_tax_class_id", [tax_class.pk], REPLICA, []
+    )
+    assert rates == []
+
+
+def test_dataloader_uses_config_snapshot(
+    rf, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.CONFIG_SNAPSHOT_ENABLED = True
+    get_config_snapshot_values("channels_by_slug", [channel_USD.slug], REPLICA)
+    request = rf.get("/")
+    request.app = None
+    context = get_context_value(request)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = ChannelBySlugLoader(context).load(channel_USD.slug).get()
+
+    # then
+    assert channel == channel_USD
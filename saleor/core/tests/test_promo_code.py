@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from ..utils.promo_code import generate_promo_codes, get_used_promo_codes
+
+
+def test_generate_promo_codes():
+    # when
+    codes = generate_promo_codes(25)
+
+    # then
+    assert len(codes) == 25
+    assert len(set(codes)) == 25
+    assert not get_used_promo_codes(codes)
+
+
+def test_generate_promo_codes_replaces_used_codes(gift_card, voucher):
+    # given
+    voucher_code = voucher.codes.first().code
+    generated_codes = [gift_card.code, voucher_code, "NEW-CODE-1", "NEW-CODE-2"]
+
+    # when
+    with patch(
+        "saleor.core.utils.promo_code.generate_random_code",
+        side_effect=generated_codes,
+    ):
+        codes = generate_promo_codes(2)
+
+    # then
+    assert set(codes) == {"NEW-CODE-1", "NEW-CODE-2"}
+
+
+def test_generate_promo_codes_queries_per_batch(django_assert_num_queries):
+    # given
+    with patch("saleor.core.utils.promo_code.PROMO_CODE_BATCH_SIZE", 10):
+        # when
+        with django_assert_num_queries(3):
+            codes = generate_promo_codes(25)
+
+    # then
+    assert len(set(codes)) == 25
+
+
+def test_get_used_promo_codes(gift_card, voucher):
+    # given
+    voucher_code = voucher.codes.first().code
+
+    # when
+    used_codes = get_used_promo_codes([gift_card.code, voucher_code, "UNUSED"])
+
+    # then
+    assert used_codes == {gift_card.code, voucher_code}
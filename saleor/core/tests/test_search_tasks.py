@@ -1,8 +1,26 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import call, patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
 from ...core.postgres import FlatConcatSearchVector
 from ...core.search_tasks import (
+    SEARCH_INDEXES,
+    get_search_index_rebuild_checkpoints,
+    rebuild_search_index_shard,
+    rebuild_search_index_shard_task,
+    resume_search_index_rebuild,
     set_order_search_document_values,
+    set_order_search_document_values_in_shards,
     set_user_search_document_values,
+    start_search_index_rebuild,
 )
+from ...order.models import Order
+from ...order.search import prepare_orders_search_vector_values
+from ..models import SearchIndexRebuildShard
 
 
 def test_set_user_search_document_values(customer_user, customer_user2):
@@ -48,3 +66,244 @@ def test_set_order_search_document_values_no_vector(order):
     # then
     order.refresh_from_db()
     assert order.user.email in order.search_vector
+
+
+def test_set_order_search_document_values_rebuilds_orders_modified_meanwhile(
+    order,
+):
+    # given
+    Order.objects.filter(pk=order.pk).update(
+        updated_at=timezone.now() + timedelta(minutes=1)
+    )
+
+    # when
+    with patch(
+        "saleor.core.search_tasks.prepare_orders_search_vector_values",
+        wraps=prepare_orders_search_vector_values,
+    ) as mocked_prepare:
+        set_order_search_document_values()
+
+    # then
+    order.refresh_from_db()
+    assert order.user.email in order.search_vector
+    assert mocked_prepare.call_args_list == [
+        call([order.pk], settings.DATABASE_CONNECTION_REPLICA_NAME),
+        call([order.pk], settings.DATABASE_CONNECTION_DEFAULT_NAME),
+    ]
+
+
+def test_set_order_search_document_values_order_number_range(order_list):
+    # given
+    first_order, second_order, third_order = sorted(
+        order_list, key=lambda order: order.number
+    )
+
+    # when
+    set_order_search_document_values(
+        order_number=second_order.number, order_number_to=third_order.number
+    )
+
+    # then
+    first_order.refresh_from_db()
+    second_order.refresh_from_db()
+    third_order.refresh_from_db()
+    assert first_order.search_vector is None
+    assert second_order.search_vector
+    assert third_order.search_vector is None
+
+
+@patch("saleor.core.search_tasks.set_order_search_document_values.delay")
+def test_set_order_search_document_values_in_shards(mocked_delay, order_list):
+    # given
+    numbers = sorted(order.number for order in order_list)
+
+    # when
+    set_order_search_document_values_in_shards(shard_count=2)
+
+    # then
+    assert mocked_delay.call_args_list == [
+        call(
+            False,
+            settings.DATABASE_CONNECTION_REPLICA_NAME,
+            order_number=numbers[0],
+            order_number_to=numbers[0] + 2,
+        ),
+        call(
+            False,
+            settings.DATABASE_CONNECTION_REPLICA_NAME,
+            order_number=numbers[0] + 2,
+            order_number_to=numbers[-1] + 1,
+        ),
+    ]
+
+
+def test_rebuild_search_index_shards(order_list):
+    # given
+    Order.objects.update(search_vector=None)
+
+    # when
+    run_id, shards = start_search_index_rebuild("orders", 2)
+    for shard in shards:
+        rebuild_search_index_shard_task(index_name="orders", shard=shard, run_id=run_id)
+
+    # then
+    assert len(shards) == 2
+    assert not Order.objects.filter(search_vector=None).exists()
+    checkpoints = get_search_index_rebuild_checkpoints("orders")
+    assert all(checkpoint.done for checkpoint in checkpoints.values())
+    assert sum(checkpoint.rows for checkpoint in checkpoints.values()) == 3
+
+
+def test_rebuild_search_index_shard_resumes_from_checkpoint(order_list):
+    # given
+    first_order, second_order, third_order = sorted(
+        order_list, key=lambda order: order.number
+    )
+    Order.objects.update(search_vector=None)
+    start_search_index_rebuild("orders", 1)
+    SearchIndexRebuildShard.objects.filter(index_name="orders", shard=0).update(
+        next_key=second_order.number, rows=1
+    )
+
+    # when
+    run_id, shards = resume_search_index_rebuild("orders")
+    done = rebuild_search_index_shard("orders", 0, run_id)
+
+    # then
+    assert shards == [0]
+    assert done is True
+    first_order.refresh_from_db()
+    second_order.refresh_from_db()
+    third_order.refresh_from_db()
+    assert first_order.search_vector is None
+    assert second_order.search_vector
+    assert third_order.search_vector
+    assert get_search_index_rebuild_checkpoints("orders")[0].rows == 3
+
+
+def test_rebuild_search_index_shard_stops_when_taken_over(order_list):
+    # given
+    Order.objects.update(search_vector=None)
+    previous_run_id, _ = start_search_index_rebuild("orders", 1)
+    resume_search_index_rebuild("orders")
+
+    # when
+    done = rebuild_search_index_shard("orders", 0, previous_run_id)
+
+    # then
+    assert done is True
+    assert Order.objects.filter(search_vector=None).count() == len(order_list)
+    checkpoint = get_search_index_rebuild_checkpoints("orders")[0]
+    assert checkpoint.rows == 0
+    assert checkpoint.done is False
+
+
+def test_start_search_index_rebuild_replaces_previous_run(order_list):
+    # given
+    previous_run_id, _ = start_search_index_rebuild("orders", 2)
+
+    # when
+    run_id, shards = start_search_index_rebuild("orders", 1)
+
+    # then
+    assert shards == [0]
+    checkpoints = get_search_index_rebuild_checkpoints("orders")
+    assert list(checkpoints) == [0]
+    assert str(checkpoints[0].run_id) == run_id != previous_run_id
+    assert rebuild_search_index_shard("orders", 0, previous_run_id) is True
+    assert get_search_index_rebuild_checkpoints("orders")[0].rows == 0
+
+
+def test_resume_search_index_rebuild_skips_done_shards(order_list):
+    # given
+    start_search_index_rebuild("orders", 2)
+    SearchIndexRebuildShard.objects.filter(index_name="orders", shard=0).update(
+        done=True
+    )
+
+    # when
+    _run_id, shards = resume_search_index_rebuild("orders")
+
+    # then
+    assert shards == [1]
+
+
+@patch("saleor.core.search_tasks.SEARCH_INDEXES")
+@patch("saleor.core.search_tasks.rebuild_search_index_shard_task.delay")
+def test_rebuild_search_index_shard_task_reschedules_itself(
+    mocked_delay, mocked_indexes, customer_user, staff_user
+):
+    # given
+    mocked_indexes.__getitem__.return_value = SEARCH_INDEXES["users"]._replace(
+        batch_size=1
+    )
+    run_id, _ = start_search_index_rebuild("users", 1)
+
+    # when
+    with patch("saleor.core.search_tasks.SEARCH_INDEX_REBUILD_BATCH_COUNT", 1):
+        rebuild_search_index_shard_task("users", 0, run_id)
+
+    # then
+    mocked_delay.assert_called_once_with("users", 0, run_id)
+    checkpoint = get_search_index_rebuild_checkpoints("users")[0]
+    assert checkpoint.rows == 1
+    assert checkpoint.done is False
+
+
+def test_update_search_indexes_command_rebuild(order_list, customer_user):
+    # given
+    Order.objects.update(search_vector=None)
+    out = StringIO()
+
+    # when
+    call_command(
+        "update_search_indexes",
+        "--rebuild",
+        "--index=orders",
+        "--index=users",
+        "--shards=2",
+        stdout=out,
+    )
+    call_command("update_search_indexes", "--status", "--index=orders", stdout=out)
+
+    # then
+    assert not Order.objects.filter(search_vector=None).exists()
+    assert "orders: 2/2 shards done" in out.getvalue()
+
+
+@patch("saleor.core.search_tasks.rebuild_search_index_shard_task.delay")
+def test_update_search_indexes_command_resume(mocked_delay, order_list):
+    # given
+    previous_run_id, _ = start_search_index_rebuild("orders", 2)
+    SearchIndexRebuildShard.objects.filter(index_name="orders", shard=0).update(
+        done=True
+    )
+    out = StringIO()
+
+    # when
+    call_command("update_search_indexes", "--resume", "--index=orders", stdout=out)
+
+    # then
+    assert "Rebuilding orders search index in 1 shards" in out.getvalue()
+    run_id = str(get_search_index_rebuild_checkpoints("orders")[1].run_id)
+    assert run_id != previous_run_id
+    mocked_delay.assert_called_once_with("orders", 1, run_id)
+
+
+@patch("saleor.core.search_tasks.rebuild_search_index_shard_task.delay")
+def test_update_search_indexes_command_resume_without_rebuild(mocked_delay, order_list):
+    # given
+    out, err = StringIO(), StringIO()
+
+    # when
+    call_command(
+        "update_search_indexes",
+        "--resume",
+        "--index=orders",
+        stdout=out,
+        stderr=err,
+    )
+
+    # then
+    assert "orders: no rebuild to resume" in err.getvalue()
+    mocked_delay.assert_not_called()
@@ -1,13 +1,15 @@
 import datetime
+from unittest.mock import patch
 
 from django.core.files.storage import default_storage
 from django.utils import timezone
 from freezegun import freeze_time
 
 from ...webhook.event_types import WebhookEventAsyncType
-from .. import private_storage
+from .. import EventDeliveryStatus, private_storage
 from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..tasks import (
+    delete_event_delivery_attempts_task,
     delete_event_payloads_task,
     delete_files_from_storage_task,
     delete_from_storage_task,
@@ -65,6 +67,67 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_event_delivery_attempts_task(event_delivery, settings):
+    # given
+    settings.EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD = datetime.timedelta(days=1)
+    start_time = timezone.now()
+    before_delete_period = start_time - datetime.timedelta(days=1, seconds=1)
+    after_delete_period = start_time - datetime.timedelta(hours=23)
+    event_delivery.status = EventDeliveryStatus.FAILED
+    event_delivery.save(update_fields=["status"])
+    for creation_time in [before_delete_period, after_delete_period]:
+        with freeze_time(creation_time):
+            EventDeliveryAttempt.objects.create(delivery=event_delivery)
+
+    # when
+    with freeze_time(start_time):
+        delete_event_delivery_attempts_task()
+
+    # then
+    attempt = EventDeliveryAttempt.objects.get()
+    assert attempt.created_at == after_delete_period
+    assert EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+
+
+def test_delete_event_delivery_attempts_task_skips_pending_deliveries(
+    event_delivery, settings
+):
+    # given
+    settings.EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD = datetime.timedelta(days=1)
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    with freeze_time(timezone.now() - datetime.timedelta(days=2)):
+        EventDeliveryAttempt.objects.create(delivery=event_delivery)
+
+    # when
+    delete_event_delivery_attempts_task()
+
+    # then
+    assert EventDeliveryAttempt.objects.count() == 1
+
+
+@patch("saleor.core.tasks.EVENT_DELIVERY_ATTEMPT_DELETE_BATCH_COUNT", 2)
+@patch("saleor.core.tasks.BATCH_SIZE", 1)
+@patch("saleor.core.tasks.delete_event_delivery_attempts_task.delay")
+def test_delete_event_delivery_attempts_task_reschedules_itself(
+    mocked_delay, event_delivery, settings, django_assert_num_queries
+):
+    # given
+    settings.EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD = datetime.timedelta(days=1)
+    event_delivery.status = EventDeliveryStatus.FAILED
+    event_delivery.save(update_fields=["status"])
+    with freeze_time(timezone.now() - datetime.timedelta(days=2)):
+        for _ in range(3):
+            EventDeliveryAttempt.objects.create(delivery=event_delivery)
+
+    # when
+    with django_assert_num_queries(2):
+        delete_event_delivery_attempts_task()
+
+    # then
+    assert EventDeliveryAttempt.objects.count() == 1
+    mocked_delay.assert_called_once()
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
@@ -1,4 +1,5 @@
 import secrets
+from collections.abc import Iterable
 
 from django.core.exceptions import ValidationError
 
@@ -6,6 +7,9 @@ from ...discount.models import VoucherCode
 from ...giftcard.error_codes import GiftCardErrorCode
 from ...giftcard.models import GiftCard
 
+# The number of codes checked against the existing ones in a single query.
+PROMO_CODE_BATCH_SIZE = 1000
+
 
 class InvalidPromoCode(ValidationError):
     def __init__(self, message=None, **kwargs):
@@ -26,6 +30,21 @@ def generate_promo_code():
     return code
 
 
+def generate_promo_codes(count: int) -> list[str]:
+    """Generate unique promo codes that can be used as voucher or gift card codes.
+
+    The codes are generated in batches, each batch is checked against the existing
+    voucher and gift card codes with a single query, and the used ones are replaced
+    in the next batch.
+    """
+    codes: set[str] = set()
+    while len(codes) < count:
+        batch_size = min(count - len(codes), PROMO_CODE_BATCH_SIZE)
+        batch = {generate_random_code() for _ in range(batch_size)} - codes
+        codes.update(batch - get_used_promo_codes(batch))
+    return list(codes)
+
+
 def generate_random_code():
     # generate code in format "ABCD-EFGH-IJKL"
     code = secrets.token_hex(nbytes=6).upper()
@@ -36,6 +55,20 @@ def is_available_promo_code(code):
     return not (promo_code_is_gift_card(code) or promo_code_is_voucher(code))
 
 
+def get_used_promo_codes(codes: Iterable[str]) -> set[str]:
+    """Return the codes that are already used by vouchers or gift cards."""
+    codes = list(codes)
+    if not codes:
+        return set()
+    voucher_codes = VoucherCode.objects.filter(code__in=codes).values_list(
+        "code", flat=True
+    )
+    gift_card_codes = GiftCard.objects.filter(code__in=codes).values_list(
+        "code", flat=True
+    )
+    return set(voucher_codes.union(gift_card_codes))
+
+
 def promo_code_is_voucher(code):
     return VoucherCode.objects.filter(code=code).exists()
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import graphene
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Exists, F, OuterRef, Q, QuerySet
 
 from ..celeryconf import app
@@ -31,7 +32,10 @@ from .models import (
     PromotionRule,
     VoucherCode,
 )
-from .utils.promotion import mark_catalogue_promotion_rules_as_dirty
+from .utils.promotion import (
+    mark_catalogue_promotion_rules_as_dirty,
+    schedule_promotion_toggle,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -51,21 +55,99 @@ def handle_promotion_toggle():
 
     Send the notifications about starting or ending promotions and call recalculation
     of product discounted prices.
+    The promotions are locked, the ones being handled by
+    `handle_promotion_toggle_at_date_task` are skipped.
     """
     manager = get_plugins_manager(allow_replica=False)
 
-    starting_promotions = get_starting_promotions(batch=True)
-    ending_promotions = get_ending_promotions(batch=True)
-    promotion_ids = [
-        promotion.id for promotion in starting_promotions | ending_promotions
-    ][:PROMOTION_TOGGLE_BATCH_SIZE]
-    starting_promotions = [
-        promotion for promotion in starting_promotions if promotion.id in promotion_ids
-    ]
-    ending_promotions = [
-        promotion for promotion in ending_promotions if promotion.id in promotion_ids
-    ]
-    promotions = Promotion.objects.filter(id__in=promotion_ids).all()
+    with transaction.atomic():
+        promotion_ids = list(
+            (get_starting_promotions() | get_ending_promotions())
+            .select_for_update(of=("self",), skip_locked=True)
+            .order_by("pk")
+            .values_list("id", flat=True)[:PROMOTION_TOGGLE_BATCH_SIZE]
+        )
+        starting_promotions = list(
+            get_starting_promotions().filter(id__in=promotion_ids)
+        )
+        ending_promotions = list(get_ending_promotions().filter(id__in=promotion_ids))
+        promotions = Promotion.objects.filter(id__in=promotion_ids).all()
+        _toggle_promotions(manager, promotions, starting_promotions, ending_promotions)
+    if ending_promotions:
+        clear_promotion_rule_variants_task.delay()
+
+
+@app.task
+@allow_writer()
+def handle_promotion_toggle_at_date_task(promotion_id: str):
+    """Handle the start or the end of a promotion scheduled for its exact date.
+
+    Nothing is done when the promotion was already handled or its dates were changed
+    in the meantime, as the new dates are scheduled separately.
+    """
+    from ..product.tasks import (
+        recalculate_discounted_price_for_products_task,
+        update_variant_relations_for_active_promotion_rules_task,
+    )
+
+    with transaction.atomic():
+        promotion = (
+            Promotion.objects.select_for_update(of=("self",))
+            .filter(pk=promotion_id)
+            .first()
+        )
+        if not promotion:
+            return
+        starting_promotions = list(get_starting_promotions().filter(pk=promotion.pk))
+        ending_promotions = list(get_ending_promotions().filter(pk=promotion.pk))
+        if not starting_promotions and not ending_promotions:
+            return
+        manager = get_plugins_manager(allow_replica=False)
+        _toggle_promotions(
+            manager,
+            Promotion.objects.filter(pk=promotion.pk),
+            starting_promotions,
+            ending_promotions,
+        )
+
+    # Recalculate the prices of the promotion products right away instead of waiting
+    # for the periodic tasks.
+    recalculate_prices = recalculate_discounted_price_for_products_task.si()
+    if starting_promotions:
+        update_variant_relations_for_active_promotion_rules_task.apply_async(
+            link=recalculate_prices
+        )
+    if ending_promotions:
+        clear_promotion_rule_variants_task.apply_async(link=recalculate_prices)
+
+
+@app.task
+def schedule_promotion_toggles_task():
+    """Schedule the promotions that start or end within the scheduling horizon.
+
+    The task runs twice per horizon, so the windows of consecutive runs overlap
+    and a delayed run doesn't leave any dates unscheduled.
+    """
+    now = datetime.datetime.now(tz=datetime.UTC)
+    horizon = now + settings.PROMOTION_TOGGLE_SCHEDULE_HORIZON
+    promotions = (
+        Promotion.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(
+            Q(start_date__gt=now, start_date__lte=horizon)
+            | Q(end_date__gt=now, end_date__lte=horizon)
+        )
+        .only("pk", "start_date", "end_date")
+    )
+    for promotion in promotions.iterator():
+        schedule_promotion_toggle(promotion)
+
+
+def _toggle_promotions(
+    manager,
+    promotions: "QuerySet[Promotion]",
+    starting_promotions: list[Promotion],
+    ending_promotions: list[Promotion],
+):
     promotion_id_to_variants, product_ids = fetch_promotion_variants_and_product_ids(
         promotions
     )
@@ -94,9 +176,6 @@ def handle_promotion_toggle():
         }
         manager.sale_toggle(promotion, catalogues, webhooks=toggle_webhooks)
 
-    if ending_promotions:
-        clear_promotion_rule_variants_task.delay()
-
     mark_catalogue_promotion_rules_as_dirty(
         set(promotions.values_list("id", flat=True))
     )
@@ -19,9 +19,14 @@ from ..tasks import (
     disconnect_voucher_codes_from_draft_orders_task,
     fetch_promotion_variants_and_product_ids,
     handle_promotion_toggle,
+    handle_promotion_toggle_at_date_task,
+    schedule_promotion_toggles_task,
     set_promotion_rule_variants_task,
 )
-from ..utils.promotion import mark_catalogue_promotion_rules_as_dirty
+from ..utils.promotion import (
+    mark_catalogue_promotion_rules_as_dirty,
+    schedule_promotion_toggle,
+)
 
 
 def test_fetch_promotion_variants_and_product_ids(
@@ -195,6 +200,166 @@ def test_handle_promotion_toggle(
     mock_clear_promotion_rule_variants_task.assert_called_once()
 
 
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.clear_promotion_rule_variants_task.apply_async")
+@patch(
+    "saleor.product.tasks.update_variant_relations_for_active_promotion_rules_task"
+    ".apply_async"
+)
+@patch("saleor.plugins.manager.PluginsManager.promotion_ended")
+@patch("saleor.plugins.manager.PluginsManager.promotion_started")
+def test_handle_promotion_toggle_at_date_task_promotion_started(
+    promotion_started_mock,
+    promotion_ended_mock,
+    update_variant_relations_mock,
+    clear_promotion_rule_variants_mock,
+    catalogue_promotion,
+):
+    # given
+    now = timezone.now()
+    promotion = catalogue_promotion
+    promotion.start_date = now
+    promotion.end_date = None
+    promotion.last_notification_scheduled_at = None
+    promotion.save(
+        update_fields=["start_date", "end_date", "last_notification_scheduled_at"]
+    )
+
+    # when
+    handle_promotion_toggle_at_date_task(str(promotion.pk))
+
+    # then
+    promotion_started_mock.assert_called_once_with(promotion, webhooks=ANY)
+    promotion_ended_mock.assert_not_called()
+    promotion.refresh_from_db()
+    assert promotion.last_notification_scheduled_at == now
+    update_variant_relations_mock.assert_called_once()
+    clear_promotion_rule_variants_mock.assert_not_called()
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.clear_promotion_rule_variants_task.apply_async")
+@patch("saleor.plugins.manager.PluginsManager.promotion_ended")
+@patch("saleor.plugins.manager.PluginsManager.promotion_started")
+def test_handle_promotion_toggle_at_date_task_promotion_ended(
+    promotion_started_mock,
+    promotion_ended_mock,
+    clear_promotion_rule_variants_mock,
+    catalogue_promotion,
+):
+    # given
+    now = timezone.now()
+    promotion = catalogue_promotion
+    promotion.start_date = now - datetime.timedelta(days=1)
+    promotion.end_date = now
+    promotion.last_notification_scheduled_at = now - datetime.timedelta(hours=1)
+    promotion.save(
+        update_fields=["start_date", "end_date", "last_notification_scheduled_at"]
+    )
+
+    # when
+    handle_promotion_toggle_at_date_task(str(promotion.pk))
+
+    # then
+    promotion_started_mock.assert_not_called()
+    promotion_ended_mock.assert_called_once_with(promotion, webhooks=ANY)
+    clear_promotion_rule_variants_mock.assert_called_once()
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.clear_promotion_rule_variants_task.apply_async")
+@patch(
+    "saleor.product.tasks.update_variant_relations_for_active_promotion_rules_task"
+    ".apply_async"
+)
+@patch("saleor.plugins.manager.PluginsManager.promotion_ended")
+@patch("saleor.plugins.manager.PluginsManager.promotion_started")
+def test_handle_promotion_toggle_at_date_task_already_handled(
+    promotion_started_mock,
+    promotion_ended_mock,
+    update_variant_relations_mock,
+    clear_promotion_rule_variants_mock,
+    catalogue_promotion,
+):
+    # given
+    now = timezone.now()
+    promotion = catalogue_promotion
+    promotion.start_date = now - datetime.timedelta(minutes=1)
+    promotion.end_date = None
+    promotion.last_notification_scheduled_at = now
+    promotion.save(
+        update_fields=["start_date", "end_date", "last_notification_scheduled_at"]
+    )
+
+    # when
+    handle_promotion_toggle_at_date_task(str(promotion.pk))
+
+    # then
+    promotion_started_mock.assert_not_called()
+    promotion_ended_mock.assert_not_called()
+    update_variant_relations_mock.assert_not_called()
+    clear_promotion_rule_variants_mock.assert_not_called()
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.handle_promotion_toggle_at_date_task.apply_async")
+def test_schedule_promotion_toggle(mocked_apply_async, catalogue_promotion, settings):
+    # given
+    settings.PROMOTION_TOGGLE_SCHEDULE_HORIZON = datetime.timedelta(hours=1)
+    now = timezone.now()
+    promotion = catalogue_promotion
+    promotion.start_date = now + datetime.timedelta(minutes=10)
+    promotion.end_date = now + datetime.timedelta(hours=2)
+
+    # when
+    schedule_promotion_toggle(promotion)
+
+    # then
+    mocked_apply_async.assert_called_once_with(
+        args=[str(promotion.pk)], eta=promotion.start_date
+    )
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.handle_promotion_toggle_at_date_task.apply_async")
+def test_schedule_promotion_toggles_task(mocked_apply_async, promotion_list, settings):
+    # given
+    settings.PROMOTION_TOGGLE_SCHEDULE_HORIZON = datetime.timedelta(hours=1)
+    now = timezone.now()
+    starting_promotion, ending_promotion, distant_promotion = promotion_list[:3]
+
+    starting_promotion.start_date = now + datetime.timedelta(minutes=30)
+    starting_promotion.end_date = None
+    ending_promotion.start_date = now - datetime.timedelta(days=1)
+    ending_promotion.end_date = now + datetime.timedelta(minutes=45)
+    distant_promotion.start_date = now + datetime.timedelta(days=1)
+    distant_promotion.end_date = None
+    Promotion.objects.bulk_update(
+        [starting_promotion, ending_promotion, distant_promotion],
+        ["start_date", "end_date"],
+    )
+
+    # when
+    schedule_promotion_toggles_task()
+
+    # then
+    assert mocked_apply_async.call_count == 2
+    mocked_apply_async.assert_any_call(
+        args=[str(starting_promotion.pk)], eta=starting_promotion.start_date
+    )
+    mocked_apply_async.assert_any_call(
+        args=[str(ending_promotion.pk)], eta=ending_promotion.end_date
+    )
+
+
+def test_schedule_promotion_toggles_task_windows_overlap(settings):
+    # when
+    schedule = settings.CELERY_BEAT_SCHEDULE["schedule-promotion-toggles"]["schedule"]
+
+    # then
+    assert schedule < settings.PROMOTION_TOGGLE_SCHEDULE_HORIZON
+
+
 def test_clear_promotion_rule_variants_task(promotion_list):
     # given
     expired_promotion = promotion_list[-1]
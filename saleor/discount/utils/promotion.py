@@ -935,3 +935,21 @@ def mark_catalogue_promotion_rules_as_dirty(promotion_pks: Iterable[UUID]):
         PromotionRule.objects.filter(id__in=rule_ids_to_update).update(
             variants_dirty=True
         )
+
+
+def schedule_promotion_toggle(promotion: Promotion):
+    """Schedule handling the start and the end of the promotion at their exact dates.
+
+    Only the dates within `PROMOTION_TOGGLE_SCHEDULE_HORIZON` are scheduled, the later
+    ones are scheduled by `schedule_promotion_toggles_task` when they get closer.
+    The scheduled task is idempotent, so the promotion can be rescheduled safely.
+    """
+    from ..tasks import handle_promotion_toggle_at_date_task
+
+    now = datetime.datetime.now(tz=datetime.UTC)
+    horizon = now + settings.PROMOTION_TOGGLE_SCHEDULE_HORIZON
+    for toggle_date in {promotion.start_date, promotion.end_date}:
+        if toggle_date and now < toggle_date <= horizon:
+            handle_promotion_toggle_at_date_task.apply_async(
+                args=[str(promotion.pk)], eta=toggle_date
+            )
@@ -55,7 +55,7 @@ from ..core.types import (
 )
 from ..core.utils import from_global_id_or_error, str_to_enum, to_global_id_or_none
 from ..giftcard.dataloaders import GiftCardsByUserLoader
-from ..meta.types import ObjectWithMetadata
+from ..meta.types import METADATA_DEFERRABLE_COLUMNS, ObjectWithMetadata
 from ..order.dataloaders import OrderByIdLoader, OrderLineByIdLoader, OrdersByUserLoader
 from ..payment.types import StoredPaymentMethod
 from ..plugins.dataloaders import get_plugin_manager_promise
@@ -489,6 +489,11 @@ class User(ModelObjectType[models.User]):
         interfaces = [relay.Node, ObjectWithMetadata]
         model = get_user_model()
         doc_category = DOC_CATEGORY_USERS
+        deferrable_columns = {
+            **METADATA_DEFERRABLE_COLUMNS,
+            "note": ["note"],
+            "search_document": [],
+        }
 
     @staticmethod
     def resolve_addresses(root: models.User, _info: ResolveInfo):
@@ -12,6 +12,7 @@ from ....attribute import models
 from ....attribute.error_codes import AttributeBulkUpdateErrorCode
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import PageTypePermissions, ProductTypePermissions
+from ....product.utils.attributes import invalidate_attribute_slug_pk_map
 from ....webhook.utils import get_webhooks_for_event
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_ATTRIBUTES
@@ -581,6 +582,8 @@ class AttributeBulkUpdate(BaseMutation):
             id__in=[values_to_remove.id for values_to_remove in values_to_remove]
         ).delete()
         models.AttributeValue.objects.bulk_create(values_to_create)
+        # bulk update doesn't send the signals that keep the cached slugs up to date
+        invalidate_attribute_slug_pk_map()
 
         updated_attributes.extend(attributes_to_update)
         return updated_attributes, values_to_remove, values_to_create
@@ -29,6 +29,7 @@ from ...page import models as page_models
 from ...page.error_codes import PageErrorCode
 from ...product import models as product_models
 from ...product.error_codes import ProductErrorCode
+from ...product.utils.attributes import update_products_attribute_value_ids
 from ..core.utils import from_global_id_or_error, get_duplicated_values
 from ..core.validators import validate_one_of_args_is_in_mutation
 from ..product.utils import get_used_attribute_values_for_variant
@@ -450,6 +451,8 @@ class AttributeAssignmentMixin:
             instance.attributes.filter(  # type:ignore[union-attr]
                 assignment__attribute_id__in=clean_assignment
             ).delete()
+            if isinstance(instance, product_models.ProductVariant):
+                update_products_attribute_value_ids([instance.product_id])
 
     @classmethod
     def _pre_save_dropdown_value(
@@ -1029,6 +1032,7 @@ class ProductAttributeAssignmentMixin(AttributeAssignmentMixin):
                 Exists(values.filter(id=OuterRef("value_id"))),
                 product_id=instance.pk,
             ).delete()
+            update_products_attribute_value_ids([instance.pk])
 
 
 def prepare_attribute_values(attribute: attribute_models.Attribute, values: list[str]):
@@ -3,6 +3,7 @@ from uuid import UUID
 from django.db.models import Exists, OuterRef
 
 from ...channel.models import Channel
+from ...core.config_snapshot import get_config_snapshot_values
 from ...order.models import Order
 from ..core.dataloaders import DataLoader
 from ..order.dataloaders import OrderByIdLoader
@@ -12,6 +13,11 @@ class ChannelByIdLoader(DataLoader[int, Channel]):
     context_key = "channel_by_id"
 
     def batch_load(self, keys):
+        snapshot_channels = get_config_snapshot_values(
+            "channels_by_id", keys, self.database_connection_name
+        )
+        if snapshot_channels is not None:
+            return snapshot_channels
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
         return [channels.get(channel_id) for channel_id in keys]
 
@@ -20,6 +26,11 @@ class ChannelBySlugLoader(DataLoader[str, Channel]):
     context_key = "channel_by_slug"
 
     def batch_load(self, keys):
+        snapshot_channels = get_config_snapshot_values(
+            "channels_by_slug", keys, self.database_connection_name
+        )
+        if snapshot_channels is not None:
+            return snapshot_channels
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
             keys, field_name="slug"
         )
@@ -15,6 +15,7 @@ from ....permission.enums import (
     OrderPermissions,
     PaymentPermissions,
 )
+from ....product.utils.price_ranges import invalidate_channels_price_ranges
 from ....shipping.tasks import (
     drop_invalid_shipping_methods_relations_for_given_channels,
 )
@@ -125,6 +126,8 @@ class ChannelUpdate(DeprecatedModelMutation):
         slug = cleaned_input.get("slug")
         if slug:
             cleaned_input["slug"] = slugify(slug)
+        if "default_country" in cleaned_input:
+            cleaned_input["prev_default_country"] = instance.default_country.code
         if stock_settings := cleaned_input.get("stock_settings"):
             cleaned_input["allocation_strategy"] = stock_settings["allocation_strategy"]
         if order_settings := cleaned_input.get("order_settings"):
@@ -244,3 +247,9 @@ class ChannelUpdate(DeprecatedModelMutation):
         if cleaned_input.get("metadata"):
             cls.call_event(manager.channel_metadata_updated, instance)
         cls._update_voucher_usage(cleaned_input, instance)
+        prev_default_country = cleaned_input.get("prev_default_country")
+        if prev_default_country and (
+            prev_default_country != instance.default_country.code
+        ):
+            # price ranges are stored for the default country of the channel
+            invalidate_channels_price_ranges([instance.id])
@@ -1683,3 +1683,60 @@ def test_channel_update_set_use_legacy_line_discount_propagation(
         == expected_result
     )
     assert channel_USD.use_legacy_line_discount_propagation_for_order == expected_result
+
+
+@patch(
+    "saleor.graphql.channel.mutations.channel_update.invalidate_channels_price_ranges"
+)
+def test_channel_update_default_country_invalidates_price_ranges(
+    mocked_invalidate_channels_price_ranges,
+    permission_manage_channels,
+    staff_api_client,
+    channel_USD,
+):
+    # given
+    assert channel_USD.default_country.code != "FR"
+    variables = {
+        "id": graphene.Node.to_global_id("Channel", channel_USD.id),
+        "input": {"defaultCountry": "FR"},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_UPDATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelUpdate"]["errors"]
+    mocked_invalidate_channels_price_ranges.assert_called_once_with([channel_USD.id])
+
+
+@patch(
+    "saleor.graphql.channel.mutations.channel_update.invalidate_channels_price_ranges"
+)
+def test_channel_update_same_default_country_does_not_invalidate_price_ranges(
+    mocked_invalidate_channels_price_ranges,
+    permission_manage_channels,
+    staff_api_client,
+    channel_USD,
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Channel", channel_USD.id),
+        "input": {"defaultCountry": channel_USD.default_country.code},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_UPDATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelUpdate"]["errors"]
+    mocked_invalidate_channels_price_ranges.assert_not_called()
@@ -4,6 +4,7 @@ from ....checkout.actions import call_checkout_info_event
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import invalidate_checkout
+from ....warehouse.variant_availability import invalidate_reserved_variants_availability
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.context import SyncWebhookControlContext
@@ -76,6 +77,7 @@ class CheckoutLineDelete(BaseMutation):
             )
 
         if line and line in checkout.lines.all():
+            invalidate_reserved_variants_availability(line.reservations.all())
             line.delete()
 
         manager = get_plugin_manager_promise(info.context).get()
@@ -5,6 +5,8 @@ from ....checkout.actions import call_checkout_info_event
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import invalidate_checkout
+from ....warehouse.models import Reservation
+from ....warehouse.variant_availability import invalidate_reserved_variants_availability
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.context import SyncWebhookControlContext
@@ -94,6 +96,11 @@ class CheckoutLinesDelete(BaseMutation):
             lines_ids, graphene_type="CheckoutLine", raise_error=True
         )
         cls.validate_lines(checkout, lines_to_delete)
+        invalidate_reserved_variants_availability(
+            Reservation.objects.filter(
+                checkout_line__checkout=checkout, checkout_line_id__in=lines_to_delete
+            )
+        )
         checkout.lines.filter(id__in=lines_to_delete).delete()
 
         lines, _ = fetch_checkout_lines(checkout)
@@ -1,5 +1,6 @@
 from typing import cast
 
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.http import HttpRequest
 from django.utils import timezone
@@ -12,6 +13,7 @@ from ..core.jwt import jwt_decode_with_exception_handler
 from .api import API_PATH
 from .app.dataloaders import get_app_promise
 from .core import SaleorContext
+from .metrics import record_dataloader_stats
 
 
 def get_context_value(request: HttpRequest) -> SaleorContext:
@@ -27,6 +29,8 @@ def get_context_value(request: HttpRequest) -> SaleorContext:
 
 
 def clear_context(context: SaleorContext):
+    if settings.DATALOADER_STATS_ENABLED:
+        record_dataloader_stats(list(context.dataloaders.values()))
     context.dataloaders.clear()
     del context.user
 
@@ -7,9 +7,11 @@ import graphene
 from django.conf import settings
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
+from django.db.models.query import ModelIterable
 from graphene.relay import Connection
 from graphql import GraphQLError
-from graphql.language.ast import FragmentSpread, InlineFragment, SelectionSet
+from graphql.execution.utils import should_include_node
+from graphql.language.ast import Field, FragmentSpread, InlineFragment, SelectionSet
 from graphql_relay.connection.arrayconnection import connection_from_list_slice
 from graphql_relay.connection.connectiontypes import Edge, PageInfo
 from graphql_relay.utils import base64, unbase64
@@ -339,6 +341,7 @@ def create_connection_slice(
         iterable=queryset, args=args, allow_replica=allow_replica
     )
     args["sort_by"] = sort_by
+    queryset = _defer_unrequested_columns(queryset, info, connection_type, sort_by)
 
     from ...core.db.connection import allow_writer_in_context
 
@@ -431,6 +434,79 @@ def _edges_in_selections(selection_set: SelectionSet, info: "ResolveInfo") -> bo
     return False
 
 
+def _get_selected_fields(
+    selection_set: SelectionSet | None, info: "ResolveInfo"
+) -> list[Field]:
+    """Return the fields of the selection set, including the fragments' fields.
+
+    The selections skipped with the `@skip` and `@include` directives are omitted.
+    """
+    if selection_set is None:
+        return []
+    fields = []
+    for selection in selection_set.selections:
+        # Only the variable values of the context are used to evaluate the directives.
+        if not should_include_node(info, selection.directives):
+            continue
+        if isinstance(selection, FragmentSpread):
+            fragment = info.fragments[selection.name.value]
+            fields.extend(_get_selected_fields(fragment.selection_set, info))
+        elif isinstance(selection, InlineFragment):
+            fields.extend(_get_selected_fields(selection.selection_set, info))
+        else:
+            fields.append(selection)
+    return fields
+
+
+def get_requested_node_fields(info: "ResolveInfo") -> set[str]:
+    """Return the names of the fields requested for the nodes of the connection."""
+    node_fields = set()
+    for connection_field in info.field_asts:
+        for edges in _get_selected_fields(connection_field.selection_set, info):
+            if edges.name.value != "edges":
+                continue
+            for node in _get_selected_fields(edges.selection_set, info):
+                if node.name.value != "node":
+                    continue
+                node_fields.update(
+                    field.name.value
+                    for field in _get_selected_fields(node.selection_set, info)
+                )
+    return node_fields
+
+
+def _defer_unrequested_columns(
+    queryset: QuerySet, info: "ResolveInfo", connection_type, sort_by: dict
+) -> QuerySet:
+    """Defer the large columns that are not used by any requested node field.
+
+    The columns are declared with `deferrable_columns` of the node model type.
+    """
+    deferrable_columns = getattr(
+        connection_type._meta.node._meta, "deferrable_columns", None
+    )
+    if (
+        not deferrable_columns
+        or queryset._iterable_class is not ModelIterable
+        or queryset.query.combinator
+    ):
+        return queryset
+
+    requested_fields = get_requested_node_fields(info)
+    # The values of the sorting fields are read from the instances for the cursors.
+    sorting_fields = sort_by.get("field") or []
+    if not isinstance(sorting_fields, list):
+        sorting_fields = [sorting_fields]
+    columns = [
+        column
+        for column, fields in deferrable_columns.items()
+        if column not in sorting_fields and requested_fields.isdisjoint(fields)
+    ]
+    if not columns:
+        return queryset
+    return queryset.defer(*columns)
+
+
 def _is_first_or_last_required(info: "ResolveInfo") -> bool:
     """Disable `enforce_first_or_last` if not querying for `edges`."""
     selection_set = info.field_asts[0].selection_set
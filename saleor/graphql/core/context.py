@@ -11,6 +11,7 @@ from ...app.models import App
 
 if TYPE_CHECKING:
     from .dataloaders import DataLoader
+    from .profiler import RequestProfiler
 
 
 class SaleorContext(HttpRequest):
@@ -22,6 +23,7 @@ class SaleorContext(HttpRequest):
     user: User | None  # type: ignore[assignment]
     requestor: App | User | None
     request_time: datetime.datetime
+    resolver_profiler: "RequestProfiler | None" = None
 
     def __init__(self, *args, **kwargs):
         if "dataloaders" in kwargs:
@@ -1,11 +1,14 @@
 from collections import defaultdict
 from collections.abc import Iterable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
+from django.conf import settings
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
-from ...core.db.connection import allow_writer_in_context
+from ...core.db.connection import allow_writer_in_context, call_on_each_query
 from ...core.telemetry import saleor_attributes, tracer
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
@@ -16,10 +19,29 @@ K = TypeVar("K")
 R = TypeVar("R")
 
 
+@dataclass
+class DataLoaderStats:
+    """Usage of a dataloader during its lifetime in a single context."""
+
+    requested_keys: int = 0
+    batch_sizes: list[int] = field(default_factory=list)
+    # Counted only when `DATALOADER_STATS_ENABLED` is set.
+    queries: int = 0
+
+    @property
+    def loaded_keys(self) -> int:
+        return sum(self.batch_sizes)
+
+    @property
+    def cache_hits(self) -> int:
+        return self.requested_keys - self.loaded_keys
+
+
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key: str
     context: SaleorContext
     database_connection_name: str
+    stats: DataLoaderStats
 
     def __new__(cls, context: SaleorContext):
         key = cls.context_key
@@ -37,8 +59,13 @@ class DataLoader(BaseLoader, Generic[K, R]):
         if getattr(self, "context", None) != context:
             self.context = context
             self.database_connection_name = get_database_connection_name(context)
+            self.stats = DataLoaderStats()
             super().__init__()
 
+    def load(self, key=None):
+        self.stats.requested_keys += 1
+        return super().load(key)
+
     def batch_load_fn(  # pylint: disable=method-hidden
         self, keys: Iterable[K]
     ) -> Promise[list[R]]:
@@ -47,7 +74,18 @@ class DataLoader(BaseLoader, Generic[K, R]):
                 saleor_attributes.OPERATION_NAME, "dataloader.batch_load"
             )
 
-            with allow_writer_in_context(self.context):
+            keys = list(keys)
+            self.stats.batch_sizes.append(len(keys))
+            profiler = getattr(self.context, "resolver_profiler", None)
+            with (
+                allow_writer_in_context(self.context),
+                profiler.profile_dataloader(self.__class__.__name__, len(keys))
+                if profiler
+                else nullcontext(),
+                call_on_each_query(self._count_query)
+                if settings.DATALOADER_STATS_ENABLED
+                else nullcontext(),
+            ):
                 results = self.batch_load(keys)
 
             if not isinstance(results, Promise):
@@ -57,6 +95,9 @@ class DataLoader(BaseLoader, Generic[K, R]):
     def batch_load(self, keys: Iterable[K]) -> Promise[list[R]] | list[R]:
         raise NotImplementedError()
 
+    def _count_query(self):
+        self.stats.queries += 1
+
 
 class BaseThumbnailBySizeAndFormatLoader(
     DataLoader[tuple[int, int, str | None], Thumbnail]
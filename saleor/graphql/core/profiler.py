@@ -0,0 +1,144 @@
+import random
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+
+from ...core.db.connection import call_on_each_query
+
+if TYPE_CHECKING:
+    from . import SaleorContext
+
+PROFILER_HEADER = "saleor-profile"
+
+
+@dataclass
+class ResolverProfile:
+    calls: int = 0
+    duration: float = 0
+    queries: int = 0
+
+
+@dataclass
+class DataLoaderProfile:
+    batch_sizes: list[int] = field(default_factory=list)
+    duration: float = 0
+    queries: int = 0
+
+
+class RequestProfiler:
+    """Collect the statistics of the resolvers of a single GraphQL operation.
+
+    The resolvers are aggregated by `parent_type.field_name`. The duration is the
+    time spent in the resolver itself, the work done later in the dataloaders is
+    recorded per dataloader. SQL queries are attributed to the innermost resolver
+    or dataloader that is running when the query is executed.
+    """
+
+    def __init__(self, report: bool = False):
+        # Whether the report should be returned in the response extensions.
+        self.report = report
+        self.resolvers: defaultdict[tuple[str, str], ResolverProfile] = defaultdict(
+            ResolverProfile
+        )
+        self.dataloaders: defaultdict[str, DataLoaderProfile] = defaultdict(
+            DataLoaderProfile
+        )
+        self.queries = 0
+        self._stack: list[ResolverProfile | DataLoaderProfile] = []
+
+    @contextmanager
+    def profile_resolver(self, parent_type: str, field_name: str) -> Iterator[None]:
+        stats = self.resolvers[(parent_type, field_name)]
+        stats.calls += 1
+        with self._measure(stats):
+            yield
+
+    @contextmanager
+    def profile_dataloader(self, name: str, batch_size: int) -> Iterator[None]:
+        stats = self.dataloaders[name]
+        stats.batch_sizes.append(batch_size)
+        with self._measure(stats):
+            yield
+
+    def capture_queries(self):
+        return call_on_each_query(self._count_query)
+
+    @contextmanager
+    def _measure(self, stats: ResolverProfile | DataLoaderProfile) -> Iterator[None]:
+        self._stack.append(stats)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.duration += time.perf_counter() - start
+            self._stack.pop()
+
+    def _count_query(self):
+        self.queries += 1
+        if self._stack:
+            self._stack[-1].queries += 1
+
+    def get_report(self) -> dict[str, Any]:
+        resolvers = sorted(
+            self.resolvers.items(), key=lambda item: item[1].duration, reverse=True
+        )
+        dataloaders = sorted(
+            self.dataloaders.items(), key=lambda item: item[1].duration, reverse=True
+        )
+        return {
+            "queries": self.queries,
+            "resolvers": [
+                {
+                    "path": f"{parent_type}.{field_name}",
+                    "calls": stats.calls,
+                    "duration": round(stats.duration, 6),
+                    "queries": stats.queries,
+                }
+                for (parent_type, field_name), stats in resolvers
+            ],
+            "dataloaders": [
+                {
+                    "name": name,
+                    "batches": len(stats.batch_sizes),
+                    "keys": sum(stats.batch_sizes),
+                    "maxBatchSize": max(stats.batch_sizes),
+                    "duration": round(stats.duration, 6),
+                    "queries": stats.queries,
+                }
+                for name, stats in dataloaders
+            ],
+        }
+
+
+def get_request_profiler(context: "SaleorContext") -> RequestProfiler | None:
+    """Return the profiler for the request or None if it shouldn't be profiled.
+
+    Staff users can request the profiling with the `Saleor-Profile` header, the
+    report is then returned in the response extensions. Other requests are sampled
+    with `GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE` and recorded only as metrics.
+    """
+    if not settings.GRAPHQL_RESOLVER_PROFILER_ENABLED:
+        return None
+    if context.headers.get(PROFILER_HEADER, "").lower() in ("1", "true"):
+        user = context.user
+        if user and user.is_active and user.is_staff:
+            return RequestProfiler(report=True)
+    if random.random() < settings.GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE:
+        return RequestProfiler()
+    return None
+
+
+class ResolverProfilerMiddleware:
+    """Profile the resolvers of the requests that have a profiler in the context."""
+
+    def resolve(self, next_, root, info, **kwargs):
+        profiler = getattr(info.context, "resolver_profiler", None)
+        if profiler is None:
+            return next_(root, info, **kwargs)
+        with profiler.profile_resolver(info.parent_type.name, info.field_name):
+            return next_(root, info, **kwargs)
@@ -0,0 +1,126 @@
+import logging
+from unittest import mock
+
+from promise import Promise
+
+from ....channel.models import Channel
+from ...context import clear_context, get_context_value
+from ...metrics import (
+    METRIC_GRAPHQL_DATALOADER_EXCESSIVE_BATCHES,
+    record_dataloader_stats,
+)
+from ..dataloaders import DataLoader
+
+
+class ChannelSlugByIdLoader(DataLoader[int, str | None]):
+    context_key = "test_channel_slug_by_id"
+
+    def batch_load(self, keys):
+        channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
+        return [channels[key].slug if key in channels else None for key in keys]
+
+
+def _get_context(rf):
+    request = rf.get("/")
+    request.app = None
+    return get_context_value(request)
+
+
+def test_dataloader_stats(rf, channel_USD, channel_PLN, settings):
+    # given
+    settings.DATALOADER_STATS_ENABLED = True
+    context = _get_context(rf)
+    loader = ChannelSlugByIdLoader(context)
+
+    # when
+    # Loads issued from a promise callback are batched like during the execution.
+    Promise.resolve(None).then(
+        lambda _: loader.load_many([channel_USD.pk, channel_PLN.pk, channel_USD.pk])
+    ).get()
+    loader.load(channel_PLN.pk).get()
+
+    # then
+    stats = loader.stats
+    assert stats.requested_keys == 4
+    assert stats.batch_sizes == [2]
+    assert stats.loaded_keys == 2
+    assert stats.cache_hits == 2
+    assert stats.queries == 1
+
+
+def test_dataloader_stats_queries_not_counted_when_disabled(rf, channel_USD, settings):
+    # given
+    settings.DATALOADER_STATS_ENABLED = False
+    context = _get_context(rf)
+    loader = ChannelSlugByIdLoader(context)
+
+    # when
+    loader.load(channel_USD.pk).get()
+
+    # then
+    assert loader.stats.batch_sizes == [1]
+    assert loader.stats.queries == 0
+
+
+@mock.patch("saleor.graphql.metrics.meter.record")
+def test_record_dataloader_stats_detects_excessive_batches(
+    mocked_record, rf, channel_USD, channel_PLN, settings, caplog
+):
+    # given
+    settings.DATALOADER_MAX_BATCHES_PER_REQUEST = 1
+    context = _get_context(rf)
+    loader = ChannelSlugByIdLoader(context)
+    for channel in [channel_USD, channel_PLN]:
+        loader.load(channel.pk).get()
+
+    # when
+    with caplog.at_level(logging.WARNING):
+        record_dataloader_stats([loader])
+
+    # then
+    assert (
+        "Dataloader ChannelSlugByIdLoader dispatched 2 batches in a single request."
+        in caplog.text
+    )
+    recorded_metrics = [call.args[0] for call in mocked_record.call_args_list]
+    assert METRIC_GRAPHQL_DATALOADER_EXCESSIVE_BATCHES in recorded_metrics
+
+
+@mock.patch("saleor.graphql.metrics.meter.record")
+def test_record_dataloader_stats_within_limit(
+    mocked_record, rf, channel_USD, settings, caplog
+):
+    # given
+    settings.DATALOADER_MAX_BATCHES_PER_REQUEST = 1
+    context = _get_context(rf)
+    loader = ChannelSlugByIdLoader(context)
+    loader.load(channel_USD.pk).get()
+
+    # when
+    with caplog.at_level(logging.WARNING):
+        record_dataloader_stats([loader])
+
+    # then
+    assert not caplog.records
+    recorded_metrics = [call.args[0] for call in mocked_record.call_args_list]
+    assert METRIC_GRAPHQL_DATALOADER_EXCESSIVE_BATCHES not in recorded_metrics
+
+
+def test_clear_context_records_dataloader_stats(rf, channel_USD, settings):
+    # given
+    settings.DATALOADER_STATS_ENABLED = True
+    context = _get_context(rf)
+    loader = ChannelSlugByIdLoader(context)
+    loader.load(channel_USD.pk).get()
+    recorded_loaders = []
+
+    # when
+    with mock.patch(
+        "saleor.graphql.context.record_dataloader_stats",
+        side_effect=recorded_loaders.extend,
+    ):
+        clear_context(context)
+
+    # then
+    assert recorded_loaders == [loader]
+    assert context.dataloaders == {}
@@ -0,0 +1,114 @@
+from unittest import mock
+
+import pytest
+
+from ...tests.utils import get_graphql_content
+from ..profiler import RequestProfiler
+
+PROFILER_MIDDLEWARE = "saleor.graphql.core.profiler.ResolverProfilerMiddleware"
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    thumbnail {
+                        url
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def resolver_profiler_settings(settings):
+    settings.GRAPHQL_RESOLVER_PROFILER_ENABLED = True
+    settings.GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE = 0
+    settings.GRAPHQL_MIDDLEWARE = [PROFILER_MIDDLEWARE]
+    return settings
+
+
+def test_profiler_report_for_staff_user(
+    staff_api_client, product_list, channel_USD, resolver_profiler_settings
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS, variables, HTTP_SALEOR_PROFILE="true"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    report = content["extensions"]["profiler"]
+    assert report["queries"] > 0
+    resolvers = {resolver["path"]: resolver for resolver in report["resolvers"]}
+    assert resolvers["Query.products"]["calls"] == 1
+    assert resolvers["Query.products"]["queries"] > 0
+    assert resolvers["Product.name"]["calls"] == len(product_list)
+    dataloaders = {loader["name"]: loader for loader in report["dataloaders"]}
+    media_loader = dataloaders["MediaByProductIdLoader"]
+    assert media_loader["batches"] == 1
+    assert media_loader["keys"] == len(product_list)
+    assert media_loader["queries"] > 0
+
+
+def test_profiler_report_not_returned_for_customer(
+    user_api_client, product_list, channel_USD, resolver_profiler_settings
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(
+        QUERY_PRODUCTS, variables, HTTP_SALEOR_PROFILE="true"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "profiler" not in content.get("extensions", {})
+
+
+def test_profiler_disabled(
+    staff_api_client, product_list, channel_USD, resolver_profiler_settings
+):
+    # given
+    resolver_profiler_settings.GRAPHQL_RESOLVER_PROFILER_ENABLED = False
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS, variables, HTTP_SALEOR_PROFILE="true"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "profiler" not in content.get("extensions", {})
+
+
+@mock.patch("saleor.graphql.views.record_graphql_resolver_profile")
+def test_profiler_sampled_request_recorded_as_metrics(
+    mocked_record_profile,
+    api_client,
+    product_list,
+    channel_USD,
+    resolver_profiler_settings,
+):
+    # given
+    resolver_profiler_settings.GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE = 1
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert "profiler" not in content.get("extensions", {})
+    mocked_record_profile.assert_called_once()
+    profiler = mocked_record_profile.call_args.args[0]
+    assert isinstance(profiler, RequestProfiler)
+    assert profiler.resolvers[("Query", "products")].calls == 1
@@ -12,6 +12,7 @@ from graphql.execution.base import ExecutionResult
 from .... import __version__ as saleor_version
 from ....graphql.api import backend, schema
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ...context import get_context_value as context_get_context_value
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
 from ...views import GraphQLView, generate_cache_key
@@ -383,6 +384,117 @@ def test_graphql_view_clears_context(rf, staff_user, product, channel_USD):
     assert request.dataloaders == {}
 
 
+BATCH_PRODUCT_QUERY = """
+    query GetProduct($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            name
+            category {
+                name
+            }
+        }
+    }
+"""
+
+BATCH_VERIFY_TOKEN_MUTATION = """
+    mutation {
+        tokenVerify(token: "invalid") {
+            isValid
+        }
+    }
+"""
+
+
+def _execute_batch_recording_dataloaders(rf, staff_user, data):
+    request = rf.post(path="/", data=data, content_type="application/json")
+    request.app = None
+    request.user = staff_user
+    dataloaders_sizes = []
+
+    def get_context_value(request):
+        dataloaders_sizes.append(len(getattr(request, "dataloaders", {})))
+        return context_get_context_value(request)
+
+    view = GraphQLView.as_view(backend=backend, schema=schema)
+    with patch("saleor.graphql.views.get_context_value", side_effect=get_context_value):
+        response = view(request)
+    return request, response, dataloaders_sizes
+
+
+def test_graphql_view_batch_shares_dataloaders_between_queries(
+    rf, staff_user, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_SHARE_DATALOADERS = True
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    data = [{"query": BATCH_PRODUCT_QUERY, "variables": variables}] * 2
+
+    # when
+    request, response, dataloaders_sizes = _execute_batch_recording_dataloaders(
+        rf, staff_user, data
+    )
+
+    # then
+    content = json.loads(response.content)
+    assert [result["data"]["product"]["name"] for result in content] == [
+        product.name
+    ] * 2
+    assert dataloaders_sizes[0] == 0
+    assert dataloaders_sizes[1] > 0
+    assert request.dataloaders == {}
+
+
+def test_graphql_view_batch_does_not_share_dataloaders_by_default(
+    rf, staff_user, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_SHARE_DATALOADERS = False
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    data = [{"query": BATCH_PRODUCT_QUERY, "variables": variables}] * 2
+
+    # when
+    request, _, dataloaders_sizes = _execute_batch_recording_dataloaders(
+        rf, staff_user, data
+    )
+
+    # then
+    assert dataloaders_sizes == [0, 0]
+    assert request.dataloaders == {}
+
+
+def test_graphql_view_batch_does_not_share_dataloaders_with_mutations(
+    rf, staff_user, product, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_SHARE_DATALOADERS = True
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    data = [
+        {"query": BATCH_PRODUCT_QUERY, "variables": variables},
+        {"query": BATCH_VERIFY_TOKEN_MUTATION},
+        {"query": BATCH_PRODUCT_QUERY, "variables": variables},
+    ]
+
+    # when
+    request, response, dataloaders_sizes = _execute_batch_recording_dataloaders(
+        rf, staff_user, data
+    )
+
+    # then
+    content = json.loads(response.content)
+    assert content[1]["data"]["tokenVerify"]["isValid"] is False
+    assert content[2]["data"]["product"]["name"] == product.name
+    assert dataloaders_sizes == [0, 0, 0]
+    assert request.dataloaders == {}
+
+
 @pytest.mark.parametrize(
     ("public_url", "expected_url_base"),
     [
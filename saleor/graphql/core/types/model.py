@@ -11,6 +11,10 @@ from .base import BaseObjectType
 
 class ModelObjectOptions(ObjectTypeOptions):
     model = None
+    # Large model columns that can be deferred in the connection querysets, mapped
+    # to the GraphQL fields that read them. A column is deferred when none of its
+    # fields is requested.
+    deferrable_columns: dict[str, list[str]] | None = None
 
 
 MT = TypeVar("MT", bound=Model)
@@ -25,11 +29,15 @@ class ModelObjectType(Generic[MT], BaseObjectType):
         default_resolver=None,
         _meta=None,
         doc_category=None,
+        deferrable_columns=None,
         **options,
     ):
         if not _meta:
             _meta = ModelObjectOptions(cls)
 
+        if deferrable_columns is not None:
+            _meta.deferrable_columns = deferrable_columns
+
         if not getattr(_meta, "model", None):
             if not options.get("model"):
                 raise ValueError(
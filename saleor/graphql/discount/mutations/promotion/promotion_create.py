@@ -10,6 +10,7 @@ from graphql.error import GraphQLError
 
 from .....channel import models as channel_models
 from .....discount import PromotionType, events, models
+from .....discount.utils.promotion import schedule_promotion_toggle
 from .....permission.enums import DiscountPermissions
 from .....plugins.manager import PluginsManager
 from .....webhook.event_types import WebhookEventAsyncType
@@ -262,6 +263,7 @@ class PromotionCreate(DeprecatedModelMutation):
         cls.call_event(manager.promotion_created, instance)
         if has_started:
             cls.send_promotion_started_webhook(manager, instance)
+        cls.call_event(schedule_promotion_toggle, instance)
 
     @classmethod
     def has_started(cls, instance: models.Promotion) -> bool:
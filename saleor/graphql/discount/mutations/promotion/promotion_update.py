@@ -5,7 +5,10 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from .....discount import PromotionType, events, models
-from .....discount.utils.promotion import mark_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    mark_catalogue_promotion_rules_as_dirty,
+    schedule_promotion_toggle,
+)
 from .....permission.enums import DiscountPermissions
 from .....plugins.manager import PluginsManager
 from .....webhook.event_types import WebhookEventAsyncType
@@ -102,6 +105,8 @@ class PromotionUpdate(DeprecatedModelMutation):
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.promotion_updated, instance)
         cls.send_promotion_toggle_webhook(manager, instance, toggle_type)
+        if "start_date" in cleaned_input or "end_date" in cleaned_input:
+            cls.call_event(schedule_promotion_toggle, instance)
 
         # update the product undiscounted prices for promotion only when
         # start or end date has changed
@@ -7,7 +7,10 @@ from .....core.tracing import traced_atomic_transaction
 from .....discount import PromotionType, models
 from .....discount.error_codes import DiscountErrorCode
 from .....discount.models import Promotion
-from .....discount.utils.promotion import mark_catalogue_promotion_rules_as_dirty
+from .....discount.utils.promotion import (
+    mark_catalogue_promotion_rules_as_dirty,
+    schedule_promotion_toggle,
+)
 from .....permission.enums import DiscountPermissions
 from .....webhook.event_types import WebhookEventAsyncType
 from ....channel import ChannelContext
@@ -123,6 +126,7 @@ class SaleCreate(DeprecatedModelMutation):
             manager = get_plugin_manager_promise(info.context).get()
             cls.send_sale_notifications(manager, promotion, predicate)
             cls.call_event(mark_catalogue_promotion_rules_as_dirty, [promotion.pk])
+            cls.call_event(schedule_promotion_toggle, promotion)
         return response
 
     @classmethod
@@ -7,7 +7,7 @@ from django.db.models import Exists, OuterRef
 from .....core.tracing import traced_atomic_transaction
 from .....discount import models
 from .....discount.error_codes import DiscountErrorCode
-from .....discount.utils.promotion import CATALOGUE_FIELDS
+from .....discount.utils.promotion import CATALOGUE_FIELDS, schedule_promotion_toggle
 from .....permission.enums import DiscountPermissions
 from .....product import models as product_models
 from .....product.utils.product import mark_products_in_channels_as_dirty
@@ -180,6 +180,8 @@ class SaleUpdate(DeprecatedModelMutation):
             current_catalogue,
             previous_end_date,
         )
+        if "start_date" in input.keys() or "end_date" in input.keys():
+            cls.call_event(schedule_promotion_toggle, promotion)
         if any(
             field in input.keys()
             for field in [*CATALOGUE_FIELDS, "start_date", "end_date", "type"]
@@ -2,7 +2,12 @@ import graphene
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
-from .....core.utils.promo_code import generate_promo_code, is_available_promo_code
+from .....core.utils.promo_code import (
+    generate_promo_code,
+    generate_promo_codes,
+    get_used_promo_codes,
+    is_available_promo_code,
+)
 from .....discount import models
 from .....discount.error_codes import DiscountErrorCode
 from .....permission.enums import DiscountPermissions
@@ -164,17 +169,9 @@ class VoucherCreate(DeprecatedModelMutation):
                 }
             )
 
-        existing_codes = []
-        clean_add_codes = []
-        for code in data.add_codes:
-            cleaned_code = code.strip() if code else None
-
-            if not cleaned_code:
-                cleaned_code = generate_promo_code()
-            elif not is_available_promo_code(cleaned_code):
-                existing_codes.append(cleaned_code)
-
-            clean_add_codes.append(cleaned_code)
+        clean_add_codes = [code.strip() if code else None for code in data.add_codes]
+        used_codes = get_used_promo_codes(code for code in clean_add_codes if code)
+        existing_codes = [code for code in clean_add_codes if code in used_codes]
 
         if existing_codes:
             raise ValidationError(
@@ -187,7 +184,10 @@ class VoucherCreate(DeprecatedModelMutation):
                 }
             )
 
-        data["add_codes"] = clean_add_codes
+        generated_codes = iter(
+            generate_promo_codes(sum(1 for code in clean_add_codes if not code))
+        )
+        data["add_codes"] = [code or next(generated_codes) for code in clean_add_codes]
 
     @classmethod
     def clean_codes(cls, data):
@@ -363,3 +363,30 @@ def test_promotion_update_events(
     assert PromotionEvent.objects.count() == event_count + 2
     assert PromotionEvents.PROMOTION_UPDATED.upper() in event_types
     assert PromotionEvents.PROMOTION_STARTED.upper() in event_types
+
+
+@freeze_time("2020-03-18 12:00:00")
+@patch("saleor.discount.tasks.handle_promotion_toggle_at_date_task.apply_async")
+def test_promotion_update_schedules_toggle_at_start_date(
+    mocked_apply_async,
+    staff_api_client,
+    permission_group_manage_discounts,
+    catalogue_promotion,
+):
+    # given
+    promotion = catalogue_promotion
+    permission_group_manage_discounts.user_set.add(staff_api_client.user)
+    start_date = timezone.now() + datetime.timedelta(minutes=30)
+
+    variables = {
+        "id": graphene.Node.to_global_id("Promotion", promotion.id),
+        "input": {"startDate": start_date.isoformat()},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(PROMOTION_UPDATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["promotionUpdate"]["errors"]
+    mocked_apply_async.assert_called_once_with(args=[str(promotion.pk)], eta=start_date)
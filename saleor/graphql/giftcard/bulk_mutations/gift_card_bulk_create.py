@@ -5,7 +5,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from ....core.tracing import traced_atomic_transaction
-from ....core.utils.promo_code import generate_promo_code
+from ....core.utils.promo_code import PROMO_CODE_BATCH_SIZE, generate_promo_codes
 from ....core.utils.validators import is_date_in_future
 from ....giftcard import events, models
 from ....giftcard.error_codes import GiftCardErrorCode
@@ -152,9 +152,10 @@ class GiftCardBulkCreate(BaseMutation):
         app = get_app_promise(info.context).get()
         gift_cards = models.GiftCard.objects.bulk_create(
             [
-                models.GiftCard(code=generate_promo_code(), **cleaned_input)
-                for _ in range(count)
-            ]
+                models.GiftCard(code=code, **cleaned_input)
+                for code in generate_promo_codes(count)
+            ],
+            batch_size=PROMO_CODE_BATCH_SIZE,
         )
         events.gift_cards_issued_event(gift_cards, info.context.user, app, balance)
         return gift_cards
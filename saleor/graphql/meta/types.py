@@ -32,6 +32,14 @@ class Metadata(GenericScalar):
     """
 
 
+# Metadata columns of `ModelWithMetadata` mapped to the `ObjectWithMetadata` fields
+# reading them, to be used in the `deferrable_columns` of the model object types.
+METADATA_DEFERRABLE_COLUMNS = {
+    "metadata": ["metadata", "metafield", "metafields"],
+    "private_metadata": ["privateMetadata", "privateMetafield", "privateMetafields"],
+}
+
+
 def _filter_metadata(metadata, keys):
     if keys is None:
         return metadata
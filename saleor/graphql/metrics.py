@@ -1,5 +1,9 @@
+import logging
+from collections.abc import Iterable
 from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING
 
+from django.conf import settings
 from opentelemetry.semconv._incubating.attributes import graphql_attributes
 from opentelemetry.semconv.attributes import error_attributes
 from opentelemetry.util.types import AttributeValue
@@ -13,6 +17,12 @@ from ..core.telemetry import (
     saleor_attributes,
 )
 
+if TYPE_CHECKING:
+    from .core.dataloaders import DataLoader
+    from .core.profiler import RequestProfiler
+
+logger = logging.getLogger(__name__)
+
 # Initialize metrics
 METRIC_GRAPHQL_QUERY_COUNT = meter.create_metric(
     "saleor.graphql.operation.count",
@@ -75,6 +85,90 @@ METRIC_REQUEST_DURATION = meter.create_metric(
     bucket_boundaries=DEFAULT_DURATION_BUCKETS,
 )
 
+METRIC_GRAPHQL_RESOLVER_CALLS = meter.create_metric(
+    "saleor.graphql.resolver.calls",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.CALL,
+    description="Number of calls of GraphQL field resolvers in profiled requests.",
+)
+
+METRIC_GRAPHQL_RESOLVER_DURATION = meter.create_metric(
+    "saleor.graphql.resolver.duration",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time spent in a GraphQL field resolver in a profiled request.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+METRIC_GRAPHQL_RESOLVER_DB_QUERIES = meter.create_metric(
+    "saleor.graphql.resolver.db_queries",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.QUERY,
+    description="Number of SQL queries of GraphQL field resolvers in profiled requests.",
+)
+
+DATALOADER_KEYS_BUCKETS = [0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+DATALOADER_BATCHES_BUCKETS = [0, 1, 2, 3, 5, 10, 20, 50, 100]
+
+METRIC_GRAPHQL_DATALOADER_BATCH_SIZE = meter.create_metric(
+    "saleor.graphql.dataloader.batch_size",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.KEY,
+    description="Number of keys in a dataloader batch.",
+    bucket_boundaries=DATALOADER_KEYS_BUCKETS,
+)
+
+METRIC_GRAPHQL_DATALOADER_BATCHES = meter.create_metric(
+    "saleor.graphql.dataloader.batches",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.BATCH,
+    description="Number of batches dispatched by a dataloader in a request.",
+    bucket_boundaries=DATALOADER_BATCHES_BUCKETS,
+)
+
+METRIC_GRAPHQL_DATALOADER_REQUESTED_KEYS = meter.create_metric(
+    "saleor.graphql.dataloader.requested_keys",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.KEY,
+    description="Number of keys requested from a dataloader in a request.",
+    bucket_boundaries=DATALOADER_KEYS_BUCKETS,
+)
+
+METRIC_GRAPHQL_DATALOADER_CACHE_HITS = meter.create_metric(
+    "saleor.graphql.dataloader.cache_hits",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.KEY,
+    description="Number of keys served from a dataloader cache in a request.",
+    bucket_boundaries=DATALOADER_KEYS_BUCKETS,
+)
+
+METRIC_GRAPHQL_DATALOADER_DB_QUERIES = meter.create_metric(
+    "saleor.graphql.dataloader.db_queries",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.QUERY,
+    description="Number of SQL queries executed by a dataloader in a request.",
+    bucket_boundaries=DATALOADER_BATCHES_BUCKETS,
+)
+
+METRIC_GRAPHQL_DATALOADER_EXCESSIVE_BATCHES = meter.create_metric(
+    "saleor.graphql.dataloader.excessive_batches",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description=(
+        "Number of requests in which a dataloader dispatched more batches than "
+        "allowed by DATALOADER_MAX_BATCHES_PER_REQUEST."
+    ),
+)
+
 
 # Helper functions
 def record_graphql_query_count(
@@ -134,3 +228,92 @@ def record_request_count(
 def record_request_duration() -> AbstractContextManager[dict[str, AttributeValue]]:
     attributes: dict[str, AttributeValue] = {}
     return meter.record_duration(METRIC_REQUEST_DURATION, attributes=attributes)
+
+
+def record_graphql_resolver_profile(profiler: "RequestProfiler") -> None:
+    for (parent_type, field_name), stats in profiler.resolvers.items():
+        attributes = {
+            saleor_attributes.GRAPHQL_PARENT_TYPE: parent_type,
+            saleor_attributes.GRAPHQL_FIELD_NAME: field_name,
+        }
+        meter.record(
+            METRIC_GRAPHQL_RESOLVER_CALLS, stats.calls, Unit.CALL, attributes=attributes
+        )
+        meter.record(
+            METRIC_GRAPHQL_RESOLVER_DURATION,
+            stats.duration,
+            Unit.SECOND,
+            attributes=attributes,
+        )
+        meter.record(
+            METRIC_GRAPHQL_RESOLVER_DB_QUERIES,
+            stats.queries,
+            Unit.QUERY,
+            attributes=attributes,
+        )
+
+
+def record_dataloader_stats(dataloaders: Iterable["DataLoader"]) -> None:
+    """Record the usage of the dataloaders of a single request.
+
+    A dataloader dispatching more than `DATALOADER_MAX_BATCHES_PER_REQUEST`
+    batches is reported as it is most likely called in a loop, instead of
+    batching the keys.
+    """
+    for dataloader in dataloaders:
+        stats = dataloader.stats
+        if not stats.requested_keys:
+            continue
+        name = dataloader.__class__.__name__
+        attributes = {saleor_attributes.GRAPHQL_DATALOADER_NAME: name}
+        batches = len(stats.batch_sizes)
+        meter.record(
+            METRIC_GRAPHQL_DATALOADER_BATCHES,
+            batches,
+            Unit.BATCH,
+            attributes=attributes,
+        )
+        meter.record(
+            METRIC_GRAPHQL_DATALOADER_REQUESTED_KEYS,
+            stats.requested_keys,
+            Unit.KEY,
+            attributes=attributes,
+        )
+        meter.record(
+            METRIC_GRAPHQL_DATALOADER_CACHE_HITS,
+            stats.cache_hits,
+            Unit.KEY,
+            attributes=attributes,
+        )
+        meter.record(
+            METRIC_GRAPHQL_DATALOADER_DB_QUERIES,
+            stats.queries,
+            Unit.QUERY,
+            attributes=attributes,
+        )
+        for batch_size in stats.batch_sizes:
+            meter.record(
+                METRIC_GRAPHQL_DATALOADER_BATCH_SIZE,
+                batch_size,
+                Unit.KEY,
+                attributes=attributes,
+            )
+        if batches > settings.DATALOADER_MAX_BATCHES_PER_REQUEST:
+            logger.warning(
+                "Dataloader %s dispatched %s batches in a single request.",
+                name,
+                batches,
+                extra={
+                    "dataloader": name,
+                    "batches": batches,
+                    "requested_keys": stats.requested_keys,
+                    "loaded_keys": stats.loaded_keys,
+                    "db_queries": stats.queries,
+                },
+            )
+            meter.record(
+                METRIC_GRAPHQL_DATALOADER_EXCESSIVE_BATCHES,
+                1,
+                Unit.REQUEST,
+                attributes=attributes,
+            )
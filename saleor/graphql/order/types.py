@@ -1846,6 +1846,12 @@ class Order(SyncWebhookControlContextModelObjectType[ModelObjectType[models.Orde
         description = "Represents an order in the shop."
         interfaces = [relay.Node, ObjectWithMetadata]
         model = models.Order
+        # Only the search columns, the remaining ones are used by the order
+        # calculations and webhook payloads triggered by the resolvers.
+        deferrable_columns = {
+            "search_document": [],
+            "search_vector": [],
+        }
 
     @staticmethod
     def resolve_created(root: SyncWebhookControlContext[models.Order], _info):
@@ -13,6 +13,7 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
+from ....product.utils.price_ranges import invalidate_products_price_ranges
 from ....warehouse import models as warehouse_models
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -934,6 +935,7 @@ class ProductVariantBulkCreate(BaseMutation):
         )
         # This will finally recalculate discounted prices for products.
         cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+        invalidate_products_price_ranges([product.pk])
 
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
@@ -18,6 +18,8 @@ from ....order.tasks import recalculate_orders_task
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.search import prepare_product_search_vector_value
+from ....product.utils.attributes import update_products_attribute_value_ids
+from ....product.utils.price_ranges import invalidate_products_price_ranges
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...app.dataloaders import get_app_promise
@@ -63,6 +65,7 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
         cls.call_event(
             mark_active_catalogue_promotion_rules_as_dirty, impacted_channels
         )
+        invalidate_products_price_ranges(variant.product_id for variant in variants)
 
         manager = get_plugin_manager_promise(info.context).get()
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_DELETED)
@@ -118,6 +121,7 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
                 product_pks, pks
             )
             response = super().perform_mutation(_root, info, ids=ids, **data)
+            update_products_attribute_value_ids(product_pks)
 
             # delete order lines for deleted variants, they are ordered by Meta
             order_lines_qs_select_for_update().filter(
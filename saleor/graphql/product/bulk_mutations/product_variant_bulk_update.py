@@ -12,8 +12,10 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
+from ....product.utils.price_ranges import invalidate_products_price_ranges
 from ....warehouse import models as warehouse_models
 from ....warehouse.management import delete_stocks, stock_bulk_update
+from ....warehouse.variant_availability import invalidate_variants_availability
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.utils import AttributeAssignmentMixin
@@ -724,6 +726,9 @@ class ProductVariantBulkUpdate(BaseMutation):
             warehouse_models.Stock.objects.bulk_create(
                 stocks_to_create, ignore_conflicts=True
             )
+        invalidate_variants_availability(
+            stock.product_variant_id for stock in stocks_to_create
+        )
         if stocks_to_update:
             stock_bulk_update(stocks_to_update, ["quantity"])
 
@@ -767,6 +772,7 @@ class ProductVariantBulkUpdate(BaseMutation):
             cls.call_event(
                 mark_active_catalogue_promotion_rules_as_dirty, impacted_channel_ids
             )
+        invalidate_products_price_ranges([product.pk])
         manager = get_plugin_manager_promise(info.context).get()
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
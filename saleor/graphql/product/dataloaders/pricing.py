@@ -0,0 +1,250 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from promise import Promise
+
+from ....channel.models import Channel
+from ....product.models import ProductChannelListing
+from ....product.utils.availability import (
+    ProductPriceRanges,
+    get_product_availability_from_price_ranges,
+    get_product_price_ranges,
+)
+from ....product.utils.price_ranges import get_products_price_ranges
+from ....tax.utils import (
+    get_display_gross_prices,
+    get_tax_calculation_strategy,
+    get_tax_rate_for_country,
+)
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...core.dataloaders import DataLoader
+from ...tax.dataloaders import (
+    TaxClassCountryRateByTaxClassIDLoader,
+    TaxClassDefaultRateByCountryLoader,
+    TaxClassIdByProductIdLoader,
+    TaxConfigurationByChannelId,
+    TaxConfigurationPerCountryByTaxConfigurationIDLoader,
+)
+from .products import (
+    ProductChannelListingByProductIdAndChannelSlugLoader,
+    VariantsChannelListingByProductIdAndChannelSlugLoader,
+)
+
+# Country code None stands for the default country of the channel.
+ProductIdChannelSlugAndCountryCode = tuple[int, str, str | None]
+
+
+class ProductPricingByProductIdChannelSlugAndCountryCodeLoader(
+    DataLoader[ProductIdChannelSlugAndCountryCode, dict[str, Any] | None]
+):
+    """Return the values of `ProductPricingInfo` for the given keys.
+
+    All inputs of the pricing are loaded for the whole batch in three rounds of
+    dataloaders, instead of a chain of promises for every single product.
+    When `PRODUCT_PRICE_RANGE_TABLE_ENABLED` is set, the price ranges stored in
+    the `ProductPriceRange` table are used for the listings not marked as dirty,
+    and the variant listings are loaded only for the remaining products. The
+    missing ranges are calculated without being stored.
+    """
+
+    context_key = "product_pricing_by_product_id_channel_slug_and_country_code"
+
+    def batch_load(self, keys: Iterable[ProductIdChannelSlugAndCountryCode]):
+        keys = list(keys)
+        product_channel_keys = [(product_id, slug) for product_id, slug, _ in keys]
+        product_ids = list({product_id for product_id, _, _ in keys})
+        channel_slugs = list({slug for _, slug, _ in keys})
+
+        channels = ChannelBySlugLoader(self.context).load_many(channel_slugs)
+        product_channel_listings = ProductChannelListingByProductIdAndChannelSlugLoader(
+            self.context
+        ).load_many(product_channel_keys)
+        tax_class_ids = TaxClassIdByProductIdLoader(self.context).load_many(product_ids)
+
+        def load_tax_data(data):
+            channels, product_channel_listings, tax_class_ids = data
+            channel_by_slug = dict(zip(channel_slugs, channels, strict=True))
+            tax_class_id_by_product_id = dict(
+                zip(product_ids, tax_class_ids, strict=True)
+            )
+            country_codes = [
+                country_code or channel_by_slug[slug].default_country.code
+                for _, slug, country_code in keys
+            ]
+            stored_price_ranges = {}
+            if settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED:
+                stored_price_ranges = self.get_stored_price_ranges(
+                    keys,
+                    country_codes,
+                    product_channel_listings,
+                    channel_by_slug,
+                    tax_class_id_by_product_id,
+                )
+            keys_to_calculate = list(
+                {
+                    (product_id, slug)
+                    for (product_id, slug, _), country_code in zip(
+                        keys, country_codes, strict=True
+                    )
+                    if (product_id, slug, country_code) not in stored_price_ranges
+                }
+            )
+            channel_ids = list({channel.id for channel in channels})
+            used_tax_class_ids = list(
+                {tax_class_id for tax_class_id in tax_class_ids if tax_class_id}
+            )
+            unique_country_codes = list(set(country_codes))
+
+            variants_channel_listings = (
+                VariantsChannelListingByProductIdAndChannelSlugLoader(
+                    self.context
+                ).load_many(keys_to_calculate)
+            )
+            tax_configs = TaxConfigurationByChannelId(self.context).load_many(
+                channel_ids
+            )
+            country_rates = TaxClassCountryRateByTaxClassIDLoader(
+                self.context
+            ).load_many(used_tax_class_ids)
+            default_rates = TaxClassDefaultRateByCountryLoader(self.context).load_many(
+                unique_country_codes
+            )
+
+            def load_tax_configs_per_country(data):
+                (
+                    variants_channel_listings,
+                    tax_configs,
+                    country_rates,
+                    default_rates,
+                ) = data
+                tax_configs_per_country = (
+                    TaxConfigurationPerCountryByTaxConfigurationIDLoader(
+                        self.context
+                    ).load_many([tax_config.id for tax_config in tax_configs])
+                )
+
+                def calculate_pricing(tax_configs_per_country):
+                    variants_channel_listing_map = dict(
+                        zip(keys_to_calculate, variants_channel_listings, strict=True)
+                    )
+                    tax_config_by_channel_id = dict(
+                        zip(channel_ids, tax_configs, strict=True)
+                    )
+                    country_config_by_tax_config_id_and_country = {
+                        (tax_config.id, country_config.country.code): country_config
+                        for tax_config, country_configs in zip(
+                            tax_configs, tax_configs_per_country, strict=True
+                        )
+                        for country_config in country_configs
+                    }
+                    rates_by_tax_class_id = dict(
+                        zip(used_tax_class_ids, country_rates, strict=True)
+                    )
+                    default_rate_by_country_code = {
+                        country_code: default_rate.rate
+                        for country_code, default_rate in zip(
+                            unique_country_codes, default_rates, strict=True
+                        )
+                        if default_rate
+                    }
+
+                    results = []
+                    for key, country_code, product_listing in zip(
+                        keys, country_codes, product_channel_listings, strict=True
+                    ):
+                        product_id, slug, _ = key
+                        channel = channel_by_slug[slug]
+                        tax_config = tax_config_by_channel_id[channel.id]
+                        tax_config_country = (
+                            country_config_by_tax_config_id_and_country.get(
+                                (tax_config.id, country_code)
+                            )
+                        )
+                        price_ranges = stored_price_ranges.get(
+                            (product_id, slug, country_code)
+                        )
+                        if price_ranges is None:
+                            variants_listing = variants_channel_listing_map[
+                                (product_id, slug)
+                            ]
+                            if not variants_listing:
+                                results.append(None)
+                                continue
+                            tax_class_id = tax_class_id_by_product_id[product_id]
+                            tax_rate = get_tax_rate_for_country(
+                                rates_by_tax_class_id.get(tax_class_id, []),
+                                default_rate_by_country_code.get(
+                                    country_code, Decimal(0)
+                                ),
+                                country_code,
+                            )
+                            price_ranges = get_product_price_ranges(
+                                variants_channel_listing=variants_listing,
+                                prices_entered_with_tax=tax_config.prices_entered_with_tax,
+                                tax_calculation_strategy=get_tax_calculation_strategy(
+                                    tax_config, tax_config_country
+                                ),
+                                tax_rate=tax_rate,
+                            )
+
+                        availability = get_product_availability_from_price_ranges(
+                            product_channel_listing=product_listing,
+                            price_ranges=price_ranges,
+                        )
+                        pricing_info = vars(availability).copy()
+                        pricing_info["display_gross_prices"] = get_display_gross_prices(
+                            tax_config, tax_config_country
+                        )
+                        results.append(pricing_info)
+                    return results
+
+                return tax_configs_per_country.then(calculate_pricing)
+
+            return Promise.all(
+                [variants_channel_listings, tax_configs, country_rates, default_rates]
+            ).then(load_tax_configs_per_country)
+
+        return Promise.all([channels, product_channel_listings, tax_class_ids]).then(
+            load_tax_data
+        )
+
+    def get_stored_price_ranges(
+        self,
+        keys: list[ProductIdChannelSlugAndCountryCode],
+        country_codes: list[str],
+        product_channel_listings: list[ProductChannelListing | None],
+        channel_by_slug: dict[str, Channel],
+        tax_class_id_by_product_id: dict[int, int | None],
+    ) -> dict[ProductIdChannelSlugAndCountryCode, ProductPriceRanges]:
+        product_ids_by_channel_slug_and_country: defaultdict[
+            tuple[str, str], set[int]
+        ] = defaultdict(set)
+        for (product_id, slug, _), country_code, product_listing in zip(
+            keys, country_codes, product_channel_listings, strict=True
+        ):
+            # the stored ranges of dirty listings are waiting for recalculation
+            if product_listing is None or product_listing.price_range_dirty:
+                continue
+            product_ids_by_channel_slug_and_country[(slug, country_code)].add(
+                product_id
+            )
+
+        stored_price_ranges = {}
+        for (
+            slug,
+            country_code,
+        ), product_ids in product_ids_by_channel_slug_and_country.items():
+            rows = get_products_price_ranges(
+                product_ids,
+                channel_by_slug[slug].id,
+                country_code,
+                self.database_connection_name,
+            )
+            for product_id, (tax_class_id, price_ranges) in rows.items():
+                # skip the rows calculated before the tax class was changed
+                if tax_class_id == tax_class_id_by_product_id[product_id]:
+                    stored_price_ranges[(product_id, slug, country_code)] = price_ranges
+        return stored_price_ranges
@@ -5,6 +5,7 @@ from typing import TypedDict
 
 import django_filters
 import graphene
+from django.conf import settings
 from django.db.models import Exists, FloatField, OuterRef, Q, Subquery, Sum
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.fields import IntegerField
@@ -32,6 +33,10 @@ from ...product.models import (
     ProductVariantChannelListing,
 )
 from ...product.search import search_products
+from ...product.utils.attributes import (
+    get_attribute_slug_pk_map,
+    get_products_attribute_values_filter,
+)
 from ...warehouse.models import Allocation, Reservation, Stock, Warehouse
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -100,24 +105,29 @@ def _clean_product_attributes_filter_input(
         attribute_slugs.append(attr_slug)
         values.extend(field_value)
 
-    attributes_slug_pk_map: dict[str, int] = {}
-    attributes_pk_slug_map: dict[int, str] = {}
-    attributes = Attribute.objects.using(database_connection_name).filter(
-        slug__in=attribute_slugs
-    )
-    for attr_slug, attr_pk in attributes.values_list("slug", "id"):
-        attributes_slug_pk_map[attr_slug] = attr_pk
-        attributes_pk_slug_map[attr_pk] = attr_slug
+    if settings.PRODUCT_ATTRIBUTE_VALUE_IDS_FILTER_ENABLED:
+        attributes_slug_pk_map = get_attribute_slug_pk_map(
+            attribute_slugs, database_connection_name
+        )
+    else:
+        attributes_slug_pk_map = dict(
+            Attribute.objects.using(database_connection_name)
+            .filter(slug__in=attribute_slugs)
+            .values_list("slug", "id")
+        )
+    attributes_pk_slug_map = {
+        attr_pk: attr_slug for attr_slug, attr_pk in attributes_slug_pk_map.items()
+    }
 
     values_map = _populate_value_map(
-        database_connection_name, field, values, attributes, attributes_pk_slug_map
+        database_connection_name, field, values, attributes_pk_slug_map
     )
 
     _update_queries(queries, filter_values, attributes_slug_pk_map, values_map)
 
 
 def _populate_value_map(
-    database_connection_name, field, values, attribute_qs, attributes_pk_slug_map
+    database_connection_name, field, values, attributes_pk_slug_map
 ):
     value_maps: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
     for (
@@ -126,7 +136,7 @@ def _populate_value_map(
         field_value,
     ) in (
         AttributeValue.objects.using(database_connection_name)
-        .filter(Exists(attribute_qs.filter(pk=OuterRef("attribute_id"))))
+        .filter(attribute_id__in=attributes_pk_slug_map.keys())
         .filter(**{f"{field}__in": values})
         .values_list("attribute_id", "pk", field)
     ):
@@ -244,6 +254,9 @@ def _clean_product_attributes_boolean_filter_input(
 
 
 def filter_products_by_attributes_values(qs, queries: T_PRODUCT_FILTER_QUERIES):
+    if settings.PRODUCT_ATTRIBUTE_VALUE_IDS_FILTER_ENABLED:
+        return qs.filter(get_products_attribute_values_filter(queries))
+
     filters = []
     for values in queries.values():
         assigned_product_attribute_values = AssignedProductAttributeValue.objects.using(
@@ -11,6 +11,8 @@ from .....order import models as order_models
 from .....order.tasks import recalculate_orders_task
 from .....permission.enums import ProductPermissions
 from .....product import models
+from .....product.utils.attributes import update_products_attribute_value_ids
+from .....product.utils.price_ranges import invalidate_products_price_ranges
 from ....app.dataloaders import get_app_promise
 from ....channel import ChannelContext
 from ....core import ResolveInfo
@@ -113,6 +115,7 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
             cls.delete_assigned_attribute_values(variant)
             cls.delete_product_channel_listings_without_available_variants(variant)
             response = super().perform_mutation(_root, info, id=node_id)
+            update_products_attribute_value_ids([variant.product_id])
 
             # delete order lines for deleted variant
             order_models.OrderLine.objects.filter(
@@ -137,6 +140,7 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
 
         # This will finally recalculate discounted prices for products.
         cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+        invalidate_products_price_ranges([variant.product_id])
 
         return response
 
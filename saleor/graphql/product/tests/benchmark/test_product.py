@@ -1,4 +1,6 @@
 import json
+import time
+import tracemalloc
 
 import graphene
 import pytest
@@ -11,8 +13,19 @@ from .....attribute.tests.model_helpers import (
 from .....attribute.utils import associate_attribute_values_to_instance
 from .....core.taxes import TaxType
 from .....plugins.manager import PluginsManager
-from .....product.models import ProductMedia, ProductTranslation
+from .....product.models import (
+    Product,
+    ProductChannelListing,
+    ProductMedia,
+    ProductTranslation,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ....context import get_context_value
 from ....tests.utils import get_graphql_content
+from ...dataloaders.pricing import (
+    ProductPricingByProductIdChannelSlugAndCountryCodeLoader,
+)
 
 
 @pytest.mark.django_db
@@ -885,3 +898,114 @@ def test_products_types_for_federation_query_count(
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 2
+
+
+def _create_products_with_pricing(product, channel, count):
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {i}",
+                slug=f"pricing-product-{i}",
+                product_type_id=product.product_type_id,
+                category_id=product.category_id,
+                tax_class_id=product.tax_class_id,
+            )
+            for i in range(count)
+        ]
+    )
+    ProductChannelListing.objects.bulk_create(
+        [
+            ProductChannelListing(
+                product=product,
+                channel=channel,
+                is_published=True,
+                visible_in_listings=True,
+                currency=channel.currency_code,
+            )
+            for product in products
+        ]
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"pricing-{product.pk}")
+            for product in products
+        ]
+    )
+    ProductVariantChannelListing.objects.bulk_create(
+        [
+            ProductVariantChannelListing(
+                variant=variant,
+                channel=channel,
+                price_amount=10,
+                discounted_price_amount=8,
+                currency=channel.currency_code,
+            )
+            for variant in variants
+        ]
+    )
+    return products
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_products_pricing(product, api_client, count_queries, channel_USD):
+    query = """
+      query Products($channel: String) {
+        products(first: 100, channel: $channel) {
+          edges {
+            node {
+              pricing {
+                displayGrossPrices
+                priceRange {
+                  start {
+                    gross {
+                      amount
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    """
+    _create_products_with_pricing(product, channel_USD, 99)
+
+    variables = {"channel": channel_USD.slug}
+    content = get_graphql_content(api_client.post_graphql(query, variables))
+
+    edges = content["data"]["products"]["edges"]
+    assert len(edges) == 100
+    assert all(edge["node"]["pricing"] for edge in edges)
+
+
+@pytest.mark.django_db
+def test_product_pricing_loader_micro_benchmark(
+    product, channel_USD, rf, record_property
+):
+    # Records the peak memory allocated and the time spent by the pricing loader
+    # for 100 products; the first run warms up the caches and imports.
+    products = [product, *_create_products_with_pricing(product, channel_USD, 99)]
+    keys = [(product.pk, channel_USD.slug, None) for product in products]
+
+    def load_pricing():
+        request = rf.get("/")
+        request.app = None
+        loader = ProductPricingByProductIdChannelSlugAndCountryCodeLoader(
+            get_context_value(request)
+        )
+        return loader.load_many(keys).get()
+
+    load_pricing()
+
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    results = load_pricing()
+    elapsed = time.perf_counter() - started_at
+    _, peak_allocated = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(results) == 100
+    assert all(results)
+    record_property("seconds_per_100_products", elapsed)
+    record_property("peak_allocated_bytes_per_100_products", peak_allocated)
@@ -788,6 +788,43 @@ def test_update_product_clear_attribute_values(
     updated_webhook_mock.assert_called_once_with(product)
 
 
+def test_update_product_clear_attribute_values_updates_attribute_value_ids(
+    staff_api_client, product, permission_manage_products
+):
+    # given
+    attribute = get_product_attributes(product).first()
+    attribute.value_required = False
+    attribute.save(update_fields=["value_required"])
+    value_ids = set(
+        get_product_attribute_values(product, attribute).values_list("pk", flat=True)
+    )
+    product.refresh_from_db()
+    assert value_ids & set(product.attribute_value_ids)
+
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "input": {
+            "attributes": [
+                {
+                    "id": graphene.Node.to_global_id("Attribute", attribute.pk),
+                    "values": [],
+                }
+            ]
+        },
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        MUTATION_UPDATE_PRODUCT, variables, permissions=[permission_manage_products]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productUpdate"]["errors"] == []
+    product.refresh_from_db()
+    assert not value_ids & set(product.attribute_value_ids)
+
+
 def test_update_product_clean_boolean_attribute_value(
     staff_api_client,
     product,
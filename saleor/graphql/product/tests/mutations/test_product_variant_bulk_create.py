@@ -2269,3 +2269,51 @@ def test_product_variant_bulk_create_with_default_track_inventory(
         data["results"][0]["productVariant"]["trackInventory"]
         == site_settings.track_inventory_by_default
     )
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations."
+    "product_variant_bulk_create.invalidate_products_price_ranges"
+)
+def test_product_variant_bulk_create_invalidates_price_ranges(
+    mocked_invalidate_products_price_ranges,
+    staff_api_client,
+    product,
+    size_attribute,
+    channel_USD,
+    permission_manage_products,
+):
+    # given
+    attribute_value = size_attribute.values.last()
+    variants = [
+        {
+            "sku": str(uuid4())[:12],
+            "attributes": [
+                {
+                    "id": graphene.Node.to_global_id("Attribute", size_attribute.pk),
+                    "values": [attribute_value.name],
+                }
+            ],
+            "channelListings": [
+                {
+                    "price": 10.0,
+                    "channelId": graphene.Node.to_global_id("Channel", channel_USD.pk),
+                }
+            ],
+        }
+    ]
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "variants": variants,
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_CREATE_MUTATION, variables
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["productVariantBulkCreate"]["results"][0]["errors"]
+    mocked_invalidate_products_price_ranges.assert_called_once_with([product.pk])
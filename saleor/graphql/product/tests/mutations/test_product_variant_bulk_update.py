@@ -921,3 +921,49 @@ def test_product_variant_bulk_update_channel_listings_input_with_prior_price(
         new_variant_listing.prior_price_amount
         == not_existing_variant_listing_prior_price
     )
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations."
+    "product_variant_bulk_update.invalidate_products_price_ranges"
+)
+def test_product_variant_bulk_update_invalidates_price_ranges(
+    mocked_invalidate_products_price_ranges,
+    staff_api_client,
+    variant,
+    channel_USD,
+    permission_manage_products,
+):
+    # given
+    product = variant.product
+    variant_listing = variant.channel_listings.get(channel=channel_USD)
+    variants = [
+        {
+            "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channelListings": {
+                "update": [
+                    {
+                        "price": 50.0,
+                        "channelListing": graphene.Node.to_global_id(
+                            "ProductVariantChannelListing", variant_listing.id
+                        ),
+                    }
+                ],
+            },
+        },
+    ]
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "variants": variants,
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_UPDATE_MUTATION, variables
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["productVariantBulkUpdate"]["results"][0]["errors"]
+    mocked_invalidate_products_price_ranges.assert_called_once_with([product.pk])
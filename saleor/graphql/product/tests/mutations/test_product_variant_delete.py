@@ -534,3 +534,48 @@ def test_delete_product_by_external_reference_not_existing(
     # then
     errors = content["data"]["productVariantDelete"]["errors"]
     assert errors[0]["message"] == f"Couldn't resolve to a node: {ext_ref}"
+
+
+@patch(
+    "saleor.graphql.product.mutations.product_variant.product_variant_delete."
+    "invalidate_products_price_ranges"
+)
+def test_delete_variant_invalidates_price_ranges(
+    mocked_invalidate_products_price_ranges,
+    staff_api_client,
+    product,
+    permission_manage_products,
+):
+    # given
+    variant = product.variants.first()
+    variables = {"id": graphene.Node.to_global_id("ProductVariant", variant.pk)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        DELETE_VARIANT_MUTATION, variables, permissions=[permission_manage_products]
+    )
+
+    # then
+    get_graphql_content(response)
+    mocked_invalidate_products_price_ranges.assert_called_once_with([product.pk])
+
+
+def test_delete_variant_updates_product_attribute_value_ids(
+    staff_api_client, product, permission_manage_products
+):
+    # given
+    variant = product.variants.first()
+    value_ids = set(variant.attributes.values_list("values__pk", flat=True))
+    product.refresh_from_db()
+    assert value_ids & set(product.attribute_value_ids)
+    variables = {"id": graphene.Node.to_global_id("ProductVariant", variant.pk)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        DELETE_VARIANT_MUTATION, variables, permissions=[permission_manage_products]
+    )
+
+    # then
+    get_graphql_content(response)
+    product.refresh_from_db()
+    assert not value_ids & set(product.attribute_value_ids)
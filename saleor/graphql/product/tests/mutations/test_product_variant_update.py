@@ -1501,6 +1501,43 @@ def test_update_variant_with_numeric_attribute(
     product_variant_updated.assert_called_once_with(product.variants.last())
 
 
+def test_update_variant_clear_attribute_values_updates_attribute_value_ids(
+    permission_manage_products, product, staff_api_client
+):
+    # given
+    variant = product.variants.first()
+    attribute = product.product_type.variant_attributes.first()
+    attribute.value_required = False
+    attribute.save(update_fields=["value_required"])
+    value_ids = set(
+        variant.attributes.filter(assignment__attribute=attribute).values_list(
+            "values__pk", flat=True
+        )
+    )
+    product.refresh_from_db()
+    assert value_ids & set(product.attribute_value_ids)
+
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "attributes": [
+            {"id": graphene.Node.to_global_id("Attribute", attribute.pk), "values": []}
+        ],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_UPDATE_VARIANT_ATTRIBUTES,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)["data"]["productVariantUpdate"]
+    assert not content["errors"]
+    product.refresh_from_db()
+    assert not value_ids & set(product.attribute_value_ids)
+
+
 def test_update_product_variant_with_new_attribute(
     staff_api_client,
     product_with_variant_with_two_attributes,
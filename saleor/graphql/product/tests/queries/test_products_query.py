@@ -3,6 +3,8 @@ from decimal import Decimal
 
 import graphene
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.dateparse import parse_datetime
 
 from .....attribute.tests.model_helpers import get_product_attributes
@@ -1411,3 +1413,69 @@ def test_search_product_sort_by_attribute_returns_correct_cursor(
     # First field stores the flag to determine if product has assigned attribute values
     # Second is the list of attribute values as string
     assert ["0", attr_value.name, product.name] == cursor_data
+
+
+QUERY_PRODUCTS_WITH_FRAGMENT = """
+    fragment ProductDetails on Product {
+        description
+        metafield(key: "key")
+    }
+    query ($channel: String, $withDetails: Boolean!) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    ...ProductDetails @include(if: $withDetails)
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_products_select(queries):
+    return next(
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "product_product"' in query["sql"]
+    )
+
+
+def test_products_query_defers_not_requested_columns(
+    user_api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug, "withDetails": False}
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_api_client.post_graphql(QUERY_PRODUCTS_WITH_FRAGMENT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["products"]["edges"]) == len(product_list)
+    products_select = _get_products_select(ctx.captured_queries)
+    assert '"product_product"."name"' in products_select
+    for column in ["description", "metadata", "search_vector", "search_document"]:
+        assert f'"product_product"."{column}"' not in products_select
+
+
+def test_products_query_fetches_columns_requested_in_fragment(
+    user_api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug, "withDetails": True}
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_api_client.post_graphql(QUERY_PRODUCTS_WITH_FRAGMENT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["products"]["edges"]
+    assert edges[0]["node"]["description"] == product_list[0].description
+    products_select = _get_products_select(ctx.captured_queries)
+    assert '"product_product"."description"' in products_select
+    assert '"product_product"."metadata"' in products_select
+    assert '"product_product"."search_vector"' not in products_select
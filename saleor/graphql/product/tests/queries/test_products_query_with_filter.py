@@ -91,6 +91,47 @@ def test_products_query_with_filter_attributes(
     assert products[0]["node"]["name"] == second_product.name
 
 
+@pytest.mark.parametrize(
+    ("variant_value_slugs", "expected_count"),
+    [(None, 1), (["non-existing"], 0)],
+)
+def test_products_query_with_filter_attributes_by_attribute_value_ids(
+    variant_value_slugs,
+    expected_count,
+    settings,
+    api_client,
+    product,
+    channel_USD,
+):
+    # given
+    settings.PRODUCT_ATTRIBUTE_VALUE_IDS_FILTER_ENABLED = True
+    product_attribute = product.product_type.product_attributes.first()
+    variant_attribute = product.product_type.variant_attributes.first()
+    if variant_value_slugs is None:
+        variant_value_slugs = [variant_attribute.values.first().slug]
+
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {
+            "attributes": [
+                {
+                    "slug": product_attribute.slug,
+                    "values": [product_attribute.values.first().slug],
+                },
+                {"slug": variant_attribute.slug, "values": variant_value_slugs},
+            ],
+        },
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_WITH_FILTER, variables)
+    content = get_graphql_content(response)
+
+    # then
+    products = content["data"]["products"]["edges"]
+    assert len(products) == expected_count
+
+
 @pytest.mark.parametrize(
     ("gte", "lte", "expected_products_index"),
     [
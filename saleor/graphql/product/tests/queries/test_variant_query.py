@@ -6,7 +6,9 @@ from .....attribute.utils import (
     _associate_attribute_to_instance,
     associate_attribute_values_to_instance,
 )
-from .....warehouse.models import Stock, Warehouse
+from .....warehouse.management import stock_bulk_update
+from .....warehouse.models import ProductVariantAvailability, Stock, Warehouse
+from .....warehouse.tasks import recalculate_variants_availability_task
 from ....tests.utils import (
     assert_graphql_error_with_message,
     get_graphql_content,
@@ -1038,3 +1040,91 @@ def test_stock_quantity_is_sum_of_quantities_from_warehouses_that_support_countr
     content = get_graphql_content(response)
 
     assert content["data"]["productVariant"]["quantityAvailable"] == sum_quantities
+
+
+QUERY_VARIANT_QUANTITY_AVAILABLE = """
+    query ProductVariant($id: ID!, $channel: String!, $country: CountryCode) {
+        productVariant(id: $id, channel: $channel) {
+            quantityAvailable(address: { country: $country })
+        }
+    }
+"""
+
+
+def test_stock_quantity_served_from_variant_availability_table(
+    api_client, channel_USD, variant_with_many_stocks, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    variant = variant_with_many_stocks
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+        "country": "PL",
+    }
+    content = get_graphql_content(
+        api_client.post_graphql(QUERY_VARIANT_QUANTITY_AVAILABLE, variables)
+    )
+    quantity = content["data"]["productVariant"]["quantityAvailable"]
+    recalculate_variants_availability_task()
+    availability = ProductVariantAvailability.objects.get(
+        product_variant=variant, channel=channel_USD, country_code="PL"
+    )
+    assert availability.quantity == quantity
+
+    # when
+    ProductVariantAvailability.objects.filter(pk=availability.pk).update(quantity=1)
+    response = api_client.post_graphql(QUERY_VARIANT_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 1
+
+
+def test_stock_quantity_not_stored_on_read(
+    api_client, channel_USD, variant_with_many_stocks, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+        "country": "PL",
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_VARIANT_QUANTITY_AVAILABLE, variables)
+
+    # then
+    get_graphql_content(response)
+    assert not ProductVariantAvailability.objects.exists()
+
+
+def test_stock_quantity_calculated_after_stock_update(
+    api_client,
+    channel_USD,
+    variant_with_many_stocks,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    variant = variant_with_many_stocks
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+        "channel": channel_USD.slug,
+        "country": "PL",
+    }
+    recalculate_variants_availability_task()
+    stocks = list(variant.stocks.all())
+    for stock in stocks:
+        stock.quantity = 1
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        stock_bulk_update(stocks, ["quantity"])
+    response = api_client.post_graphql(QUERY_VARIANT_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == len(stocks)
@@ -1114,6 +1114,38 @@ def test_delete_product_variants(
     mocked_recalculate_orders_task.assert_not_called()
 
 
+def test_delete_product_variants_updates_product_attribute_value_ids(
+    staff_api_client, product, permission_manage_products
+):
+    # given
+    variants = list(product.variants.all())
+    value_ids = set(
+        AttributeValue.objects.filter(
+            variantvalueassignment__assignment__variant__in=variants
+        ).values_list("pk", flat=True)
+    )
+    product.refresh_from_db()
+    assert value_ids & set(product.attribute_value_ids)
+    variables = {
+        "ids": [
+            graphene.Node.to_global_id("ProductVariant", variant.pk)
+            for variant in variants
+        ]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_DELETE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    get_graphql_content(response)
+    product.refresh_from_db()
+    assert not value_ids & set(product.attribute_value_ids)
+
+
 @patch(
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_delete.get_webhooks_for_event"
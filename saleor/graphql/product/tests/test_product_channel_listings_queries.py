@@ -155,7 +155,7 @@ query FetchProduct($id: ID, $channel: String) {
 """
 
 
-@mock.patch("saleor.graphql.product.types.products.get_tax_rate_for_country")
+@mock.patch("saleor.graphql.product.dataloaders.pricing.get_tax_rate_for_country")
 def test_product_channel_listing_pricing_field_no_address(
     mock_get_tax_rate_for_country,
     staff_api_client,
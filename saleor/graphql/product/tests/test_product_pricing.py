@@ -3,6 +3,15 @@ from decimal import Decimal
 import graphene
 import pytest
 
+from ....product.models import (
+    ProductChannelListing,
+    ProductPriceRange,
+    ProductVariantChannelListing,
+)
+from ....product.utils.price_ranges import (
+    invalidate_products_price_ranges,
+    update_products_price_ranges,
+)
 from ....tax import TaxCalculationStrategy
 from ....tax.models import TaxClassCountryRate, TaxConfigurationPerCountry
 from ...tests.utils import get_graphql_content
@@ -296,3 +305,94 @@ def test_product_pricing_no_flat_rates_in_one_country(
     assert price_range_undiscounted_DE["start"]["gross"]["amount"] == gross_de
     assert price_range_undiscounted_DE["stop"]["net"]["amount"] == net_de
     assert price_range_undiscounted_DE["stop"]["gross"]["amount"] == gross_de
+
+
+def test_product_pricing_uses_stored_price_ranges(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+    settings,
+):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = True
+    product = product_available_in_many_channels
+    _enable_flat_rates(channel_PLN, False)
+    _configure_tax_rates(product)
+    update_products_price_ranges([(product.pk, channel_PLN.pk)])
+    ProductChannelListing.objects.update(price_range_dirty=False)
+    assert set(ProductPriceRange.objects.values_list("country_code", flat=True)) == {
+        "PL",
+        "DE",
+        channel_PLN.default_country.code,
+    }
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+
+    # when
+    ProductVariantChannelListing.objects.filter(
+        variant__product=product, channel=channel_PLN
+    ).update(price_amount=Decimal(1), discounted_price_amount=Decimal(1))
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["net"]["amount"] == 50.00
+    assert price_range_PL["start"]["gross"]["amount"] == 61.50
+
+
+def test_product_pricing_skips_stored_price_ranges_of_dirty_listing(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+    settings,
+):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = True
+    product = product_available_in_many_channels
+    _enable_flat_rates(channel_PLN, False)
+    _configure_tax_rates(product)
+    update_products_price_ranges([(product.pk, channel_PLN.pk)])
+    ProductChannelListing.objects.update(price_range_dirty=False)
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+
+    # when
+    ProductVariantChannelListing.objects.filter(
+        variant__product=product, channel=channel_PLN
+    ).update(price_amount=Decimal(1), discounted_price_amount=Decimal(1))
+    invalidate_products_price_ranges([product.pk])
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    price_range_PL = content["data"]["product"]["pricingPL"]["priceRange"]
+    assert price_range_PL["start"]["net"]["amount"] == 1.00
+    assert price_range_PL["start"]["gross"]["amount"] == 1.23
+
+
+def test_product_pricing_does_not_store_price_ranges(
+    product_available_in_many_channels,
+    channel_PLN,
+    user_api_client,
+    settings,
+):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = True
+    product = product_available_in_many_channels
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.id),
+        "channel": channel_PLN.slug,
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_PRICING, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["pricing"]["priceRange"]
+    assert not ProductPriceRange.objects.exists()
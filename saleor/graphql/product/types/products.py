@@ -19,13 +19,9 @@ from ....permission.utils import has_one_of_permissions
 from ....product import models
 from ....product.models import ALL_PRODUCTS_PERMISSIONS
 from ....product.utils import calculate_revenue_for_variant
-from ....product.utils.availability import (
-    get_product_availability,
-    get_variant_availability,
-)
+from ....product.utils.availability import get_variant_availability
 from ....product.utils.variants import get_variant_selection_attributes
 from ....tax.utils import (
-    get_display_gross_prices,
     get_tax_calculation_strategy,
     get_tax_rate_for_country,
 )
@@ -84,7 +80,7 @@ from ...core.types import (
 )
 from ...core.utils import from_global_id_or_error
 from ...core.validators import validate_one_of_args_is_in_query
-from ...meta.types import ObjectWithMetadata
+from ...meta.types import METADATA_DEFERRABLE_COLUMNS, ObjectWithMetadata
 from ...order.dataloaders import (
     OrderByIdLoader,
     OrderLinesByVariantIdAndChannelIdLoader,
@@ -140,7 +136,9 @@ from ..dataloaders import (
     VariantAttributesVisibleInStorefrontByProductTypeIdLoader,
     VariantChannelListingByVariantIdAndChannelSlugLoader,
     VariantChannelListingByVariantIdLoader,
-    VariantsChannelListingByProductIdAndChannelSlugLoader,
+)
+from ..dataloaders.pricing import (
+    ProductPricingByProductIdChannelSlugAndCountryCodeLoader,
 )
 from ..enums import ProductMediaType, ProductTypeKindEnum, VariantAttributeScope
 from ..filters import ProductVariantFilterInput, ProductVariantWhereInput
@@ -1032,6 +1030,13 @@ class Product(ChannelContextType[models.Product]):
         description = "Represents an individual item for sale in the storefront."
         interfaces = [relay.Node, ObjectWithMetadata]
         model = models.Product
+        deferrable_columns = {
+            **METADATA_DEFERRABLE_COLUMNS,
+            "description": ["description", "descriptionJson"],
+            "description_plaintext": [],
+            "search_document": [],
+            "search_vector": [],
+        }
 
     @staticmethod
     def resolve_created(root: ChannelContext[models.Product], _info):
@@ -1134,107 +1139,16 @@ class Product(ChannelContextType[models.Product]):
         if not root.channel_slug:
             return None
 
-        channel_slug = str(root.channel_slug)
-        context = info.context
-
-        channel = ChannelBySlugLoader(context).load(channel_slug)
-        product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
-            context
-        ).load((root.node.id, channel_slug))
-        variants_channel_listing = (
-            VariantsChannelListingByProductIdAndChannelSlugLoader(context).load(
-                (root.node.id, channel_slug)
+        country_code = address.country if address is not None else None
+        return (
+            ProductPricingByProductIdChannelSlugAndCountryCodeLoader(info.context)
+            .load((root.node.id, str(root.channel_slug), country_code))
+            .then(
+                lambda pricing_info: ProductPricingInfo(**pricing_info)
+                if pricing_info
+                else None
             )
         )
-        tax_class_id_loader = TaxClassIdByProductIdLoader(context).load(root.node.id)
-
-        def load_tax_configuration(data):
-            (
-                channel,
-                product_channel_listing,
-                variants_channel_listing,
-                tax_class_id,
-            ) = data
-
-            if not variants_channel_listing:
-                return None
-            country_code = get_active_country(channel, address_data=address)
-
-            def load_tax_country_exceptions(tax_config):
-                def load_default_tax_rate(tax_configs_per_country):
-                    def calculate_pricing_info(data):
-                        country_rates, default_country_rate_obj = data
-                        tax_config_country = next(
-                            (
-                                tc
-                                for tc in tax_configs_per_country
-                                if tc.country.code == country_code
-                            ),
-                            None,
-                        )
-                        display_gross_prices = get_display_gross_prices(
-                            tax_config,
-                            tax_config_country,
-                        )
-                        tax_calculation_strategy = get_tax_calculation_strategy(
-                            tax_config, tax_config_country
-                        )
-
-                        default_tax_rate = (
-                            default_country_rate_obj.rate
-                            if default_country_rate_obj
-                            else Decimal(0)
-                        )
-                        tax_rate = get_tax_rate_for_country(
-                            country_rates, default_tax_rate, country_code
-                        )
-
-                        availability = get_product_availability(
-                            product_channel_listing=product_channel_listing,
-                            variants_channel_listing=variants_channel_listing,
-                            prices_entered_with_tax=tax_config.prices_entered_with_tax,
-                            tax_calculation_strategy=tax_calculation_strategy,
-                            tax_rate=tax_rate,
-                        )
-
-                        pricing_info = asdict(availability)
-                        pricing_info["display_gross_prices"] = display_gross_prices
-                        return ProductPricingInfo(**pricing_info)
-
-                    country_rates = (
-                        TaxClassCountryRateByTaxClassIDLoader(context).load(
-                            tax_class_id
-                        )
-                        if tax_class_id
-                        else Promise.resolve([])
-                    )
-                    default_rate = TaxClassDefaultRateByCountryLoader(context).load(
-                        country_code
-                    )
-                    return Promise.all([country_rates, default_rate]).then(
-                        calculate_pricing_info
-                    )
-
-                return (
-                    TaxConfigurationPerCountryByTaxConfigurationIDLoader(context)
-                    .load(tax_config.id)
-                    .then(load_default_tax_rate)
-                )
-
-            return (
-                TaxConfigurationByChannelId(context)
-                .load(channel.id)
-                .then(load_tax_country_exceptions)
-            )
-
-        return Promise.all(
-            [
-                channel,
-                product_channel_listing,
-                variants_channel_listing,
-                tax_class_id_loader,
-            ]
-        ).then(load_tax_configuration)
 
     @staticmethod
     @traced_resolver
@@ -2,6 +2,7 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....channel import models as channel_models
+from ....core.config_snapshot import invalidate_config_snapshot
 from ....permission.enums import OrderPermissions
 from ....site.error_codes import OrderSettingsErrorCode
 from ...channel.types import OrderSettings
@@ -74,6 +75,8 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             channel_models.Channel.objects.update(**update_fields)
+            # the queryset update doesn't send model signals
+            invalidate_config_snapshot()
 
         channel.refresh_from_db()
 
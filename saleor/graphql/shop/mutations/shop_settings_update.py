@@ -1,10 +1,13 @@
 import graphene
+from django.conf import settings
 from django.core.exceptions import ValidationError
 
 from ....core.error_codes import ShopErrorCode
 from ....core.utils.url import validate_storefront_url
 from ....permission.enums import SitePermissions
 from ....site.models import DEFAULT_LIMIT_QUANTITY_PER_CHECKOUT
+from ....warehouse.reservations import is_reservation_enabled
+from ....warehouse.variant_availability import invalidate_channels_variants_availability
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import DEPRECATED_IN_3X_INPUT
@@ -204,6 +207,7 @@ class ShopSettingsUpdate(BaseMutation):
 
         old_metadata = dict(instance.metadata)
         old_private_metadata = dict(instance.private_metadata)
+        reservations_enabled = is_reservation_enabled(instance)
 
         instance = cls.construct_instance(instance, cleaned_input)
         cls.validate_and_update_metadata(
@@ -212,6 +216,12 @@ class ShopSettingsUpdate(BaseMutation):
         cls.clean_instance(info, instance)
         instance.save()
 
+        if (
+            settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED
+            and is_reservation_enabled(instance) != reservations_enabled
+        ):
+            invalidate_channels_variants_availability()
+
         if (
             instance.metadata != old_metadata
             or instance.private_metadata != old_private_metadata
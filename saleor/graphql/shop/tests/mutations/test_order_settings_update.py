@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from ....tests.utils import assert_no_permission, get_graphql_content
 
 ORDER_SETTINGS_UPDATE_MUTATION = """
@@ -43,6 +45,27 @@ def test_order_settings_update_by_staff(
     assert channel_USD.automatically_fulfill_non_shippable_gift_card is False
 
 
+@patch("saleor.graphql.shop.mutations.order_settings_update.invalidate_config_snapshot")
+def test_order_settings_update_invalidates_config_snapshot(
+    mocked_invalidate_config_snapshot,
+    staff_api_client,
+    permission_group_manage_orders,
+    channel_USD,
+):
+    # given
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(
+        ORDER_SETTINGS_UPDATE_MUTATION,
+        {"confirmOrders": False, "fulfillGiftCards": False},
+    )
+
+    # then
+    get_graphql_content(response)
+    mocked_invalidate_config_snapshot.assert_called_once_with()
+
+
 def test_order_settings_update_by_staff_no_channel_access(
     staff_api_client,
     permission_group_all_perms_channel_USD_only,
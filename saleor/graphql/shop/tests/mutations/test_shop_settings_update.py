@@ -1,4 +1,4 @@
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 import pytest
 
@@ -138,6 +138,36 @@ def test_shop_reservation_settings_mutation(
     assert site_settings.reserve_stock_duration_authenticated_user == 24
 
 
+@patch(
+    "saleor.graphql.shop.mutations.shop_settings_update."
+    "invalidate_channels_variants_availability"
+)
+def test_shop_reservation_settings_mutation_invalidates_variants_availability(
+    mocked_invalidate,
+    staff_api_client,
+    site_settings,
+    permission_manage_settings,
+    settings,
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    site_settings.reserve_stock_duration_anonymous_user = None
+    site_settings.reserve_stock_duration_authenticated_user = None
+    site_settings.save()
+    variables = {"input": {"reserveStockDurationAnonymousUser": 42}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        SHOP_SETTINGS_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_settings],
+    )
+
+    # then
+    get_graphql_content(response)
+    mocked_invalidate.assert_called_once_with()
+
+
 def test_shop_reservation_disable_settings_mutation(
     staff_api_client, site_settings, permission_manage_settings
 ):
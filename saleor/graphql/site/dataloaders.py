@@ -9,6 +9,7 @@ from django.db.models import Q
 from django.http.request import split_domain_port
 from promise import Promise
 
+from ...core.config_snapshot import get_config_snapshot_values
 from ..core.dataloaders import DataLoader
 
 
@@ -16,6 +17,11 @@ class SiteByIdLoader(DataLoader[int, Site]):
     context_key = "site_by_id"
 
     def batch_load(self, keys):
+        snapshot_sites = get_config_snapshot_values(
+            "sites_by_id", keys, self.database_connection_name
+        )
+        if snapshot_sites is not None:
+            return snapshot_sites
         sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
         return [sites_mapped.get(site_id) for site_id in keys]
 
@@ -24,6 +30,13 @@ class SiteByHostLoader(DataLoader[str, Site]):
     context_key = "site_by_host"
 
     def batch_load(self, keys):
+        snapshot_sites = get_config_snapshot_values(
+            "sites_by_domain",
+            [host.lower() for host in keys],
+            self.database_connection_name,
+        )
+        if snapshot_sites is not None:
+            return snapshot_sites
         # simulate non existing `domain__iexact__in`
         q_list = (Q(domain__iexact=k) for k in keys)
         q_list = reduce(lambda a, b: a | b, q_list)
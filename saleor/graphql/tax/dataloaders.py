@@ -4,6 +4,7 @@ from decimal import Decimal
 from django.db.models import Exists, OuterRef
 from promise import Promise
 
+from ...core.config_snapshot import get_config_snapshot_values
 from ...tax.models import (
     TaxClass,
     TaxClassCountryRate,
@@ -38,6 +39,11 @@ class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
 
     def batch_load(self, keys):
+        snapshot_tax_configs = get_config_snapshot_values(
+            "tax_configurations_by_channel_id", keys, self.database_connection_name
+        )
+        if snapshot_tax_configs is not None:
+            return snapshot_tax_configs
         tax_configs = TaxConfiguration.objects.using(
             self.database_connection_name
         ).in_bulk(keys, field_name="channel_id")
@@ -48,6 +54,14 @@ class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountry
     context_key = "tax_class_country_rate_by_tax_class_id"
 
     def batch_load(self, keys):
+        snapshot_tax_rates = get_config_snapshot_values(
+            "tax_class_country_rates_by_tax_class_id",
+            keys,
+            self.database_connection_name,
+            default=[],
+        )
+        if snapshot_tax_rates is not None:
+            return snapshot_tax_rates
         tax_rates = TaxClassCountryRate.objects.using(
             self.database_connection_name
         ).filter(tax_class_id__in=keys)
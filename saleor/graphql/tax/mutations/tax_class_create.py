@@ -1,5 +1,6 @@
 import graphene
 
+from ....core.config_snapshot import invalidate_config_snapshot
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -79,3 +80,5 @@ class TaxClassCreate(DeprecatedModelMutation):
         instance.save()
         create_country_rates = cleaned_input.get("create_country_rates", [])
         cls.create_country_rates(instance, create_country_rates)
+        # rates are created in bulk, which doesn't send model signals
+        invalidate_config_snapshot()
@@ -1,7 +1,9 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....core.config_snapshot import invalidate_config_snapshot
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.price_ranges import invalidate_channels_price_ranges
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
@@ -144,3 +146,6 @@ class TaxClassUpdate(DeprecatedModelMutation):
         remove_country_rates = cleaned_input.get("remove_country_rates", [])
         cls.update_country_rates(instance, update_country_rates)
         cls.remove_country_rates(remove_country_rates)
+        # rates are changed in bulk, which doesn't send model signals
+        invalidate_config_snapshot()
+        invalidate_channels_price_ranges()
@@ -2,6 +2,7 @@ import graphene
 from django_countries.fields import Country
 
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.price_ranges import invalidate_channels_price_ranges
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
@@ -47,6 +48,7 @@ class TaxCountryConfigurationDelete(BaseMutation):
         country_code = data["country_code"]
         rates = models.TaxClassCountryRate.objects.filter(country=country_code)
         rates.delete()
+        invalidate_channels_price_ranges()
         country_config = TaxCountryConfiguration(
             country=Country(country_code), tax_class_country_rates=[]
         )
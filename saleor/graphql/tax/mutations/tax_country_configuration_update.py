@@ -4,7 +4,9 @@ from django.db.models import Q
 from django_countries.fields import Country
 from graphql import GraphQLError
 
+from ....core.config_snapshot import invalidate_config_snapshot
 from ....permission.enums import CheckoutPermissions
+from ....product.utils.price_ranges import invalidate_channels_price_ranges
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
@@ -227,6 +229,9 @@ class TaxCountryConfigurationUpdate(BaseMutation):
         cleaned_data = cls.clean_input(**data)
         cls.update_default_rate(country_code, cleaned_data)
         cls.update_and_create_country_rates(country_code, cleaned_data)
+        # rates are changed with bulk operations, which don't send model signals
+        invalidate_config_snapshot()
+        invalidate_channels_price_ranges()
 
         tax_classes_lookup = Q(tax_class_id__in=cleaned_data.keys())
         if None in cleaned_data:
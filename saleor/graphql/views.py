@@ -1,6 +1,7 @@
 import hashlib
 import importlib
 import json
+from contextlib import nullcontext
 from inspect import isclass
 from typing import Any
 from urllib.parse import urljoin
@@ -33,11 +34,14 @@ from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
+from .core import SaleorContext
+from .core.profiler import get_request_profiler
 from .core.validators.query_cost import validate_query_cost
 from .metrics import (
     record_graphql_query_cost,
     record_graphql_query_count,
     record_graphql_query_duration,
+    record_graphql_resolver_profile,
     record_request_count,
     record_request_duration,
 )
@@ -67,6 +71,8 @@ class GraphQLView(View):
     root_value = None
     backend: GraphQLBackend = None  # type: ignore[assignment]
     _query: str | None = None
+    share_dataloaders: bool = False
+    _shared_context: SaleorContext | None = None
 
     HANDLED_EXCEPTIONS = (
         GraphQLError,
@@ -150,7 +156,11 @@ class GraphQLView(View):
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            self.share_dataloaders = settings.GRAPHQL_BATCH_SHARE_DATALOADERS
+            try:
+                responses = [self.get_response(request, entry) for entry in data]
+            finally:
+                self.clear_shared_context()
             result: list | dict | None = [response for response, code in responses]
             status_code = max((code for response, code in responses), default=200)
         else:
@@ -388,7 +398,14 @@ class GraphQLView(View):
                 # executor is not a valid argument in all backends
                 extra_options["executor"] = self.executor
 
+            # Only queries can reuse the dataloaders of the preceding operations,
+            # other operations have to work on freshly loaded data.
+            shares_dataloaders = self.share_dataloaders and operation_type == "query"
+            if not shares_dataloaders:
+                self.clear_shared_context()
             context = get_context_value(request)
+            profiler = get_request_profiler(context)
+            context.resolver_profiler = profiler
             if app := getattr(request, "app", None):
                 span.set_attribute(saleor_attributes.SALEOR_APP_ID, app.id)
                 span.set_attribute(saleor_attributes.SALEOR_APP_NAME, app.name)
@@ -404,14 +421,15 @@ class GraphQLView(View):
                     response = cache.get(key)
 
                 if not response:
-                    response = document.execute(
-                        root=self.get_root_value(),
-                        variables=variables,
-                        operation_name=operation_name,
-                        context=context,
-                        middleware=self.middleware,
-                        **extra_options,
-                    )
+                    with profiler.capture_queries() if profiler else nullcontext():
+                        response = document.execute(
+                            root=self.get_root_value(),
+                            variables=variables,
+                            operation_name=operation_name,
+                            context=context,
+                            middleware=self.middleware,
+                            **extra_options,
+                        )
                     if response.errors:
                         error_type = response.errors[0].__class__.__name__
                         error_description = self.format_span_error_description(response)
@@ -422,6 +440,11 @@ class GraphQLView(View):
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
 
+                    if profiler:
+                        record_graphql_resolver_profile(profiler)
+                        if profiler.report:
+                            response.extensions["profiler"] = profiler.get_report()
+
                 record_graphql_query_count(
                     operation_name=operation_name,
                     operation_identifier=operation_identifier,
@@ -463,7 +486,16 @@ class GraphQLView(View):
                 query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
                 return ExecutionResult(errors=[e], invalid=True)
             finally:
-                clear_context(context)
+                context.resolver_profiler = None
+                if shares_dataloaders:
+                    self._shared_context = context
+                else:
+                    clear_context(context)
+
+    def clear_shared_context(self):
+        if self._shared_context is not None:
+            clear_context(self._shared_context)
+            self._shared_context = None
 
     @staticmethod
     def parse_body(request: HttpRequest):
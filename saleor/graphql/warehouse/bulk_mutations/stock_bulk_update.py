@@ -9,6 +9,7 @@ from ....permission.enums import ProductPermissions
 from ....warehouse import models
 from ....warehouse.error_codes import StockBulkUpdateErrorCode
 from ....warehouse.lock_objects import stock_qs_select_for_update
+from ....warehouse.variant_availability import invalidate_variants_availability
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -386,6 +387,9 @@ class StockBulkUpdate(BaseMutation):
 
         # Stocks are locked in `get_stocks`
         models.Stock.objects.bulk_update(stocks_to_update, fields=["quantity"])
+        invalidate_variants_availability(
+            stock.product_variant_id for stock in stocks_to_update
+        )
 
         return stocks_to_update
 
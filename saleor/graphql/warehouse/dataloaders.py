@@ -1,18 +1,17 @@
 import sys
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, TypedDict
 from uuid import UUID
 
+from django.conf import settings
 from django.contrib.sites.models import Site
-from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models import Exists, OuterRef, Q
 from django.db.models.aggregates import Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
-from django_stubs_ext import WithAnnotations
 from promise import Promise
 
-from ...channel.models import Channel
+from ...core.config_snapshot import get_config_snapshot_values
 from ...product.models import ProductVariantChannelListing
 from ...warehouse import WarehouseClickAndCollectOption
 from ...warehouse.models import (
@@ -24,6 +23,12 @@ from ...warehouse.models import (
     Warehouse,
 )
 from ...warehouse.reservations import is_reservation_enabled
+from ...warehouse.topology import get_warehouse_topology
+from ...warehouse.variant_availability import (
+    get_variants_availability,
+    prepare_quantity_map,
+    prepare_warehouse_ids_by_shipping_zone_and_variant_map,
+)
 from ..channel.dataloaders import ChannelBySlugLoader
 from ..core.dataloaders import DataLoader
 from ..shipping.dataloaders import (
@@ -32,17 +37,6 @@ from ..shipping.dataloaders import (
 )
 from ..site.dataloaders import get_site_promise
 
-if TYPE_CHECKING:
-    # https://github.com/typeddjango/django-stubs/issues/719
-
-    class WithAvailableQuantity(TypedDict):
-        available_quantity: int
-
-    StockWithAvailableQuantity = WithAnnotations[Stock, WithAvailableQuantity]
-else:
-    StockWithAvailableQuantity = Stock
-
-
 CountryCode = str | None
 VariantIdCountryCodeChannelSlug = tuple[int, CountryCode, str]
 
@@ -98,6 +92,70 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         variant_ids: Iterable[int],
         site: Site,
     ) -> Iterable[tuple[int, int]]:
+        quantity_map = self.get_quantity_map(
+            country_code, channel_slug, variant_ids, site
+        )
+
+        # Return the quantities after capping them at the maximum quantity allowed in
+        # checkout. This prevent users from tracking the store's precise stock levels.
+        global_quantity_limit = site.settings.limit_quantity_per_checkout
+        return [
+            (
+                variant_id,
+                min(quantity_map[variant_id], global_quantity_limit or sys.maxsize),
+            )
+            for variant_id in variant_ids
+        ]
+
+    def get_quantity_map(
+        self,
+        country_code: CountryCode | None,
+        channel_slug: str | None,
+        variant_ids: Iterable[int],
+        site: Site,
+    ) -> defaultdict[int, int]:
+        """Return the variant id to available quantity map.
+
+        When enabled, the quantities are read from the `ProductVariantAvailability`
+        table, which is maintained by the stock changes. The missing or outdated
+        ones are calculated without being stored.
+        """
+        if not settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED or not channel_slug:
+            return self.calculate_quantity_map(country_code, channel_slug, variant_ids)
+
+        topology = get_warehouse_topology(channel_slug)
+        if topology.channel_id is None:
+            return self.calculate_quantity_map(country_code, channel_slug, variant_ids)
+
+        quantity_map: defaultdict[int, int] = defaultdict(
+            int,
+            get_variants_availability(
+                variant_ids,
+                topology,
+                country_code,
+                is_reservation_enabled(site.settings),
+                self.database_connection_name,
+            ),
+        )
+        missing_variant_ids = set(variant_ids) - quantity_map.keys()
+        if missing_variant_ids:
+            calculated_quantity_map = self.calculate_quantity_map(
+                country_code, channel_slug, missing_variant_ids
+            )
+            quantity_map.update(
+                {
+                    variant_id: calculated_quantity_map[variant_id]
+                    for variant_id in missing_variant_ids
+                }
+            )
+        return quantity_map
+
+    def calculate_quantity_map(
+        self,
+        country_code: CountryCode | None,
+        channel_slug: str | None,
+        variant_ids: Iterable[int],
+    ) -> defaultdict[int, int]:
         # get stocks only for warehouses assigned to the shipping zones
         # that are available in the given channel
         stocks = (
@@ -114,14 +172,11 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         )
 
         warehouse_shipping_zones_map = defaultdict(list)
-        for warehouse_shipping_zone in warehouse_shipping_zones:
-            warehouse_shipping_zones_map[warehouse_shipping_zone.warehouse_id].append(
-                warehouse_shipping_zone.shippingzone_id
-            )
+        for warehouse_id, shipping_zone_id in warehouse_shipping_zones:
+            warehouse_shipping_zones_map[warehouse_id].append(shipping_zone_id)
 
         stocks = stocks.filter(
-            Q(warehouse_id__in=warehouse_shipping_zones_map.keys())
-            | Q(warehouse_id__in=cc_warehouses.values("id"))
+            warehouse_id__in=warehouse_shipping_zones_map.keys() | cc_warehouses.keys()
         )
 
         stocks = stocks.annotate_available_quantity().order_by("pk")
@@ -136,101 +191,53 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             warehouse_ids_by_shipping_zone_by_variant,
             variants_with_global_cc_warehouses,
             available_quantity_by_warehouse_id_and_variant_id,
-        ) = self.prepare_warehouse_ids_by_shipping_zone_and_variant_map(
+        ) = prepare_warehouse_ids_by_shipping_zone_and_variant_map(
             stocks, stocks_reservations, warehouse_shipping_zones_map, cc_warehouses
         )
 
-        quantity_map = self.prepare_quantity_map(
+        return prepare_quantity_map(
             country_code,
             warehouse_ids_by_shipping_zone_by_variant,
             variants_with_global_cc_warehouses,
             available_quantity_by_warehouse_id_and_variant_id,
         )
 
-        # Return the quantities after capping them at the maximum quantity allowed in
-        # checkout. This prevent users from tracking the store's precise stock levels.
-        global_quantity_limit = site.settings.limit_quantity_per_checkout
-        return [
-            (
-                variant_id,
-                min(quantity_map[variant_id], global_quantity_limit or sys.maxsize),
-            )
-            for variant_id in variant_ids
-        ]
+    def get_warehouse_shipping_zones(
+        self, country_code, channel_slug
+    ) -> list[tuple[UUID, int]]:
+        """Get the warehouse and shipping zone id pairs for a channel and country."""
+        if channel_slug:
+            topology = get_warehouse_topology(channel_slug)
+            return topology.get_warehouse_shipping_zones(country_code)
 
-    def get_warehouse_shipping_zones(self, country_code, channel_slug):
-        """Get the WarehouseShippingZone instances for a given channel and country."""
         WarehouseShippingZone = Warehouse.shipping_zones.through
         warehouse_shipping_zones = WarehouseShippingZone.objects.using(
             self.database_connection_name
         ).all()
-        if country_code or channel_slug:
-            if country_code:
-                shipping_zones = (
-                    ShippingZone.objects.using(self.database_connection_name)
-                    .filter(countries__contains=country_code)
-                    .values("pk")
-                )
-                warehouse_shipping_zones = warehouse_shipping_zones.filter(
-                    Exists(shipping_zones.filter(pk=OuterRef("shippingzone_id")))
-                )
-            if channel_slug:
-                ShippingZoneChannel = Channel.shipping_zones.through
-                WarehouseChannel = Channel.warehouses.through
-                channels = (
-                    Channel.objects.using(self.database_connection_name)
-                    .filter(slug=channel_slug)
-                    .values("pk")
-                )
-                shipping_zone_channels = (
-                    ShippingZoneChannel.objects.using(self.database_connection_name)
-                    .filter(Exists(channels.filter(pk=OuterRef("channel_id"))))
-                    .values("shippingzone_id")
-                )
-                warehouse_channels = (
-                    WarehouseChannel.objects.using(self.database_connection_name)
-                    .filter(
-                        Exists(channels.filter(pk=OuterRef("channel_id"))),
-                    )
-                    .values("warehouse_id")
-                )
-                warehouse_shipping_zones = warehouse_shipping_zones.filter(
-                    Exists(
-                        shipping_zone_channels.filter(
-                            shippingzone_id=OuterRef("shippingzone_id")
-                        )
-                    ),
-                    Exists(
-                        warehouse_channels.filter(warehouse_id=OuterRef("warehouse_id"))
-                    ),
-                )
-        return warehouse_shipping_zones
-
-    def get_click_and_collect_warehouses(self, channel_slug, country_code):
-        """Get the collection point warehouses for a given channel and country code."""
-        warehouses = Warehouse.objects.none()
-        if not country_code and channel_slug:
-            channels = (
-                Channel.objects.using(self.database_connection_name)
-                .filter(slug=channel_slug)
+        if country_code:
+            shipping_zones = (
+                ShippingZone.objects.using(self.database_connection_name)
+                .filter(countries__contains=country_code)
                 .values("pk")
             )
-            WarehouseChannel = Channel.warehouses.through
-            warehouse_channels = (
-                WarehouseChannel.objects.using(self.database_connection_name)
-                .filter(
-                    Exists(channels.filter(pk=OuterRef("channel_id"))),
-                )
-                .values("warehouse_id")
-            )
-            warehouses = Warehouse.objects.using(self.database_connection_name).filter(
-                Exists(warehouse_channels.filter(warehouse_id=OuterRef("id"))),
-                click_and_collect_option__in=[
-                    WarehouseClickAndCollectOption.LOCAL_STOCK,
-                    WarehouseClickAndCollectOption.ALL_WAREHOUSES,
-                ],
+            warehouse_shipping_zones = warehouse_shipping_zones.filter(
+                Exists(shipping_zones.filter(pk=OuterRef("shippingzone_id")))
             )
-        return warehouses
+        return list(
+            warehouse_shipping_zones.values_list("warehouse_id", "shippingzone_id")
+        )
+
+    def get_click_and_collect_warehouses(
+        self, channel_slug, country_code
+    ) -> dict[UUID, str]:
+        """Get the collection point warehouses for a given channel and country code.
+
+        Return the map of warehouse ids to their click and collect options.
+        """
+        if not country_code and channel_slug:
+            topology = get_warehouse_topology(channel_slug)
+            return topology.click_and_collect_warehouses
+        return {}
 
     def prepare_stocks_reservations_map(self, variant_ids):
         """Prepare stock id to quantity reserved map for provided variant ids."""
@@ -251,128 +258,6 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
                 stocks_reservations[stock_id] = quantity_reserved
         return stocks_reservations
 
-    def prepare_warehouse_ids_by_shipping_zone_and_variant_map(
-        self,
-        stocks: QuerySet[StockWithAvailableQuantity],
-        stocks_reservations,
-        warehouse_shipping_zones_map,
-        cc_warehouses,
-    ):
-        """Combine all quantities within a single zone.
-
-        Prepare `warehouse_ids_by_shipping_zone_by_variant` map in the following format:
-            {
-                variant_id: {
-                    shipping_zone_id/warehouse_id: [
-                        warehouse_id
-                    ]
-                }
-            }
-
-        In case of the collection point warehouses the warehouse_id is used instead of
-        the shipping zone id. Every stock of the collection point warehouse is treated
-        as a magic single-warehouse shipping zone.
-        """
-        cc_warehouses_in_bulk = cc_warehouses.in_bulk()
-        warehouse_ids_by_shipping_zone_by_variant: defaultdict[
-            int, defaultdict[int | UUID, list[UUID]]
-        ] = defaultdict(lambda: defaultdict(list))
-        variants_with_global_cc_warehouses = []
-        available_quantity_by_warehouse_id_and_variant_id: defaultdict[
-            UUID, dict[int, int]
-        ] = defaultdict(lambda: defaultdict(int))
-        for stock in stocks:
-            reserved_quantity = stocks_reservations[stock.id]
-            quantity = stock.available_quantity - reserved_quantity
-            # when the available_quantity was under 0 we do not want clipping to zero,
-            # as it means that the stock might be exceeded
-            if stock.available_quantity > 0:
-                quantity = max(0, quantity)
-            variant_id = stock.product_variant_id
-            warehouse_id = stock.warehouse_id
-            available_quantity_by_warehouse_id_and_variant_id[warehouse_id][
-                variant_id
-            ] += quantity
-            if shipping_zone_ids := warehouse_shipping_zones_map[warehouse_id]:
-                for shipping_zone_id in shipping_zone_ids:
-                    warehouse_ids_by_shipping_zone_by_variant[variant_id][
-                        shipping_zone_id
-                    ].append(warehouse_id)
-            else:
-                cc_option = cc_warehouses_in_bulk[warehouse_id].click_and_collect_option
-                # every stock of a collection point warehouse should treat as a magic
-                # single-warehouse shipping zone
-                warehouse_ids_by_shipping_zone_by_variant[variant_id][warehouse_id] = [
-                    warehouse_id
-                ]
-                # in case of global warehouses the quantity available will be the sum
-                # of the available quantity for that variant from all stocks,
-                # so we need to keep information for which variant there is a warehouse
-                # with the global stock
-                if cc_option == WarehouseClickAndCollectOption.ALL_WAREHOUSES:
-                    variants_with_global_cc_warehouses.append(variant_id)
-        return (
-            warehouse_ids_by_shipping_zone_by_variant,
-            variants_with_global_cc_warehouses,
-            available_quantity_by_warehouse_id_and_variant_id,
-        )
-
-    def prepare_quantity_map(
-        self,
-        country_code,
-        warehouse_ids_by_shipping_zone_by_variant,
-        variants_with_global_cc_warehouses,
-        available_quantity_by_warehouse_id_and_variant_id,
-    ):
-        """Prepare the variant id to quantity map.
-
-        When the country code is known, the available quantity is the sum of quantities
-        from all shipping zones supporting given country. When the country is not known
-        the highest known quantity is returned.
-
-        The local warehouses are treated as a magic single-warehouse shipping zone.
-        When the variant has any global collection point warehouse, the quantity is the
-        sum of the quantities from all shipping zones.
-        In case of global warehouses the available quantity of such collection point
-        is the sum of the available quantities from all stocks that passed the country
-        or channel conditions.
-        """
-        quantity_map: defaultdict[int, int] = defaultdict(int)
-        for (
-            variant_id,
-            warehouse_ids_shipping_zone,
-        ) in warehouse_ids_by_shipping_zone_by_variant.items():
-            if country_code or variant_id in variants_with_global_cc_warehouses:
-                used_warehouse_ids = []
-                for warehouse_ids in warehouse_ids_shipping_zone.values():
-                    used_warehouse_ids.extend(warehouse_ids)
-                used_warehouse_ids = set(used_warehouse_ids)
-                # When country code is known or the global collection point warehouse
-                # for this variant exists, return the sum of quantities from all
-                # shipping zones supporting given country.
-                quantity = 0
-                for warehouse_id in used_warehouse_ids:
-                    quantity += available_quantity_by_warehouse_id_and_variant_id[
-                        warehouse_id
-                    ][variant_id]
-                quantity_map[variant_id] = quantity
-            else:
-                # When country code is unknown, return the highest known quantity.
-                quantity_values = []
-                for (
-                    warehouse_ids_per_shipping_zones
-                ) in warehouse_ids_shipping_zone.values():
-                    quantity = 0
-                    for warehouse_id in warehouse_ids_per_shipping_zones:
-                        quantity += available_quantity_by_warehouse_id_and_variant_id[
-                            warehouse_id
-                        ][variant_id]
-                    quantity_values.append(quantity)
-
-                quantity_map[variant_id] = max(quantity_values)
-
-        return quantity_map
-
 
 class StocksWithAvailableQuantityByProductVariantIdCountryCodeAndChannelLoader(
     DataLoader[VariantIdCountryCodeChannelSlug, Iterable[Stock]]
@@ -655,6 +540,11 @@ class WarehouseByIdLoader(DataLoader):
     context_key = "warehouse_by_id"
 
     def batch_load(self, keys: Iterable[UUID]) -> list[Warehouse | None]:
+        snapshot_warehouses = get_config_snapshot_values(
+            "warehouses_by_id", keys, self.database_connection_name
+        )
+        if snapshot_warehouses is not None:
+            return snapshot_warehouses
         warehouses = (
             Warehouse.objects.all().using(self.database_connection_name).in_bulk(keys)
         )
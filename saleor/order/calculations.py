@@ -1,10 +1,13 @@
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from decimal import Decimal
 from uuid import UUID
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils import timezone
 from prices import Money, TaxedMoney
 
@@ -57,6 +60,34 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+ORDER_PRICE_FIELDS = [
+    "subtotal_net_amount",
+    "subtotal_gross_amount",
+    "total_net_amount",
+    "total_gross_amount",
+    "undiscounted_total_net_amount",
+    "undiscounted_total_gross_amount",
+    "shipping_price_net_amount",
+    "shipping_price_gross_amount",
+    "base_shipping_price_amount",
+    "shipping_tax_rate",
+    "should_refresh_prices",
+    "tax_error",
+]
+
+ORDER_LINE_PRICE_FIELDS = [
+    "unit_price_net_amount",
+    "unit_price_gross_amount",
+    "undiscounted_unit_price_net_amount",
+    "undiscounted_unit_price_gross_amount",
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "undiscounted_total_price_net_amount",
+    "undiscounted_total_price_gross_amount",
+    "tax_rate",
+]
+
+
 def fetch_order_prices_if_expired(
     order: Order,
     manager: PluginsManager,
@@ -72,16 +103,131 @@ def fetch_order_prices_if_expired(
     Prices will be updated if force_update is True
     or if order.should_refresh_prices is True.
     """
-    if order.status not in ORDER_EDITABLE_STATUS:
+    prepared = _prepare_order_prices(
+        order,
+        lines,
+        force_update=force_update,
+        database_connection_name=database_connection_name,
+        allow_sync_webhooks=allow_sync_webhooks,
+    )
+    if prepared is None:
+        return order, lines
+
+    lines, tax_strategy = prepared
+    calculate_taxes(
+        order,
+        manager,
+        lines,
+        tax_calculation_strategy=tax_strategy,
+        database_connection_name=database_connection_name,
+    )
+
+    order.should_refresh_prices = False
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            order.save(update_fields=ORDER_PRICE_FIELDS)
+            order.lines.bulk_update(lines, ORDER_LINE_PRICE_FIELDS)
+
         return order, lines
 
+
+def fetch_orders_prices_if_expired(
+    orders: Iterable[Order],
+    manager: PluginsManager,
+    force_update: bool = False,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    allow_sync_webhooks: bool = True,
+    max_concurrency: int | None = None,
+) -> dict[UUID, list[OrderLine]]:
+    """Fetch prices with taxes for multiple orders.
+
+    Works as `fetch_order_prices_if_expired`, but the tax app calls, which
+    dominate the recalculation time, are made concurrently, with at most
+    `max_concurrency` requests in flight. Each thread uses its own plugins manager
+    and database connections, with the writer access of the caller. Recalculated
+    prices are saved in bulk.
+
+    Concurrent calls require the orders to be committed, as the tax apps payloads
+    are generated in separate threads, so the calls are made sequentially inside
+    a transaction.
+
+    Return the recalculated lines for the orders whose prices were refreshed.
+    """
+    if max_concurrency is None:
+        max_concurrency = settings.ORDER_TAX_APP_MAX_CONCURRENCY
+
+    refreshed_orders: list[Order] = []
+    orders_lines: dict[UUID, list[OrderLine]] = {}
+    tax_app_orders: dict[str | None, list[Order]] = defaultdict(list)
+    for order in orders:
+        prepared = _prepare_order_prices(
+            order,
+            None,
+            force_update=force_update,
+            database_connection_name=database_connection_name,
+            allow_sync_webhooks=allow_sync_webhooks,
+        )
+        if prepared is None:
+            continue
+        lines, tax_strategy = prepared
+        refreshed_orders.append(order)
+        orders_lines[order.pk] = lines
+        if tax_strategy == TaxCalculationStrategy.TAX_APP:
+            tax_app_orders[get_tax_app_identifier_for_order(order)].append(order)
+        else:
+            calculate_taxes(
+                order,
+                manager,
+                lines,
+                tax_calculation_strategy=tax_strategy,
+                database_connection_name=database_connection_name,
+            )
+
+    _calculate_taxes_with_tax_apps(
+        tax_app_orders,
+        orders_lines,
+        manager,
+        max_concurrency,
+        database_connection_name=database_connection_name,
+    )
+
+    if not refreshed_orders:
+        return orders_lines
+
+    for order in refreshed_orders:
+        order.should_refresh_prices = False
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            Order.objects.bulk_update(refreshed_orders, ORDER_PRICE_FIELDS)
+            OrderLine.objects.bulk_update(
+                [line for lines in orders_lines.values() for line in lines],
+                ORDER_LINE_PRICE_FIELDS,
+            )
+    return orders_lines
+
+
+def _prepare_order_prices(
+    order: Order,
+    lines: Iterable[OrderLine] | None,
+    force_update: bool,
+    database_connection_name: str,
+    allow_sync_webhooks: bool,
+) -> tuple[list[OrderLine], str] | None:
+    """Recalculate the order base prices and discounts.
+
+    Return the order lines and the tax calculation strategy, or None when
+    the order prices don't need to be refreshed.
+    """
+    if order.status not in ORDER_EDITABLE_STATUS:
+        return None
+
     expired_line_ids = get_expired_line_ids(order, lines)
     if not force_update and not order.should_refresh_prices and not expired_line_ids:
-        return order, lines
+        return None
 
     tax_strategy = get_tax_calculation_strategy_for_order(order)
     if tax_strategy == TaxCalculationStrategy.TAX_APP and not allow_sync_webhooks:
-        return order, lines
+        return None
 
     if expired_line_ids:
         # handle line base price expiration
@@ -101,50 +247,60 @@ def fetch_order_prices_if_expired(
         lines,
         database_connection_name=database_connection_name,
     )
+    return lines, tax_strategy
 
-    calculate_taxes(
-        order,
-        manager,
-        lines,
-        tax_calculation_strategy=tax_strategy,
-        database_connection_name=database_connection_name,
-    )
 
-    order.should_refresh_prices = False
-    with transaction.atomic(savepoint=False):
-        with allow_writer():
-            order.save(
-                update_fields=[
-                    "subtotal_net_amount",
-                    "subtotal_gross_amount",
-                    "total_net_amount",
-                    "total_gross_amount",
-                    "undiscounted_total_net_amount",
-                    "undiscounted_total_gross_amount",
-                    "shipping_price_net_amount",
-                    "shipping_price_gross_amount",
-                    "base_shipping_price_amount",
-                    "shipping_tax_rate",
-                    "should_refresh_prices",
-                    "tax_error",
-                ]
-            )
-            order.lines.bulk_update(
-                lines,
-                [
-                    "unit_price_net_amount",
-                    "unit_price_gross_amount",
-                    "undiscounted_unit_price_net_amount",
-                    "undiscounted_unit_price_gross_amount",
-                    "total_price_net_amount",
-                    "total_price_gross_amount",
-                    "undiscounted_total_price_net_amount",
-                    "undiscounted_total_price_gross_amount",
-                    "tax_rate",
-                ],
-            )
+def _calculate_taxes_with_tax_apps(
+    tax_app_orders: dict[str | None, list[Order]],
+    orders_lines: dict[UUID, list[OrderLine]],
+    manager: PluginsManager,
+    max_concurrency: int,
+    database_connection_name: str,
+):
+    # The orders of the same tax app are spread between the threads, so the requests
+    # to a single app are sent concurrently.
+    orders = [order for group in tax_app_orders.values() for order in group]
 
-        return order, lines
+    def calculate(order: Order, manager: PluginsManager):
+        calculate_taxes(
+            order,
+            manager,
+            orders_lines[order.pk],
+            tax_calculation_strategy=TaxCalculationStrategy.TAX_APP,
+            database_connection_name=database_connection_name,
+        )
+
+    connection = connections[database_connection_name]
+    if max_concurrency <= 1 or len(orders) <= 1 or connection.in_atomic_block:
+        for order in orders:
+            calculate(order, manager)
+        return
+
+    # The writer access is granted per connection, and the threads open their own
+    # connections, so they have to get the access of the caller explicitly.
+    writer_allowed = getattr(
+        connections[settings.DATABASE_CONNECTION_DEFAULT_NAME], "_allow_writer", False
+    )
+
+    def calculate_in_thread(orders_chunk: list[Order]):
+        with allow_writer() if writer_allowed else nullcontext():
+            try:
+                # The manager caches the loaded plugins, so it's not shared between
+                # the threads.
+                thread_manager = PluginsManager(
+                    manager.plugins,
+                    requestor_getter=manager.requestor_getter,
+                    allow_replica=manager._allow_replica,
+                )
+                for order in orders_chunk:
+                    calculate(order, thread_manager)
+            finally:
+                connections.close_all()
+
+    workers = min(max_concurrency, len(orders))
+    orders_chunks = [orders[index::workers] for index in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(calculate_in_thread, orders_chunks))
 
 
 def get_expired_line_ids(order: Order, lines: Iterable[OrderLine] | None) -> list[UUID]:
@@ -1,18 +1,40 @@
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 import graphene
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.db.models import F, Q, Value, Window, prefetch_related_objects
+from django.db.models.functions import RowNumber
 
+from ..account.models import Address, User
 from ..account.search import generate_address_search_vector_value
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
+from ..discount.models import OrderDiscount
+from ..invoice.models import Invoice
+from ..payment.models import Payment, TransactionEvent, TransactionItem
 from . import OrderEvents
+from .models import Order, OrderEvent, OrderLine
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from .models import Order
+# Fields of the address used by `generate_address_search_vector_value`.
+ADDRESS_SEARCH_VECTOR_FIELDS = [
+    "first_name",
+    "last_name",
+    "company_name",
+    "street_address_1",
+    "street_address_2",
+    "city",
+    "city_area",
+    "postal_code",
+    "country",
+    "country_area",
+    "phone",
+]
 
 
 def update_order_search_vector(order: "Order", *, save: bool = True):
@@ -39,6 +61,211 @@ def prepare_order_search_vector_value(
             "invoices",
             "events",
         )
+    events = order.events.filter(
+        type__in=[OrderEvents.NOTE_ADDED, OrderEvents.NOTE_UPDATED]
+    ).order_by("-date")
+    return (
+        generate_order_fields_search_vector_value(
+            order, order.user, order.billing_address, order.shipping_address
+        )
+        + generate_payments_search_vector_value(
+            order.payments.all()[: settings.SEARCH_ORDERS_MAX_INDEXED_PAYMENTS]
+        )
+        + generate_discounts_search_vector_value(
+            order.discounts.all()[: settings.SEARCH_ORDERS_MAX_INDEXED_DISCOUNTS]
+        )
+        + generate_lines_search_vector_value(
+            order.lines.all()[: settings.SEARCH_ORDERS_MAX_INDEXED_LINES]
+        )
+        + generate_transactions_search_vector_value(
+            (
+                transaction,
+                transaction.events.all()[
+                    : settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS
+                ],
+            )
+            for transaction in order.payment_transactions.all()[
+                : settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS
+            ]
+        )
+        + generate_invoices_search_vector_value(
+            order.invoices.all().order_by("-created_at")[
+                : settings.SEARCH_ORDERS_MAX_INDEXED_INVOICES
+            ]
+        )
+        + generate_events_search_vector_value(
+            event.parameters.get("message")
+            for event in events[: settings.SEARCH_ORDERS_MAX_INDEXED_EVENTS]
+        )
+    )
+
+
+def prepare_orders_search_vector_values(
+    order_ids: Iterable[UUID], database_connection_name: str
+) -> dict[UUID, list[NoValidationSearchVector]]:
+    """Prepare the search vector values of many orders at once.
+
+    Produces the same vectors as `prepare_order_search_vector_value`, but instead
+    of hydrating the orders and all of their relations, only the text fields
+    used by the search are fetched, with a single query per relation.
+    """
+    orders = list(
+        Order.objects.using(database_connection_name)
+        .filter(id__in=order_ids)
+        .values_list(
+            "id",
+            "number",
+            "user_email",
+            "customer_note",
+            "external_reference",
+            "user_id",
+            "billing_address_id",
+            "shipping_address_id",
+            named=True,
+        )
+    )
+    if not orders:
+        return {}
+    order_ids = [order.id for order in orders]
+
+    users = {
+        user.id: user
+        for user in User.objects.using(database_connection_name)
+        .filter(id__in={order.user_id for order in orders if order.user_id})
+        .values_list("id", "email", "first_name", "last_name", named=True)
+    }
+    addresses = (
+        Address.objects.using(database_connection_name)
+        .only(*ADDRESS_SEARCH_VECTOR_FIELDS)
+        .in_bulk(
+            {
+                address_id
+                for order in orders
+                for address_id in (order.billing_address_id, order.shipping_address_id)
+                if address_id
+            }
+        )
+    )
+    payments = _get_values_per_parent(
+        Payment.objects.using(database_connection_name).filter(order_id__in=order_ids),
+        "order_id",
+        ["id", "psp_reference"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_PAYMENTS,
+    )
+    discounts = _get_values_per_parent(
+        OrderDiscount.objects.using(database_connection_name).filter(
+            order_id__in=order_ids
+        ),
+        "order_id",
+        ["name", "translated_name"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_DISCOUNTS,
+    )
+    lines = _get_values_per_parent(
+        OrderLine.objects.using(database_connection_name).filter(
+            order_id__in=order_ids
+        ),
+        "order_id",
+        [
+            "product_sku",
+            "product_name",
+            "variant_name",
+            "translated_product_name",
+            "translated_variant_name",
+        ],
+        settings.SEARCH_ORDERS_MAX_INDEXED_LINES,
+    )
+    transactions = _get_values_per_parent(
+        TransactionItem.objects.using(database_connection_name).filter(
+            order_id__in=order_ids
+        ),
+        "order_id",
+        ["id", "token", "psp_reference"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS,
+    )
+    transaction_events = _get_values_per_parent(
+        TransactionEvent.objects.using(database_connection_name).filter(
+            transaction_id__in=[
+                transaction.id
+                for order_transactions in transactions.values()
+                for transaction in order_transactions
+            ]
+        ),
+        "transaction_id",
+        ["psp_reference"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS,
+    )
+    invoices = _get_values_per_parent(
+        Invoice.objects.using(database_connection_name).filter(order_id__in=order_ids),
+        "order_id",
+        ["id"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_INVOICES,
+        ordering=["-created_at"],
+    )
+    events = _get_values_per_parent(
+        OrderEvent.objects.using(database_connection_name).filter(
+            order_id__in=order_ids,
+            type__in=[OrderEvents.NOTE_ADDED, OrderEvents.NOTE_UPDATED],
+        ),
+        "order_id",
+        ["parameters__message"],
+        settings.SEARCH_ORDERS_MAX_INDEXED_EVENTS,
+        ordering=["-date"],
+    )
+
+    search_vectors = {}
+    for order in orders:
+        search_vectors[order.id] = (
+            generate_order_fields_search_vector_value(
+                order,
+                users.get(order.user_id),
+                addresses.get(order.billing_address_id),
+                addresses.get(order.shipping_address_id),
+            )
+            + generate_payments_search_vector_value(payments[order.id])
+            + generate_discounts_search_vector_value(discounts[order.id])
+            + generate_lines_search_vector_value(lines[order.id])
+            + generate_transactions_search_vector_value(
+                (transaction, transaction_events[transaction.id])
+                for transaction in transactions[order.id]
+            )
+            + generate_invoices_search_vector_value(invoices[order.id])
+            + generate_events_search_vector_value(
+                event.parameters__message for event in events[order.id]
+            )
+        )
+    return search_vectors
+
+
+def _get_values_per_parent(
+    qs: "QuerySet",
+    parent_field: str,
+    fields: list[str],
+    limit: int,
+    ordering: list[str] | None = None,
+) -> defaultdict[Any, list[Any]]:
+    """Return the first `limit` rows of the given fields grouped by the parent."""
+    ordering = ordering or list(qs.model._meta.ordering) or ["pk"]
+    qs = (
+        qs.annotate(
+            row_number=Window(
+                RowNumber(), partition_by=F(parent_field), order_by=ordering
+            )
+        )
+        .filter(row_number__lte=limit)
+        .order_by(parent_field, "row_number")
+    )
+    rows = defaultdict(list)
+    for row in qs.values_list(parent_field, *fields, named=True):
+        rows[getattr(row, parent_field)].append(row)
+    return rows
+
+
+def generate_order_fields_search_vector_value(
+    order: Any,
+    user: Any,
+    billing_address: Address | None,
+    shipping_address: Address | None,
+) -> list[NoValidationSearchVector]:
     search_vectors = [
         NoValidationSearchVector(Value(str(order.number)), config="simple", weight="A"),
         NoValidationSearchVector(
@@ -53,22 +280,20 @@ def prepare_order_search_vector_value(
                 Value(order.user_email), config="simple", weight="A"
             )
         )
-    if order.user:
+    if user:
         search_vectors.append(
-            NoValidationSearchVector(
-                Value(order.user.email), config="simple", weight="A"
-            )
+            NoValidationSearchVector(Value(user.email), config="simple", weight="A")
         )
-        if order.user.first_name:
+        if user.first_name:
             search_vectors.append(
                 NoValidationSearchVector(
-                    Value(order.user.first_name), config="simple", weight="A"
+                    Value(user.first_name), config="simple", weight="A"
                 )
             )
-        if order.user.last_name:
+        if user.last_name:
             search_vectors.append(
                 NoValidationSearchVector(
-                    Value(order.user.last_name), config="simple", weight="A"
+                    Value(user.last_name), config="simple", weight="A"
                 )
             )
 
@@ -78,14 +303,13 @@ def prepare_order_search_vector_value(
                 Value(order.customer_note), config="simple", weight="B"
             )
         )
-
-    if order.billing_address:
+    if billing_address:
         search_vectors += generate_address_search_vector_value(
-            order.billing_address, weight="B"
+            billing_address, weight="B"
         )
-    if order.shipping_address:
+    if shipping_address:
         search_vectors += generate_address_search_vector_value(
-            order.shipping_address, weight="B"
+            shipping_address, weight="B"
         )
     if order.external_reference:
         search_vectors.append(
@@ -93,23 +317,14 @@ def prepare_order_search_vector_value(
                 Value(order.external_reference), config="simple", weight="B"
             )
         )
-
-    search_vectors += generate_order_payments_search_vector_value(order)
-    search_vectors += generate_order_discounts_search_vector_value(order)
-    search_vectors += generate_order_lines_search_vector_value(order)
-    search_vectors += generate_order_transactions_search_vector_value(order)
-    search_vectors += generate_order_invoices_search_vector_value(order)
-    search_vectors += generate_order_events_search_vector_value(order)
     return search_vectors
 
 
-def generate_order_transactions_search_vector_value(
-    order: "Order",
+def generate_transactions_search_vector_value(
+    transactions_with_events: Iterable[tuple[Any, Iterable[Any]]],
 ) -> list[NoValidationSearchVector]:
     transaction_vectors = []
-    for transaction in order.payment_transactions.all()[
-        : settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS
-    ]:
+    for transaction, events in transactions_with_events:
         transaction_vectors.append(
             NoValidationSearchVector(
                 Value(graphene.Node.to_global_id("TransactionItem", transaction.token)),
@@ -125,9 +340,7 @@ def generate_order_transactions_search_vector_value(
                     weight="D",
                 )
             )
-        for event in transaction.events.all()[
-            : settings.SEARCH_ORDERS_MAX_INDEXED_TRANSACTIONS
-        ]:
+        for event in events:
             if event.psp_reference:
                 transaction_vectors.append(
                     NoValidationSearchVector(
@@ -139,11 +352,11 @@ def generate_order_transactions_search_vector_value(
     return transaction_vectors
 
 
-def generate_order_payments_search_vector_value(
-    order: "Order",
+def generate_payments_search_vector_value(
+    payments: Iterable[Any],
 ) -> list[NoValidationSearchVector]:
     payment_vectors = []
-    for payment in order.payments.all()[: settings.SEARCH_ORDERS_MAX_INDEXED_PAYMENTS]:
+    for payment in payments:
         payment_vectors.append(
             NoValidationSearchVector(
                 Value(graphene.Node.to_global_id("Payment", payment.id)),
@@ -162,13 +375,11 @@ def generate_order_payments_search_vector_value(
     return payment_vectors
 
 
-def generate_order_discounts_search_vector_value(
-    order: "Order",
+def generate_discounts_search_vector_value(
+    discounts: Iterable[Any],
 ) -> list[NoValidationSearchVector]:
     discount_vectors = []
-    for discount in order.discounts.all()[
-        : settings.SEARCH_ORDERS_MAX_INDEXED_DISCOUNTS
-    ]:
+    for discount in discounts:
         if discount.name:
             discount_vectors.append(
                 NoValidationSearchVector(
@@ -188,88 +399,54 @@ def generate_order_discounts_search_vector_value(
     return discount_vectors
 
 
-def generate_order_lines_search_vector_value(
-    order: "Order",
+def generate_lines_search_vector_value(
+    lines: Iterable[Any],
 ) -> list[NoValidationSearchVector]:
     line_vectors = []
-    for line in order.lines.all()[: settings.SEARCH_ORDERS_MAX_INDEXED_LINES]:
-        if line.product_sku:
-            line_vectors.append(
-                NoValidationSearchVector(
-                    Value(line.product_sku),
-                    config="simple",
-                    weight="C",
-                )
-            )
-        if line.product_name:
-            line_vectors.append(
-                NoValidationSearchVector(
-                    Value(line.product_name),
-                    config="simple",
-                    weight="C",
-                )
-            )
-        if line.variant_name:
-            line_vectors.append(
-                NoValidationSearchVector(
-                    Value(line.variant_name),
-                    config="simple",
-                    weight="C",
-                )
-            )
-        if line.translated_product_name:
-            line_vectors.append(
-                NoValidationSearchVector(
-                    Value(line.translated_product_name),
-                    config="simple",
-                    weight="C",
-                )
-            )
-        if line.translated_variant_name:
-            line_vectors.append(
-                NoValidationSearchVector(
-                    Value(line.translated_variant_name),
-                    config="simple",
-                    weight="C",
+    for line in lines:
+        for value in [
+            line.product_sku,
+            line.product_name,
+            line.variant_name,
+            line.translated_product_name,
+            line.translated_variant_name,
+        ]:
+            if value:
+                line_vectors.append(
+                    NoValidationSearchVector(
+                        Value(value),
+                        config="simple",
+                        weight="C",
+                    )
                 )
-            )
     return line_vectors
 
 
-def generate_order_invoices_search_vector_value(
-    order: "Order",
+def generate_invoices_search_vector_value(
+    invoices: Iterable[Any],
 ) -> list[NoValidationSearchVector]:
-    invoice_vectors = []
-    for invoice in order.invoices.all().order_by("-created_at")[
-        : settings.SEARCH_ORDERS_MAX_INDEXED_INVOICES
-    ]:
-        invoice_vectors.append(
-            NoValidationSearchVector(
-                Value(graphene.Node.to_global_id("Invoice", invoice.id)),
-                config="simple",
-                weight="D",
-            )
+    return [
+        NoValidationSearchVector(
+            Value(graphene.Node.to_global_id("Invoice", invoice.id)),
+            config="simple",
+            weight="D",
         )
-    return invoice_vectors
+        for invoice in invoices
+    ]
 
 
-def generate_order_events_search_vector_value(
-    order: "Order",
+def generate_events_search_vector_value(
+    messages: Iterable[str | None],
 ) -> list[NoValidationSearchVector]:
-    event_vectors = []
-    events = order.events.filter(
-        type__in=[OrderEvents.NOTE_ADDED, OrderEvents.NOTE_UPDATED]
-    ).order_by("-date")
-    for event in events[: settings.SEARCH_ORDERS_MAX_INDEXED_EVENTS]:
-        if message := event.parameters.get("message"):
-            event_vectors.append(
-                NoValidationSearchVector(
-                    Value(message),
-                    config="simple",
-                    weight="D",
-                )
-            )
-    return event_vectors
+    return [
+        NoValidationSearchVector(
+            Value(message),
+            config="simple",
+            weight="D",
+        )
+        for message in messages
+        if message
+    ]
 
 
 def search_orders(qs: "QuerySet[Order]", value) -> "QuerySet[Order]":
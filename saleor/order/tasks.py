@@ -21,6 +21,7 @@ from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_multiple_events
 from . import OrderEvents, OrderStatus
 from .actions import call_order_event, call_order_events
+from .calculations import fetch_orders_prices_if_expired
 from .models import Order, OrderEvent
 from .utils import invalidate_order_prices
 
@@ -37,13 +38,18 @@ DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 @app.task
 @allow_writer()
 def recalculate_orders_task(order_ids: list[int]):
-    orders = Order.objects.filter(id__in=order_ids)
+    orders = list(Order.objects.filter(id__in=order_ids).select_related("channel"))
 
     for order in orders:
         invalidate_order_prices(order)
 
     Order.objects.bulk_update(orders, ["should_refresh_prices"])
 
+    # Refresh the prices right away, so the tax apps are called concurrently for all
+    # orders instead of one by one when the orders are fetched.
+    manager = get_plugins_manager(allow_replica=False)
+    fetch_orders_prices_if_expired(orders, manager)
+
 
 @app.task
 @allow_writer()
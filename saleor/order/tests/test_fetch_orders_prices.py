@@ -0,0 +1,181 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db import connections
+
+from ...core.db.connection import allow_writer
+from ...core.taxes import TaxData, TaxLineData
+from .. import OrderStatus
+from ..calculations import fetch_orders_prices_if_expired
+from ..models import Order
+
+
+def _get_tax_data(order, _tax_app_identifier):
+    tax_rate = Decimal(10)
+    lines = []
+    for line in order.lines.all():
+        net = line.undiscounted_total_price_net_amount
+        lines.append(
+            TaxLineData(
+                total_net_amount=net,
+                total_gross_amount=net * Decimal("1.1"),
+                tax_rate=tax_rate,
+            )
+        )
+    shipping_net = order.base_shipping_price_amount
+    return TaxData(
+        shipping_price_net_amount=shipping_net,
+        shipping_price_gross_amount=shipping_net * Decimal("1.1"),
+        shipping_tax_rate=tax_rate,
+        lines=lines,
+    )
+
+
+@pytest.fixture
+def editable_orders(order_with_lines, order_list):
+    orders = [order_with_lines, *order_list]
+    for order in orders:
+        order.status = OrderStatus.UNCONFIRMED
+        order.should_refresh_prices = True
+    Order.objects.bulk_update(orders, ["status", "should_refresh_prices"])
+    return orders
+
+
+def test_fetch_orders_prices_if_expired_tax_app(
+    editable_orders, tax_configuration_tax_app
+):
+    # given
+    manager = Mock(get_taxes_for_order=Mock(side_effect=_get_tax_data))
+
+    # when
+    orders_lines = fetch_orders_prices_if_expired(editable_orders, manager)
+
+    # then
+    assert manager.get_taxes_for_order.call_count == len(editable_orders)
+    assert set(orders_lines) == {order.pk for order in editable_orders}
+    for order in editable_orders:
+        order.refresh_from_db()
+        assert not order.should_refresh_prices
+        assert order.tax_error is None
+        assert order.shipping_tax_rate == Decimal("0.1")
+        for line in order.lines.all():
+            assert line.tax_rate == Decimal("0.1")
+            assert line.total_price_gross_amount == (
+                line.total_price_net_amount * Decimal("1.1")
+            )
+
+
+def test_fetch_orders_prices_if_expired_skips_not_expired_orders(
+    editable_orders, tax_configuration_tax_app
+):
+    # given
+    manager = Mock(get_taxes_for_order=Mock(side_effect=_get_tax_data))
+    order, *not_expired_orders = editable_orders
+    for not_expired_order in not_expired_orders:
+        not_expired_order.should_refresh_prices = False
+    not_editable_order = not_expired_orders[0]
+    not_editable_order.status = OrderStatus.UNFULFILLED
+    not_editable_order.should_refresh_prices = True
+
+    # when
+    orders_lines = fetch_orders_prices_if_expired(editable_orders, manager)
+
+    # then
+    assert list(orders_lines) == [order.pk]
+    manager.get_taxes_for_order.assert_called_once()
+
+
+def test_fetch_orders_prices_if_expired_sync_webhooks_not_allowed(
+    editable_orders, tax_configuration_tax_app
+):
+    # given
+    manager = Mock(get_taxes_for_order=Mock(side_effect=_get_tax_data))
+
+    # when
+    orders_lines = fetch_orders_prices_if_expired(
+        editable_orders, manager, allow_sync_webhooks=False
+    )
+
+    # then
+    assert orders_lines == {}
+    manager.get_taxes_for_order.assert_not_called()
+    for order in editable_orders:
+        order.refresh_from_db()
+        assert order.should_refresh_prices
+
+
+def test_fetch_orders_prices_if_expired_flat_rates(
+    editable_orders, tax_configuration_flat_rates
+):
+    # given
+    manager = Mock()
+
+    # when
+    orders_lines = fetch_orders_prices_if_expired(editable_orders, manager)
+
+    # then
+    assert set(orders_lines) == {order.pk for order in editable_orders}
+    manager.get_taxes_for_order.assert_not_called()
+    for order in editable_orders:
+        order.refresh_from_db()
+        assert not order.should_refresh_prices
+
+
+@patch("saleor.order.calculations.ThreadPoolExecutor")
+def test_fetch_orders_prices_if_expired_sequential_in_transaction(
+    mocked_executor, editable_orders, tax_configuration_tax_app
+):
+    # given
+    manager = Mock(get_taxes_for_order=Mock(side_effect=_get_tax_data))
+
+    # when
+    fetch_orders_prices_if_expired(editable_orders, manager, max_concurrency=4)
+
+    # then
+    mocked_executor.assert_not_called()
+    assert manager.get_taxes_for_order.call_count == len(editable_orders)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fetch_orders_prices_if_expired_concurrent_tax_app_calls(
+    editable_orders, tax_configuration_tax_app
+):
+    # given
+    writer_allowed_in_threads = []
+
+    def get_tax_data(order, tax_app_identifier):
+        writer_allowed_in_threads.append(
+            getattr(connections["default"], "_allow_writer", False)
+        )
+        return _get_tax_data(order, tax_app_identifier)
+
+    manager = Mock(get_taxes_for_order=Mock(side_effect=get_tax_data))
+    thread_manager = Mock(get_taxes_for_order=Mock(side_effect=get_tax_data))
+
+    # when
+    with (
+        patch(
+            "saleor.order.calculations.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mocked_executor,
+        patch(
+            "saleor.order.calculations.PluginsManager", return_value=thread_manager
+        ) as mocked_manager_class,
+        allow_writer(),
+    ):
+        fetch_orders_prices_if_expired(editable_orders, manager, max_concurrency=2)
+
+    # then
+    mocked_executor.assert_called_once_with(max_workers=2)
+    # each thread uses its own plugins manager
+    assert mocked_manager_class.call_count == 2
+    manager.get_taxes_for_order.assert_not_called()
+    assert thread_manager.get_taxes_for_order.call_count == len(editable_orders)
+    # the threads get the writer access of the caller
+    assert all(writer_allowed_in_threads)
+    for order in editable_orders:
+        order.refresh_from_db()
+        assert not order.should_refresh_prices
+        assert order.shipping_tax_rate == Decimal("0.1")
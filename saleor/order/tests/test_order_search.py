@@ -1,8 +1,14 @@
 from decimal import Decimal
 
+from ...core.postgres import FlatConcatSearchVector
 from ...discount import DiscountValueType
-from ..models import OrderLine
-from ..search import prepare_order_search_vector_value, update_order_search_vector
+from .. import OrderEvents
+from ..models import Order, OrderLine
+from ..search import (
+    prepare_order_search_vector_value,
+    prepare_orders_search_vector_values,
+    update_order_search_vector,
+)
 
 
 def test_update_order_search_vector_auto_save(order):
@@ -112,3 +118,50 @@ def test_prepare_order_search_vector_value_no_relations_data(order, address_usa)
 
     # then
     assert search_vector_value
+
+
+def test_prepare_orders_search_vector_values_matches_single_order_value(
+    order_with_lines, order, address_usa, payment_dummy, settings
+):
+    # given
+    settings.SEARCH_ORDERS_MAX_INDEXED_LINES = 1
+    order_with_lines.shipping_address = address_usa
+    order_with_lines.customer_note = "Customer note"
+    order_with_lines.external_reference = "external-reference"
+    order_with_lines.save(
+        update_fields=["shipping_address", "customer_note", "external_reference"]
+    )
+    order_with_lines.discounts.create(
+        value_type=DiscountValueType.FIXED,
+        name="discount",
+        translated_name="discount translated",
+        value=Decimal("20"),
+        amount=(order_with_lines.undiscounted_total - order_with_lines.total).gross,
+    )
+    payment_dummy.psp_reference = "TestABC"
+    payment_dummy.save(update_fields=["psp_reference"])
+    transaction = order_with_lines.payment_transactions.create(psp_reference="ABC")
+    transaction.events.create(psp_reference="event-psp-reference")
+    order_with_lines.invoices.create()
+    order_with_lines.events.create(
+        type=OrderEvents.NOTE_ADDED, parameters={"message": "Note message"}
+    )
+    orders = [order_with_lines, order]
+
+    # when
+    search_vectors = prepare_orders_search_vector_values(
+        [order.pk for order in orders], "default"
+    )
+
+    # then
+    for order in orders:
+        Order.objects.filter(pk=order.pk).update(
+            search_vector=FlatConcatSearchVector(
+                *prepare_order_search_vector_value(order)
+            )
+        )
+        expected_vector = Order.objects.get(pk=order.pk).search_vector
+        Order.objects.filter(pk=order.pk).update(
+            search_vector=FlatConcatSearchVector(*search_vectors[order.pk])
+        )
+        assert Order.objects.get(pk=order.pk).search_vector == expected_vector
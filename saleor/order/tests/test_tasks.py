@@ -19,6 +19,7 @@ from ..tasks import (
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
+    recalculate_orders_task,
     send_order_updated,
 )
 
@@ -897,3 +898,41 @@ def test_send_order_updated(
     )
 
     assert wrapped_call_order_event.called
+
+
+@patch("saleor.order.tasks.fetch_orders_prices_if_expired")
+def test_recalculate_orders_task(mocked_fetch_orders_prices, draft_order, order_list):
+    # given
+    not_editable_order = order_list[0]
+    draft_order.should_refresh_prices = False
+    not_editable_order.status = OrderStatus.UNFULFILLED
+    not_editable_order.should_refresh_prices = False
+    Order.objects.bulk_update(
+        [draft_order, not_editable_order], ["status", "should_refresh_prices"]
+    )
+
+    # when
+    recalculate_orders_task([draft_order.pk, not_editable_order.pk])
+
+    # then
+    draft_order.refresh_from_db()
+    not_editable_order.refresh_from_db()
+    assert draft_order.should_refresh_prices
+    # prices of not editable orders are not refreshed
+    assert not not_editable_order.should_refresh_prices
+    mocked_fetch_orders_prices.assert_called_once()
+    orders = mocked_fetch_orders_prices.call_args.args[0]
+    assert {order.pk for order in orders} == {draft_order.pk, not_editable_order.pk}
+
+
+def test_recalculate_orders_task_refreshes_prices(draft_order):
+    # given
+    draft_order.should_refresh_prices = False
+    draft_order.save(update_fields=["should_refresh_prices"])
+
+    # when
+    recalculate_orders_task([draft_order.pk])
+
+    # then
+    draft_order.refresh_from_db()
+    assert not draft_order.should_refresh_prices
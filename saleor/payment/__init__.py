@@ -125,6 +125,26 @@ class ChargeStatus:
     ]
 
 
+class GatewayNotificationStatus:
+    """Represents the processing status of a queued payment gateway notification.
+
+    The following statuses are possible:
+    - PENDING - the notification is waiting for processing, or for a retry.
+    - PROCESSED - the notification was processed.
+    - FAILED - the processing failed and the notification won't be retried.
+    """
+
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSED, "Processed"),
+        (FAILED, "Failed"),
+    ]
+
+
 class StorePaymentMethod:
     """Represents if and how a payment should be stored in a payment gateway.
 
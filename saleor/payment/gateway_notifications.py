@@ -0,0 +1,133 @@
+"""Queue of the notifications received from the payment gateways.
+
+When `PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED` is set, the gateway webhooks
+only validate the received notification, store it and acknowledge it right away.
+The stored notifications are processed by `process_gateway_notifications_task`.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import GatewayNotificationStatus
+from .models import GatewayNotification
+
+if TYPE_CHECKING:
+    from ..plugins.manager import PluginsManager
+
+logger = logging.getLogger(__name__)
+
+# Functions processing a single notification, called with the stored payload,
+# the gateway config and the channel slug.
+GATEWAY_NOTIFICATION_PROCESSORS = {
+    "mirumee.payments.adyen": (
+        "saleor.payment.gateways.adyen.webhooks.process_notification"
+    ),
+    "saleor.payments.stripe": (
+        "saleor.payment.gateways.stripe.webhooks.process_notification"
+    ),
+}
+
+
+def enqueue_gateway_notification(
+    *,
+    plugin_id: str,
+    channel_slug: str,
+    idempotency_key: str,
+    payment_reference: str,
+    event_type: str,
+    payload: dict[str, Any],
+) -> bool:
+    """Store the notification and schedule its processing.
+
+    Return False when the notification was already received.
+    """
+    from .tasks import process_gateway_notifications_task
+
+    _notification, created = GatewayNotification.objects.get_or_create(
+        plugin_id=plugin_id,
+        idempotency_key=idempotency_key,
+        defaults={
+            "channel_slug": channel_slug,
+            "payment_reference": payment_reference,
+            "event_type": event_type,
+            "payload": payload,
+        },
+    )
+    if not created:
+        logger.info(
+            "Skipping duplicated payment gateway notification",
+            extra={"plugin_id": plugin_id, "idempotency_key": idempotency_key},
+        )
+        return False
+
+    transaction.on_commit(
+        lambda: process_gateway_notifications_task.delay(plugin_id, payment_reference)
+    )
+    return True
+
+
+def process_gateway_notifications(
+    plugin_id: str, payment_reference: str, manager: "PluginsManager"
+):
+    """Process the pending notifications of a single payment.
+
+    The notifications are locked for the time of processing, so the notifications of
+    the same payment are never processed concurrently. When the processing of
+    a notification fails, it's retried later, and the following notifications of
+    the payment wait for it.
+    """
+    processor = import_string(GATEWAY_NOTIFICATION_PROCESSORS[plugin_id])
+    with transaction.atomic():
+        notifications = (
+            GatewayNotification.objects.select_for_update(of=("self",))
+            .filter(
+                plugin_id=plugin_id,
+                payment_reference=payment_reference,
+                status=GatewayNotificationStatus.PENDING,
+            )
+            .order_by("pk")
+        )
+        for notification in notifications:
+            notification.attempts += 1
+            plugin = manager.get_plugin(plugin_id, notification.channel_slug)
+            if not plugin or not plugin.active:
+                notification.status = GatewayNotificationStatus.FAILED
+                notification.error = "The plugin is not active in the channel."
+                notification.save(update_fields=["attempts", "status", "error"])
+                continue
+            try:
+                with transaction.atomic():
+                    processor(
+                        notification.payload, plugin.config, notification.channel_slug
+                    )
+            except Exception as e:
+                logger.exception(
+                    "Unable to process the payment gateway notification",
+                    extra={
+                        "plugin_id": plugin_id,
+                        "idempotency_key": notification.idempotency_key,
+                        "attempts": notification.attempts,
+                    },
+                )
+                notification.error = str(e)
+                if (
+                    notification.attempts
+                    < settings.PAYMENT_GATEWAY_NOTIFICATIONS_MAX_ATTEMPTS
+                ):
+                    notification.save(update_fields=["attempts", "error"])
+                    # Keep the order of the payment notifications.
+                    break
+                notification.status = GatewayNotificationStatus.FAILED
+                notification.save(update_fields=["attempts", "status", "error"])
+                continue
+            notification.status = GatewayNotificationStatus.PROCESSED
+            notification.processed_at = timezone.now()
+            notification.error = None
+            notification.save(
+                update_fields=["attempts", "status", "processed_at", "error"]
+            )
@@ -257,7 +257,12 @@ class AdyenGatewayPlugin(BasePlugin):
             return HttpResponseNotFound()
         config = self._get_gateway_config()
         if path.startswith(WEBHOOK_PATH):
-            return handle_webhook(request, config)
+            return handle_webhook(
+                request,
+                config,
+                plugin_id=self.PLUGIN_ID,
+                channel_slug=self.channel.slug,
+            )
         if path.startswith(ADDITIONAL_ACTION_PATH):
             with tracer.start_as_current_span("adyen.checkout.payment_details") as span:
                 span.set_attribute(saleor_attributes.COMPONENT, "payment")
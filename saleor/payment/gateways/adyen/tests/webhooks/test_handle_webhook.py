@@ -0,0 +1,143 @@
+import json
+from unittest import mock
+
+import graphene
+
+from ..... import GatewayNotificationStatus
+from .....models import GatewayNotification
+from ...plugin import AdyenGatewayPlugin
+from ...webhooks import EVENT_MAP
+
+
+def _webhook_request(rf, notification):
+    return rf.post(
+        path="/webhooks",
+        data=json.dumps(
+            {"notificationItems": [{"NotificationRequestItem": notification}]}
+        ),
+        content_type="application/json",
+    )
+
+
+@mock.patch.dict(
+    "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+    {"AUTHORISATION": mock.Mock()},
+)
+def test_handle_webhook_processes_notification_synchronously(
+    notification, adyen_plugin, rf, settings
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = False
+    plugin = adyen_plugin()
+    notification = notification()
+    request = _webhook_request(rf, notification)
+
+    # when
+    response = plugin.webhook(request, "/webhooks", None)
+
+    # then
+    assert response.content == b"[accepted]"
+    EVENT_MAP["AUTHORISATION"].assert_called_once_with(notification, plugin.config)
+    assert not GatewayNotification.objects.exists()
+
+
+@mock.patch.dict(
+    "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+    {"AUTHORISATION": mock.Mock()},
+)
+def test_handle_webhook_enqueues_notification(
+    notification,
+    adyen_plugin,
+    payment_adyen_for_order,
+    rf,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = True
+    plugin = adyen_plugin()
+    payment_id = graphene.Node.to_global_id("Payment", payment_adyen_for_order.pk)
+    notification = notification(merchant_reference=payment_id)
+    request = _webhook_request(rf, notification)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = plugin.webhook(request, "/webhooks", None)
+
+    # then
+    assert response.content == b"[accepted]"
+    gateway_notification = GatewayNotification.objects.get()
+    assert gateway_notification.plugin_id == AdyenGatewayPlugin.PLUGIN_ID
+    assert gateway_notification.idempotency_key == (
+        f"{notification['pspReference']}:AUTHORISATION"
+    )
+    assert gateway_notification.payment_reference == payment_id
+    assert gateway_notification.status == GatewayNotificationStatus.PROCESSED
+    assert gateway_notification.attempts == 1
+    EVENT_MAP["AUTHORISATION"].assert_called_once_with(notification, plugin.config)
+
+
+@mock.patch.dict(
+    "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+    {"AUTHORISATION": mock.Mock()},
+)
+def test_handle_webhook_skips_duplicated_notification(
+    notification, adyen_plugin, rf, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = True
+    plugin = adyen_plugin()
+    notification = notification()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        plugin.webhook(_webhook_request(rf, notification), "/webhooks", None)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        response = plugin.webhook(_webhook_request(rf, notification), "/webhooks", None)
+
+    # then
+    assert response.content == b"[accepted]"
+    assert not callbacks
+    assert GatewayNotification.objects.count() == 1
+    EVENT_MAP["AUTHORISATION"].assert_called_once()
+
+
+@mock.patch.dict(
+    "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+    {
+        "AUTHORISATION": mock.Mock(side_effect=Exception("Error")),
+        "CAPTURE": mock.Mock(),
+    },
+)
+def test_handle_webhook_retries_failed_notification_before_next_one(
+    notification, adyen_plugin, rf, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = True
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_MAX_ATTEMPTS = 2
+    plugin = adyen_plugin()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        plugin.webhook(
+            _webhook_request(rf, notification(event_code="AUTHORISATION")),
+            "/webhooks",
+            None,
+        )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        plugin.webhook(
+            _webhook_request(rf, notification(event_code="CAPTURE")),
+            "/webhooks",
+            None,
+        )
+
+    # then
+    authorization, capture = GatewayNotification.objects.order_by("pk")
+    assert authorization.status == GatewayNotificationStatus.FAILED
+    assert authorization.attempts == 2
+    assert authorization.error == "Error"
+    assert capture.status == GatewayNotificationStatus.PROCESSED
+    assert EVENT_MAP["AUTHORISATION"].call_count == 2
+    EVENT_MAP["CAPTURE"].assert_called_once()
@@ -12,6 +12,7 @@ from urllib.parse import urlencode, urlparse
 
 import Adyen
 import graphene
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
 from django.forms.models import model_to_dict
@@ -46,6 +47,7 @@ from ....payment.models import Payment, Transaction
 from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, PaymentError, TransactionKind, gateway
 from ...gateway import payment_refund_or_void
+from ...gateway_notifications import enqueue_gateway_notification
 from ...interface import GatewayConfig, GatewayResponse
 from ...utils import (
     create_payment_information,
@@ -983,8 +985,22 @@ def validate_merchant_account(
     )
 
 
+def process_notification(
+    notification: dict[str, Any], gateway_config: GatewayConfig, _channel_slug: str
+):
+    """Process the notification taken from the payment gateway notifications queue."""
+    event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
+    if event_handler:
+        event_handler(notification, gateway_config)
+
+
 @transaction_with_commit_on_errors()
-def handle_webhook(request: SaleorContext, gateway_config: "GatewayConfig"):
+def handle_webhook(
+    request: SaleorContext,
+    gateway_config: "GatewayConfig",
+    plugin_id: str,
+    channel_slug: str,
+):
     try:
         json_data = json.loads(request.body)
     except JSONDecodeError:
@@ -1004,10 +1020,23 @@ def handle_webhook(request: SaleorContext, gateway_config: "GatewayConfig"):
     if not validate_auth_user(request.headers, gateway_config):
         return HttpResponseBadRequest("Invalid or missing basic auth.")
 
-    event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
-    if event_handler:
-        event_handler(notification, gateway_config)
+    event_code = notification.get("eventCode", "")
+    event_handler = EVENT_MAP.get(event_code)
+    if not event_handler:
         return HttpResponse("[accepted]")
+    if settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED:
+        # Adyen retries the notification with the same PSP reference and event code
+        # until it's accepted.
+        enqueue_gateway_notification(
+            plugin_id=plugin_id,
+            channel_slug=channel_slug,
+            idempotency_key=f"{notification.get('pspReference', '')}:{event_code}",
+            payment_reference=notification.get("merchantReference") or "",
+            event_type=event_code,
+            payload=notification,
+        )
+    else:
+        event_handler(notification, gateway_config)
     return HttpResponse("[accepted]")
 
 
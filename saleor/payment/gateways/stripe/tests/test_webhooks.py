@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
+import stripe
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from stripe.stripe_object import StripeObject
@@ -12,10 +13,10 @@ from .....checkout.calculations import calculate_checkout_total_with_gift_cards
 from .....checkout.complete_checkout import complete_checkout
 from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from .....order.actions import order_charged, order_refunded, order_voided
-from .....payment.models import Transaction
+from .....payment.models import GatewayNotification, Transaction
 from .....plugins.manager import get_plugins_manager
 from .....tests import race_condition
-from .... import ChargeStatus, TransactionKind
+from .... import ChargeStatus, GatewayNotificationStatus, TransactionKind
 from ....utils import price_to_minor_unit
 from ..consts import (
     AUTHORIZED_STATUS,
@@ -26,6 +27,7 @@ from ..consts import (
     WEBHOOK_CANCELED_EVENT,
     WEBHOOK_FAILED_EVENT,
     WEBHOOK_PROCESSING_EVENT,
+    WEBHOOK_REFUND_EVENT,
     WEBHOOK_SUCCESS_EVENT,
 )
 from ..webhooks import (
@@ -1487,6 +1489,55 @@ def test_handle_webhook_events_when_secret_is_missing(stripe_plugin, rf):
     assert response.status_code == 500
 
 
+@patch("saleor.payment.gateways.stripe.webhooks.handle_refund")
+@patch("saleor.payment.gateways.stripe.stripe_api.stripe.Webhook.construct_event")
+def test_handle_webhook_events_with_notifications_queue(
+    mocked_webhook_event,
+    mocked_handle_refund,
+    stripe_plugin,
+    rf,
+    channel_USD,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = True
+    event_data = {
+        "id": "evt_1Ip9ANH1Vac4G4dbE9ch7zGS",
+        "object": "event",
+        "type": WEBHOOK_REFUND_EVENT,
+        "data": {
+            "object": {"id": "ch_1", "object": "charge", "payment_intent": "pi_1"}
+        },
+    }
+    mocked_webhook_event.return_value = stripe.Event.construct_from(
+        event_data, "secret_key"
+    )
+    request = rf.post(
+        path="/webhooks/", data=event_data, content_type="application/json"
+    )
+    request.META["HTTP_STRIPE_SIGNATURE"] = "1234"
+    plugin = stripe_plugin()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = plugin.webhook(request, "/webhooks/", None)
+        duplicated_response = plugin.webhook(request, "/webhooks/", None)
+
+    # then
+    assert response.status_code == 200
+    assert duplicated_response.status_code == 200
+    notification = GatewayNotification.objects.get()
+    assert notification.idempotency_key == event_data["id"]
+    assert notification.payment_reference == "pi_1"
+    assert notification.status == GatewayNotificationStatus.PROCESSED
+    mocked_handle_refund.assert_called_once()
+    charge, config, channel_slug = mocked_handle_refund.call_args.args
+    assert charge.payment_intent == "pi_1"
+    assert config == plugin.config
+    assert channel_slug == channel_USD.slug
+
+
 @patch("saleor.payment.gateway.refund")
 @patch("saleor.checkout.complete_checkout._get_order_data")
 def test_finalize_checkout_not_created_order_payment_refund(
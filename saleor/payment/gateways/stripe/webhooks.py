@@ -2,6 +2,7 @@ import logging
 from typing import cast
 
 import stripe
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db.models import Prefetch
 from django.http import HttpResponse
@@ -20,6 +21,7 @@ from ....order.models import Order
 from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, TransactionKind
 from ...gateway import payment_refund_or_void
+from ...gateway_notifications import enqueue_gateway_notification
 from ...interface import GatewayConfig, GatewayResponse
 from ...models import Payment, Transaction
 from ...utils import (
@@ -31,8 +33,10 @@ from ...utils import (
     update_payment_method_details,
 )
 from .consts import (
+    PLUGIN_ID,
     WEBHOOK_AUTHORIZED_EVENT,
     WEBHOOK_CANCELED_EVENT,
+    WEBHOOK_EVENTS,
     WEBHOOK_FAILED_EVENT,
     WEBHOOK_PROCESSING_EVENT,
     WEBHOOK_REFUND_EVENT,
@@ -80,6 +84,42 @@ def handle_webhook(
         logger.warning("Invalid signature for Stripe webhook", extra={"error": str(e)})
         return HttpResponse(status=400)
 
+    if event.type not in WEBHOOK_EVENTS:
+        logger.warning(
+            "Received unhandled webhook events", extra={"event_type": event.type}
+        )
+        return HttpResponse(status=200)
+
+    if settings.PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED:
+        stripe_object = event.data.object
+        # The refund events are sent for the charge object.
+        payment_intent_id = stripe_object.get("payment_intent") or stripe_object.id
+        # Stripe sends the retries of the event with the same event ID.
+        enqueue_gateway_notification(
+            plugin_id=PLUGIN_ID,
+            channel_slug=channel_slug,
+            idempotency_key=event.id,
+            payment_reference=payment_intent_id,
+            event_type=event.type,
+            payload=event.to_dict_recursive(),
+        )
+    else:
+        _process_event(event, gateway_config, channel_slug)
+    return HttpResponse(status=200)
+
+
+def process_notification(
+    event_data: dict, gateway_config: "GatewayConfig", channel_slug: str
+):
+    """Process the event taken from the payment gateway notifications queue."""
+    api_key = gateway_config.connection_params["secret_api_key"]
+    event = stripe.Event.construct_from(event_data, api_key)
+    _process_event(event, gateway_config, channel_slug)
+
+
+def _process_event(
+    event: StripeObject, gateway_config: "GatewayConfig", channel_slug: str
+):
     webhook_handlers = {
         WEBHOOK_SUCCESS_EVENT: handle_successful_payment_intent,
         WEBHOOK_AUTHORIZED_EVENT: handle_authorized_payment_intent,
@@ -88,21 +128,15 @@ def handle_webhook(
         WEBHOOK_CANCELED_EVENT: handle_failed_payment_intent,
         WEBHOOK_REFUND_EVENT: handle_refund,
     }
-    if event.type in webhook_handlers:
-        logger.debug(
-            "Processing new Stripe webhook",
-            extra={
-                "event_type": event.type,
-                "event_id": event.id,
-                "channel_slug": channel_slug,
-            },
-        )
-        webhook_handlers[event.type](event.data.object, gateway_config, channel_slug)
-    else:
-        logger.warning(
-            "Received unhandled webhook events", extra={"event_type": event.type}
-        )
-    return HttpResponse(status=200)
+    logger.debug(
+        "Processing new Stripe webhook",
+        extra={
+            "event_type": event.type,
+            "event_id": event.id,
+            "channel_slug": channel_slug,
+        },
+    )
+    webhook_handlers[event.type](event.data.object, gateway_config, channel_slug)
 
 
 def _channel_slug_is_different_from_payment_channel_slug(
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.1 on 2026-10-19 10:17
+
+import django.contrib.postgres.indexes
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0063_transactionitem_payment_method_type_ids_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GatewayNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("plugin_id", models.CharField(max_length=128)),
+                ("channel_slug", models.CharField(max_length=255)),
+                ("idempotency_key", models.CharField(max_length=512)),
+                (
+                    "payment_reference",
+                    models.CharField(blank=True, default="", max_length=512),
+                ),
+                ("event_type", models.CharField(max_length=128)),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processed", "Processed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=32,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("error", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "pending")),
+                        fields=["plugin_id", "payment_reference"],
+                        name="gateway_notification_pending",
+                    ),
+                    django.contrib.postgres.indexes.BTreeIndex(
+                        fields=["created_at"], name="gateway_notification_created"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("plugin_id", "idempotency_key"),
+                        name="unique_gateway_notification_idempotency",
+                    )
+                ],
+            },
+        ),
+    ]
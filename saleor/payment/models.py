@@ -20,6 +20,7 @@ from ..permission.enums import PaymentPermissions
 from . import (
     ChargeStatus,
     CustomPaymentChoices,
+    GatewayNotificationStatus,
     PaymentMethodType,
     StorePaymentMethod,
     TransactionAction,
@@ -487,3 +488,47 @@ class Transaction(models.Model):
 
     def get_amount(self):
         return Money(self.amount, self.currency)
+
+
+class GatewayNotification(models.Model):
+    """A notification received from a payment gateway, queued for processing.
+
+    The notifications of a single payment are processed one by one, in the order
+    they were received.
+    """
+
+    created_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    plugin_id = models.CharField(max_length=128)
+    channel_slug = models.CharField(max_length=255)
+    # Identifies the notification on the gateway side, the duplicates of the
+    # already received notification are ignored.
+    idempotency_key = models.CharField(max_length=512)
+    # Identifies the payment, the notification applies to.
+    payment_reference = models.CharField(max_length=512, blank=True, default="")
+    event_type = models.CharField(max_length=128)
+    payload = JSONField(encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=32,
+        choices=GatewayNotificationStatus.CHOICES,
+        default=GatewayNotificationStatus.PENDING,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+
+    class Meta:
+        ordering = ("pk",)
+        indexes = [
+            models.Index(
+                name="gateway_notification_pending",
+                fields=["plugin_id", "payment_reference"],
+                condition=models.Q(status=GatewayNotificationStatus.PENDING),
+            ),
+            BTreeIndex(fields=["created_at"], name="gateway_notification_created"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["plugin_id", "idempotency_key"],
+                name="unique_gateway_notification_idempotency",
+            )
+        ]
@@ -1,24 +1,35 @@
 import datetime
 import logging
 import uuid
+from collections import defaultdict
 
 import graphene
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Q
+from django.db.models import Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
 
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..checkout import CheckoutAuthorizeStatus
 from ..checkout.models import Checkout
 from ..core.db.connection import allow_writer
-from ..payment.models import TransactionEvent, TransactionItem
+from ..payment.models import GatewayNotification, TransactionEvent, TransactionItem
 from ..plugins.manager import get_plugins_manager
-from . import PaymentError, TransactionAction, TransactionEventType
+from . import (
+    GatewayNotificationStatus,
+    PaymentError,
+    TransactionAction,
+    TransactionEventType,
+)
 from .gateway import request_cancelation_action, request_refund_action
+from .gateway_notifications import process_gateway_notifications
 
 logger = logging.getLogger(__name__)
 
+GATEWAY_NOTIFICATIONS_DELETE_BATCH_SIZE = 1000
+
 
 def transactions_to_release_funds():
     """Fetch transactions for checkouts eligible for automatic refunds.
@@ -26,35 +37,39 @@ def transactions_to_release_funds():
     The function retrieves checkouts that are automatically refundable and have exceeded the
     predefined TTL. It then fetches related transactions that are authorized or charged,
     ready for fund release.
+
+    The checkouts are read from the `checkout_release_funds_idx` partial index,
+    in the order they became due.
     """
     expired_checkouts_time = (
         datetime.datetime.now(tz=datetime.UTC)
         - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
     )
 
-    checkouts = Checkout.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(
-        automatically_refundable=True,
-        last_change__lt=expired_checkouts_time,
-        last_transaction_modified_at__lt=expired_checkouts_time,
-        authorize_status__in=[
-            CheckoutAuthorizeStatus.PARTIAL,
-            CheckoutAuthorizeStatus.FULL,
-        ],
-    )
-
     # Fetch transactions for checkouts that are ready to release funds.
     transactions = (
-        TransactionItem.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+        TransactionItem.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        # Same expression as in the index, so the index can be used
+        .alias(
+            release_funds_at=Greatest(
+                "checkout__last_change", "checkout__last_transaction_modified_at"
+            )
+        )
+        .filter(
             Q(
-                Exists(checkouts.filter(pk=OuterRef("checkout_id"))),
+                checkout__automatically_refundable=True,
+                checkout__authorize_status__in=[
+                    CheckoutAuthorizeStatus.PARTIAL,
+                    CheckoutAuthorizeStatus.FULL,
+                ],
+                checkout__last_transaction_modified_at__isnull=False,
+                release_funds_at__lt=expired_checkouts_time,
                 order_id=None,
                 last_refund_success=True,
             )
             & (Q(authorized_value__gt=0) | Q(charged_value__gt=0))
         )
-    ).order_by("created_at")
+    ).order_by("release_funds_at", "created_at")
     return transactions
 
 
@@ -64,130 +79,206 @@ def transaction_release_funds_for_checkout_task():
     TRANSACTION_BATCH_SIZE = int(settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS)
 
     # Fetch transactions that are ready to release funds
-    transactions = transactions_to_release_funds().order_by("modified_at")
-    transactions_data = list(
-        transactions.values_list("pk", "checkout_id")[:TRANSACTION_BATCH_SIZE]
+    transaction_pks = list(
+        transactions_to_release_funds().values_list("pk", flat=True)[
+            :TRANSACTION_BATCH_SIZE
+        ]
     )
-    transaction_pks = [pk for pk, _checkout_id in transactions_data]
-    checkout_ids = [checkout_id for _, checkout_id in transactions_data]
+    if not transaction_pks:
+        logger.warning("No transactions to release funds.")
+        return
 
-    checkouts_data = Checkout.objects.filter(pk__in=checkout_ids).values_list(
-        "pk", "channel_id"
-    )
-    checkout_channel_ids = {channel_id for _, channel_id in checkouts_data}
-    channels_in_bulk = (
-        Channel.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(id__in=checkout_channel_ids)
-        .in_bulk()
-    )
-    checkout_id_to_channel = {
-        checkout_id: channels_in_bulk[channel_id]
-        for checkout_id, channel_id in checkouts_data
-    }
-    if transaction_pks:
-        # Select_related app as, this will be used to trigger the proper webhook.
-        transactions = TransactionItem.objects.filter(
-            pk__in=transaction_pks,
-            order_id=None,  # type: ignore[misc]
-        ).select_related("app")
-        transactions_with_cancel_request_events = []
-        transactions_with_charge_request_events = []
-
-        for transaction_item in transactions:
-            # If transaction is authorized we need to trigger the cancel event
-            if transaction_item.authorized_value:
-                event = TransactionEvent(
+    transactions = TransactionItem.objects.filter(
+        pk__in=transaction_pks,
+        order_id=None,  # type: ignore[misc]
+    ).order_by("pk")
+    events = []
+    for transaction_item in transactions:
+        # If transaction is authorized we need to trigger the cancel event
+        if transaction_item.authorized_value:
+            events.append(
+                TransactionEvent(
                     amount_value=transaction_item.authorized_value,
                     currency=transaction_item.currency,
                     type=TransactionEventType.CANCEL_REQUEST,
-                    transaction_id=transaction_item.id,
+                    transaction=transaction_item,
                     idempotency_key=str(uuid.uuid4()),
                 )
-                transactions_with_cancel_request_events.append(
-                    (transaction_item, event)
-                )
+            )
 
-            # If transaction is charged we need to trigger the refund event
-            if transaction_item.charged_value:
-                event = TransactionEvent(
+        # If transaction is charged we need to trigger the refund event
+        if transaction_item.charged_value:
+            events.append(
+                TransactionEvent(
                     amount_value=transaction_item.charged_value,
                     currency=transaction_item.currency,
                     type=TransactionEventType.REFUND_REQUEST,
-                    transaction_id=transaction_item.id,
+                    transaction=transaction_item,
                     idempotency_key=str(uuid.uuid4()),
                 )
-                transactions_with_charge_request_events.append(
-                    (transaction_item, event)
-                )
+            )
+    if not events:
+        logger.warning("No transactions to release funds.")
+        return
+
+    with transaction.atomic():
+        TransactionEvent.objects.bulk_create(events)
+        # Mark transactions as not refundable to avoid multiple automatic
+        # refund requests
+        transactions.update(last_refund_success=False)
+
+    # The requests are sent to the payment apps concurrently, with at most
+    # `TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP` tasks per app.
+    # All events of a transaction are handled by the same task, so its cancel
+    # request is sent before the refund request.
+    concurrency = settings.TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP
+    events_per_transaction: dict[int, list[int]] = defaultdict(list)
+    transactions_per_app: dict[str, list[int]] = defaultdict(list)
+    for event in events:
+        transaction_item = event.transaction
+        if transaction_item.pk not in events_per_transaction:
+            app_key = str(transaction_item.app_id or transaction_item.app_identifier)
+            transactions_per_app[app_key].append(transaction_item.pk)
+        events_per_transaction[transaction_item.pk].append(event.pk)
+    for transaction_ids in transactions_per_app.values():
+        for chunk_number in range(min(concurrency, len(transaction_ids))):
+            transaction_release_funds_task.delay(
+                [
+                    event_id
+                    for transaction_id in transaction_ids[chunk_number::concurrency]
+                    for event_id in events_per_transaction[transaction_id]
+                ]
+            )
+
 
-        if (
-            transactions_with_charge_request_events
-            or transactions_with_cancel_request_events
-        ):
-            with transaction.atomic():
-                TransactionEvent.objects.bulk_create(
-                    [event for _tr, event in transactions_with_cancel_request_events]
-                    + [event for _tr, event in transactions_with_charge_request_events]
+@app.task
+@allow_writer()
+def transaction_release_funds_task(event_ids: list[int]):
+    """Request the payment apps to cancel or refund the transactions of the events."""
+    events = TransactionEvent.objects.filter(pk__in=event_ids).select_related(
+        # Select_related app as, this will be used to trigger the proper webhook.
+        "transaction__app"
+    )
+    events_in_bulk = events.in_bulk()
+    checkouts_data = Checkout.objects.filter(
+        pk__in={event.transaction.checkout_id for event in events_in_bulk.values()}
+    ).values_list("pk", "channel_id")
+    channels_in_bulk = (
+        Channel.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(id__in={channel_id for _, channel_id in checkouts_data})
+        .in_bulk()
+    )
+    checkout_id_to_channel = {
+        checkout_id: channels_in_bulk[channel_id]
+        for checkout_id, channel_id in checkouts_data
+    }
+
+    manager = get_plugins_manager(allow_replica=True)
+    for event_id in event_ids:
+        event = events_in_bulk.get(event_id)
+        if not event:
+            continue
+        transaction_item = event.transaction
+        channel = checkout_id_to_channel.get(transaction_item.checkout_id)
+        if not channel:
+            logger.warning(
+                "Unable to release funds for transaction %s. Checkout not found.",
+                transaction_item.token,
+            )
+            continue
+        if event.type == TransactionEventType.CANCEL_REQUEST:
+            logger.info(
+                "Releasing funds for transaction %s - canceling",
+                transaction_item.token,
+                extra={
+                    "transactionId": graphene.Node.to_global_id(
+                        "TransactionItem", transaction_item.pk
+                    )
+                },
+            )
+            try:
+                request_cancelation_action(
+                    request_event=event,
+                    cancel_value=event.amount_value,
+                    action=TransactionAction.CANCEL,
+                    channel_slug=channel.slug,
+                    user=None,
+                    app=None,
+                    transaction=transaction_item,
+                    manager=manager,
                 )
-                # Mark transactions as not refundable to avoid multiple automatic
-                # refund requests
-                transactions.update(last_refund_success=False)
-
-            manager = get_plugins_manager(allow_replica=True)
-            for transaction_item, event in transactions_with_cancel_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - canceling",
+            except PaymentError as e:
+                logger.warning(
+                    "Unable to cancel transaction %s. %s",
                     transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
+                    str(e),
                 )
-                try:
-                    request_cancelation_action(
-                        request_event=event,
-                        cancel_value=event.amount_value,
-                        action=TransactionAction.CANCEL,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to cancel transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
+        else:
+            logger.info(
+                "Releasing funds for transaction %s - refunding",
+                transaction_item.token,
+                extra={
+                    "transactionId": graphene.Node.to_global_id(
+                        "TransactionItem", transaction_item.pk
                     )
-            for transaction_item, event in transactions_with_charge_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - refunding",
+                },
+            )
+            try:
+                request_refund_action(
+                    request_event=event,
+                    refund_value=event.amount_value,
+                    channel_slug=channel.slug,
+                    user=None,
+                    app=None,
+                    transaction=transaction_item,
+                    manager=manager,
+                )
+            except PaymentError as e:
+                logger.warning(
+                    "Unable to refund transaction %s. %s",
                     transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
+                    str(e),
                 )
-                try:
-                    request_refund_action(
-                        request_event=event,
-                        refund_value=event.amount_value,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to refund transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
-                    )
-        else:
-            logger.warning("No transactions to release funds.")
+
+
+@app.task(queue=settings.PAYMENT_GATEWAY_NOTIFICATIONS_CELERY_QUEUE_NAME)
+@allow_writer()
+def process_gateway_notifications_task(plugin_id: str, payment_reference: str):
+    manager = get_plugins_manager(allow_replica=False)
+    process_gateway_notifications(plugin_id, payment_reference, manager)
+
+
+@app.task
+@allow_writer()
+def retry_gateway_notifications_task():
+    """Schedule the processing of the pending payment gateway notifications.
+
+    Picks up the notifications which processing failed and should be retried, or
+    which task was lost.
+    """
+    retry_before = timezone.now() - settings.PAYMENT_GATEWAY_NOTIFICATIONS_RETRY_DELAY
+    payments = (
+        GatewayNotification.objects.filter(
+            status=GatewayNotificationStatus.PENDING, created_at__lt=retry_before
+        )
+        .values_list("plugin_id", "payment_reference")
+        .order_by()
+        .distinct()
+    )
+    for plugin_id, payment_reference in payments:
+        process_gateway_notifications_task.delay(plugin_id, payment_reference)
+
+
+@app.task
+@allow_writer()
+def delete_old_gateway_notifications_task():
+    """Delete the payment gateway notifications older than the configured TTL."""
+    expired_before = timezone.now() - settings.PAYMENT_GATEWAY_NOTIFICATIONS_TTL
+    ids = list(
+        GatewayNotification.objects.filter(created_at__lt=expired_before)
+        .exclude(status=GatewayNotificationStatus.PENDING)
+        .values_list("pk", flat=True)[:GATEWAY_NOTIFICATIONS_DELETE_BATCH_SIZE]
+    )
+    if ids:
+        GatewayNotification.objects.filter(pk__in=ids).delete()
+        delete_old_gateway_notifications_task.delay()
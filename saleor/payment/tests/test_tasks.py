@@ -1,13 +1,21 @@
 import datetime
+from collections import defaultdict
 from decimal import Decimal
 from unittest import mock
 
+from django.utils import timezone
 from freezegun import freeze_time
 
 from ...checkout import CheckoutAuthorizeStatus, CheckoutChargeStatus
 from ...checkout.actions import transaction_amounts_for_checkout_updated
-from .. import TransactionAction, TransactionEventType
-from ..tasks import transaction_release_funds_for_checkout_task
+from ...checkout.models import Checkout
+from .. import GatewayNotificationStatus, TransactionAction, TransactionEventType
+from ..models import GatewayNotification, TransactionEvent
+from ..tasks import (
+    delete_old_gateway_notifications_task,
+    retry_gateway_notifications_task,
+    transaction_release_funds_for_checkout_task,
+)
 
 
 @mock.patch("saleor.payment.tasks.request_cancelation_action")
@@ -447,3 +455,221 @@ def test_transaction_release_funds_for_checkout_task_transaction_with_charge(
     )
     transaction_item.refresh_from_db()
     assert transaction_item.last_refund_success is False
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_task.delay")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_concurrency_per_app(
+    mocked_release_funds_task,
+    checkout,
+    settings,
+    transaction_item_generator,
+    app,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP = 2
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    with freeze_time(ttl_time - datetime.timedelta(seconds=1)):
+        transaction_items = [
+            transaction_item_generator(
+                checkout_id=checkout.pk, app=app, charged_value=Decimal(100)
+            )
+            for _ in range(3)
+        ]
+        transaction_amounts_for_checkout_updated(
+            transaction_items[0], plugins_manager, user=None, app=None
+        )
+        checkout.automatically_refundable = True
+        checkout.save(update_fields=["automatically_refundable", "last_change"])
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    event_ids = [
+        event_ids
+        for call in mocked_release_funds_task.call_args_list
+        for event_ids in call.args
+    ]
+    assert len(event_ids) == 2
+    request_event_ids = TransactionEvent.objects.filter(
+        type=TransactionEventType.REFUND_REQUEST
+    ).values_list("pk", flat=True)
+    assert sorted(sum(event_ids, [])) == sorted(request_event_ids)
+    assert len(request_event_ids) == 3
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_task.delay")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_keeps_transaction_events_together(
+    mocked_release_funds_task,
+    checkout,
+    settings,
+    transaction_item_generator,
+    app,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP = 2
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    with freeze_time(ttl_time - datetime.timedelta(seconds=1)):
+        transaction_items = [
+            transaction_item_generator(
+                checkout_id=checkout.pk,
+                app=app,
+                authorized_value=Decimal(50),
+                charged_value=Decimal(100),
+            )
+            for _ in range(3)
+        ]
+        transaction_amounts_for_checkout_updated(
+            transaction_items[0], plugins_manager, user=None, app=None
+        )
+        checkout.automatically_refundable = True
+        checkout.save(update_fields=["automatically_refundable", "last_change"])
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    assert mocked_release_funds_task.call_count == 2
+    events_per_transaction = defaultdict(list)
+    tasks_per_transaction = defaultdict(set)
+    for task_number, call in enumerate(mocked_release_funds_task.call_args_list):
+        (event_ids,) = call.args
+        events = TransactionEvent.objects.in_bulk(event_ids)
+        for event_id in event_ids:
+            event = events[event_id]
+            events_per_transaction[event.transaction_id].append(event.type)
+            tasks_per_transaction[event.transaction_id].add(task_number)
+    # all events of a transaction are handled by a single task
+    assert all(len(tasks) == 1 for tasks in tasks_per_transaction.values())
+    assert len(events_per_transaction) == 3
+    # the cancel request is sent before the refund request
+    for event_types in events_per_transaction.values():
+        assert event_types == [
+            TransactionEventType.CANCEL_REQUEST,
+            TransactionEventType.REFUND_REQUEST,
+        ]
+
+
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@mock.patch("saleor.payment.tasks.request_refund_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_releases_earliest_due_first(
+    mocked_refund_action,
+    mocked_cancel_action,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS = 1
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    first_checkout = checkout
+    second_checkout = Checkout.objects.create(
+        currency=checkout.currency, channel=checkout.channel
+    )
+    transaction_items = {}
+    for checkout_to_release, due_time in [
+        (first_checkout, ttl_time - datetime.timedelta(seconds=1)),
+        (second_checkout, ttl_time - datetime.timedelta(hours=1)),
+    ]:
+        with freeze_time(due_time):
+            transaction_item = transaction_item_generator(
+                checkout_id=checkout_to_release.pk, charged_value=Decimal(100)
+            )
+            transaction_items[checkout_to_release.pk] = transaction_item
+            transaction_amounts_for_checkout_updated(
+                transaction_item, plugins_manager, user=None, app=None
+            )
+            checkout_to_release.automatically_refundable = True
+            checkout_to_release.save(
+                update_fields=["automatically_refundable", "last_change"]
+            )
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    mocked_refund_action.assert_called_once()
+    assert (
+        mocked_refund_action.call_args.kwargs["transaction"]
+        == transaction_items[second_checkout.pk]
+    )
+
+
+def _create_gateway_notification(idempotency_key, payment_reference, **kwargs):
+    return GatewayNotification.objects.create(
+        plugin_id="mirumee.payments.adyen",
+        channel_slug="main",
+        idempotency_key=idempotency_key,
+        payment_reference=payment_reference,
+        event_type="AUTHORISATION",
+        payload={},
+        **kwargs,
+    )
+
+
+@mock.patch("saleor.payment.tasks.process_gateway_notifications_task.delay")
+def test_retry_gateway_notifications_task(mocked_process_task, settings):
+    # given
+    created_at = timezone.now() - settings.PAYMENT_GATEWAY_NOTIFICATIONS_RETRY_DELAY
+    _create_gateway_notification(
+        "psp-1:AUTHORISATION", "payment-1", created_at=created_at
+    )
+    _create_gateway_notification("psp-1:CAPTURE", "payment-1", created_at=created_at)
+    _create_gateway_notification("psp-2:AUTHORISATION", "payment-2")
+    _create_gateway_notification(
+        "psp-3:AUTHORISATION",
+        "payment-3",
+        created_at=created_at,
+        status=GatewayNotificationStatus.FAILED,
+    )
+
+    # when
+    retry_gateway_notifications_task()
+
+    # then
+    mocked_process_task.assert_called_once_with("mirumee.payments.adyen", "payment-1")
+
+
+def test_delete_old_gateway_notifications_task(settings):
+    # given
+    created_at = (
+        timezone.now()
+        - settings.PAYMENT_GATEWAY_NOTIFICATIONS_TTL
+        - datetime.timedelta(seconds=1)
+    )
+    _create_gateway_notification(
+        "psp-1:AUTHORISATION",
+        "payment-1",
+        created_at=created_at,
+        status=GatewayNotificationStatus.PROCESSED,
+    )
+    pending = _create_gateway_notification(
+        "psp-2:AUTHORISATION", "payment-2", created_at=created_at
+    )
+    recent = _create_gateway_notification(
+        "psp-3:AUTHORISATION", "payment-3", status=GatewayNotificationStatus.PROCESSED
+    )
+
+    # when
+    delete_old_gateway_notifications_task()
+
+    # then
+    assert set(GatewayNotification.objects.values_list("pk", flat=True)) == {
+        pending.pk,
+        recent.pk,
+    }
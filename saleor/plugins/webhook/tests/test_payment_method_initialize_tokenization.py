@@ -18,6 +18,8 @@ from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook
 from ....webhook.transport.utils import (
     generate_cache_key_for_webhook,
+    get_webhook_cache_lock_key,
+    get_webhook_stale_cache_key,
     to_payment_app_id,
 )
 
@@ -415,6 +417,7 @@ def test_payment_method_initialize_tokenization_missing_required_id(
         PaymentMethodTokenizationResult.PENDING,
     ],
 )
+@mock.patch("saleor.webhook.transport.synchronous.transport.cache.delete_many")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.delete")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
@@ -424,6 +427,7 @@ def test_expected_result_invalidates_cache_for_app(
     mocked_cache_get,
     mocked_cache_set,
     mocked_cache_delete,
+    mocked_cache_delete_many,
     result,
     customer_user,
     webhook_plugin,
@@ -521,8 +525,18 @@ def test_expected_result_invalidates_cache_for_app(
         "paymentFlowToSupport": "INTERACTIVE",
     }
 
+    # the lock taken when fetching stored payment methods is released
+    mocked_cache_delete.assert_called_once_with(
+        get_webhook_cache_lock_key(expected_cache_key)
+    )
     # delete the same cache key as created when fetching stored payment methods
-    mocked_cache_delete.assert_called_once_with(expected_cache_key)
+    mocked_cache_delete_many.assert_called_once_with(
+        [
+            expected_cache_key,
+            get_webhook_stale_cache_key(expected_cache_key),
+            get_webhook_cache_lock_key(expected_cache_key),
+        ]
+    )
 
     assert response == PaymentMethodTokenizationResponseData(
         result=result,
@@ -17,6 +17,8 @@ from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook
 from ....webhook.transport.utils import (
     generate_cache_key_for_webhook,
+    get_webhook_cache_lock_key,
+    get_webhook_stale_cache_key,
     to_payment_app_id,
 )
 
@@ -359,6 +361,7 @@ def test_stored_payment_method_request_delete_missing_result_in_response_from_we
     assert response.error == "Missing value for field: result. Input: {}."
 
 
+@mock.patch("saleor.webhook.transport.synchronous.transport.cache.delete_many")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.delete")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
@@ -368,6 +371,7 @@ def test_stored_payment_method_request_delete_invalidates_cache_for_app(
     mocked_cache_get,
     mocked_cache_set,
     mocked_cache_delete,
+    mocked_cache_delete_many,
     customer_user,
     webhook_plugin,
     stored_payment_method_request_delete_app,
@@ -461,8 +465,18 @@ def test_stored_payment_method_request_delete_invalidates_cache_for_app(
             "channel": {"id": graphene.Node.to_global_id("Channel", channel_USD.pk)},
         }
     )
+    # the lock taken when fetching stored payment methods is released
+    mocked_cache_delete.assert_called_once_with(
+        get_webhook_cache_lock_key(expected_cache_key)
+    )
     # delete the same cache key as created when fetching stored payment methods
-    mocked_cache_delete.assert_called_once_with(expected_cache_key)
+    mocked_cache_delete_many.assert_called_once_with(
+        [
+            expected_cache_key,
+            get_webhook_stale_cache_key(expected_cache_key),
+            get_webhook_cache_lock_key(expected_cache_key),
+        ]
+    )
 
     assert response == StoredPaymentMethodRequestDeleteResponseData(
         result=StoredPaymentMethodRequestDeleteResult.SUCCESSFULLY_DELETED, error=None
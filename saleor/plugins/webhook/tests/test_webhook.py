@@ -1729,7 +1729,7 @@ def test_create_event_payload_reference_with_error(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.webhook.transport.utils.boto3.client",
+        "saleor.webhook.transport.clients.boto3.client",
         mocked_client_constructor,
     )
 
@@ -1,16 +1,21 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class ProductAppConfig(AppConfig):
     name = "saleor.product"
 
     def ready(self):
+        from ..attribute.models import Attribute
+        from ..tax.models import TaxClass, TaxConfiguration
         from .models import Category, Collection, DigitalContent, ProductMedia
         from .signals import (
             delete_background_image,
             delete_digital_content_file,
             delete_product_media_image,
+            invalidate_attribute_slug_pk_map_cache,
+            invalidate_price_ranges_on_tax_class_change,
+            invalidate_price_ranges_on_tax_configuration_change,
         )
 
         # preventing duplicate signals
@@ -34,3 +39,25 @@ class ProductAppConfig(AppConfig):
             sender=DigitalContent,
             dispatch_uid="delete_digital_content_file",
         )
+        post_save.connect(
+            invalidate_attribute_slug_pk_map_cache,
+            sender=Attribute,
+            dispatch_uid="invalidate_attribute_slug_pk_map_on_save",
+        )
+        post_delete.connect(
+            invalidate_attribute_slug_pk_map_cache,
+            sender=Attribute,
+            dispatch_uid="invalidate_attribute_slug_pk_map_on_delete",
+        )
+        # the tax rates and country exceptions are changed in bulk by the tax
+        # mutations, which invalidate the price ranges explicitly
+        post_save.connect(
+            invalidate_price_ranges_on_tax_configuration_change,
+            sender=TaxConfiguration,
+            dispatch_uid="invalidate_price_ranges_on_tax_configuration_save",
+        )
+        post_delete.connect(
+            invalidate_price_ranges_on_tax_class_change,
+            sender=TaxClass,
+            dispatch_uid="invalidate_price_ranges_on_tax_class_delete",
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:24
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0200_merge_20250527_1210"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="attribute_value_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 5.2.1 on 2026-10-19 09:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0022_merge_20250527_1210"),
+        ("product", "0201_product_attribute_value_ids"),
+        ("tax", "0011_merge_20250530_0929"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductPriceRange",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("country_code", models.CharField(max_length=2)),
+                ("config_generation", models.BigIntegerField()),
+                ("currency", models.CharField(max_length=3)),
+                (
+                    "price_range_start_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "price_range_start_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "price_range_stop_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "price_range_stop_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "undiscounted_start_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "undiscounted_start_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "undiscounted_stop_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "undiscounted_stop_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "prior_start_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "prior_start_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "prior_stop_net_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                (
+                    "prior_stop_gross_amount",
+                    models.DecimalField(decimal_places=3, max_digits=20, null=True),
+                ),
+                ("valid_until", models.DateTimeField()),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="price_ranges",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "tax_class",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="tax.taxclass",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "channel", "country_code"),
+                        name="unique_product_channel_country_price_range",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("product", "0203_productpricerange_version"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["attribute_value_ids"], name="product_attr_value_ids_gin"
+            ),
+        ),
+    ]
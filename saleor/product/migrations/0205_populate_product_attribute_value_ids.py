@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:05
+
+from django.apps import apps as registry
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from .tasks.saleor3_22 import populate_product_attribute_value_ids_task
+
+
+def populate_product_attribute_value_ids(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        populate_product_attribute_value_ids_task.delay()
+
+    sender = registry.get_app_config("product")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0204_product_attribute_value_ids_gin"),
+        ("attribute", "0048_alter_attribute_metadata_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_product_attribute_value_ids,
+            reverse_code=migrations.RunPython.noop,
+        )
+    ]
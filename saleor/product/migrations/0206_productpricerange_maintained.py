@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0205_populate_product_attribute_value_ids"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="productpricerange",
+            name="config_generation",
+        ),
+        migrations.RemoveField(
+            model_name="productpricerange",
+            name="version",
+        ),
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="price_range_dirty",
+            field=models.BooleanField(default=True),
+        ),
+    ]
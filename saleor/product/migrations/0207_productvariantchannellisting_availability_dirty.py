@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0206_productpricerange_maintained"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productvariantchannellisting",
+            name="availability_dirty",
+            field=models.BooleanField(default=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from ....celeryconf import app
+from ....core.db.connection import allow_writer
+from ...models import Product
+from ...utils.attributes import update_products_attribute_value_ids
+
+PRODUCT_ATTRIBUTE_VALUE_IDS_BATCH_SIZE = 1000
+
+
+@app.task
+@allow_writer()
+def populate_product_attribute_value_ids_task(product_pk=0):
+    """Populate the denormalized attribute value ids of the existing products."""
+    product_ids = list(
+        Product.objects.filter(pk__gt=product_pk)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:PRODUCT_ATTRIBUTE_VALUE_IDS_BATCH_SIZE]
+    )
+    if not product_ids:
+        return
+
+    update_products_attribute_value_ids(product_ids)
+    populate_product_attribute_value_ids_task.delay(product_ids[-1])
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 import graphene
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import BTreeIndex, GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
@@ -180,6 +181,9 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
     search_document = models.TextField(blank=True, default="")
     search_vector = SearchVectorField(blank=True, null=True)
     search_index_dirty = models.BooleanField(default=False, db_index=True)
+    # ids of the attribute values assigned to the product and its variants,
+    # used for filtering products by attributes
+    attribute_value_ids = ArrayField(models.IntegerField(), blank=True, default=list)
 
     category = models.ForeignKey(
         Category,
@@ -235,6 +239,10 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
                 fields=["name", "slug"],
                 opclasses=["gin_trgm_ops"] * 2,
             ),
+            GinIndex(
+                name="product_attr_value_ids_gin",
+                fields=["attribute_value_ids"],
+            ),
             models.Index(
                 fields=["category_id", "slug"],
             ),
@@ -328,6 +336,8 @@ class ProductChannelListing(PublishableModel):
         amount_field="discounted_price_amount", currency_field="currency"
     )
     discounted_price_dirty = models.BooleanField(default=False)
+    # the stored `ProductPriceRange` rows of the listing have to be recalculated
+    price_range_dirty = models.BooleanField(default=True)
 
     class Meta:
         unique_together = [["product", "channel"]]
@@ -540,6 +550,9 @@ class ProductVariantChannelListing(models.Model):
     )
 
     preorder_quantity_threshold = models.IntegerField(blank=True, null=True)
+    # the stored `ProductVariantAvailability` rows of the variant in the channel
+    # have to be recalculated
+    availability_dirty = models.BooleanField(default=True)
 
     objects = managers.ProductVariantChannelListingManager()
 
@@ -576,6 +589,95 @@ class VariantChannelListingPromotionRule(models.Model):
         unique_together = [["variant_channel_listing", "promotion_rule"]]
 
 
+class ProductPriceRange(models.Model):
+    """Denormalized display price ranges of the product in the channel and country.
+
+    The rows are calculated in the background for the product channel listings
+    marked with `price_range_dirty`, which is set whenever the prices of the
+    product variants or the tax configuration change.
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="price_ranges"
+    )
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name="+")
+    country_code = models.CharField(max_length=2)
+    tax_class = models.ForeignKey(
+        TaxClass, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    price_range_start_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    price_range_start_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    price_range_stop_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    price_range_stop_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    undiscounted_start_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    undiscounted_start_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    undiscounted_stop_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    undiscounted_stop_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    prior_start_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    prior_start_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    prior_stop_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    prior_stop_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        null=True,
+    )
+    valid_until = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "channel", "country_code"],
+                name="unique_product_channel_country_price_range",
+            )
+        ]
+        ordering = ("pk",)
+
+
 class DigitalContent(ModelWithMetadata):
     FILE = "file"
     TYPE_CHOICES = ((FILE, "digital_product"),)
@@ -11,6 +11,7 @@ from ..attribute.models import Attribute
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
 from ..product.models import Product
+from .utils.attributes import update_products_attribute_value_ids
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -41,6 +42,9 @@ def _prep_product_search_vector_index(products):
     Product.objects.bulk_update(
         products, ["search_vector", "updated_at", "search_index_dirty"]
     )
+    # the search index is marked as dirty on attribute assignment changes, so
+    # the denormalized attribute values are refreshed together with it
+    update_products_attribute_value_ids([product.pk for product in products])
 
 
 def queryset_in_batches(queryset):
@@ -1,4 +1,6 @@
 from ..core.tasks import delete_from_storage_task
+from .utils.attributes import invalidate_attribute_slug_pk_map
+from .utils.price_ranges import invalidate_channels_price_ranges
 
 
 def delete_background_image(sender, instance, **kwargs):
@@ -14,3 +16,15 @@ def delete_digital_content_file(sender, instance, **kwargs):
 def delete_product_media_image(sender, instance, **kwargs):
     if file := instance.image:
         delete_from_storage_task.delay(file.name)
+
+
+def invalidate_attribute_slug_pk_map_cache(sender, instance, **kwargs):
+    invalidate_attribute_slug_pk_map()
+
+
+def invalidate_price_ranges_on_tax_configuration_change(sender, instance, **kwargs):
+    invalidate_channels_price_ranges([instance.channel_id])
+
+
+def invalidate_price_ranges_on_tax_class_change(sender, instance, **kwargs):
+    invalidate_channels_price_ranges()
@@ -20,8 +20,15 @@ from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deactivate_preorder_for_variant
 from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
-from .models import Product, ProductChannelListing, ProductType, ProductVariant
+from .models import (
+    Product,
+    ProductChannelListing,
+    ProductPriceRange,
+    ProductType,
+    ProductVariant,
+)
 from .search import update_products_search_vector
+from .utils.price_ranges import mark_price_ranges_as_dirty, update_products_price_ranges
 from .utils.product import mark_products_in_channels_as_dirty
 from .utils.variant_prices import update_discounted_prices_for_promotion
 from .utils.variants import (
@@ -39,6 +46,8 @@ VARIANTS_UPDATE_BATCH = 500
 DISCOUNTED_PRODUCT_BATCH = 2000
 # Results in update time ~2s when 600 channels exist
 PROMOTION_RULE_BATCH_SIZE = 50
+PRICE_RANGE_LISTING_BATCH = 200
+PRICE_RANGE_DIRTY_MARK_BATCH = 2000
 
 
 def _variants_in_batches(variants_qs):
@@ -262,6 +271,104 @@ def recalculate_discounted_price_for_products_task():
         recalculate_discounted_price_for_products_task.delay()
 
 
+@app.task
+@allow_writer()
+def recalculate_products_price_ranges_task():
+    """Recalculate the stored price ranges of the listings marked as dirty.
+
+    The listings are locked while their price ranges are calculated, so changes
+    marking them as dirty again wait and get recalculated by the next run.
+    """
+    if not settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED:
+        return
+    with transaction.atomic():
+        listings = list(
+            ProductChannelListing.objects.select_for_update(
+                of=("self",), skip_locked=True
+            )
+            .filter(price_range_dirty=True)
+            .order_by("pk")
+            .values_list("id", "product_id", "channel_id")[:PRICE_RANGE_LISTING_BATCH]
+        )
+        if not listings:
+            return
+        update_products_price_ranges(
+            (product_id, channel_id) for _, product_id, channel_id in listings
+        )
+        ProductChannelListing.objects.filter(
+            id__in=[listing_id for listing_id, _, _ in listings]
+        ).update(price_range_dirty=False)
+    if len(listings) == PRICE_RANGE_LISTING_BATCH:
+        recalculate_products_price_ranges_task.delay()
+
+
+@app.task
+@allow_writer()
+def mark_products_price_ranges_as_dirty_task(
+    channel_ids: list[int] | None = None, start_id: int = 0
+):
+    """Mark the listings in the given channels, or in all channels, as dirty."""
+    listings = ProductChannelListing.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(id__gt=start_id)
+    if channel_ids is not None:
+        listings = listings.filter(channel_id__in=channel_ids)
+    listing_ids = list(
+        listings.order_by("pk").values_list("id", flat=True)[
+            :PRICE_RANGE_DIRTY_MARK_BATCH
+        ]
+    )
+    if not listing_ids:
+        return
+    mark_price_ranges_as_dirty(listing_ids)
+    if len(listing_ids) == PRICE_RANGE_DIRTY_MARK_BATCH:
+        mark_products_price_ranges_as_dirty_task.delay(channel_ids, listing_ids[-1])
+
+
+@app.task
+@allow_writer()
+def delete_expired_product_price_ranges_task():
+    """Delete the expired price ranges and mark their listings as dirty.
+
+    The rows are kept up to date by the changes marking them as dirty, so expired
+    rows come from missed changes or from listings removed from the channel.
+    """
+    expired_price_ranges = ProductPriceRange.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(valid_until__lte=timezone.now())
+    rows = list(
+        expired_price_ranges.order_by("pk").values_list(
+            "id", "product_id", "channel_id"
+        )[:PRICE_RANGE_DIRTY_MARK_BATCH]
+    )
+    if not rows:
+        return
+    ProductPriceRange.objects.filter(
+        id__in=[row_id for row_id, _, _ in rows], valid_until__lte=timezone.now()
+    ).delete()
+    product_channel_ids = {
+        (product_id, channel_id) for _, product_id, channel_id in rows
+    }
+    mark_price_ranges_as_dirty(
+        [
+            listing_id
+            for listing_id, product_id, channel_id in (
+                ProductChannelListing.objects.filter(
+                    product_id__in={
+                        product_id for product_id, _ in product_channel_ids
+                    },
+                    channel_id__in={
+                        channel_id for _, channel_id in product_channel_ids
+                    },
+                ).values_list("id", "product_id", "channel_id")
+            )
+            if (product_id, channel_id) in product_channel_ids
+        ]
+    )
+    if len(rows) == PRICE_RANGE_DIRTY_MARK_BATCH:
+        delete_expired_product_price_ranges_task.delay()
+
+
 @app.task
 @allow_writer()
 def update_discounted_prices_task(product_ids: Iterable[int]):
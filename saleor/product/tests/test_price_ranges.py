@@ -0,0 +1,144 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.conf import settings as django_settings
+from django.utils import timezone
+
+from ...tax.models import TaxClassCountryRate
+from ..models import ProductChannelListing, ProductPriceRange
+from ..utils.price_ranges import (
+    get_products_price_ranges,
+    invalidate_channels_price_ranges,
+    invalidate_products_price_ranges,
+    update_products_price_ranges,
+)
+from ..utils.product import mark_products_in_channels_as_dirty
+
+REPLICA = django_settings.DATABASE_CONNECTION_REPLICA_NAME
+
+
+def test_update_products_price_ranges(product, channel_USD):
+    # given
+    variant_listing = product.variants.first().channel_listings.get(channel=channel_USD)
+    country_code = channel_USD.default_country.code
+
+    # when
+    update_products_price_ranges([(product.pk, channel_USD.pk)])
+
+    # then
+    stored_price_ranges = get_products_price_ranges(
+        [product.pk], channel_USD.pk, country_code, REPLICA
+    )
+    tax_class_id, price_ranges = stored_price_ranges[product.pk]
+    assert tax_class_id == product.tax_class_id
+    assert price_ranges.price_range.start.net == variant_listing.discounted_price
+    assert price_ranges.price_range_undiscounted.start.net == variant_listing.price
+
+
+def test_update_products_price_ranges_for_countries_with_tax_rates(
+    product, channel_USD
+):
+    # given
+    channel_USD.tax_configuration.country_exceptions.all().delete()
+    TaxClassCountryRate.objects.all().delete()
+    TaxClassCountryRate.objects.create(
+        tax_class=product.tax_class, country="PL", rate=Decimal(23)
+    )
+    TaxClassCountryRate.objects.create(tax_class=None, country="DE", rate=Decimal(19))
+
+    # when
+    update_products_price_ranges([(product.pk, channel_USD.pk)])
+
+    # then
+    assert set(ProductPriceRange.objects.values_list("country_code", flat=True)) == {
+        channel_USD.default_country.code,
+        "PL",
+        "DE",
+    }
+
+
+def test_update_products_price_ranges_removes_rows_without_priced_variants(
+    product, channel_USD
+):
+    # given
+    update_products_price_ranges([(product.pk, channel_USD.pk)])
+    assert ProductPriceRange.objects.exists()
+    product.variants.first().channel_listings.update(price_amount=None)
+
+    # when
+    update_products_price_ranges([(product.pk, channel_USD.pk)])
+
+    # then
+    assert not ProductPriceRange.objects.exists()
+
+
+def test_get_products_price_ranges_skips_expired_rows(product, channel_USD):
+    # given
+    update_products_price_ranges([(product.pk, channel_USD.pk)])
+
+    # when
+    ProductPriceRange.objects.update(valid_until=timezone.now() - timedelta(seconds=1))
+
+    # then
+    assert (
+        get_products_price_ranges(
+            [product.pk], channel_USD.pk, channel_USD.default_country.code, REPLICA
+        )
+        == {}
+    )
+
+
+def test_invalidate_products_price_ranges(product, channel_USD):
+    # given
+    ProductChannelListing.objects.update(price_range_dirty=False)
+
+    # when
+    invalidate_products_price_ranges([product.pk])
+
+    # then
+    assert product.channel_listings.get(channel=channel_USD).price_range_dirty
+
+
+@patch("saleor.product.tasks.mark_products_price_ranges_as_dirty_task.delay")
+def test_invalidate_channels_price_ranges_on_commit(
+    mocked_delay, channel_USD, django_capture_on_commit_callbacks
+):
+    # when
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        invalidate_channels_price_ranges([channel_USD.pk])
+
+    # then
+    mocked_delay.assert_not_called()
+    for callback in callbacks:
+        callback()
+    mocked_delay.assert_called_once_with([channel_USD.pk])
+
+
+def test_mark_products_in_channels_as_dirty_invalidates_price_ranges(
+    product, channel_USD
+):
+    # given
+    ProductChannelListing.objects.update(price_range_dirty=False)
+
+    # when
+    mark_products_in_channels_as_dirty({channel_USD.pk: {product.pk}})
+
+    # then
+    assert product.channel_listings.get(channel=channel_USD).price_range_dirty
+
+
+@patch("saleor.product.tasks.mark_products_price_ranges_as_dirty_task.delay")
+def test_tax_configuration_change_invalidates_channel_price_ranges(
+    mocked_delay, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    tax_configuration = channel_USD.tax_configuration
+    tax_configuration.prices_entered_with_tax = False
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        tax_configuration.save(update_fields=["prices_entered_with_tax"])
+
+    # then
+    mocked_delay.assert_called_once_with([channel_USD.pk])
@@ -9,14 +9,23 @@ from faker import Faker
 
 from ...discount import PromotionType, RewardValueType
 from ...discount.models import Promotion, PromotionRule
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
+from ..models import (
+    Product,
+    ProductChannelListing,
+    ProductPriceRange,
+    ProductVariantChannelListing,
+)
 from ..tasks import (
     _get_preorder_variants_to_clean,
+    delete_expired_product_price_ranges_task,
+    mark_products_price_ranges_as_dirty_task,
     recalculate_discounted_price_for_products_task,
+    recalculate_products_price_ranges_task,
     update_products_search_vector_task,
     update_variant_relations_for_active_promotion_rules_task,
     update_variants_names,
 )
+from ..utils.price_ranges import update_products_price_ranges
 from ..utils.variants import fetch_variants_for_promotion_rules
 
 
@@ -229,6 +238,99 @@ def test_recalculate_discounted_price_for_products_task_re_trigger_task(
     assert recalculate_discounted_price_for_products_task_mock.called
 
 
+@patch("saleor.product.tasks.recalculate_products_price_ranges_task.delay")
+def test_recalculate_products_price_ranges_task(
+    recalculate_products_price_ranges_task_mock, product_list, channel_USD, settings
+):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = True
+    product = product_list[0]
+    ProductChannelListing.objects.update(price_range_dirty=False)
+    ProductChannelListing.objects.filter(product=product).update(price_range_dirty=True)
+
+    # when
+    recalculate_products_price_ranges_task()
+
+    # then
+    assert set(ProductPriceRange.objects.values_list("product_id", flat=True)) == {
+        product.pk
+    }
+    assert not ProductChannelListing.objects.filter(price_range_dirty=True).exists()
+    recalculate_products_price_ranges_task_mock.assert_not_called()
+
+
+@patch("saleor.product.tasks.recalculate_products_price_ranges_task.delay")
+@patch("saleor.product.tasks.PRICE_RANGE_LISTING_BATCH", 1)
+def test_recalculate_products_price_ranges_task_re_trigger_task(
+    recalculate_products_price_ranges_task_mock, product_list, settings
+):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = True
+
+    # when
+    recalculate_products_price_ranges_task()
+
+    # then
+    assert ProductChannelListing.objects.filter(price_range_dirty=False).count() == 1
+    recalculate_products_price_ranges_task_mock.assert_called_once_with()
+
+
+def test_recalculate_products_price_ranges_task_disabled(product_list, settings):
+    # given
+    settings.PRODUCT_PRICE_RANGE_TABLE_ENABLED = False
+
+    # when
+    recalculate_products_price_ranges_task()
+
+    # then
+    assert not ProductPriceRange.objects.exists()
+    assert not ProductChannelListing.objects.filter(price_range_dirty=False).exists()
+
+
+def test_mark_products_price_ranges_as_dirty_task(
+    product, product_available_in_many_channels, channel_USD
+):
+    # given
+    ProductChannelListing.objects.update(price_range_dirty=False)
+
+    # when
+    mark_products_price_ranges_as_dirty_task([channel_USD.pk])
+
+    # then
+    dirty_listings = ProductChannelListing.objects.filter(price_range_dirty=True)
+    assert dirty_listings.exists()
+    assert set(dirty_listings.values_list("channel_id", flat=True)) == {channel_USD.pk}
+
+
+@patch("saleor.product.tasks.delete_expired_product_price_ranges_task.delay")
+def test_delete_expired_product_price_ranges_task(
+    delete_expired_product_price_ranges_task_mock, product_list, channel_USD
+):
+    # given
+    expired_product, product = product_list[:2]
+    ProductChannelListing.objects.update(price_range_dirty=False)
+    update_products_price_ranges(
+        [(expired_product.pk, channel_USD.pk), (product.pk, channel_USD.pk)]
+    )
+    ProductPriceRange.objects.filter(product=expired_product).update(
+        valid_until=timezone.now()
+    )
+
+    # when
+    delete_expired_product_price_ranges_task()
+
+    # then
+    assert set(ProductPriceRange.objects.values_list("product_id", flat=True)) == {
+        product.pk
+    }
+    assert set(
+        ProductChannelListing.objects.filter(price_range_dirty=True).values_list(
+            "product_id", flat=True
+        )
+    ) == {expired_product.pk}
+    delete_expired_product_price_ranges_task_mock.assert_not_called()
+
+
 def test_update_variants_names(product_variant_list, size_attribute):
     # given
     variant_without_name = product_variant_list[0]
@@ -308,7 +410,7 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         product_list[i].save(update_fields=["search_index_dirty"])
 
     # when & # then
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(16):
         update_products_search_vector_task()
 
 
@@ -0,0 +1,153 @@
+from django.core.cache import cache
+from django.db.models import Q
+
+from ...attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeValue,
+)
+from ...attribute.utils import associate_attribute_values_to_instance
+from ..models import Product
+from ..utils.attributes import (
+    ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY,
+    get_attribute_slug_pk_map,
+    get_products_attribute_values_filter,
+    update_products_attribute_value_ids,
+)
+
+
+def test_update_products_attribute_value_ids(product):
+    # given
+    product_value_ids = list(
+        AssignedProductAttributeValue.objects.filter(product=product).values_list(
+            "value_id", flat=True
+        )
+    )
+    variant_value_ids = list(
+        AssignedVariantAttributeValue.objects.filter(
+            assignment__variant__product=product
+        ).values_list("value_id", flat=True)
+    )
+    assert product_value_ids
+    assert variant_value_ids
+    Product.objects.filter(pk=product.pk).update(attribute_value_ids=[])
+
+    # when
+    update_products_attribute_value_ids([product.pk])
+
+    # then
+    product.refresh_from_db()
+    assert sorted(product.attribute_value_ids) == sorted(
+        product_value_ids + variant_value_ids
+    )
+
+
+def test_associate_attribute_values_updates_product_attribute_value_ids(product):
+    # given
+    variant = product.variants.first()
+    variant_attribute = product.product_type.variant_attributes.first()
+    old_value = variant_attribute.values.first()
+    new_value = AttributeValue.objects.create(
+        attribute=variant_attribute, name="New value", slug="new-value"
+    )
+    product.refresh_from_db()
+    assert old_value.pk in product.attribute_value_ids
+
+    # when
+    associate_attribute_values_to_instance(variant, {variant_attribute.pk: [new_value]})
+
+    # then
+    product.refresh_from_db()
+    assert new_value.pk in product.attribute_value_ids
+    assert old_value.pk not in product.attribute_value_ids
+
+
+def test_get_attribute_slug_pk_map_cached(
+    color_attribute, size_attribute, django_assert_num_queries
+):
+    # given
+    cache.delete(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+    slugs = [color_attribute.slug, size_attribute.slug, "non-existing"]
+    get_attribute_slug_pk_map(slugs[:1], "default")
+
+    # when
+    with django_assert_num_queries(0):
+        slug_pk_map = get_attribute_slug_pk_map(slugs[:2], "default")
+
+    # then
+    assert slug_pk_map == {
+        color_attribute.slug: color_attribute.pk,
+        size_attribute.slug: size_attribute.pk,
+    }
+
+
+def test_get_attribute_slug_pk_map_invalidated_on_attribute_change(color_attribute):
+    # given
+    cache.delete(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+    get_attribute_slug_pk_map([color_attribute.slug], "default")
+    old_slug = color_attribute.slug
+
+    # when
+    color_attribute.slug = "new-color"
+    color_attribute.save(update_fields=["slug"])
+
+    # then
+    assert cache.get(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY) is None
+    assert get_attribute_slug_pk_map([old_slug, "new-color"], "default") == {
+        "new-color": color_attribute.pk
+    }
+
+
+def test_get_attribute_slug_pk_map_refreshed_for_missing_slug(color_attribute):
+    # given
+    cache.delete(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+    get_attribute_slug_pk_map([color_attribute.slug], "default")
+    attribute = Attribute(slug="bulk-created", name="Bulk created")
+    Attribute.objects.bulk_create([attribute])
+
+    # when
+    slug_pk_map = get_attribute_slug_pk_map([attribute.slug], "default")
+
+    # then
+    assert slug_pk_map == {attribute.slug: attribute.pk}
+    assert cache.get(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)[attribute.slug] == attribute.pk
+
+
+def test_get_attribute_slug_pk_map_queries_only_missing_slugs(
+    color_attribute, size_attribute, django_assert_num_queries
+):
+    # given
+    cache.delete(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+    get_attribute_slug_pk_map([color_attribute.slug], "default")
+    slug_pk_map = cache.get(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+
+    # when
+    with django_assert_num_queries(1) as ctx:
+        result = get_attribute_slug_pk_map(
+            [color_attribute.slug, "non-existing"], "default"
+        )
+
+    # then
+    assert result == {color_attribute.slug: color_attribute.pk}
+    assert "non-existing" in ctx.captured_queries[0]["sql"]
+    assert color_attribute.slug not in ctx.captured_queries[0]["sql"]
+    assert cache.get(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY) == slug_pk_map
+
+
+def test_get_products_attribute_values_filter():
+    # when
+    lookup = get_products_attribute_values_filter({1: [10], 2: [20, 21], 3: [30]})
+
+    # then
+    assert lookup == Q(attribute_value_ids__overlap=[20, 21]) & Q(
+        attribute_value_ids__contains=[10, 30]
+    )
+
+
+def test_get_products_attribute_values_filter_no_values():
+    # when
+    lookup = get_products_attribute_values_filter({1: [10], 2: []})
+
+    # then
+    assert lookup == Q(pk__in=[])
@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.cache import cache
+from django.db.models import Func, OuterRef, Q
+
+from ...attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttributeValue,
+    Attribute,
+)
+from ..models import Product
+
+ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY = "attribute_slug_pk_map"
+ATTRIBUTE_SLUG_PK_MAP_CACHE_TIMEOUT = 60 * 60
+
+
+def update_products_attribute_value_ids(product_ids: Iterable[int]):
+    """Refresh the denormalized attribute value ids of the given products.
+
+    The array holds the ids of the attribute values assigned to the product and
+    to all of its variants.
+    """
+    product_values = (
+        AssignedProductAttributeValue.objects.filter(product_id=OuterRef("pk"))
+        .order_by()
+        .values("value_id")
+    )
+    variant_values = (
+        AssignedVariantAttributeValue.objects.filter(
+            assignment__variant__product_id=OuterRef("pk")
+        )
+        .order_by()
+        .values("value_id")
+    )
+    Product.objects.filter(pk__in=product_ids).update(
+        attribute_value_ids=Func(
+            ArraySubquery(product_values),
+            ArraySubquery(variant_values),
+            function="ARRAY_CAT",
+        )
+    )
+
+
+def get_attribute_slug_pk_map(
+    slugs: Iterable[str], database_connection_name: str
+) -> dict[str, int]:
+    """Return the primary keys of the attributes with the given slugs.
+
+    The map of all attributes is cached, as resolving the slugs is needed for every
+    filtered products query. Only the slugs missing from the cached map are looked
+    up in the database, the found ones are added to the map.
+    """
+    slugs = set(slugs)
+    slug_pk_map = cache.get(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+    if slug_pk_map is None:
+        slug_pk_map = dict(
+            Attribute.objects.using(database_connection_name).values_list("slug", "pk")
+        )
+        cache.set(
+            ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY,
+            slug_pk_map,
+            timeout=ATTRIBUTE_SLUG_PK_MAP_CACHE_TIMEOUT,
+        )
+    elif missing_slugs := slugs - slug_pk_map.keys():
+        found_slug_pk_map = dict(
+            Attribute.objects.using(database_connection_name)
+            .filter(slug__in=missing_slugs)
+            .values_list("slug", "pk")
+        )
+        if found_slug_pk_map:
+            slug_pk_map.update(found_slug_pk_map)
+            cache.set(
+                ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY,
+                slug_pk_map,
+                timeout=ATTRIBUTE_SLUG_PK_MAP_CACHE_TIMEOUT,
+            )
+    return {slug: slug_pk_map[slug] for slug in slugs if slug in slug_pk_map}
+
+
+def invalidate_attribute_slug_pk_map():
+    cache.delete(ATTRIBUTE_SLUG_PK_MAP_CACHE_KEY)
+
+
+def get_products_attribute_values_filter(queries: dict[int, list[int]]) -> Q:
+    """Compile the attribute filters into predicates on the attribute values array.
+
+    Attributes filtered by a single value are combined into a single containment
+    check, the ones filtered by any of multiple values use an overlap check.
+    """
+    required_value_ids = []
+    lookup = Q()
+    for values in queries.values():
+        if not values:
+            return Q(pk__in=[])
+        if len(values) == 1:
+            required_value_ids.extend(values)
+        else:
+            lookup &= Q(attribute_value_ids__overlap=values)
+    if required_value_ids:
+        lookup &= Q(attribute_value_ids__contains=required_value_ids)
+    return lookup
@@ -19,6 +19,13 @@ class ProductAvailability:
     discount_prior: TaxedMoney | None
 
 
+@dataclass
+class ProductPriceRanges:
+    price_range: TaxedMoneyRange | None
+    price_range_undiscounted: TaxedMoneyRange | None
+    price_range_prior: TaxedMoneyRange | None
+
+
 @dataclass
 class VariantAvailability:
     on_sale: bool
@@ -116,14 +123,13 @@ def _calculate_product_price_with_taxes_range(
     return price
 
 
-def get_product_availability(
+def get_product_price_ranges(
     *,
-    product_channel_listing: ProductChannelListing | None,
     variants_channel_listing: list[ProductVariantChannelListing],
     prices_entered_with_tax: bool,
     tax_calculation_strategy: str,
     tax_rate: Decimal,
-) -> ProductAvailability:
+) -> ProductPriceRanges:
     undiscounted: TaxedMoneyRange | None = _calculate_product_price_with_taxes_range(
         "price",
         variants_channel_listing,
@@ -152,6 +158,22 @@ def get_product_availability(
             prices_entered_with_tax,
         )
 
+    return ProductPriceRanges(
+        price_range=discounted,
+        price_range_undiscounted=undiscounted,
+        price_range_prior=prior,
+    )
+
+
+def get_product_availability_from_price_ranges(
+    *,
+    product_channel_listing: ProductChannelListing | None,
+    price_ranges: ProductPriceRanges,
+) -> ProductAvailability:
+    undiscounted = price_ranges.price_range_undiscounted
+    discounted = price_ranges.price_range
+    prior = price_ranges.price_range_prior
+
     discount = None
     if undiscounted is not None and discounted is not None:
         discount = _get_total_discount_from_range(undiscounted, discounted)
@@ -175,6 +197,25 @@ def get_product_availability(
     )
 
 
+def get_product_availability(
+    *,
+    product_channel_listing: ProductChannelListing | None,
+    variants_channel_listing: list[ProductVariantChannelListing],
+    prices_entered_with_tax: bool,
+    tax_calculation_strategy: str,
+    tax_rate: Decimal,
+) -> ProductAvailability:
+    price_ranges = get_product_price_ranges(
+        variants_channel_listing=variants_channel_listing,
+        prices_entered_with_tax=prices_entered_with_tax,
+        tax_calculation_strategy=tax_calculation_strategy,
+        tax_rate=tax_rate,
+    )
+    return get_product_availability_from_price_ranges(
+        product_channel_listing=product_channel_listing, price_ranges=price_ranges
+    )
+
+
 def get_variant_availability(
     *,
     variant_channel_listing: ProductVariantChannelListing,
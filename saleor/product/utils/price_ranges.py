@@ -0,0 +1,283 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from prices import Money, TaxedMoney, TaxedMoneyRange
+
+from ...channel.models import Channel
+from ...tax.models import TaxClassCountryRate, TaxConfiguration
+from ...tax.utils import get_tax_calculation_strategy, get_tax_rate_for_country
+from ..models import (
+    Product,
+    ProductChannelListing,
+    ProductPriceRange,
+    ProductVariantChannelListing,
+)
+from .availability import ProductPriceRanges, get_product_price_ranges
+
+PRICE_RANGE_FIELDS = {
+    "price_range": "price_range",
+    "price_range_undiscounted": "undiscounted",
+    "price_range_prior": "prior",
+}
+
+
+def _taxed_money_range_from_row(
+    row: ProductPriceRange, prefix: str
+) -> TaxedMoneyRange | None:
+    if getattr(row, f"{prefix}_start_net_amount") is None:
+        return None
+
+    def taxed_money(bound: str) -> TaxedMoney:
+        return TaxedMoney(
+            net=Money(getattr(row, f"{prefix}_{bound}_net_amount"), row.currency),
+            gross=Money(getattr(row, f"{prefix}_{bound}_gross_amount"), row.currency),
+        )
+
+    return TaxedMoneyRange(start=taxed_money("start"), stop=taxed_money("stop"))
+
+
+def _taxed_money_range_to_row_values(
+    price_range: TaxedMoneyRange | None, prefix: str
+) -> dict:
+    values = {}
+    for bound in ["start", "stop"]:
+        price = getattr(price_range, bound) if price_range is not None else None
+        if price is None:
+            values[f"{prefix}_{bound}_net_amount"] = None
+            values[f"{prefix}_{bound}_gross_amount"] = None
+        else:
+            values[f"{prefix}_{bound}_net_amount"] = price.net.amount
+            values[f"{prefix}_{bound}_gross_amount"] = price.gross.amount
+    return values
+
+
+def get_products_price_ranges(
+    product_ids: Iterable[int],
+    channel_id: int,
+    country_code: str,
+    database_connection_name: str,
+) -> dict[int, tuple[int | None, ProductPriceRanges]]:
+    """Return the stored price ranges of the given products.
+
+    Only the rows that did not expire are returned, together with the tax class
+    they were calculated for. The caller has to skip the products with the
+    channel listing marked with `price_range_dirty`.
+    """
+    rows = ProductPriceRange.objects.using(database_connection_name).filter(
+        product_id__in=product_ids,
+        channel_id=channel_id,
+        country_code=country_code,
+        valid_until__gt=timezone.now(),
+    )
+    return {
+        row.product_id: (
+            row.tax_class_id,
+            ProductPriceRanges(
+                **{
+                    field: _taxed_money_range_from_row(row, prefix)
+                    for field, prefix in PRICE_RANGE_FIELDS.items()
+                }
+            ),
+        )
+        for row in rows
+    }
+
+
+def _get_country_codes(
+    channel: Channel,
+    tax_configuration: TaxConfiguration,
+    tax_class_rates: list[TaxClassCountryRate],
+    default_rates: dict[str, Decimal],
+) -> set[str]:
+    """Return the countries the price ranges in the channel are stored for.
+
+    These are the default country of the channel and the countries with their own
+    tax configuration or tax rates. The ranges of other countries are calculated
+    when read.
+    """
+    country_codes = {channel.default_country.code}
+    country_codes.update(
+        country_exception.country.code
+        for country_exception in tax_configuration.country_exceptions.all()
+    )
+    country_codes.update(rate.country.code for rate in tax_class_rates)
+    country_codes.update(default_rates.keys())
+    return country_codes
+
+
+def update_products_price_ranges(product_channel_ids: Iterable[tuple[int, int]]):
+    """Calculate and store the price ranges of the products in the channels.
+
+    The ranges are calculated from the writer, so they are never older than the
+    change that marked them as dirty. Rows of the countries that are no longer
+    stored, or of products without priced variants in the channel, are removed.
+    """
+    product_channel_ids = set(product_channel_ids)
+    if not product_channel_ids:
+        return
+    product_ids = {product_id for product_id, _ in product_channel_ids}
+    channel_ids = {channel_id for _, channel_id in product_channel_ids}
+
+    channels = Channel.objects.in_bulk(channel_ids)
+    tax_configurations = {
+        tax_configuration.channel_id: tax_configuration
+        for tax_configuration in TaxConfiguration.objects.filter(
+            channel_id__in=channel_ids
+        ).prefetch_related("country_exceptions")
+    }
+    tax_class_id_by_product_id = {
+        product_id: tax_class_id or product_type_tax_class_id
+        for product_id, tax_class_id, product_type_tax_class_id in (
+            Product.objects.filter(id__in=product_ids).values_list(
+                "id", "tax_class_id", "product_type__tax_class_id"
+            )
+        )
+    }
+    rates_by_tax_class_id: defaultdict[int | None, list[TaxClassCountryRate]] = (
+        defaultdict(list)
+    )
+    default_rates: dict[str, Decimal] = {}
+    for rate in TaxClassCountryRate.objects.filter(
+        Q(tax_class_id__in=set(tax_class_id_by_product_id.values())) | Q(tax_class=None)
+    ):
+        if rate.tax_class_id is None:
+            default_rates[rate.country.code] = rate.rate
+        else:
+            rates_by_tax_class_id[rate.tax_class_id].append(rate)
+
+    variant_listings: defaultdict[
+        tuple[int, int], list[ProductVariantChannelListing]
+    ] = defaultdict(list)
+    for variant_listing in (
+        ProductVariantChannelListing.objects.filter(
+            channel_id__in=channel_ids,
+            variant__product_id__in=product_ids,
+            price_amount__isnull=False,
+        )
+        .annotate(product_id=F("variant__product_id"))
+        .order_by("pk")
+    ):
+        key = (variant_listing.product_id, variant_listing.channel_id)
+        if key in product_channel_ids:
+            variant_listings[key].append(variant_listing)
+
+    valid_until = timezone.now() + timedelta(seconds=settings.PRODUCT_PRICE_RANGE_TTL)
+    rows = []
+    for (product_id, channel_id), listings in sorted(variant_listings.items()):
+        channel = channels[channel_id]
+        tax_configuration = tax_configurations[channel_id]
+        country_exceptions = {
+            country_exception.country.code: country_exception
+            for country_exception in tax_configuration.country_exceptions.all()
+        }
+        tax_class_id = tax_class_id_by_product_id.get(product_id)
+        tax_class_rates = rates_by_tax_class_id.get(tax_class_id, [])
+        for country_code in sorted(
+            _get_country_codes(
+                channel, tax_configuration, tax_class_rates, default_rates
+            )
+        ):
+            price_ranges = get_product_price_ranges(
+                variants_channel_listing=listings,
+                prices_entered_with_tax=tax_configuration.prices_entered_with_tax,
+                tax_calculation_strategy=get_tax_calculation_strategy(
+                    tax_configuration, country_exceptions.get(country_code)
+                ),
+                tax_rate=get_tax_rate_for_country(
+                    tax_class_rates,
+                    default_rates.get(country_code, Decimal(0)),
+                    country_code,
+                ),
+            )
+            values = {}
+            for field, prefix in PRICE_RANGE_FIELDS.items():
+                values.update(
+                    _taxed_money_range_to_row_values(
+                        getattr(price_ranges, field), prefix
+                    )
+                )
+            rows.append(
+                ProductPriceRange(
+                    product_id=product_id,
+                    channel_id=channel_id,
+                    country_code=country_code,
+                    tax_class_id=tax_class_id,
+                    currency=channel.currency_code,
+                    valid_until=valid_until,
+                    **values,
+                )
+            )
+
+    stored_keys = {(row.product_id, row.channel_id, row.country_code) for row in rows}
+    ids_to_delete = [
+        row_id
+        for row_id, product_id, channel_id, country_code in (
+            ProductPriceRange.objects.filter(
+                product_id__in=product_ids, channel_id__in=channel_ids
+            ).values_list("id", "product_id", "channel_id", "country_code")
+        )
+        if (product_id, channel_id) in product_channel_ids
+        and (product_id, channel_id, country_code) not in stored_keys
+    ]
+    if ids_to_delete:
+        ProductPriceRange.objects.filter(id__in=ids_to_delete).delete()
+    if rows:
+        ProductPriceRange.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["product", "channel", "country_code"],
+            update_fields=[
+                field.name
+                for field in ProductPriceRange._meta.concrete_fields
+                if field.name not in {"id", "product", "channel", "country_code"}
+            ],
+        )
+
+
+def mark_price_ranges_as_dirty(listing_ids: Iterable[int]):
+    """Mark the given product channel listings to recalculate their price ranges."""
+    with transaction.atomic():
+        ids = list(
+            ProductChannelListing.objects.select_for_update(of=("self",))
+            .filter(id__in=listing_ids, price_range_dirty=False)
+            .order_by("pk")
+            .values_list("id", flat=True)
+        )
+        ProductChannelListing.objects.filter(id__in=ids).update(price_range_dirty=True)
+
+
+def invalidate_products_price_ranges(product_ids: Iterable[int]):
+    """Mark the price ranges of the given products to be recalculated.
+
+    Must be called whenever the prices of the product variants change. The stored
+    ranges are not used until they are recalculated by
+    `recalculate_products_price_ranges_task`.
+    """
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    mark_price_ranges_as_dirty(
+        ProductChannelListing.objects.filter(
+            product_id__in=product_ids, price_range_dirty=False
+        ).values_list("id", flat=True)
+    )
+
+
+def invalidate_channels_price_ranges(channel_ids: list[int] | None = None):
+    """Mark the price ranges in the given channels to be recalculated.
+
+    Must be called whenever the tax configuration or tax rates change. All
+    channels are marked when `channel_ids` is not provided. The listings are
+    marked in batches by a task scheduled once the transaction is committed.
+    """
+    from ..tasks import mark_products_price_ranges_as_dirty_task
+
+    transaction.on_commit(
+        lambda: mark_products_price_ranges_as_dirty_task.delay(channel_ids)
+    )
@@ -7,6 +7,7 @@ from django.db.models import Exists, OuterRef, QuerySet
 from ...discount.models import PromotionRule
 from ...product.models import ProductChannelListing
 from ..models import ProductVariant
+from .price_ranges import invalidate_products_price_ranges
 
 
 def get_channel_to_products_map_from_rules(
@@ -105,6 +106,7 @@ def mark_products_in_channels_as_dirty(
         for product_ids in channel_to_product_ids.values()
         for product_id in product_ids
     }
+    invalidate_products_price_ranges(product_ids)
     listing_ids_to_update = []
     product_channel_listings_qs = ProductChannelListing.objects.all()
     if allow_replica:
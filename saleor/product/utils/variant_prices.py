@@ -22,6 +22,7 @@ from ..models import (
     ProductVariantChannelListing,
     VariantChannelListingPromotionRule,
 )
+from .price_ranges import invalidate_products_price_ranges
 
 
 def update_discounted_prices_for_promotion(
@@ -54,6 +55,7 @@ def update_discounted_prices_for_promotion(
 
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
+    changed_product_ids = set()
 
     product_channel_listings = (
         ProductChannelListing.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
@@ -85,6 +87,8 @@ def update_discounted_prices_for_promotion(
 
         product_discounted_price = min(discounted_variants_price)
         changed_variants_listings_to_update.extend(variant_listings_to_update)
+        if variant_listings_to_update:
+            changed_product_ids.add(product_id)
         changed_variant_listing_promotion_rule_to_create.extend(
             variant_listing_promotion_rule_to_create
         )
@@ -105,6 +109,7 @@ def update_discounted_prices_for_promotion(
         changed_variant_listing_promotion_rule_to_create,
         changed_variant_listing_promotion_rule_to_update,
     )
+    invalidate_products_price_ranges(changed_product_ids)
 
 
 def _update_or_create_listings(
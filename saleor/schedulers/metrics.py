@@ -0,0 +1,28 @@
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_TICK_DURATION = meter.create_metric(
+    "saleor.schedulers.tick.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of the Celery beat scheduler tick.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+METRIC_SCHEDULE_DRIFT = meter.create_metric(
+    "saleor.schedulers.schedule.drift",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Delay between the planned and the actual run of a periodic task.",
+    bucket_boundaries=[0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600],
+)
+
+
+def record_schedule_drift(task_name: str, drift: float) -> None:
+    meter.record(
+        METRIC_SCHEDULE_DRIFT,
+        max(drift, 0),
+        unit=Unit.SECOND,
+        attributes={"task": task_name},
+    )
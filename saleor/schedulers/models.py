@@ -2,8 +2,9 @@ import importlib
 from typing import TYPE_CHECKING, Union
 
 from celery.schedules import BaseSchedule
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation, ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import signals
 from django_celery_beat import models as base_models
 
@@ -12,6 +13,8 @@ from . import customschedule
 if TYPE_CHECKING:
     from django.db.models.expressions import Combinable
 
+SCHEDULE_VERSION_CACHE_KEY = "celery_beat_schedule_version"
+
 
 class CustomSchedule(models.Model):  # type: ignore[django-manager-missing] # problem with django-stubs # noqa: E501
     """Defines the db model storing the details of a custom Celery beat schedulers.
@@ -140,3 +143,28 @@ signals.pre_save.connect(base_models.PeriodicTasks.changed, sender=CustomPeriodi
 # CustomSchedule
 signals.pre_delete.connect(base_models.PeriodicTasks.changed, sender=CustomSchedule)
 signals.pre_save.connect(base_models.PeriodicTasks.changed, sender=CustomSchedule)
+
+
+def increment_schedule_version(sender, instance, **kwargs):
+    """Notify the change-driven scheduler that the periodic tasks changed.
+
+    Changes saved by the scheduler itself (``no_changes``) are ignored the same
+    way as they are by ``PeriodicTasks.changed``.
+    """
+    if getattr(instance, "no_changes", False):
+        return
+    # Bump the version only once the change is visible to the scheduler.
+    transaction.on_commit(_increment_schedule_version)
+
+
+def _increment_schedule_version():
+    try:
+        cache.incr(SCHEDULE_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(SCHEDULE_VERSION_CACHE_KEY, 1, timeout=None)
+
+
+signals.post_delete.connect(increment_schedule_version, sender=CustomPeriodicTask)
+signals.post_save.connect(increment_schedule_version, sender=CustomPeriodicTask)
+signals.post_delete.connect(increment_schedule_version, sender=CustomSchedule)
+signals.post_save.connect(increment_schedule_version, sender=CustomSchedule)
@@ -1,4 +1,5 @@
 import copy
+import heapq
 import logging
 import time
 from typing import Any, NamedTuple
@@ -6,12 +7,15 @@ from typing import Any, NamedTuple
 import celery.beat
 import celery.schedules
 from celery.signals import setup_logging
+from django.core.cache import cache
 from django_celery_beat import models as base_models
 from django_celery_beat.clockedschedule import clocked
 from django_celery_beat.schedulers import DatabaseScheduler as BaseDatabaseScheduler
 from django_celery_beat.schedulers import ModelEntry
 
+from ..core.telemetry import meter
 from . import customschedule, models
+from .metrics import METRIC_TICK_DURATION, record_schedule_drift
 
 logger = logging.getLogger(__name__)
 
@@ -83,15 +87,23 @@ class BaseScheduler(celery.beat.Scheduler):
 
         This code is all original except when noted it's not.
         """
-        adjust = self.adjust
-        max_interval = self.max_interval
+        with meter.record_duration(METRIC_TICK_DURATION):
+            return self._tick()
 
+    def refresh_heap(self):
+        """Repopulate the heap when the schedule changed."""
         if self._heap is None or not self.schedules_equal(
             self.old_schedulers, self.schedule
         ):
             self.old_schedulers = copy.copy(self.schedule)
             self.populate_heap()
 
+    def _tick(self):
+        adjust = self.adjust
+        max_interval = self.max_interval
+
+        self.refresh_heap()
+
         H: list[HeapEventType] | None = self._heap
         if not H:
             return max_interval
@@ -119,6 +131,7 @@ class BaseScheduler(celery.beat.Scheduler):
                 next_tick = next_time_to_run
 
             if is_due:
+                record_schedule_drift(entry.name, now - event.time)
                 H.pop(heap_pos)
                 next_entry = self.reserve(entry)
                 self.apply_entry(entry, producer=self.producer)
@@ -167,3 +180,88 @@ class DatabaseScheduler(BaseDatabaseScheduler, BaseScheduler):
     Entry = CustomModelEntry
     Model = models.CustomPeriodicTask
     Changes = base_models.PeriodicTasks
+
+
+class ChangeNotifiedDatabaseScheduler(DatabaseScheduler):
+    """Celery beat scheduler backed by the database, reloaded only on changes.
+
+    The periodic tasks are loaded once at startup. Instead of polling the database
+    on every tick, the scheduler checks the schedule version stored in the cache,
+    bumped whenever ``CustomPeriodicTask`` or ``CustomSchedule`` rows change,
+    and only then reloads the tasks and replaces the heap entries of the tasks
+    that were added, changed or removed.
+
+    The cache must be shared between the beat process and the processes changing
+    the periodic tasks.
+
+    Usage:
+    $ celery --app saleor.celeryconf:app beat \
+        --scheduler saleor.schedulers.schedulers.ChangeNotifiedDatabaseScheduler
+    """
+
+    _schedule_version: int | None = None
+
+    @property
+    def schedule(self):
+        if self._initial_read:
+            logger.debug("ChangeNotifiedDatabaseScheduler: initial read")
+            self._initial_read = False
+            self._schedule_version = cache.get(models.SCHEDULE_VERSION_CACHE_KEY)
+            self._schedule = self.all_as_schedule()
+        return self._schedule
+
+    def all_as_schedule(self):
+        # All the enabled tasks are loaded, as contrary to the base scheduler
+        # the schedule is not read again unless it changes.
+        schedule = {}
+        for model in self.Model.objects.enabled():
+            try:
+                schedule[model.name] = self.Entry(model, app=self.app)
+            except ValueError:
+                pass
+        return schedule
+
+    def refresh_heap(self):
+        if self._heap is None:
+            self.populate_heap()
+            return
+
+        version = cache.get(models.SCHEDULE_VERSION_CACHE_KEY)
+        if version == self._schedule_version:
+            return
+        self._schedule_version = version
+        logger.info("ChangeNotifiedDatabaseScheduler: Schedule changed.")
+        self.sync()
+        self.patch_heap(self.all_as_schedule())
+
+    def patch_heap(self, new_schedule: dict[str, ModelEntry]):
+        """Replace the heap entries of the tasks that changed in the new schedule."""
+        schedule = self.schedule
+        removed = schedule.keys() - new_schedule.keys()
+        changed = {
+            name
+            for name, entry in new_schedule.items()
+            if name not in schedule or not entry.editable_fields_equal(schedule[name])
+        }
+        if not removed and not changed:
+            return
+
+        self._heap = [
+            event
+            for event in self._heap or []
+            if event.entry.name not in removed | changed
+        ]
+        for name in removed:
+            del schedule[name]
+        for name in changed:
+            entry = schedule[name] = new_schedule[name]
+            is_due, next_call_delay = entry.is_due()
+            self._heap.append(
+                HeapEventType(
+                    self._when(entry, 0 if is_due else next_call_delay) or 0,
+                    5,
+                    entry,
+                )
+            )
+            logger.debug("Rescheduled %s", name)
+        heapq.heapify(self._heap)
@@ -0,0 +1,159 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from django_celery_beat.models import IntervalSchedule
+
+from ...celeryconf import app
+from ..models import SCHEDULE_VERSION_CACHE_KEY, CustomPeriodicTask
+from ..schedulers import ChangeNotifiedDatabaseScheduler
+
+
+@pytest.fixture
+def interval_schedule():
+    return IntervalSchedule.objects.create(every=10, period=IntervalSchedule.SECONDS)
+
+
+@pytest.fixture
+def periodic_tasks(interval_schedule):
+    return [
+        CustomPeriodicTask.objects.create(
+            name=f"task-{index}",
+            task="saleor.core.tasks.delete_from_storage_task",
+            interval=interval_schedule,
+        )
+        for index in range(2)
+    ]
+
+
+@pytest.fixture
+def scheduler(periodic_tasks):
+    cache.delete(SCHEDULE_VERSION_CACHE_KEY)
+    scheduler = ChangeNotifiedDatabaseScheduler(app=app, lazy=True)
+    # Syncing closes the database connection, which isn't allowed in the tests
+    scheduler._finalize.cancel()
+    with patch.object(scheduler, "sync"):
+        scheduler.refresh_heap()
+        yield scheduler
+
+
+def _heap_events(scheduler):
+    return {event.entry.name: event for event in scheduler._heap}
+
+
+def test_refresh_heap_without_schedule_version_change(scheduler, interval_schedule):
+    # given
+    heap = list(scheduler._heap)
+    CustomPeriodicTask.objects.create(
+        name="task-new",
+        task="saleor.core.tasks.delete_from_storage_task",
+        interval=interval_schedule,
+    )
+
+    # when
+    with patch.object(CustomPeriodicTask.objects, "enabled") as mocked_enabled:
+        scheduler.refresh_heap()
+
+    # then
+    mocked_enabled.assert_not_called()
+    assert scheduler._heap == heap
+
+
+def test_refresh_heap_adds_new_task(
+    scheduler, interval_schedule, django_capture_on_commit_callbacks
+):
+    # given
+    events = _heap_events(scheduler)
+    with django_capture_on_commit_callbacks(execute=True):
+        CustomPeriodicTask.objects.create(
+            name="task-new",
+            task="saleor.core.tasks.delete_from_storage_task",
+            interval=interval_schedule,
+        )
+
+    # when
+    scheduler.refresh_heap()
+
+    # then
+    new_events = _heap_events(scheduler)
+    assert new_events.keys() == {"task-0", "task-1", "task-new"}
+    assert new_events["task-0"] is events["task-0"]
+    assert new_events["task-1"] is events["task-1"]
+    assert "task-new" in scheduler.schedule
+
+
+def test_refresh_heap_replaces_changed_task(
+    scheduler, periodic_tasks, django_capture_on_commit_callbacks
+):
+    # given
+    events = _heap_events(scheduler)
+    task = periodic_tasks[0]
+    with django_capture_on_commit_callbacks(execute=True):
+        task.interval = IntervalSchedule.objects.create(
+            every=1, period=IntervalSchedule.HOURS
+        )
+        task.save()
+
+    # when
+    scheduler.refresh_heap()
+
+    # then
+    new_events = _heap_events(scheduler)
+    assert new_events["task-0"] is not events["task-0"]
+    assert new_events["task-0"].entry.schedule.run_every.total_seconds() == 3600
+    assert new_events["task-1"] is events["task-1"]
+
+
+def test_refresh_heap_removes_disabled_task(
+    scheduler, periodic_tasks, django_capture_on_commit_callbacks
+):
+    # given
+    task = periodic_tasks[0]
+    with django_capture_on_commit_callbacks(execute=True):
+        task.enabled = False
+        task.save()
+
+    # when
+    scheduler.refresh_heap()
+
+    # then
+    assert _heap_events(scheduler).keys() == {"task-1"}
+    assert scheduler.schedule.keys() == {"task-1"}
+
+
+def test_schedule_version_not_changed_by_scheduler_own_saves(
+    scheduler, django_capture_on_commit_callbacks
+):
+    # given
+    entry = scheduler.schedule["task-0"]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        next(entry).save()
+
+    # then
+    assert cache.get(SCHEDULE_VERSION_CACHE_KEY) is None
+
+
+@patch("saleor.schedulers.schedulers.record_schedule_drift")
+def test_tick_applies_due_task_and_records_drift(mocked_record_drift, scheduler):
+    # given
+    entry = scheduler.schedule["task-0"]
+    entry.last_run_at = timezone.now() - timedelta(minutes=1)
+    scheduler.producer = Mock()
+    scheduler._heap = [
+        event._replace(time=event.time - 10) if event.entry.name == "task-0" else event
+        for event in scheduler._heap
+    ]
+
+    # when
+    with patch.object(scheduler, "apply_entry") as mocked_apply_entry:
+        scheduler.tick()
+
+    # then
+    applied_tasks = {call.args[0].name for call in mocked_apply_entry.call_args_list}
+    assert "task-0" in applied_tasks
+    drift_tasks = {call.args[0] for call in mocked_record_drift.call_args_list}
+    assert drift_tasks == applied_tasks
@@ -589,6 +589,11 @@ USER_CHECKOUTS_TIMEDELTA = datetime.timedelta(
 EMPTY_CHECKOUTS_TIMEDELTA = datetime.timedelta(
     seconds=parse(os.environ.get("EMPTY_CHECKOUTS_TIMEDELTA", "6 hours"))
 )
+# Maximum time the expired checkouts cleanup waits for row locks before it skips
+# the batch, so it never queues behind the checkout traffic.
+EXPIRED_CHECKOUTS_DELETE_LOCK_TIMEOUT = datetime.timedelta(
+    seconds=parse(os.environ.get("EXPIRED_CHECKOUTS_DELETE_LOCK_TIMEOUT", "1 second"))
+)
 
 # Exports settings - defines after what time exported files will be deleted
 EXPORT_FILES_TIMEDELTA = datetime.timedelta(
@@ -626,6 +631,13 @@ BEAT_PRICE_RECALCULATION_SCHEDULE = parse(
 )
 BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC = BEAT_PRICE_RECALCULATION_SCHEDULE
 
+# The start and end of the promotions within this period are scheduled as tasks
+# executed at their exact dates. The task scheduling the promotions that get
+# within the period runs twice per period, so the scheduled windows overlap.
+PROMOTION_TOGGLE_SCHEDULE_HORIZON = datetime.timedelta(
+    seconds=parse(os.environ.get("PROMOTION_TOGGLE_SCHEDULE_HORIZON", "1 hour"))
+)
+
 # Defines the Celery beat scheduler entries.
 #
 # Note: if a Celery task triggered by a Celery beat entry has an expiration
@@ -657,6 +669,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.core.tasks.delete_event_payloads_task",
         "schedule": datetime.timedelta(days=1),
     },
+    "delete-outdated-event-delivery-attempts": {
+        "task": "saleor.core.tasks.delete_event_delivery_attempts_task",
+        "schedule": datetime.timedelta(hours=1),
+    },
     "deactivate-expired-gift-cards": {
         "task": "saleor.giftcard.tasks.deactivate_expired_cards_task",
         "schedule": crontab(hour=0, minute=0),
@@ -673,6 +689,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.discount.tasks.handle_promotion_toggle",
         "schedule": initiated_promotion_webhook_schedule,
     },
+    "schedule-promotion-toggles": {
+        "task": "saleor.discount.tasks.schedule_promotion_toggles_task",
+        "schedule": PROMOTION_TOGGLE_SCHEDULE_HORIZON / 2,
+    },
     "update-products-search-vectors": {
         "task": "saleor.product.tasks.update_products_search_vector_task",
         "schedule": datetime.timedelta(seconds=BEAT_UPDATE_SEARCH_SEC),
@@ -724,6 +744,17 @@ EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
+# Longer values of the request and response headers stored in the delivery attempts
+# are truncated.
+EVENT_DELIVERY_ATTEMPT_HEADER_VALUE_SIZE_LIMIT = int(
+    os.environ.get("EVENT_DELIVERY_ATTEMPT_HEADER_VALUE_SIZE_LIMIT", 512)
+)
+# Delivery attempts older than this period are deleted, unless their delivery is
+# still pending. The deliveries are deleted with their payloads after
+# `EVENT_PAYLOAD_DELETE_PERIOD`, so only a shorter period takes effect.
+EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("EVENT_DELIVERY_ATTEMPT_DELETE_PERIOD", "14 days"))
+)
 # Time between marking app "to remove" and removing the app from the database.
 # App is not visible for the user after removing, but it still exists in the database.
 # Saleor needs time to process sending `APP_DELETED` webhook and possible retrying,
@@ -754,6 +785,16 @@ OBSERVABILITY_REPORT_PERIOD = datetime.timedelta(
 OBSERVABILITY_BUFFER_TIMEOUT = datetime.timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_TIMEOUT", "5 minutes"))
 )
+# Number of observability webhooks the events are sent to concurrently.
+OBSERVABILITY_WEBHOOKS_MAX_CONCURRENCY = int(
+    os.environ.get("OBSERVABILITY_WEBHOOKS_MAX_CONCURRENCY", 4)
+)
+# HTTP targets get smaller batches when they respond slower than that.
+OBSERVABILITY_TARGET_LATENCY = datetime.timedelta(
+    seconds=parse(os.environ.get("OBSERVABILITY_TARGET_LATENCY", "1 second"))
+)
+# Send the events to HTTP targets as gzip compressed NDJSON instead of a JSON array.
+OBSERVABILITY_GZIP_NDJSON = get_bool_from_env("OBSERVABILITY_GZIP_NDJSON", False)
 if OBSERVABILITY_ACTIVE:
     CELERY_BEAT_SCHEDULE["observability-reporter"] = {
         "task": "saleor.webhook.transport.asynchronous.transport.observability_reporter_task",
@@ -824,11 +865,46 @@ def SENTRY_INIT(dsn: str, sentry_opts: dict):
 GRAPHQL_PAGINATION_LIMIT = 100
 GRAPHQL_MIDDLEWARE: list[str] = []
 
+# Profile the GraphQL resolvers: the number of calls, the time and the number of
+# SQL queries per field, and the sizes of the dataloader batches. Staff users can
+# request the report in the response extensions with the `Saleor-Profile: true`
+# header. The given fraction of all requests is profiled and recorded as metrics.
+GRAPHQL_RESOLVER_PROFILER_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESOLVER_PROFILER_ENABLED", False
+)
+GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE = float(
+    os.environ.get("GRAPHQL_RESOLVER_PROFILER_SAMPLE_RATE", 0)
+)
+if GRAPHQL_RESOLVER_PROFILER_ENABLED:
+    GRAPHQL_MIDDLEWARE.append("saleor.graphql.core.profiler.ResolverProfilerMiddleware")
+
+# Record the usage of the dataloaders of every request as metrics: the requested
+# keys, the batches and the SQL queries per dataloader. Dataloaders dispatching more
+# than `DATALOADER_MAX_BATCHES_PER_REQUEST` batches in a single request are logged,
+# as it's usually a sign of the dataloader being called in a loop.
+DATALOADER_STATS_ENABLED = get_bool_from_env("DATALOADER_STATS_ENABLED", False)
+DATALOADER_MAX_BATCHES_PER_REQUEST = int(
+    os.environ.get("DATALOADER_MAX_BATCHES_PER_REQUEST", 10)
+)
+
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
 GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Keep sites, channels, tax configurations and warehouses in a process-level
+# snapshot consulted by the dataloaders of read-only operations. The snapshot is
+# invalidated by the model signals, so the code changing these models with bulk
+# or queryset updates has to call `invalidate_config_snapshot`.
+CONFIG_SNAPSHOT_ENABLED = get_bool_from_env("CONFIG_SNAPSHOT_ENABLED", False)
+
+# Share dataloaders between consecutive queries sent in a single batched request,
+# so data loaded by one query is reused by the next ones. Mutations always start
+# with empty dataloaders.
+GRAPHQL_BATCH_SHARE_DATALOADERS = get_bool_from_env(
+    "GRAPHQL_BATCH_SHARE_DATALOADERS", False
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -917,7 +993,41 @@ CHECKOUT_TTL_BEFORE_RELEASING_FUNDS = datetime.timedelta(
 TRANSACTION_BATCH_FOR_RELEASING_FUNDS = os.environ.get(
     "TRANSACTION_BATCH_FOR_RELEASING_FUNDS", 60
 )
+# Maximum number of concurrent tasks requesting a single payment app to release
+# the funds of abandoned checkouts.
+TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP = int(
+    os.environ.get("TRANSACTION_RELEASE_FUNDS_MAX_CONCURRENCY_PER_APP", 2)
+)
+
 
+# Acknowledge the notifications of the Adyen and Stripe payment gateways right after
+# validating them, and process them in the `process_gateway_notifications_task`
+# Celery task. The duplicated notifications are ignored.
+PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED = get_bool_from_env(
+    "PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED", False
+)
+# Number of attempts to process a queued notification before it's marked as failed.
+PAYMENT_GATEWAY_NOTIFICATIONS_MAX_ATTEMPTS = int(
+    os.environ.get("PAYMENT_GATEWAY_NOTIFICATIONS_MAX_ATTEMPTS", 5)
+)
+# Time after which the pending notifications are scheduled for processing again.
+PAYMENT_GATEWAY_NOTIFICATIONS_RETRY_DELAY = datetime.timedelta(
+    seconds=parse(os.environ.get("PAYMENT_GATEWAY_NOTIFICATIONS_RETRY_DELAY", "1 min"))
+)
+# Time after which the processed notifications are deleted. The duplicates of
+# the deleted notifications are not detected.
+PAYMENT_GATEWAY_NOTIFICATIONS_TTL = datetime.timedelta(
+    seconds=parse(os.environ.get("PAYMENT_GATEWAY_NOTIFICATIONS_TTL", "7 days"))
+)
+if PAYMENT_GATEWAY_NOTIFICATIONS_QUEUE_ENABLED:
+    CELERY_BEAT_SCHEDULE["retry-gateway-notifications"] = {
+        "task": "saleor.payment.tasks.retry_gateway_notifications_task",
+        "schedule": PAYMENT_GATEWAY_NOTIFICATIONS_RETRY_DELAY,
+    }
+    CELERY_BEAT_SCHEDULE["delete-old-gateway-notifications"] = {
+        "task": "saleor.payment.tasks.delete_old_gateway_notifications_task",
+        "schedule": crontab(hour=4, minute=0),
+    }
 
 # The maximum SearchVector expression count allowed per index SQL statement
 # If the count is exceeded, the expression list will be truncated
@@ -936,6 +1046,55 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Filter products by attributes using the denormalized `Product.attribute_value_ids`
+# array instead of subqueries over the attribute assignments.
+PRODUCT_ATTRIBUTE_VALUE_IDS_FILTER_ENABLED = get_bool_from_env(
+    "PRODUCT_ATTRIBUTE_VALUE_IDS_FILTER_ENABLED", False
+)
+
+# Serve variant available quantities from the denormalized
+# `ProductVariantAvailability` table. The rows are recalculated in the background
+# whenever the variant stocks, allocations or reservations change. Rows not
+# recalculated for the given number of seconds are deleted and calculated again.
+# Changes made while the table is disabled don't mark the stored rows, so when
+# enabling it again run `mark_variants_availability_as_dirty_task` first.
+PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = get_bool_from_env(
+    "PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED", False
+)
+PRODUCT_VARIANT_AVAILABILITY_TTL = int(
+    os.environ.get("PRODUCT_VARIANT_AVAILABILITY_TTL", 60 * 60 * 24)
+)
+if PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED:
+    CELERY_BEAT_SCHEDULE["recalculate-variants-availability"] = {
+        "task": "saleor.warehouse.tasks.recalculate_variants_availability_task",
+        "schedule": datetime.timedelta(seconds=BEAT_PRICE_RECALCULATION_SCHEDULE),
+        "options": {"expires": BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC},
+    }
+    # rows also expire with the reservations included in the quantity
+    CELERY_BEAT_SCHEDULE["delete-expired-variants-availability"] = {
+        "task": "saleor.warehouse.tasks.delete_expired_variants_availability_task",
+        "schedule": datetime.timedelta(minutes=1),
+    }
+
+# Serve product display price ranges from the denormalized `ProductPriceRange`
+# table. The rows are recalculated in the background whenever the product prices
+# or the tax configuration change. Rows not recalculated for the given number of
+# seconds are deleted and calculated again.
+PRODUCT_PRICE_RANGE_TABLE_ENABLED = get_bool_from_env(
+    "PRODUCT_PRICE_RANGE_TABLE_ENABLED", False
+)
+PRODUCT_PRICE_RANGE_TTL = int(os.environ.get("PRODUCT_PRICE_RANGE_TTL", 60 * 60 * 24))
+if PRODUCT_PRICE_RANGE_TABLE_ENABLED:
+    CELERY_BEAT_SCHEDULE["recalculate-products-price-ranges"] = {
+        "task": "saleor.product.tasks.recalculate_products_price_ranges_task",
+        "schedule": datetime.timedelta(seconds=BEAT_PRICE_RECALCULATION_SCHEDULE),
+        "options": {"expires": BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC},
+    }
+    CELERY_BEAT_SCHEDULE["delete-expired-products-price-ranges"] = {
+        "task": "saleor.product.tasks.delete_expired_product_price_ranges_task",
+        "schedule": datetime.timedelta(hours=1),
+    }
+
 
 # Patch SubscriberExecutionContext class from `graphql-core-legacy` package
 # to fix bug causing not returning errors for subscription queries.
@@ -951,6 +1110,10 @@ patch_executor()
 UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME = os.environ.get(
     "UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME", None
 )
+# Queue name for processing the payment gateway notifications
+PAYMENT_GATEWAY_NOTIFICATIONS_CELERY_QUEUE_NAME = os.environ.get(
+    "PAYMENT_GATEWAY_NOTIFICATIONS_CELERY_QUEUE_NAME", None
+)
 # Queue name for "async webhook" events
 WEBHOOK_CELERY_QUEUE_NAME = os.environ.get("WEBHOOK_CELERY_QUEUE_NAME", None)
 WEBHOOK_SQS_CELERY_QUEUE_NAME = os.environ.get(
@@ -1016,6 +1179,17 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# Time (sec) for which an expired response of a cached sync webhook can still be
+# served, while another worker fetches the fresh one, or when the app call fails.
+# Set to 0 to disable serving stale responses.
+WEBHOOK_SYNC_CACHE_STALE_TIMEOUT = int(
+    os.environ.get("WEBHOOK_SYNC_CACHE_STALE_TIMEOUT", 0)
+)
+
+# The max number of concurrent tax app calls made when taxes are recalculated
+# for multiple orders at once. Set to 1 to call the tax apps sequentially.
+ORDER_TAX_APP_MAX_CONCURRENCY = int(os.environ.get("ORDER_TAX_APP_MAX_CONCURRENCY", 4))
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -1048,7 +1222,25 @@ BREAKER_BOARD_ENABLED = get_bool_from_env("BREAKER_BOARD_ENABLED", False)
 # Storage class string for the breaker board, for example:
 # "saleor.webhook.circuit_breaker.storage.RedisStorage"
 BREAKER_BOARD_STORAGE_CLASS = "saleor.webhook.circuit_breaker.storage.RedisStorage"
-if BREAKER_BOARD_ENABLED and (CACHE_URL is None or not CACHE_URL.startswith("redis")):
+# Enable circuit breakers for async webhook deliveries (per app and per target host).
+# Deliveries blocked by an open breaker are parked and re-queued when it half-opens.
+BREAKER_BOARD_ASYNC_ENABLED = get_bool_from_env("BREAKER_BOARD_ASYNC_ENABLED", False)
+BREAKER_BOARD_ASYNC_STORAGE_CLASS = (
+    "saleor.webhook.circuit_breaker.storage.AsyncRedisStorage"
+)
+# Period of releasing parked deliveries whose release task was lost.
+BREAKER_BOARD_ASYNC_PARKED_SWEEP_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("BREAKER_BOARD_ASYNC_PARKED_SWEEP_PERIOD", "5 min"))
+)
+if BREAKER_BOARD_ASYNC_ENABLED:
+    CELERY_BEAT_SCHEDULE["release-parked-webhook-deliveries"] = {
+        "task": "saleor.webhook.transport.asynchronous.transport"
+        ".release_parked_deliveries_sweep_task",
+        "schedule": BREAKER_BOARD_ASYNC_PARKED_SWEEP_PERIOD,
+    }
+if (BREAKER_BOARD_ENABLED or BREAKER_BOARD_ASYNC_ENABLED) and (
+    CACHE_URL is None or not CACHE_URL.startswith("redis")
+):
     raise ImproperlyConfigured(
         "Redis storage cannot be used when Redis cache is not configured."
     )
@@ -98,6 +98,7 @@ PRIVATE_FILE_STORAGE = "saleor.tests.storages.PrivateFileSystemStorage"
 PRIVATE_MEDIA_ROOT: str = os.path.join(PROJECT_ROOT, "private-media")  # noqa: F405
 
 BREAKER_BOARD_ENABLED = False
+BREAKER_BOARD_ASYNC_ENABLED = False
 
 # Enable exception raising for telemetry unit conversion errors
 # This helps identify unit conversion issues during development and testing
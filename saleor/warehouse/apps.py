@@ -0,0 +1,38 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from ..channel.models import Channel
+        from ..shipping.models import ShippingZone
+        from .models import Warehouse
+        from .signals import invalidate_warehouse_topology_cache
+
+        # the warehouse topology depends on the shipping zones, warehouses and
+        # the relations between them and the channels
+        for sender in [Channel, ShippingZone, Warehouse]:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    invalidate_warehouse_topology_cache,
+                    sender=sender,
+                    dispatch_uid=f"invalidate_warehouse_topology_{sender.__name__}",
+                )
+        for through in [
+            Channel.warehouses.through,
+            Channel.shipping_zones.through,
+            Warehouse.shipping_zones.through,
+        ]:
+            m2m_changed.connect(
+                invalidate_warehouse_topology_cache,
+                sender=through,
+                dispatch_uid=f"invalidate_warehouse_topology_{through.__name__}",
+            )
+            # relations are also removed with queryset deletes
+            post_delete.connect(
+                invalidate_warehouse_topology_cache,
+                sender=through,
+                dispatch_uid=f"invalidate_warehouse_topology_{through.__name__}",
+            )
@@ -19,6 +19,7 @@ from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..product.models import ProductVariantChannelListing
 from .models import Reservation, Stock, StockQuerySet
 from .reservations import get_listings_reservations
+from .topology import get_warehouse_topology
 
 if TYPE_CHECKING:
     from ..checkout.fetch import CheckoutLineInfo
@@ -262,14 +263,16 @@ def check_stock_quantity_bulk(
     collection_point = (
         delivery_method_info.warehouse_pk if delivery_method_info else None
     )
-    stocks = (
-        Stock.objects.using(database_connection_name).for_channel_and_click_and_collect(
-            channel_slug
-        )
+    topology = get_warehouse_topology(channel_slug)
+    warehouse_ids = (
+        topology.warehouse_ids
         if collection_point
-        else Stock.objects.using(database_connection_name).for_channel_and_country(
-            channel_slug, country_code, include_cc_warehouses
-        )
+        else topology.get_warehouse_ids(country_code, include_cc_warehouses)
+    )
+    stocks = (
+        Stock.objects.using(database_connection_name)
+        .select_related("product_variant")
+        .filter(warehouse_id__in=warehouse_ids)
     )
 
     all_variants_stocks = stocks.filter(**filter_lookup).annotate_available_quantity()
@@ -37,6 +37,8 @@ from .models import (
     Stock,
     Warehouse,
 )
+from .topology import get_warehouse_topology
+from .variant_availability import invalidate_variants_availability
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -49,6 +51,11 @@ class StockData(NamedTuple):
 
 def delete_stocks(stock_pks_to_delete: list[int]):
     with transaction.atomic():
+        invalidate_variants_availability(
+            Stock.objects.filter(id__in=stock_pks_to_delete).values_list(
+                "product_variant_id", flat=True
+            )
+        )
         return Stock.objects.filter(
             id__in=Stock.objects.order_by("pk")
             .select_for_update(of=["self"])
@@ -65,6 +72,7 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
             .values_list("id", flat=True)
         )
         Stock.objects.bulk_update(stocks, fields_to_update)
+        invalidate_variants_availability(stock.product_variant_id for stock in stocks)
 
 
 def delete_allocations(allocation_pks_to_delete: list[int]):
@@ -113,11 +121,13 @@ def allocate_stocks(
 
     # in case of click and collect order, we need to check local or global stock
     # regardless of the country code
-    stocks = (
-        Stock.objects.for_channel_and_click_and_collect(channel_slug)
+    topology = get_warehouse_topology(channel_slug)
+    warehouse_ids = (
+        topology.warehouse_ids
         if collection_point_pk
-        else Stock.objects.for_channel_and_country(channel_slug, country_code)
+        else topology.get_warehouse_ids(country_code)
     )
+    stocks = Stock.objects.filter(warehouse_id__in=warehouse_ids)
 
     stocks = list(
         stock_select_for_update_for_existing_qs(stocks)
@@ -188,6 +198,7 @@ def allocate_stocks(
             stock.quantity_allocated = F("quantity_allocated") + quantity
 
         Stock.objects.bulk_update(stocks_to_update_map.values(), ["quantity_allocated"])
+        invalidate_variants_availability(variant.pk for variant in variants)
 
         for allocation in allocations:
             allocated_stock = (
@@ -387,6 +398,9 @@ def deallocate_stock(order_lines_data: list["OrderLineInfo"], manager: PluginsMa
             )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_variants_availability(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -432,6 +446,7 @@ def increase_stock(
             )
         stock.quantity_allocated = F("quantity_allocated") + quantity
         stock.save(update_fields=["quantity_allocated"])
+    invalidate_variants_availability([order_line.variant.pk])
 
 
 def _reduce_quantity_allocated_for_stocks(
@@ -510,6 +525,9 @@ def decrease_allocations(lines_info: list["OrderLineInfo"], manager):
         Allocation.objects.order_by("stock_id").filter(
             order_line__in=exc.order_lines
         ).update(quantity_allocated=0)
+        invalidate_variants_availability(
+            line.variant_id for line in exc.order_lines if line.variant_id
+        )
 
 
 @traced_atomic_transaction()
@@ -627,6 +645,9 @@ def _decrease_stocks_quantity(
         raise InsufficientStock(insufficient_stocks)
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    invalidate_variants_availability(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 def _get_variant_for_order_line_info(
@@ -707,6 +728,9 @@ def deallocate_stock_for_orders(orders_ids: list[UUID], manager: PluginsManager)
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_variants_availability(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
@@ -922,6 +946,8 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
     if preorder_allocations:
         preorder_allocations.delete()
 
+    invalidate_variants_availability([product_variant.pk])
+
     product_variant.preorder_global_threshold = None
     product_variant.preorder_end_date = None
     product_variant.is_preorder = False
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0022_merge_20250527_1210"),
+        ("product", "0201_product_attribute_value_ids"),
+        ("warehouse", "0035_alter_warehouse_metadata_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductVariantAvailability",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "country_code",
+                    models.CharField(blank=True, default="", max_length=2),
+                ),
+                ("quantity", models.IntegerField(default=0)),
+                ("topology_version", models.CharField(max_length=32)),
+                ("reservations_enabled", models.BooleanField(default=False)),
+                ("valid_until", models.DateTimeField()),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="availabilities",
+                        to="product.productvariant",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product_variant", "channel", "country_code"),
+                        name="unique_variant_channel_country_availability",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("warehouse", "0036_productvariantavailability"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productvariantavailability",
+            name="version",
+            field=models.CharField(default="", max_length=32),
+        ),
+    ]
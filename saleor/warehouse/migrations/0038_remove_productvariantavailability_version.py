@@ -0,0 +1,16 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("warehouse", "0037_productvariantavailability_version"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="productvariantavailability",
+            name="version",
+        ),
+    ]
@@ -636,3 +636,33 @@ class Reservation(models.Model):
             models.Index(fields=["checkout_line", "reserved_until"]),
         ]
         ordering = ("pk",)
+
+
+class ProductVariantAvailability(models.Model):
+    """Denormalized quantity of the variant available in the channel and country.
+
+    The rows are calculated in the background for all countries served in the channel
+    whenever the variant stocks, allocations or reservations change. They are not used
+    while the variant channel listing is marked with `availability_dirty`. The empty
+    country code stands for the quantity calculated without the country.
+    """
+
+    product_variant = models.ForeignKey(
+        ProductVariant, on_delete=models.CASCADE, related_name="availabilities"
+    )
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name="+")
+    country_code = models.CharField(max_length=2, blank=True, default="")
+    quantity = models.IntegerField(default=0)
+    # version of the warehouse topology the quantity was calculated for
+    topology_version = models.CharField(max_length=32)
+    reservations_enabled = models.BooleanField(default=False)
+    valid_until = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product_variant", "channel", "country_code"],
+                name="unique_variant_channel_country_availability",
+            )
+        ]
+        ordering = ("pk",)
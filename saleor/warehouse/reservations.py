@@ -14,6 +14,7 @@ from ..product.models import ProductVariant, ProductVariantChannelListing
 from .lock_objects import stock_qs_select_for_update
 from .management import sort_stocks
 from .models import Allocation, PreorderReservation, Reservation
+from .variant_availability import invalidate_variants_availability
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -178,6 +179,7 @@ def reserve_stocks(
         if replace:
             Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
         Reservation.objects.bulk_create(reservations)
+        invalidate_variants_availability(line.variant_id for line in checkout_lines)
 
 
 def _create_stock_reservations(
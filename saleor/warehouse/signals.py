@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.db import transaction
+
+from .topology import invalidate_warehouse_topology
+from .variant_availability import invalidate_channels_variants_availability
+
+
+def invalidate_warehouse_topology_cache(sender, **kwargs):
+    # Bumped once committed, otherwise a concurrent read could rebuild the topology
+    # from the data before the change and cache it under the new version.
+    transaction.on_commit(invalidate_warehouse_topology)
+    if settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED:
+        # the stored quantities were calculated for the previous topology
+        invalidate_channels_variants_availability()
@@ -1,15 +1,34 @@
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..product.models import ProductVariantChannelListing
 from .management import delete_allocations, stock_bulk_update
-from .models import Allocation, PreorderReservation, Reservation, Stock
+from .models import (
+    Allocation,
+    PreorderReservation,
+    ProductVariantAvailability,
+    Reservation,
+    Stock,
+)
+from .reservations import is_reservation_enabled
+from .variant_availability import (
+    invalidate_reserved_variants_availability,
+    mark_variants_availability_as_dirty,
+    update_variants_availability,
+)
 
 task_logger = get_task_logger(__name__)
 
+VARIANT_AVAILABILITY_LISTING_BATCH = 100
+VARIANT_AVAILABILITY_DIRTY_MARK_BATCH = 2000
+
 
 @app.task
 @allow_writer()
@@ -25,9 +44,9 @@ def delete_empty_allocations_task():
 @app.task
 @allow_writer()
 def delete_expired_reservations_task():
-    stock_reservations, _ = Reservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
+    expired_reservations = Reservation.objects.filter(reserved_until__lt=timezone.now())
+    invalidate_reserved_variants_availability(expired_reservations)
+    stock_reservations, _ = expired_reservations.delete()
     preorder_reservations, _ = PreorderReservation.objects.filter(
         reserved_until__lt=timezone.now()
     ).delete()
@@ -66,3 +85,105 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+@allow_writer()
+def recalculate_variants_availability_task():
+    """Recalculate the stored availability of the variant listings marked as dirty.
+
+    The listings are locked while the quantities are calculated, so changes marking
+    them as dirty again wait and get recalculated by the next run.
+    """
+    if not settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED:
+        return
+    reservations_enabled = is_reservation_enabled(Site.objects.get_current().settings)
+    with transaction.atomic():
+        listings = list(
+            ProductVariantChannelListing.objects.select_for_update(
+                of=("self",), skip_locked=True
+            )
+            .filter(availability_dirty=True)
+            .order_by("pk")
+            .values_list("id", "variant_id", "channel_id")[
+                :VARIANT_AVAILABILITY_LISTING_BATCH
+            ]
+        )
+        if not listings:
+            return
+        update_variants_availability(
+            ((variant_id, channel_id) for _, variant_id, channel_id in listings),
+            reservations_enabled,
+        )
+        ProductVariantChannelListing.objects.filter(
+            id__in=[listing_id for listing_id, _, _ in listings]
+        ).update(availability_dirty=False)
+    if len(listings) == VARIANT_AVAILABILITY_LISTING_BATCH:
+        recalculate_variants_availability_task.delay()
+
+
+@app.task
+@allow_writer()
+def mark_variants_availability_as_dirty_task(
+    channel_ids: list[int] | None = None, start_id: int = 0
+):
+    """Mark the variant listings in the given channels, or in all channels, as dirty."""
+    listings = ProductVariantChannelListing.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(id__gt=start_id)
+    if channel_ids is not None:
+        listings = listings.filter(channel_id__in=channel_ids)
+    listing_ids = list(
+        listings.order_by("pk").values_list("id", flat=True)[
+            :VARIANT_AVAILABILITY_DIRTY_MARK_BATCH
+        ]
+    )
+    if not listing_ids:
+        return
+    mark_variants_availability_as_dirty(listing_ids)
+    if len(listing_ids) == VARIANT_AVAILABILITY_DIRTY_MARK_BATCH:
+        mark_variants_availability_as_dirty_task.delay(channel_ids, listing_ids[-1])
+
+
+@app.task
+@allow_writer()
+def delete_expired_variants_availability_task():
+    """Delete the expired availability rows and mark their listings as dirty.
+
+    The rows expire with the first reservation included in the quantity, or when
+    they were not recalculated for `PRODUCT_VARIANT_AVAILABILITY_TTL` seconds.
+    """
+    expired_rows = ProductVariantAvailability.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(valid_until__lte=timezone.now())
+    rows = list(
+        expired_rows.order_by("pk").values_list(
+            "id", "product_variant_id", "channel_id"
+        )[:VARIANT_AVAILABILITY_DIRTY_MARK_BATCH]
+    )
+    if not rows:
+        return
+    ProductVariantAvailability.objects.filter(
+        id__in=[row_id for row_id, _, _ in rows], valid_until__lte=timezone.now()
+    ).delete()
+    variant_channel_ids = {
+        (variant_id, channel_id) for _, variant_id, channel_id in rows
+    }
+    mark_variants_availability_as_dirty(
+        [
+            listing_id
+            for listing_id, variant_id, channel_id in (
+                ProductVariantChannelListing.objects.filter(
+                    variant_id__in={
+                        variant_id for variant_id, _ in variant_channel_ids
+                    },
+                    channel_id__in={
+                        channel_id for _, channel_id in variant_channel_ids
+                    },
+                ).values_list("id", "variant_id", "channel_id")
+            )
+            if (variant_id, channel_id) in variant_channel_ids
+        ]
+    )
+    if len(rows) == VARIANT_AVAILABILITY_DIRTY_MARK_BATCH:
+        delete_expired_variants_availability_task.delay()
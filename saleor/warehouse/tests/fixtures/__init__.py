@@ -1,4 +1,5 @@
 from .allocation import *  # noqa: F403
 from .preorder_allocation import *  # noqa: F403
 from .stock import *  # noqa: F403
+from .topology import *  # noqa: F403
 from .warehouse import *  # noqa: F403
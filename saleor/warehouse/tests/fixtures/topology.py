@@ -0,0 +1,10 @@
+import pytest
+
+from ...topology import invalidate_warehouse_topology
+
+
+@pytest.fixture(autouse=True)
+def clear_warehouse_topology_cache():
+    # The topology is cached outside of the database transaction, so it would
+    # outlive the data rolled back after each test.
+    invalidate_warehouse_topology()
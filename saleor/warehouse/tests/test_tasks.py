@@ -1,12 +1,22 @@
 import datetime
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
 
-from ..models import Allocation, PreorderReservation, Reservation
+from ...product.models import ProductVariantChannelListing
+from ..models import (
+    Allocation,
+    PreorderReservation,
+    ProductVariantAvailability,
+    Reservation,
+)
 from ..tasks import (
     delete_empty_allocations_task,
     delete_expired_reservations_task,
+    delete_expired_variants_availability_task,
+    mark_variants_availability_as_dirty_task,
+    recalculate_variants_availability_task,
     update_stocks_quantity_allocated_task,
 )
 
@@ -35,6 +45,29 @@ def test_delete_expired_reservations_task_deletes_expired_stock_reservations(
     assert not Reservation.objects.exists()
 
 
+def test_delete_expired_reservations_task_invalidates_variants_availability(
+    checkout_line_with_reservation_in_many_stocks,
+    django_capture_on_commit_callbacks,
+    settings,
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    variant_id = checkout_line_with_reservation_in_many_stocks.variant_id
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    Reservation.objects.update(
+        reserved_until=timezone.now() - datetime.timedelta(seconds=1)
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_expired_reservations_task()
+
+    # then
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=variant_id
+    ).availability_dirty
+
+
 def test_delete_expired_reservations_task_skips_active_stock_reservations(
     checkout_line_with_reservation_in_many_stocks,
 ):
@@ -104,3 +137,89 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_recalculate_variants_availability_task(stock, channel_USD, settings):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    listing = ProductVariantChannelListing.objects.get(
+        variant_id=stock.product_variant_id, channel=channel_USD
+    )
+    assert listing.availability_dirty
+
+    # when
+    recalculate_variants_availability_task()
+
+    # then
+    listing.refresh_from_db()
+    assert not listing.availability_dirty
+    availability = ProductVariantAvailability.objects.get(
+        product_variant_id=stock.product_variant_id, country_code="PL"
+    )
+    assert availability.quantity == stock.quantity
+
+
+def test_recalculate_variants_availability_task_disabled(stock, settings):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = False
+
+    # when
+    recalculate_variants_availability_task()
+
+    # then
+    assert not ProductVariantAvailability.objects.exists()
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=stock.product_variant_id
+    ).availability_dirty
+
+
+@patch("saleor.warehouse.tasks.recalculate_variants_availability_task.delay")
+@patch("saleor.warehouse.tasks.VARIANT_AVAILABILITY_LISTING_BATCH", 1)
+def test_recalculate_variants_availability_task_reschedules_itself(
+    mocked_delay, product_variant_list, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+
+    # when
+    recalculate_variants_availability_task()
+
+    # then
+    mocked_delay.assert_called_once_with()
+    assert (
+        ProductVariantChannelListing.objects.filter(availability_dirty=False).count()
+        == 1
+    )
+
+
+def test_mark_variants_availability_as_dirty_task(variant, channel_USD):
+    # given
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+
+    # when
+    mark_variants_availability_as_dirty_task([channel_USD.pk])
+
+    # then
+    assert variant.channel_listings.get().availability_dirty
+
+
+def test_delete_expired_variants_availability_task(stock, channel_USD):
+    # given
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    ProductVariantAvailability.objects.create(
+        product_variant_id=stock.product_variant_id,
+        channel=channel_USD,
+        country_code="PL",
+        quantity=7,
+        topology_version="",
+        valid_until=timezone.now() - datetime.timedelta(seconds=1),
+    )
+
+    # when
+    delete_expired_variants_availability_task()
+
+    # then
+    assert not ProductVariantAvailability.objects.exists()
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=stock.product_variant_id
+    ).availability_dirty
@@ -0,0 +1,122 @@
+from ..topology import get_warehouse_topology
+
+
+def test_get_warehouse_topology(warehouse, shipping_zone, channel_USD):
+    # when
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # then
+    assert topology.warehouse_ids == {warehouse.id}
+    assert topology.get_warehouse_shipping_zones("PL") == [
+        (warehouse.id, shipping_zone.id)
+    ]
+    assert topology.get_warehouse_shipping_zones("XX") == []
+    assert topology.get_warehouse_ids("PL") == {warehouse.id}
+    assert topology.get_warehouse_ids("XX") == set()
+
+
+def test_get_warehouse_topology_click_and_collect_warehouses(
+    warehouse, warehouse_for_cc, channel_USD
+):
+    # when
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # then
+    assert topology.click_and_collect_warehouses == {
+        warehouse_for_cc.id: warehouse_for_cc.click_and_collect_option
+    }
+    assert topology.get_warehouse_ids(None) == {warehouse.id, warehouse_for_cc.id}
+    assert topology.get_warehouse_ids("PL") == {warehouse.id}
+    assert topology.get_warehouse_ids("PL", include_cc_warehouses=True) == {
+        warehouse.id,
+        warehouse_for_cc.id,
+    }
+
+
+def test_get_warehouse_topology_unknown_channel(warehouse):
+    # when
+    topology = get_warehouse_topology("non-existing")
+
+    # then
+    assert topology.warehouse_ids == set()
+    assert topology.get_warehouse_ids(None) == set()
+
+
+def test_get_warehouse_topology_cached(
+    warehouse, channel_USD, django_assert_num_queries
+):
+    # given
+    get_warehouse_topology(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        topology = get_warehouse_topology(channel_USD.slug)
+
+    # then
+    assert topology.warehouse_ids == {warehouse.id}
+
+
+def test_get_warehouse_topology_invalidated_on_warehouse_shipping_zones_change(
+    warehouse, shipping_zone, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    get_warehouse_topology(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        warehouse.shipping_zones.remove(shipping_zone)
+
+    # then
+    topology = get_warehouse_topology(channel_USD.slug)
+    assert topology.get_warehouse_shipping_zones("PL") == []
+
+
+def test_get_warehouse_topology_invalidated_on_channel_warehouses_change(
+    warehouse, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    get_warehouse_topology(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.warehouses.remove(warehouse)
+
+    # then
+    topology = get_warehouse_topology(channel_USD.slug)
+    assert topology.warehouse_ids == set()
+
+
+def test_get_warehouse_topology_invalidated_on_shipping_zone_countries_change(
+    warehouse, shipping_zone, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    get_warehouse_topology(channel_USD.slug)
+
+    # when
+    shipping_zone.countries = ["US"]
+    with django_capture_on_commit_callbacks(execute=True):
+        shipping_zone.save(update_fields=["countries"])
+
+    # then
+    topology = get_warehouse_topology(channel_USD.slug)
+    assert topology.get_warehouse_ids("US") == {warehouse.id}
+    assert topology.get_warehouse_ids("PL") == set()
+
+
+def test_get_warehouse_topology_not_invalidated_before_commit(
+    warehouse, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        channel_USD.warehouses.remove(warehouse)
+        cached_topology = get_warehouse_topology(channel_USD.slug)
+
+    # then
+    assert callbacks
+    assert cached_topology.version == topology.version
+    for callback in callbacks:
+        callback()
+    assert get_warehouse_topology(channel_USD.slug).version != (topology.version)
@@ -0,0 +1,255 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ...checkout.utils import delete_checkouts
+from ...order.fetch import OrderLineInfo
+from ...plugins.manager import get_plugins_manager
+from ...product.models import ProductVariantChannelListing
+from ..management import allocate_stocks, stock_bulk_update
+from ..models import ProductVariantAvailability, Reservation
+from ..topology import get_warehouse_topology
+from ..variant_availability import (
+    calculate_variants_availability,
+    get_variants_availability,
+    invalidate_variants_availability,
+    update_variants_availability,
+)
+
+
+def test_update_variants_availability(stock, channel_USD):
+    # given
+    variant_id = stock.product_variant_id
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # when
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+
+    # then
+    for country_code in ["PL", None]:
+        assert get_variants_availability(
+            [variant_id], topology, country_code, False, "default"
+        ) == {variant_id: stock.quantity}
+    assert ProductVariantAvailability.objects.count() == 1 + len(
+        set().union(*topology.shipping_zone_countries.values())
+    )
+
+
+def test_update_variants_availability_removes_rows_of_countries_not_served(
+    stock, channel_USD
+):
+    # given
+    variant_id = stock.product_variant_id
+    ProductVariantAvailability.objects.create(
+        product_variant_id=variant_id,
+        channel=channel_USD,
+        country_code="XX",
+        quantity=7,
+        topology_version="",
+        valid_until=timezone.now() + timedelta(hours=1),
+    )
+
+    # when
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+
+    # then
+    assert not ProductVariantAvailability.objects.filter(country_code="XX").exists()
+
+
+def test_update_variants_availability_valid_until_reservation_expires(
+    checkout_line_with_reservation_in_many_stocks, channel_USD
+):
+    # given
+    checkout_line = checkout_line_with_reservation_in_many_stocks
+    reservation = Reservation.objects.filter(checkout_line=checkout_line).first()
+    reserved_until = timezone.now() + timedelta(seconds=30)
+    Reservation.objects.filter(pk=reservation.pk).update(reserved_until=reserved_until)
+
+    # when
+    update_variants_availability([(checkout_line.variant_id, channel_USD.pk)], True)
+
+    # then
+    assert ProductVariantAvailability.objects.exists()
+    assert not ProductVariantAvailability.objects.exclude(
+        valid_until=reserved_until
+    ).exists()
+
+
+def test_calculate_variants_availability_with_reservations(
+    checkout_line_with_reservation_in_many_stocks, channel_USD
+):
+    # given
+    variant = checkout_line_with_reservation_in_many_stocks.variant
+    topology = get_warehouse_topology(channel_USD.slug)
+    stocks_quantity = sum(
+        stock.quantity - stock.quantity_allocated
+        for stock in variant.stocks.filter(warehouse_id__in=topology.warehouse_ids)
+    )
+    reserved_quantity = sum(
+        Reservation.objects.filter(
+            stock__warehouse_id__in=topology.warehouse_ids
+        ).values_list("quantity_reserved", flat=True)
+    )
+
+    # when
+    quantity_maps = calculate_variants_availability(
+        [variant.pk], topology, ["PL"], True, "default"
+    )
+
+    # then
+    assert quantity_maps["PL"][variant.pk] == stocks_quantity - reserved_quantity
+
+
+def test_get_variants_availability_skips_dirty_listings(stock, channel_USD):
+    # given
+    variant_id = stock.product_variant_id
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # when
+    ProductVariantChannelListing.objects.update(availability_dirty=True)
+
+    # then
+    assert (
+        get_variants_availability([variant_id], topology, "PL", False, "default") == {}
+    )
+
+
+def test_get_variants_availability_skips_outdated_topology(
+    stock, warehouse, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    variant_id = stock.product_variant_id
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        warehouse.channels.remove(channel_USD)
+
+    # then
+    topology = get_warehouse_topology(channel_USD.slug)
+    assert (
+        get_variants_availability([variant_id], topology, "PL", False, "default") == {}
+    )
+
+
+def test_get_variants_availability_skips_other_reservation_setting(stock, channel_USD):
+    # given
+    variant_id = stock.product_variant_id
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # when
+    availability = get_variants_availability(
+        [variant_id], topology, "PL", True, "default"
+    )
+
+    # then
+    assert availability == {}
+
+
+def test_get_variants_availability_skips_expired_rows(stock, channel_USD):
+    # given
+    variant_id = stock.product_variant_id
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    update_variants_availability([(variant_id, channel_USD.pk)], False)
+    topology = get_warehouse_topology(channel_USD.slug)
+
+    # when
+    ProductVariantAvailability.objects.update(
+        valid_until=timezone.now() - timedelta(seconds=1)
+    )
+
+    # then
+    assert (
+        get_variants_availability([variant_id], topology, "PL", False, "default") == {}
+    )
+
+
+def test_invalidate_variants_availability_on_commit(
+    variant, django_capture_on_commit_callbacks, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    listing = variant.channel_listings.get()
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        invalidate_variants_availability([variant.pk])
+
+    # then
+    listing.refresh_from_db()
+    assert listing.availability_dirty is False
+    for callback in callbacks:
+        callback()
+    listing.refresh_from_db()
+    assert listing.availability_dirty is True
+
+
+def test_allocate_stocks_invalidates_variants_availability(
+    order_line, stock, channel_USD, django_capture_on_commit_callbacks, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            "US",
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=order_line.variant_id, channel=channel_USD
+    ).availability_dirty
+
+
+def test_stock_bulk_update_invalidates_variants_availability(
+    stock, django_capture_on_commit_callbacks, settings
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+    stock.quantity = 0
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        stock_bulk_update([stock], ["quantity"])
+
+    # then
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=stock.product_variant_id
+    ).availability_dirty
+
+
+def test_delete_checkouts_invalidates_reserved_variants_availability(
+    checkout_line_with_reservation_in_many_stocks,
+    django_capture_on_commit_callbacks,
+    settings,
+):
+    # given
+    settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED = True
+    checkout_line = checkout_line_with_reservation_in_many_stocks
+    ProductVariantChannelListing.objects.update(availability_dirty=False)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_checkouts([checkout_line.checkout_id])
+
+    # then
+    assert not Reservation.objects.exists()
+    assert ProductVariantChannelListing.objects.get(
+        variant_id=checkout_line.variant_id,
+        channel_id=checkout_line.checkout.channel_id,
+    ).availability_dirty
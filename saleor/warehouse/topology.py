@@ -0,0 +1,151 @@
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..channel.models import Channel
+from ..core.db.connection import allow_writer
+from ..shipping.models import ShippingZone
+from . import WarehouseClickAndCollectOption
+from .models import Warehouse
+
+WAREHOUSE_TOPOLOGY_VERSION_CACHE_KEY = "warehouse_topology_version"
+WAREHOUSE_TOPOLOGY_CACHE_KEY = "warehouse_topology:{version}:{channel_slug}"
+WAREHOUSE_TOPOLOGY_CACHE_TIMEOUT = 60 * 60 * 24
+
+CLICK_AND_COLLECT_OPTIONS = [
+    WarehouseClickAndCollectOption.LOCAL_STOCK,
+    WarehouseClickAndCollectOption.ALL_WAREHOUSES,
+]
+
+
+@dataclass
+class WarehouseTopology:
+    """Warehouses serving the given channel.
+
+    Only the shipping zones and warehouses assigned to the channel are included.
+    """
+
+    channel_id: int | None = None
+    # version of the cache the topology was built for
+    version: str = ""
+    # ids of all warehouses assigned to the channel
+    warehouse_ids: set[UUID] = field(default_factory=set)
+    # shipping zone id to the zone's country codes
+    shipping_zone_countries: dict[int, set[str]] = field(default_factory=dict)
+    # shipping zone id to ids of the zone's warehouses
+    shipping_zone_warehouse_ids: dict[int, list[UUID]] = field(default_factory=dict)
+    # collection point warehouse id to its click and collect option
+    click_and_collect_warehouses: dict[UUID, str] = field(default_factory=dict)
+
+    def get_warehouse_shipping_zones(
+        self, country_code: str | None
+    ) -> list[tuple[UUID, int]]:
+        """Return the warehouse and shipping zone id pairs for the given country."""
+        return [
+            (warehouse_id, shipping_zone_id)
+            for shipping_zone_id, warehouse_ids in self.shipping_zone_warehouse_ids.items()
+            if not country_code
+            or country_code in self.shipping_zone_countries[shipping_zone_id]
+            for warehouse_id in warehouse_ids
+        ]
+
+    def get_warehouse_ids(
+        self, country_code: str | None, include_cc_warehouses: bool = False
+    ) -> set[UUID]:
+        """Return ids of warehouses shipping to the given country.
+
+        When the country code is not provided or `include_cc_warehouses` is set,
+        the collection point warehouses are also returned.
+        """
+        warehouse_ids = {
+            warehouse_id
+            for warehouse_id, _ in self.get_warehouse_shipping_zones(country_code)
+        }
+        if not country_code or include_cc_warehouses:
+            warehouse_ids |= self.click_and_collect_warehouses.keys()
+        return warehouse_ids
+
+
+def _build_warehouse_topology(
+    channel_slug: str, database_connection_name: str
+) -> WarehouseTopology:
+    topology = WarehouseTopology()
+    channel = (
+        Channel.objects.using(database_connection_name)
+        .filter(slug=channel_slug)
+        .values_list("pk", flat=True)
+        .first()
+    )
+    if channel is None:
+        return topology
+    topology.channel_id = channel
+
+    warehouses = Warehouse.objects.using(database_connection_name).filter(
+        channels__id=channel
+    )
+    for warehouse_id, cc_option in warehouses.values_list(
+        "id", "click_and_collect_option"
+    ):
+        topology.warehouse_ids.add(warehouse_id)
+        if cc_option in CLICK_AND_COLLECT_OPTIONS:
+            topology.click_and_collect_warehouses[warehouse_id] = cc_option
+
+    shipping_zones = (
+        ShippingZone.objects.using(database_connection_name)
+        .filter(channels__id=channel)
+        .only("id", "countries")
+    )
+    for shipping_zone in shipping_zones:
+        topology.shipping_zone_countries[shipping_zone.id] = {
+            country.code for country in shipping_zone.countries
+        }
+
+    WarehouseShippingZone = Warehouse.shipping_zones.through
+    shipping_zone_warehouse_ids = defaultdict(list)
+    for warehouse_id, shipping_zone_id in (
+        WarehouseShippingZone.objects.using(database_connection_name)
+        .filter(
+            warehouse_id__in=topology.warehouse_ids,
+            shippingzone_id__in=topology.shipping_zone_countries.keys(),
+        )
+        .order_by("pk")
+        .values_list("warehouse_id", "shippingzone_id")
+    ):
+        shipping_zone_warehouse_ids[shipping_zone_id].append(warehouse_id)
+    topology.shipping_zone_warehouse_ids = dict(shipping_zone_warehouse_ids)
+    return topology
+
+
+def get_warehouse_topology(channel_slug: str) -> WarehouseTopology:
+    """Return the cached warehouse topology of the given channel.
+
+    The cache is versioned, changing shipping zones, warehouses or their channel
+    assignments bumps the version, so all channels topologies are rebuilt.
+    The topology is always built from the writer, a lagging replica would pin
+    the outdated topology under the new version for the whole cache timeout.
+    """
+    version = cache.get(WAREHOUSE_TOPOLOGY_VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(WAREHOUSE_TOPOLOGY_VERSION_CACHE_KEY, version, timeout=None)
+
+    cache_key = WAREHOUSE_TOPOLOGY_CACHE_KEY.format(
+        version=version, channel_slug=channel_slug
+    )
+    topology = cache.get(cache_key)
+    if topology is None:
+        with allow_writer():
+            topology = _build_warehouse_topology(
+                channel_slug, settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
+        topology.version = version
+        cache.set(cache_key, topology, timeout=WAREHOUSE_TOPOLOGY_CACHE_TIMEOUT)
+    return topology
+
+
+def invalidate_warehouse_topology():
+    cache.set(WAREHOUSE_TOPOLOGY_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
@@ -0,0 +1,413 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING, TypedDict
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, Min, OuterRef, QuerySet
+from django.utils import timezone
+from django_stubs_ext import WithAnnotations
+
+from ..channel.models import Channel
+from ..product.models import ProductVariantChannelListing
+from . import WarehouseClickAndCollectOption
+from .models import ProductVariantAvailability, Reservation, Stock
+from .topology import WarehouseTopology, get_warehouse_topology
+
+if TYPE_CHECKING:
+    # https://github.com/typeddjango/django-stubs/issues/719
+
+    class WithAvailableQuantity(TypedDict):
+        available_quantity: int
+
+    StockWithAvailableQuantity = WithAnnotations[Stock, WithAvailableQuantity]
+else:
+    StockWithAvailableQuantity = Stock
+
+
+# Up to the number of countries times the number of variants rows are upserted
+# at once
+PRODUCT_VARIANT_AVAILABILITY_BATCH_SIZE = 1000
+
+
+def prepare_warehouse_ids_by_shipping_zone_and_variant_map(
+    stocks: Iterable[StockWithAvailableQuantity],
+    stocks_reservations,
+    warehouse_shipping_zones_map,
+    cc_warehouses,
+):
+    """Combine all quantities within a single zone.
+
+    Prepare `warehouse_ids_by_shipping_zone_by_variant` map in the following format:
+        {
+            variant_id: {
+                shipping_zone_id/warehouse_id: [
+                    warehouse_id
+                ]
+            }
+        }
+
+    In case of the collection point warehouses the warehouse_id is used instead of
+    the shipping zone id. Every stock of the collection point warehouse is treated
+    as a magic single-warehouse shipping zone.
+    """
+    warehouse_ids_by_shipping_zone_by_variant: defaultdict[
+        int, defaultdict[int | UUID, list[UUID]]
+    ] = defaultdict(lambda: defaultdict(list))
+    variants_with_global_cc_warehouses = []
+    available_quantity_by_warehouse_id_and_variant_id: defaultdict[
+        UUID, dict[int, int]
+    ] = defaultdict(lambda: defaultdict(int))
+    for stock in stocks:
+        reserved_quantity = stocks_reservations[stock.id]
+        quantity = stock.available_quantity - reserved_quantity
+        # when the available_quantity was under 0 we do not want clipping to zero,
+        # as it means that the stock might be exceeded
+        if stock.available_quantity > 0:
+            quantity = max(0, quantity)
+        variant_id = stock.product_variant_id
+        warehouse_id = stock.warehouse_id
+        available_quantity_by_warehouse_id_and_variant_id[warehouse_id][variant_id] += (
+            quantity
+        )
+        if shipping_zone_ids := warehouse_shipping_zones_map[warehouse_id]:
+            for shipping_zone_id in shipping_zone_ids:
+                warehouse_ids_by_shipping_zone_by_variant[variant_id][
+                    shipping_zone_id
+                ].append(warehouse_id)
+        else:
+            cc_option = cc_warehouses[warehouse_id]
+            # every stock of a collection point warehouse should treat as a magic
+            # single-warehouse shipping zone
+            warehouse_ids_by_shipping_zone_by_variant[variant_id][warehouse_id] = [
+                warehouse_id
+            ]
+            # in case of global warehouses the quantity available will be the sum
+            # of the available quantity for that variant from all stocks,
+            # so we need to keep information for which variant there is a warehouse
+            # with the global stock
+            if cc_option == WarehouseClickAndCollectOption.ALL_WAREHOUSES:
+                variants_with_global_cc_warehouses.append(variant_id)
+    return (
+        warehouse_ids_by_shipping_zone_by_variant,
+        variants_with_global_cc_warehouses,
+        available_quantity_by_warehouse_id_and_variant_id,
+    )
+
+
+def prepare_quantity_map(
+    country_code,
+    warehouse_ids_by_shipping_zone_by_variant,
+    variants_with_global_cc_warehouses,
+    available_quantity_by_warehouse_id_and_variant_id,
+):
+    """Prepare the variant id to quantity map.
+
+    When the country code is known, the available quantity is the sum of quantities
+    from all shipping zones supporting given country. When the country is not known
+    the highest known quantity is returned.
+
+    The local warehouses are treated as a magic single-warehouse shipping zone.
+    When the variant has any global collection point warehouse, the quantity is the
+    sum of the quantities from all shipping zones.
+    In case of global warehouses the available quantity of such collection point
+    is the sum of the available quantities from all stocks that passed the country
+    or channel conditions.
+    """
+    quantity_map: defaultdict[int, int] = defaultdict(int)
+    for (
+        variant_id,
+        warehouse_ids_shipping_zone,
+    ) in warehouse_ids_by_shipping_zone_by_variant.items():
+        if country_code or variant_id in variants_with_global_cc_warehouses:
+            used_warehouse_ids = []
+            for warehouse_ids in warehouse_ids_shipping_zone.values():
+                used_warehouse_ids.extend(warehouse_ids)
+            used_warehouse_ids = set(used_warehouse_ids)
+            # When country code is known or the global collection point warehouse
+            # for this variant exists, return the sum of quantities from all
+            # shipping zones supporting given country.
+            quantity = 0
+            for warehouse_id in used_warehouse_ids:
+                quantity += available_quantity_by_warehouse_id_and_variant_id[
+                    warehouse_id
+                ][variant_id]
+            quantity_map[variant_id] = quantity
+        else:
+            # When country code is unknown, return the highest known quantity.
+            quantity_values = []
+            for (
+                warehouse_ids_per_shipping_zones
+            ) in warehouse_ids_shipping_zone.values():
+                quantity = 0
+                for warehouse_id in warehouse_ids_per_shipping_zones:
+                    quantity += available_quantity_by_warehouse_id_and_variant_id[
+                        warehouse_id
+                    ][variant_id]
+                quantity_values.append(quantity)
+
+            quantity_map[variant_id] = max(quantity_values)
+
+    return quantity_map
+
+
+def calculate_variants_availability(
+    variant_ids: Iterable[int],
+    topology: WarehouseTopology,
+    country_codes: Iterable[str],
+    reservations_enabled: bool,
+    database_connection_name: str,
+) -> dict[str, defaultdict[int, int]]:
+    """Calculate the available quantities of the variants in the given countries.
+
+    The stocks are fetched once for all countries, the countries served by the same
+    shipping zones share the calculated quantities. The empty country code stands
+    for the quantity calculated without the country.
+    """
+    variant_ids = set(variant_ids)
+    stocks = list(
+        Stock.objects.using(database_connection_name)
+        .filter(
+            product_variant_id__in=variant_ids,
+            warehouse_id__in=topology.warehouse_ids,
+        )
+        .annotate_available_quantity()
+        .order_by("pk")
+    )
+    stocks_reservations: defaultdict[int, int] = defaultdict(int)
+    if reservations_enabled:
+        stocks_reservations.update(
+            Stock.objects.using(database_connection_name)
+            .filter(id__in=[stock.id for stock in stocks])
+            .annotate_reserved_quantity()
+            .order_by("pk")
+            .values_list("id", "reserved_quantity")
+        )
+
+    quantity_maps: dict[str, defaultdict[int, int]] = {}
+    quantity_map_by_shipping_zones: dict[
+        frozenset[tuple[UUID, int]], defaultdict[int, int]
+    ] = {}
+    for country_code in country_codes:
+        warehouse_shipping_zones = topology.get_warehouse_shipping_zones(
+            country_code or None
+        )
+        shipping_zones_key = frozenset(warehouse_shipping_zones)
+        if country_code and shipping_zones_key in quantity_map_by_shipping_zones:
+            quantity_maps[country_code] = quantity_map_by_shipping_zones[
+                shipping_zones_key
+            ]
+            continue
+
+        warehouse_shipping_zones_map: defaultdict[UUID, list[int]] = defaultdict(list)
+        for warehouse_id, shipping_zone_id in warehouse_shipping_zones:
+            warehouse_shipping_zones_map[warehouse_id].append(shipping_zone_id)
+        cc_warehouses = {} if country_code else topology.click_and_collect_warehouses
+        warehouse_ids = warehouse_shipping_zones_map.keys() | cc_warehouses.keys()
+        quantity_map = prepare_quantity_map(
+            country_code or None,
+            *prepare_warehouse_ids_by_shipping_zone_and_variant_map(
+                [stock for stock in stocks if stock.warehouse_id in warehouse_ids],
+                stocks_reservations,
+                warehouse_shipping_zones_map,
+                cc_warehouses,
+            ),
+        )
+        quantity_maps[country_code] = quantity_map
+        if country_code:
+            quantity_map_by_shipping_zones[shipping_zones_key] = quantity_map
+    return quantity_maps
+
+
+def get_variants_availability(
+    variant_ids: Iterable[int],
+    topology: WarehouseTopology,
+    country_code: str | None,
+    reservations_enabled: bool,
+    database_connection_name: str,
+) -> dict[int, int]:
+    """Return the stored available quantities of the given variants.
+
+    Only the rows calculated for the current warehouse topology and reservation
+    settings that did not expire are returned. The rows of the variants with the
+    channel listing marked with `availability_dirty` are skipped.
+    """
+    clean_listings = ProductVariantChannelListing.objects.using(
+        database_connection_name
+    ).filter(
+        variant_id=OuterRef("product_variant_id"),
+        channel_id=topology.channel_id,
+        availability_dirty=False,
+    )
+    rows = ProductVariantAvailability.objects.using(database_connection_name).filter(
+        Exists(clean_listings),
+        product_variant_id__in=variant_ids,
+        channel_id=topology.channel_id,
+        country_code=country_code or "",
+        topology_version=topology.version,
+        reservations_enabled=reservations_enabled,
+        valid_until__gt=timezone.now(),
+    )
+    return dict(rows.values_list("product_variant_id", "quantity"))
+
+
+def update_variants_availability(
+    variant_channel_ids: Iterable[tuple[int, int]], reservations_enabled: bool
+):
+    """Calculate and store the available quantities of the variants in the channels.
+
+    The quantities are calculated from the writer for every country served by
+    the shipping zones of the channel and for the unknown country. The rows expire
+    after `PRODUCT_VARIANT_AVAILABILITY_TTL` seconds, or earlier when any of
+    the reservations included in the quantity expires. Rows of countries that are
+    no longer served are removed.
+    """
+    variant_channel_ids = set(variant_channel_ids)
+    if not variant_channel_ids:
+        return
+    variant_ids_by_channel_id: defaultdict[int, set[int]] = defaultdict(set)
+    for variant_id, channel_id in variant_channel_ids:
+        variant_ids_by_channel_id[channel_id].add(variant_id)
+    variant_ids = {variant_id for variant_id, _ in variant_channel_ids}
+
+    now = timezone.now()
+    valid_until = now + timedelta(seconds=settings.PRODUCT_VARIANT_AVAILABILITY_TTL)
+    reservations_expiration = {}
+    if reservations_enabled:
+        reservations_expiration = dict(
+            Reservation.objects.filter(
+                stock__product_variant_id__in=variant_ids,
+                reserved_until__gt=now,
+            )
+            .order_by()
+            .values("stock__product_variant_id")
+            .annotate(expiration=Min("reserved_until"))
+            .values_list("stock__product_variant_id", "expiration")
+        )
+
+    rows = []
+    country_codes_by_channel_id = {}
+    for channel_id, channel_slug in (
+        Channel.objects.filter(id__in=variant_ids_by_channel_id.keys())
+        .order_by("pk")
+        .values_list("id", "slug")
+    ):
+        topology = get_warehouse_topology(channel_slug)
+        country_codes = {""}.union(*topology.shipping_zone_countries.values())
+        country_codes_by_channel_id[channel_id] = country_codes
+        quantity_maps = calculate_variants_availability(
+            variant_ids_by_channel_id[channel_id],
+            topology,
+            country_codes,
+            reservations_enabled,
+            settings.DATABASE_CONNECTION_DEFAULT_NAME,
+        )
+        for country_code in sorted(country_codes):
+            quantity_map = quantity_maps[country_code]
+            for variant_id in sorted(variant_ids_by_channel_id[channel_id]):
+                rows.append(
+                    ProductVariantAvailability(
+                        product_variant_id=variant_id,
+                        channel_id=channel_id,
+                        country_code=country_code,
+                        quantity=quantity_map[variant_id],
+                        topology_version=topology.version,
+                        reservations_enabled=reservations_enabled,
+                        valid_until=min(
+                            valid_until,
+                            reservations_expiration.get(variant_id, valid_until),
+                        ),
+                    )
+                )
+
+    ids_to_delete = [
+        row_id
+        for row_id, variant_id, channel_id, country_code in (
+            ProductVariantAvailability.objects.filter(
+                product_variant_id__in=variant_ids,
+                channel_id__in=variant_ids_by_channel_id.keys(),
+            ).values_list("id", "product_variant_id", "channel_id", "country_code")
+        )
+        if (variant_id, channel_id) in variant_channel_ids
+        and country_code not in country_codes_by_channel_id.get(channel_id, set())
+    ]
+    if ids_to_delete:
+        ProductVariantAvailability.objects.filter(id__in=ids_to_delete).delete()
+    if rows:
+        ProductVariantAvailability.objects.bulk_create(
+            rows,
+            batch_size=PRODUCT_VARIANT_AVAILABILITY_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["product_variant", "channel", "country_code"],
+            update_fields=[
+                "quantity",
+                "topology_version",
+                "reservations_enabled",
+                "valid_until",
+            ],
+        )
+
+
+def mark_variants_availability_as_dirty(listing_ids: Iterable[int]):
+    """Mark the given variant channel listings to recalculate their availability."""
+    with transaction.atomic():
+        ids = list(
+            ProductVariantChannelListing.objects.select_for_update(of=("self",))
+            .filter(id__in=listing_ids, availability_dirty=False)
+            .order_by("pk")
+            .values_list("id", flat=True)
+        )
+        ProductVariantChannelListing.objects.filter(id__in=ids).update(
+            availability_dirty=True
+        )
+
+
+def invalidate_variants_availability(variant_ids: Iterable[int]):
+    """Mark the stored available quantities of the given variants to be recalculated.
+
+    Must be called whenever the variant stocks, allocations or reservations change.
+    The listings are marked once the transaction is committed, so the stock changes
+    don't wait for the listing locks. The stored quantities are not used until they
+    are recalculated by `recalculate_variants_availability_task`.
+    """
+    if not settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED:
+        return
+    variant_ids = set(variant_ids)
+    if not variant_ids:
+        return
+    transaction.on_commit(
+        lambda: mark_variants_availability_as_dirty(
+            ProductVariantChannelListing.objects.filter(
+                variant_id__in=variant_ids, availability_dirty=False
+            ).values_list("id", flat=True)
+        )
+    )
+
+
+def invalidate_reserved_variants_availability(reservations: QuerySet[Reservation]):
+    """Mark the availability of the variants with the given reservations as dirty.
+
+    Must be called before the reservations are removed outside of the stock
+    reservation, e.g. together with the checkout lines.
+    """
+    if not settings.PRODUCT_VARIANT_AVAILABILITY_TABLE_ENABLED:
+        return
+    invalidate_variants_availability(
+        reservations.values_list("stock__product_variant_id", flat=True)
+    )
+
+
+def invalidate_channels_variants_availability(channel_ids: list[int] | None = None):
+    """Mark the available quantities in the given channels to be recalculated.
+
+    Must be called whenever the warehouse topology or the reservation settings
+    change. All channels are marked when `channel_ids` is not provided. The listings
+    are marked in batches by a task scheduled once the transaction is committed.
+    """
+    from .tasks import mark_variants_availability_as_dirty_task
+
+    transaction.on_commit(
+        lambda: mark_variants_availability_as_dirty_task.delay(channel_ids)
+    )
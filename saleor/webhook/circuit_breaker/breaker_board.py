@@ -1,6 +1,8 @@
 import logging
 import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -8,9 +10,14 @@ from django.utils.module_loading import import_string
 
 from ...graphql.app.enums import CircuitBreakerState
 from ...webhook.event_types import WebhookEventSyncType
+from ..metrics import (
+    record_async_breaker_state_change,
+    record_async_webhooks_deferred,
+)
 
 if TYPE_CHECKING:
     from ...app.models import App
+    from ...core.models import EventDelivery
     from ...webhook.models import Webhook
 
 BREAKER_BOARD_LOGGER_NAME = "breaker_board"
@@ -39,6 +46,23 @@ BREAKER_BOARD_SUCCESS_COUNT_RECOVERY: int = 50
 BREAKER_BOARD_COOLDOWN_SECONDS: int = 2 * 60
 
 
+@dataclass(frozen=True)
+class BreakerTarget:
+    """Entity guarded by a single circuit breaker of async webhook deliveries.
+
+    It mimics the `App` attributes used by the breaker board, so the same state
+    machine can guard apps and target hosts.
+    """
+
+    id: str
+    name: str
+
+    @property
+    def type(self) -> str:
+        """Return the kind of the guarded entity, `app` or `host`."""
+        return self.id.split("-", 1)[0]
+
+
 class BreakerBoard:
     """Base class for breaker board implementations.
 
@@ -106,7 +130,9 @@ class BreakerBoard:
     def reached_half_open_target_success_count(self, total: int, errors: int) -> bool:
         return total - errors >= self.success_count_recovery
 
-    def set_breaker_state(self, app: "App", state: str, total: int, errors: int) -> str:
+    def set_breaker_state(
+        self, app: "App | BreakerTarget", state: str, total: int, errors: int
+    ) -> str:
         self.storage.clear_state_for_app(app.id)
 
         changed_at = int(time.time())
@@ -125,7 +151,7 @@ class BreakerBoard:
         )
         return state
 
-    def update_breaker_state(self, app: "App") -> str:
+    def update_breaker_state(self, app: "App | BreakerTarget") -> str:
         state, changed_at = self.storage.get_app_state(app.id)
 
         total = self.storage.get_event_count(app.id, "total") or 1
@@ -154,11 +180,11 @@ class BreakerBoard:
                 )
         return state
 
-    def register_error(self, app_id: int):
+    def register_error(self, app_id: int | str):
         self.storage.register_event(app_id, "error", self.ttl_seconds)
         self.storage.register_event(app_id, "total", self.ttl_seconds)
 
-    def register_success(self, app_id: int):
+    def register_success(self, app_id: int | str):
         self.storage.register_event(app_id, "total", self.ttl_seconds)
 
     def __call__(self, func):
@@ -193,6 +219,82 @@ class BreakerBoard:
         return inner
 
 
+class AsyncBreakerBoard(BreakerBoard):
+    """Breaker board guarding asynchronous webhook deliveries.
+
+    Every delivery is checked against two breakers: one per app and one per target
+    host, so both a misbehaving app and a dead endpoint are isolated from the rest of
+    the webhooks sharing the queue. Deliveries blocked by an opened breaker are parked
+    in the storage and released in bulk once the breaker goes half-open.
+    """
+
+    def validate_sync_events(self):
+        # All async events are guarded by the board, there is nothing to validate.
+        pass
+
+    @staticmethod
+    def get_breaker_targets(webhook: "Webhook") -> list[BreakerTarget]:
+        parsed_url = urlparse(webhook.target_url)
+        host = parsed_url.hostname or parsed_url.netloc
+        return [
+            BreakerTarget(id=f"app-{webhook.app_id}", name=webhook.app.name),
+            BreakerTarget(id=f"host-{host}", name=host),
+        ]
+
+    def get_open_breaker_target(self, webhook: "Webhook") -> BreakerTarget | None:
+        """Return the first breaker target that blocks the webhook delivery."""
+        for target in self.get_breaker_targets(webhook):
+            if self.update_breaker_state(target) == CircuitBreakerState.OPEN:
+                return target
+        return None
+
+    def register_delivery_result(self, webhook: "Webhook", success: bool):
+        for target in self.get_breaker_targets(webhook):
+            if success:
+                self.register_success(target.id)
+            else:
+                self.register_error(target.id)
+
+    def set_breaker_state(
+        self, app: "App | BreakerTarget", state: str, total: int, errors: int
+    ) -> str:
+        state = super().set_breaker_state(app, state, total, errors)
+        if isinstance(app, BreakerTarget):
+            record_async_breaker_state_change(app.type, state)
+        return state
+
+    def park_delivery(
+        self, target: BreakerTarget, delivery: "EventDelivery", retries: int = 0
+    ) -> int:
+        """Park the delivery blocked by the target's breaker.
+
+        Return the number of deliveries parked for the target, or 0 if the delivery
+        couldn't be parked.
+        """
+        parked_count = self.storage.park_delivery(target.id, delivery.pk, retries)
+        record_async_webhooks_deferred(delivery.webhook.app_id, target.type)
+        return parked_count
+
+    def pop_parked_deliveries(
+        self, target: BreakerTarget, count: int
+    ) -> list[tuple[int, int]]:
+        return self.storage.pop_parked_deliveries(target.id, count)
+
+    def should_schedule_release(self, target: BreakerTarget) -> bool:
+        """Return whether the release of the target's parked deliveries should be scheduled.
+
+        The release is scheduled at most once per cooldown, so a lost release task
+        is rescheduled by the deliveries parked after the cooldown.
+        """
+        return self.storage.acquire_release_lock(target.id, self.cooldown_seconds)
+
+    def get_parked_targets(self) -> list[BreakerTarget]:
+        # The target names aren't stored, the ids are used instead.
+        return [
+            BreakerTarget(id=key, name=key) for key in self.storage.get_parked_keys()
+        ]
+
+
 def initialize_breaker_board() -> BreakerBoard | None:
     if not settings.BREAKER_BOARD_ENABLED:
         return None
@@ -208,3 +310,20 @@ def initialize_breaker_board() -> BreakerBoard | None:
         cooldown_seconds=BREAKER_BOARD_COOLDOWN_SECONDS,
         ttl_seconds=BREAKER_BOARD_TTL_SECONDS,
     )
+
+
+def initialize_async_breaker_board() -> AsyncBreakerBoard | None:
+    if not settings.BREAKER_BOARD_ASYNC_ENABLED:
+        return None
+
+    storage_class = import_string(settings.BREAKER_BOARD_ASYNC_STORAGE_CLASS)
+    return AsyncBreakerBoard(
+        storage=storage_class(),
+        failure_min_count=BREAKER_BOARD_FAILURE_MIN_COUNT,
+        failure_threshold=BREAKER_BOARD_FAILURE_THRESHOLD_PERCENTAGE,
+        failure_min_count_recovery=BREAKER_BOARD_FAILURE_MIN_COUNT_RECOVERY,
+        failure_threshold_recovery=BREAKER_BOARD_FAILURE_THRESHOLD_PERCENTAGE_RECOVERY,
+        success_count_recovery=BREAKER_BOARD_SUCCESS_COUNT_RECOVERY,
+        cooldown_seconds=BREAKER_BOARD_COOLDOWN_SECONDS,
+        ttl_seconds=BREAKER_BOARD_TTL_SECONDS,
+    )
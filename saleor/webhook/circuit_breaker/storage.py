@@ -11,19 +11,36 @@ logger = logging.getLogger(__name__)
 
 
 class Storage:
-    def set_app_state(self, app_id: int, state: CircuitBreakerState, changed_at: int):
+    def set_app_state(
+        self, app_id: int | str, state: CircuitBreakerState, changed_at: int
+    ):
         pass
 
-    def get_app_state(self, app_id: int) -> tuple[str, int]:  # type: ignore[empty-body]
+    def get_app_state(self, app_id: int | str) -> tuple[str, int]:  # type: ignore[empty-body]
         pass
 
-    def get_event_count(self, app_id: int, name: str) -> int:  # type: ignore[empty-body]
+    def get_event_count(self, app_id: int | str, name: str) -> int:  # type: ignore[empty-body]
         pass
 
-    def register_event(self, app_id: int, name: str, ttl_seconds: int):
+    def register_event(self, app_id: int | str, name: str, ttl_seconds: int):
         pass
 
-    def clear_state_for_app(self, app_id: int):
+    def clear_state_for_app(self, app_id: int | str):
+        pass
+
+    def park_delivery(self, key: str, delivery_id: int, retries: int = 0) -> int:  # type: ignore[empty-body]
+        pass
+
+    def pop_parked_deliveries(self, key: str, count: int) -> list[tuple[int, int]]:  # type: ignore[empty-body]
+        pass
+
+    def get_parked_deliveries_count(self, key: str) -> int:  # type: ignore[empty-body]
+        pass
+
+    def get_parked_keys(self) -> list[str]:  # type: ignore[empty-body]
+        pass
+
+    def acquire_release_lock(self, key: str, ttl_seconds: int) -> bool:  # type: ignore[empty-body]
         pass
 
     class Meta:
@@ -40,11 +57,24 @@ def deserialize_breaker_state(data) -> tuple[str, int]:
     return state, int(changed_at)
 
 
+def serialize_parked_delivery(delivery_id: int, retries: int) -> str:
+    return f"{delivery_id}|{retries}"
+
+
+def deserialize_parked_delivery(data) -> tuple[int, int]:
+    data = str(data, "utf-8")
+    # deliveries parked without the retry count start from the first retry
+    delivery_id, _, retries = data.partition("|")
+    return int(delivery_id), int(retries or 0)
+
+
 class RedisStorage(Storage):
     WARNING_MESSAGE = "An error occurred when interacting with Redis"
     KEY_PREFIX = "bbrs"  # as in "breaker board redis storage"
     EVENT_KEYS = ["error", "total"]
     STATE_KEY = "state"
+    PARKED_KEY = "parked"
+    RELEASE_LOCK_KEY = "release-lock"
 
     def __init__(self, client=None):
         super().__init__()
@@ -56,7 +86,9 @@ class RedisStorage(Storage):
     def get_base_storage_key(self) -> str:
         return self.KEY_PREFIX
 
-    def set_app_state(self, app_id: int, state: CircuitBreakerState, changed_at: int):
+    def set_app_state(
+        self, app_id: int | str, state: CircuitBreakerState, changed_at: int
+    ):
         base_key = self.get_base_storage_key()
         try:
             self._client.set(
@@ -66,7 +98,7 @@ class RedisStorage(Storage):
         except RedisError:
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
 
-    def get_app_state(self, app_id: int) -> tuple[str, int]:
+    def get_app_state(self, app_id: int | str) -> tuple[str, int]:
         base_key = self.get_base_storage_key()
         state_key = f"{base_key}-{app_id}-{self.STATE_KEY}"
         try:
@@ -77,7 +109,7 @@ class RedisStorage(Storage):
 
         return CircuitBreakerState.CLOSED, 0
 
-    def get_event_count(self, app_id: int, name: str) -> int:
+    def get_event_count(self, app_id: int | str, name: str) -> int:
         base_key = self.get_base_storage_key()
         key = f"{base_key}-{app_id}-{name}"
         try:
@@ -86,7 +118,7 @@ class RedisStorage(Storage):
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
             return 0
 
-    def register_event(self, app_id: int, name: str, ttl_seconds: int):
+    def register_event(self, app_id: int | str, name: str, ttl_seconds: int):
         base_key = self.get_base_storage_key()
         key = f"{base_key}-{app_id}-{name}"
         now = int(time.time())
@@ -110,7 +142,7 @@ class RedisStorage(Storage):
         except RedisError:
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
 
-    def clear_state_for_app(self, app_id: int):
+    def clear_state_for_app(self, app_id: int | str):
         base_key = self.get_base_storage_key()
         keys = [f"{base_key}-{app_id}-{name}" for name in self.EVENT_KEYS]
         keys.append(f"{base_key}-{app_id}-{self.STATE_KEY}")
@@ -120,3 +152,89 @@ class RedisStorage(Storage):
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
             error = 1
             return error
+
+    def park_delivery(self, key: str, delivery_id: int, retries: int = 0) -> int:
+        """Park the delivery until the breaker allows sending it.
+
+        The retry count of the delivery is stored with it, so the released delivery
+        continues from the same retry. Return the number of deliveries parked for the
+        given key, or 0 if the delivery couldn't be parked.
+        """
+        base_key = self.get_base_storage_key()
+        try:
+            return self._client.rpush(
+                f"{base_key}-{key}-{self.PARKED_KEY}",
+                serialize_parked_delivery(delivery_id, retries),
+            )
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return 0
+
+    def pop_parked_deliveries(self, key: str, count: int) -> list[tuple[int, int]]:
+        """Return the ids and retry counts of the oldest parked deliveries."""
+        base_key = self.get_base_storage_key()
+        parked_key = f"{base_key}-{key}-{self.PARKED_KEY}"
+        try:
+            # Read and trim in one transaction so concurrent workers never release
+            # the same delivery twice.
+            p = self._client.pipeline()
+            p.lrange(parked_key, 0, count - 1)
+            p.ltrim(parked_key, count, -1)
+            parked_deliveries, _ = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return []
+        return [deserialize_parked_delivery(data) for data in parked_deliveries]
+
+    def get_parked_deliveries_count(self, key: str) -> int:
+        base_key = self.get_base_storage_key()
+        try:
+            return self._client.llen(f"{base_key}-{key}-{self.PARKED_KEY}")
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return 0
+
+    def get_parked_keys(self) -> list[str]:
+        """Return the keys with parked deliveries."""
+        base_key = self.get_base_storage_key()
+        prefix = f"{base_key}-"
+        suffix = f"-{self.PARKED_KEY}"
+        try:
+            parked_keys = list(self._client.scan_iter(match=f"{prefix}*{suffix}"))
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return []
+        return [
+            str(parked_key, "utf-8")[len(prefix) : -len(suffix)]
+            for parked_key in parked_keys
+        ]
+
+    def acquire_release_lock(self, key: str, ttl_seconds: int) -> bool:
+        """Acquire the lock for scheduling the release of the deliveries parked for the key.
+
+        Return `False` when the release was already scheduled within `ttl_seconds`.
+        """
+        base_key = self.get_base_storage_key()
+        try:
+            return bool(
+                self._client.set(
+                    f"{base_key}-{key}-{self.RELEASE_LOCK_KEY}",
+                    1,
+                    nx=True,
+                    ex=ttl_seconds,
+                )
+            )
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            # Rather schedule a duplicate release than leave the deliveries parked.
+            return True
+
+
+class AsyncRedisStorage(RedisStorage):
+    """Redis storage for breakers guarding asynchronous webhook deliveries.
+
+    Breakers are identified by string keys (per app and per target host), so the
+    state is kept under a separate prefix than the sync breaker board state.
+    """
+
+    KEY_PREFIX = "bbars"  # as in "breaker board async redis storage"
@@ -1,5 +1,10 @@
 CACHE_EXCLUDED_SHIPPING_TIME = 60 * 3
 WEBHOOK_CACHE_DEFAULT_TIMEOUT: int = 5 * 60  # 5 minutes
+# Time for which a single worker holds the right to call the app for a cache key;
+# it must outlive the sync webhook request timeout.
+WEBHOOK_CACHE_LOCK_TIMEOUT: int = 30
+# Interval between checks for a response fetched by another worker.
+WEBHOOK_CACHE_LOCK_POLL_INTERVAL: float = 0.05
 APP_ID_PREFIX = "app"
 
 MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT = 500
@@ -20,6 +20,30 @@ METRIC_ASYNC_WEBHOOK_CALLS = meter.create_metric(
     description="Number of async webhook calls.",
 )
 
+METRIC_ASYNC_BREAKER_STATE_CHANGES = meter.create_metric(
+    "saleor.webhooks.async.circuit_breaker.state_changes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of state changes of async webhooks circuit breakers.",
+)
+
+METRIC_ASYNC_WEBHOOK_DEFERRED = meter.create_metric(
+    "saleor.webhooks.async.deferred",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of async webhook deliveries parked by an open circuit breaker.",
+)
+
+METRIC_ASYNC_WEBHOOK_RELEASED = meter.create_metric(
+    "saleor.webhooks.async.released",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of parked async webhook deliveries re-queued for sending.",
+)
+
 
 def record_first_delivery_attempt_delay(event_delivery: EventDelivery) -> None:
     delay = (datetime.now(UTC) - event_delivery.created_at).total_seconds()
@@ -45,3 +69,32 @@ def record_async_webhooks_count(
     meter.record(
         METRIC_ASYNC_WEBHOOK_CALLS, amount, unit=Unit.REQUEST, attributes=attributes
     )
+
+
+def record_async_breaker_state_change(breaker_type: str, state: str) -> None:
+    attributes = {"breaker.type": breaker_type, "state": state}
+    meter.record(
+        METRIC_ASYNC_BREAKER_STATE_CHANGES, 1, unit=Unit.REQUEST, attributes=attributes
+    )
+
+
+def record_async_webhooks_deferred(
+    app_id: int, breaker_type: str, amount: int = 1
+) -> None:
+    meter.record(
+        METRIC_ASYNC_WEBHOOK_DEFERRED,
+        amount,
+        unit=Unit.REQUEST,
+        attributes={"app.id": app_id, "breaker.type": breaker_type},
+    )
+
+
+def record_async_webhooks_released(
+    app_id: int, breaker_type: str, amount: int = 1
+) -> None:
+    meter.record(
+        METRIC_ASYNC_WEBHOOK_RELEASED,
+        amount,
+        unit=Unit.REQUEST,
+        attributes={"app.id": app_id, "breaker.type": breaker_type},
+    )
@@ -1,6 +1,7 @@
+from .batching import AdaptiveBatchSize
 from .buffers import get_buffer
 from .exceptions import ObservabilityError
-from .payloads import concatenate_json_events, dump_payload
+from .payloads import concatenate_json_events, dump_payload, gzip_ndjson_events
 from .tracing import otel_trace
 from .utils import (
     WebhookData,
@@ -15,6 +16,7 @@ from .utils import (
 )
 
 __all__ = [
+    "AdaptiveBatchSize",
     "get_buffer",
     "pop_events_with_remaining_size",
     "ObservabilityError",
@@ -29,4 +31,5 @@ __all__ = [
     "report_view",
     "otel_trace",
     "concatenate_json_events",
+    "gzip_ndjson_events",
 ]
@@ -0,0 +1,34 @@
+from threading import Lock
+
+from django.conf import settings
+
+
+class AdaptiveBatchSize:
+    """Number of events sent to a target in a single request.
+
+    Batches start at `OBSERVABILITY_BUFFER_BATCH_SIZE`. The batch size of the target
+    grows by half while it responds within `OBSERVABILITY_TARGET_LATENCY`, and is
+    halved when it responds slower or fails.
+    """
+
+    def __init__(self):
+        self._sizes: dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, target: str) -> int:
+        max_size = settings.OBSERVABILITY_BUFFER_BATCH_SIZE
+        return max(1, min(self._sizes.get(target, max_size), max_size))
+
+    def update(self, target: str, duration: float, success: bool):
+        target_latency = settings.OBSERVABILITY_TARGET_LATENCY.total_seconds()
+        with self._lock:
+            size = self.get(target)
+            if success and duration <= target_latency:
+                size += max(1, size // 2)
+            else:
+                size //= 2
+            self._sizes[target] = size
+
+    def clear(self):
+        with self._lock:
+            self._sizes.clear()
@@ -4,16 +4,47 @@ import zlib
 from asgiref.local import Local
 from django.conf import settings
 from redis import ConnectionPool, Redis
+from redis.commands.core import Script
+from redis.exceptions import ResponseError
 
+from ...core.telemetry import meter
 from .exceptions import ConnectionNotConfigured
+from .metrics import (
+    METRIC_BUFFER_OPERATION_DURATION,
+    record_buffer_bytes,
+    record_buffer_events,
+)
 
 KEY_TYPE = str
 DEFAULT_CONNECTION_TIMEOUT = 0.5
 _local = Local()
 
+# Preset dictionary for compressing the events. It's made of the fragments
+# repeated in every API call and event delivery attempt payload, so even small
+# events compress well. The most frequent fragments are placed at the end, as
+# zlib encodes the closer matches with fewer bits. Changing the dictionary makes
+# events already stored in the buffer impossible to decode.
+COMPRESSION_DICTIONARY = (
+    b'"eventType": "event_delivery_attempt", "id": "", "time": "", "duration": '
+    b'"nextRetry": null, "status": "success", "eventDelivery": {"id": "", '
+    b'"eventSync": false, "payload": {"contentLength": , "body": {"text": "'
+    b'"webhook": {"id": "", "name": "", "targetUrl": "https://", '
+    b'"subscriptionQuery": {"text": "subscription { event { ... on '
+    b'"gqlOperations": [{"name": {"text": "", "truncated": false}, '
+    b'"operationType": "mutation", "operationType": "query", "query": {"text": "'
+    b'"result": {"text": "{\\"data\\": {\\"", "truncated": false}, '
+    b'"resultInvalid": false}], "app": {"id": "QXBwOj", "name": "'
+    b'{"eventType": "api_call", "request": {"id": "", "method": "POST", '
+    b'"url": "https:///graphql/", "time": , "headers": [["Content-Type", '
+    b'"application/json"], ["Content-Length", ""], ["Authorization", "***"], '
+    b'["User-Agent", ""]], "contentLength": }, "response": {"headers": '
+    b'"statusCode": 200, "contentLength": '
+)
+
 
 class BaseBuffer:
     _compressor_preset = 6
+    _compression_dictionary = COMPRESSION_DICTIONARY
 
     def __init__(
         self,
@@ -32,10 +63,24 @@ class BaseBuffer:
         self.timeout = timeout
 
     def decode(self, value: bytes) -> bytes:
-        return zlib.decompress(value)
+        # The dictionary is used only by the streams that were compressed with it,
+        # so the events compressed without one are decoded as well.
+        decompressor = zlib.decompressobj(zdict=self._compression_dictionary)
+        return decompressor.decompress(value) + decompressor.flush()
 
     def encode(self, value: bytes) -> bytes:
-        return zlib.compress(value, self._compressor_preset)
+        compressor = zlib.compressobj(
+            self._compressor_preset, zdict=self._compression_dictionary
+        )
+        return compressor.compress(value) + compressor.flush()
+
+    def encode_events(self, events: list[bytes]) -> list[bytes]:
+        encoded_events = [self.encode(event) for event in events]
+        record_buffer_bytes(
+            sum(len(event) for event in events),
+            sum(len(event) for event in encoded_events),
+        )
+        return encoded_events
 
     def put_event(self, event: bytes) -> int:
         raise NotImplementedError(
@@ -85,12 +130,24 @@ class BaseBuffer:
 
 class RedisBuffer(BaseBuffer):
     _pools: dict[str, ConnectionPool] = {}
+    # broker urls of the servers that don't support `RPOP key count`
+    _counted_pop_unsupported: set[str] = set()
     _socket_connect_timeout = 0.25
     _client_name = "observability_buffer"
+    # Fallback for Redis < 6.2. Returns the list size and up to `count` elements
+    # from the tail of the list, ordered from the newest to the oldest.
+    _pop_events_script = """
+        local size = redis.call('LLEN', KEYS[1])
+        local count = tonumber(ARGV[1])
+        local events = redis.call('LRANGE', KEYS[1], -count, -1)
+        redis.call('LTRIM', KEYS[1], 0, -count - 1)
+        return {size, events}
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._client: Redis | None = None
+        self._pop_script: Script | None = None
 
     def get_connection_pool(self):
         return ConnectionPool.from_url(
@@ -119,7 +176,7 @@ class RedisBuffer(BaseBuffer):
         self, key: KEY_TYPE, events: list[bytes], client: Redis | None = None
     ) -> int:
         start_index = -self.max_size
-        events_data = [self.encode(event) for event in events[start_index:]]
+        events_data = self.encode_events(events[start_index:])
         if client is None:
             client = self.client
         client.lpush(key, *events_data)
@@ -128,10 +185,16 @@ class RedisBuffer(BaseBuffer):
         return max(0, len(events) - self.max_size)
 
     def put_events(self, events: list[bytes]) -> int:
-        with self.client.pipeline(transaction=False) as pipe:
-            dropped = self._put_events(self.key, events, client=pipe)
-            result = pipe.execute()
-        return dropped + max(0, result[0] - self.max_size)
+        with meter.record_duration(
+            METRIC_BUFFER_OPERATION_DURATION, attributes={"operation": "put"}
+        ):
+            with self.client.pipeline(transaction=False) as pipe:
+                dropped = self._put_events(self.key, events, client=pipe)
+                result = pipe.execute()
+        dropped += max(0, result[0] - self.max_size)
+        record_buffer_events("put", len(events))
+        record_buffer_events("dropped", dropped)
+        return dropped
 
     def put_event(self, event: bytes) -> int:
         return self.put_events([event])
@@ -143,27 +206,49 @@ class RedisBuffer(BaseBuffer):
         trimmed: dict[KEY_TYPE, int] = {}
         if not keys:
             return trimmed
-        with self.client.pipeline(transaction=False) as pipe:
-            for key in keys:
-                trimmed[key] = self._put_events(key, events_dict[key], client=pipe)
-            result = pipe.execute()
+        with meter.record_duration(
+            METRIC_BUFFER_OPERATION_DURATION, attributes={"operation": "put"}
+        ):
+            with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    trimmed[key] = self._put_events(key, events_dict[key], client=pipe)
+                result = pipe.execute()
         for key in keys:
             buffer_len, _, _ = result.pop(0), result.pop(0), result.pop(0)
             trimmed[key] += max(0, buffer_len - self.max_size)
+        record_buffer_events("put", sum(len(events) for events in events_dict.values()))
+        record_buffer_events("dropped", sum(trimmed.values()))
         return trimmed
 
+    def _pop_raw_events(self, key: KEY_TYPE, count: int) -> tuple[list[bytes], int]:
+        """Pop up to `count` oldest events in a single round trip.
+
+        Return the popped events and the buffer size before popping.
+        """
+        if self.broker_url not in self._counted_pop_unsupported:
+            try:
+                with self.client.pipeline(transaction=False) as pipe:
+                    pipe.llen(key)
+                    pipe.rpop(key, count)
+                    size, events = pipe.execute()
+                return events or [], size
+            except ResponseError as e:
+                if "wrong number of arguments" not in str(e).lower():
+                    raise
+                self._counted_pop_unsupported.add(self.broker_url)
+
+        if self._pop_script is None:
+            self._pop_script = self.client.register_script(self._pop_events_script)
+        size, events = self._pop_script(keys=[key], args=[count])
+        return list(reversed(events)), size
+
     def _pop_events(self, key: KEY_TYPE, batch_size: int) -> tuple[list[bytes], int]:
-        events = []
-        with self.client.pipeline(transaction=False) as pipe:
-            pipe.llen(key)
-            for _i in range(max(1, batch_size)):
-                pipe.rpop(key)
-            result = pipe.execute()
-        size = result.pop(0)
-        for elem in result:
-            if elem is None:
-                break
-            events.append(self.decode(elem))
+        with meter.record_duration(
+            METRIC_BUFFER_OPERATION_DURATION, attributes={"operation": "pop"}
+        ):
+            raw_events, size = self._pop_raw_events(key, max(1, batch_size))
+        events = [self.decode(event) for event in raw_events]
+        record_buffer_events("pop", len(events))
         return events, size - len(events)
 
     def pop_event(self) -> bytes | None:
@@ -0,0 +1,47 @@
+from ...core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_BUFFER_EVENTS = meter.create_metric(
+    "saleor.observability.buffer.events",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of events put to, popped from or dropped by the observability buffer.",
+)
+METRIC_BUFFER_BYTES = meter.create_metric(
+    "saleor.observability.buffer.bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Size of the events put to the observability buffer before and after compression.",
+)
+METRIC_BUFFER_OPERATION_DURATION = meter.create_metric(
+    "saleor.observability.buffer.operation.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of the observability buffer operations.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+
+def record_buffer_events(operation: str, amount: int) -> None:
+    if amount:
+        meter.record(
+            METRIC_BUFFER_EVENTS,
+            amount,
+            unit=Unit.REQUEST,
+            attributes={"operation": operation},
+        )
+
+
+def record_buffer_bytes(raw_size: int, compressed_size: int) -> None:
+    meter.record(
+        METRIC_BUFFER_BYTES, raw_size, unit=Unit.BYTE, attributes={"compressed": False}
+    )
+    meter.record(
+        METRIC_BUFFER_BYTES,
+        compressed_size,
+        unit=Unit.BYTE,
+        attributes={"compressed": True},
+    )
@@ -1,4 +1,5 @@
 import datetime
+import gzip
 import json
 import uuid
 from collections.abc import Mapping
@@ -76,6 +77,10 @@ def concatenate_json_events(events: list[bytes]) -> bytes:
     return b"[" + b", ".join(events) + b"]"
 
 
+def gzip_ndjson_events(events: list[bytes]) -> bytes:
+    return gzip.compress(b"".join(event + b"\n" for event in events))
+
+
 TRUNC_PLACEHOLDER = JsonTruncText(truncated=False)
 EMPTY_TRUNC = JsonTruncText(truncated=True)
 GQL_OPERATION_PLACEHOLDER = GraphQLOperation(
@@ -1,8 +1,13 @@
 import datetime
+import json
+import zlib
+from unittest.mock import Mock, call, patch
 
 import pytest
 from django.utils import timezone
 from freezegun import freeze_time
+from redis.client import Pipeline
+from redis.exceptions import ResponseError
 
 from ..buffers import RedisBuffer, get_buffer
 from ..exceptions import ConnectionNotConfigured
@@ -156,3 +161,87 @@ def test_pop_expired_events(buffer):
     with freeze_time(push_time + datetime.timedelta(seconds=buffer.timeout + 1)):
         popped_events = buffer.pop_events()
     assert popped_events == []
+
+
+def test_pop_events_falls_back_to_script_when_counted_pop_unsupported(buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(3)]
+    # script returns the events from the newest to the oldest
+    script = Mock(return_value=[3, [buffer.encode(event) for event in events[::-1]]])
+    error = ResponseError("wrong number of arguments for 'rpop' command")
+
+    # when
+    with (
+        patch.object(RedisBuffer, "_counted_pop_unsupported", set()),
+        patch.object(Pipeline, "execute", side_effect=error),
+        patch.object(buffer.client, "register_script", return_value=script),
+    ):
+        popped_events, size = buffer.pop_events_get_size()
+        unsupported = set(RedisBuffer._counted_pop_unsupported)
+
+    # then
+    assert popped_events == events
+    assert size == 0
+    script.assert_called_once_with(keys=[KEY], args=[BATCH_SIZE])
+    assert unsupported == {buffer.broker_url}
+
+
+def test_pop_events_reraises_unrelated_response_errors(buffer):
+    # given
+    error = ResponseError("WRONGTYPE Operation against a key")
+
+    # when & then
+    with (
+        patch.object(Pipeline, "execute", side_effect=error),
+        pytest.raises(ResponseError),
+    ):
+        buffer.pop_events()
+
+
+def test_encode_with_compression_dictionary(buffer):
+    # given
+    event = json.dumps(
+        {
+            "eventType": "api_call",
+            "request": {
+                "id": "1",
+                "method": "POST",
+                "url": "https://example.com/graphql/",
+                "headers": [["Content-Type", "application/json"]],
+                "contentLength": 10,
+            },
+            "response": {"headers": [], "statusCode": 200, "contentLength": 20},
+        }
+    ).encode()
+
+    # when
+    encoded_event = buffer.encode(event)
+
+    # then
+    assert len(encoded_event) < len(zlib.compress(event, buffer._compressor_preset))
+    assert buffer.decode(encoded_event) == event
+
+
+def test_decode_event_compressed_without_dictionary(buffer, event_data):
+    # when
+    decoded_event = buffer.decode(zlib.compress(event_data))
+
+    # then
+    assert decoded_event == event_data
+
+
+@patch("saleor.webhook.observability.buffers.record_buffer_events")
+def test_buffer_records_events_metrics(mocked_record_buffer_events, buffer):
+    # given
+    events = [f"event-data-{i}".encode() for i in range(MAX_SIZE + 2)]
+
+    # when
+    buffer.put_events(events)
+    buffer.pop_events()
+
+    # then
+    assert mocked_record_buffer_events.call_args_list == [
+        call("put", MAX_SIZE + 2),
+        call("dropped", 2),
+        call("pop", BATCH_SIZE),
+    ]
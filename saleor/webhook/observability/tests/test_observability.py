@@ -1,15 +1,27 @@
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from unittest.mock import Mock, patch
 
+import pytest
 from celery.canvas import Signature
 
 from ....core import EventDeliveryStatus
 from ...event_types import WebhookEventAsyncType
 from ...transport.asynchronous.transport import (
+    OBSERVABILITY_GZIP_NDJSON_HEADERS,
+    observability_batch_sizes,
     observability_reporter_task,
     observability_send_events,
     send_observability_events,
 )
-from .. import concatenate_json_events
+from ...transport.utils import WebhookResponse
+from .. import AdaptiveBatchSize, concatenate_json_events
+
+
+@pytest.fixture(autouse=True)
+def clear_observability_batch_sizes():
+    observability_batch_sizes.clear()
 
 
 @patch("saleor.webhook.transport.asynchronous.transport.group")
@@ -66,6 +78,7 @@ def test_observability_send_events(
 def test_send_observability_events(
     mock_send_webhook_using_scheme_method, observability_webhook_data
 ):
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(content="")
     events = [b'{"event": "data"}', b'{"event": "data"}']
 
     send_observability_events([observability_webhook_data], events)
@@ -95,10 +108,11 @@ def test_send_observability_events_when_response_failed(
 
 
 @patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+    "saleor.webhook.transport.asynchronous.transport"
+    ".send_webhook_batch_using_scheme_method"
 )
 def test_send_observability_events_to_google_pub_sub(
-    mock_send_webhook_using_scheme_method, observability_webhook_data
+    mock_send_webhook_batch_using_scheme_method, observability_webhook_data
 ):
     observability_webhook_data.target_url = (
         "gcpubsub://cloud.google.com/projects/saleor/topics/test"
@@ -108,21 +122,21 @@ def test_send_observability_events_to_google_pub_sub(
 
     send_observability_events(webhooks, events)
 
-    assert mock_send_webhook_using_scheme_method.call_count == len(events)
-    mock_send_webhook_using_scheme_method.assert_called_with(
+    mock_send_webhook_batch_using_scheme_method.assert_called_once_with(
         observability_webhook_data.target_url,
         observability_webhook_data.saleor_domain,
         observability_webhook_data.secret_key,
         WebhookEventAsyncType.OBSERVABILITY,
-        events[-1],
+        events,
     )
 
 
 @patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+    "saleor.webhook.transport.asynchronous.transport"
+    ".send_webhook_batch_using_scheme_method"
 )
 def test_send_observability_events_to_google_pub_sub_when_response_failed(
-    mock_send_webhook_using_scheme_method, observability_webhook_data
+    mock_send_webhook_batch_using_scheme_method, observability_webhook_data, caplog
 ):
     observability_webhook_data.target_url = (
         "gcpubsub://cloud.google.com/projects/saleor/topics/test"
@@ -130,7 +144,133 @@ def test_send_observability_events_to_google_pub_sub_when_response_failed(
     events = [b'{"event": "data"}', b'{"event": "data"}']
     response = Mock()
     response.status = EventDeliveryStatus.FAILED
-    mock_send_webhook_using_scheme_method.return_value = response
+    mock_send_webhook_batch_using_scheme_method.return_value = [response, response]
+
+    send_observability_events([observability_webhook_data], events)
+    mock_send_webhook_batch_using_scheme_method.assert_called_once()
+    assert caplog.records[0].dropped_events_count == len(events)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_observability_events_as_gzip_ndjson(
+    mock_send_webhook_using_scheme_method, observability_webhook_data, settings
+):
+    # given
+    settings.OBSERVABILITY_GZIP_NDJSON = True
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(content="")
+    events = [b'{"event": "data-1"}', b'{"event": "data-2"}']
+
+    # when
+    send_observability_events([observability_webhook_data], events)
+
+    # then
+    args, kwargs = mock_send_webhook_using_scheme_method.call_args
+    assert gzip.decompress(args[4]) == b'{"event": "data-1"}\n{"event": "data-2"}\n'
+    assert kwargs == {"custom_headers": OBSERVABILITY_GZIP_NDJSON_HEADERS}
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_observability_events_reduces_batch_size_for_slow_target(
+    mock_send_webhook_using_scheme_method, observability_webhook_data, settings
+):
+    # given
+    settings.OBSERVABILITY_BUFFER_BATCH_SIZE = 4
+    mock_send_webhook_using_scheme_method.side_effect = [
+        WebhookResponse(content="", duration=5.0),
+        WebhookResponse(content="", duration=0.1),
+    ]
+    events = [f'{{"event": "data-{i}"}}'.encode() for i in range(6)]
+
+    # when
+    send_observability_events([observability_webhook_data], events)
+
+    # then
+    bodies = [
+        sent_call.args[4]
+        for sent_call in mock_send_webhook_using_scheme_method.call_args_list
+    ]
+    assert bodies == [
+        concatenate_json_events(events[:4]),
+        concatenate_json_events(events[4:]),
+    ]
+    assert observability_batch_sizes.get(observability_webhook_data.target_url) == 3
 
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_observability_events_drops_remaining_batches_when_target_fails(
+    mock_send_webhook_using_scheme_method, observability_webhook_data, settings, caplog
+):
+    # given
+    settings.OBSERVABILITY_BUFFER_BATCH_SIZE = 2
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.FAILED
+    )
+    events = [f'{{"event": "data-{i}"}}'.encode() for i in range(6)]
+
+    # when
     send_observability_events([observability_webhook_data], events)
-    assert mock_send_webhook_using_scheme_method.call_count == len(events)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_called_once()
+    assert caplog.records[0].dropped_events_count == len(events)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.ThreadPoolExecutor",
+    wraps=ThreadPoolExecutor,
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_observability_events_to_many_webhooks_concurrently(
+    mock_send_webhook_using_scheme_method,
+    mock_thread_pool_executor,
+    observability_webhook_data,
+    settings,
+):
+    # given
+    settings.OBSERVABILITY_WEBHOOKS_MAX_CONCURRENCY = 4
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(content="")
+    other_webhook_data = replace(
+        observability_webhook_data, target_url="https://other-app.com/api/"
+    )
+    events = [b'{"event": "data"}']
+
+    # when
+    send_observability_events([observability_webhook_data, other_webhook_data], events)
+
+    # then
+    mock_thread_pool_executor.assert_called_once_with(max_workers=2)
+    target_urls = {
+        sent_call.args[0]
+        for sent_call in mock_send_webhook_using_scheme_method.call_args_list
+    }
+    assert target_urls == {
+        observability_webhook_data.target_url,
+        other_webhook_data.target_url,
+    }
+
+
+def test_adaptive_batch_size(settings):
+    # given
+    settings.OBSERVABILITY_BUFFER_BATCH_SIZE = 8
+    batch_sizes = AdaptiveBatchSize()
+    target = "https://observability-app.com/api/"
+
+    # when
+    batch_sizes.update(target, duration=5.0, success=True)
+    slow_size = batch_sizes.get(target)
+    batch_sizes.update(target, duration=0.1, success=False)
+    failed_size = batch_sizes.get(target)
+    batch_sizes.update(target, duration=0.1, success=True)
+    fast_size = batch_sizes.get(target)
+
+    # then
+    assert [slow_size, failed_size, fast_size] == [4, 2, 3]
+    assert batch_sizes.get("https://other-app.com/api/") == 8
@@ -4,7 +4,7 @@ import fakeredis
 import pytest
 
 from ....app.models import App
-from ....webhook.circuit_breaker.storage import RedisStorage
+from ....webhook.circuit_breaker.storage import AsyncRedisStorage, RedisStorage
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
 
@@ -17,6 +17,14 @@ def breaker_storage():
     return RedisStorage(client=fakeredis.FakeRedis(server=server))
 
 
+@pytest.fixture
+def async_breaker_storage():
+    server = fakeredis.FakeServer()
+    server.connected = True
+
+    return AsyncRedisStorage(client=fakeredis.FakeRedis(server=server))
+
+
 @pytest.fixture
 def breaker_not_connected_storage():
     server = fakeredis.FakeServer()
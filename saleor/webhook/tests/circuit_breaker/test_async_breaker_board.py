@@ -0,0 +1,353 @@
+from unittest.mock import patch
+
+from ....core import EventDeliveryStatus
+from ....graphql.app.enums import CircuitBreakerState
+from ....webhook.circuit_breaker.breaker_board import BreakerTarget
+from ....webhook.transport.asynchronous.transport import (
+    PARKED_DELIVERIES_RELEASE_BATCH_SIZE,
+    release_parked_deliveries_sweep_task,
+    release_parked_deliveries_task,
+    send_webhook_request_async,
+)
+from .utils import create_async_breaker_board
+
+ASYNC_BREAKER_BOARD_PATH = (
+    "saleor.webhook.transport.asynchronous.transport.async_breaker_board"
+)
+
+
+def test_async_breaker_board_targets(async_breaker_storage, webhook):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+
+    # when
+    targets = breaker_board.get_breaker_targets(webhook)
+
+    # then
+    assert targets == [
+        BreakerTarget(id=f"app-{webhook.app_id}", name=webhook.app.name),
+        BreakerTarget(id="host-www.example.com", name="www.example.com"),
+    ]
+
+
+def test_async_breaker_board_trips_app_and_host(async_breaker_storage, webhook):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+
+    # when
+    breaker_board.register_delivery_result(webhook, success=False)
+    open_target = breaker_board.get_open_breaker_target(webhook)
+
+    # then
+    app_target, host_target = breaker_board.get_breaker_targets(webhook)
+    assert open_target == app_target
+    assert breaker_board.update_breaker_state(host_target) == CircuitBreakerState.OPEN
+
+
+def test_async_breaker_board_does_not_require_sync_events(
+    settings, async_breaker_storage
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = []
+
+    # when
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+
+    # then
+    assert breaker_board
+
+
+def test_async_breaker_board_closed_on_success(async_breaker_storage, webhook):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+
+    # when
+    breaker_board.register_delivery_result(webhook, success=True)
+
+    # then
+    assert breaker_board.get_open_breaker_target(webhook) is None
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.apply_async"
+)
+def test_send_webhook_request_async_parks_delivery_when_breaker_open(
+    mocked_release_task,
+    mocked_send_webhook,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(
+        async_breaker_storage, cooldown_seconds=30
+    )
+    breaker_board.register_delivery_result(event_delivery.webhook, success=False)
+    app_target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        send_webhook_request_async(
+            event_delivery_id=event_delivery.pk, telemetry_context={}
+        )
+
+    # then
+    mocked_send_webhook.assert_not_called()
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    assert not event_delivery.attempts.exists()
+    assert async_breaker_storage.pop_parked_deliveries(app_target.id, 10) == [
+        (event_delivery.pk, 0)
+    ]
+    mocked_release_task.assert_called_once_with(
+        kwargs={"breaker_id": app_target.id, "breaker_name": app_target.name},
+        countdown=30,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.apply_async"
+)
+def test_send_webhook_request_async_parks_delivery_with_retry_count(
+    mocked_release_task,
+    mocked_send_webhook,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+    breaker_board.register_delivery_result(event_delivery.webhook, success=False)
+    app_target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        send_webhook_request_async.apply(
+            kwargs={"event_delivery_id": event_delivery.pk, "telemetry_context": {}},
+            retries=2,
+        )
+
+    # then
+    mocked_send_webhook.assert_not_called()
+    assert async_breaker_storage.pop_parked_deliveries(app_target.id, 10) == [
+        (event_delivery.pk, 2)
+    ]
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.apply_async"
+)
+def test_send_webhook_request_async_schedules_release_once_per_cooldown(
+    mocked_release_task,
+    mocked_send_webhook,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(
+        async_breaker_storage, cooldown_seconds=30
+    )
+    breaker_board.register_delivery_result(event_delivery.webhook, success=False)
+    app_target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+    # the delivery parked before, which release task was lost
+    breaker_board.park_delivery(app_target, event_delivery)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        for _ in range(2):
+            send_webhook_request_async(
+                event_delivery_id=event_delivery.pk, telemetry_context={}
+            )
+
+    # then
+    mocked_send_webhook.assert_not_called()
+    assert async_breaker_storage.get_parked_deliveries_count(app_target.id) == 3
+    mocked_release_task.assert_called_once_with(
+        kwargs={"breaker_id": app_target.id, "breaker_name": app_target.name},
+        countdown=30,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.delay"
+)
+def test_release_parked_deliveries_sweep_task(
+    mocked_release_task, async_breaker_storage, event_delivery
+):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+    app_target, host_target = breaker_board.get_breaker_targets(event_delivery.webhook)
+    breaker_board.park_delivery(app_target, event_delivery)
+    breaker_board.park_delivery(host_target, event_delivery)
+    # the release of the host target deliveries is already scheduled
+    assert breaker_board.should_schedule_release(host_target)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        release_parked_deliveries_sweep_task()
+
+    # then
+    mocked_release_task.assert_called_once_with(
+        breaker_id=app_target.id, breaker_name=app_target.id
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_registers_result_in_breaker(
+    mocked_send_webhook,
+    async_breaker_storage,
+    event_delivery,
+    webhook_response,
+):
+    # given
+    mocked_send_webhook.return_value = webhook_response
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        send_webhook_request_async(
+            event_delivery_id=event_delivery.pk, telemetry_context={}
+        )
+
+    # then
+    mocked_send_webhook.assert_called_once()
+    for target in breaker_board.get_breaker_targets(event_delivery.webhook):
+        assert async_breaker_storage.get_event_count(target.id, "total") == 1
+        assert async_breaker_storage.get_event_count(target.id, "error") == 0
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async"
+    ".apply_async"
+)
+def test_release_parked_deliveries_task_half_open(
+    mocked_send_webhook_task, async_breaker_storage, event_delivery
+):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+    target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+    async_breaker_storage.set_app_state(target.id, CircuitBreakerState.OPEN, 0)
+    breaker_board.park_delivery(target, event_delivery)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        release_parked_deliveries_task(breaker_id=target.id, breaker_name=target.name)
+
+    # then
+    state, _ = async_breaker_storage.get_app_state(target.id)
+    assert state == CircuitBreakerState.HALF_OPEN
+    mocked_send_webhook_task.assert_called_once()
+    assert (
+        mocked_send_webhook_task.call_args.kwargs["kwargs"]["event_delivery_id"]
+        == event_delivery.pk
+    )
+    assert async_breaker_storage.get_parked_deliveries_count(target.id) == 0
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.record_async_webhooks_released")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async"
+    ".apply_async"
+)
+def test_release_parked_deliveries_task_keeps_retry_count(
+    mocked_send_webhook_task,
+    mocked_record_released,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+    app_target, host_target = breaker_board.get_breaker_targets(event_delivery.webhook)
+    breaker_board.park_delivery(host_target, event_delivery, retries=3)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        release_parked_deliveries_task(
+            breaker_id=host_target.id, breaker_name=host_target.name
+        )
+
+    # then
+    mocked_send_webhook_task.assert_called_once()
+    assert mocked_send_webhook_task.call_args.kwargs["retries"] == 3
+    mocked_record_released.assert_called_once_with(
+        event_delivery.webhook.app_id, "host", 1
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.apply_async"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async"
+    ".apply_async"
+)
+def test_release_parked_deliveries_task_still_open(
+    mocked_send_webhook_task,
+    mocked_release_task,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(
+        async_breaker_storage, cooldown_seconds=30
+    )
+    target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+    breaker_board.register_delivery_result(event_delivery.webhook, success=False)
+    assert breaker_board.update_breaker_state(target) == CircuitBreakerState.OPEN
+    breaker_board.park_delivery(target, event_delivery)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        release_parked_deliveries_task(breaker_id=target.id, breaker_name=target.name)
+
+    # then
+    mocked_send_webhook_task.assert_not_called()
+    mocked_release_task.assert_called_once_with(
+        kwargs={"breaker_id": target.id, "breaker_name": target.name},
+        countdown=30,
+    )
+    assert async_breaker_storage.get_parked_deliveries_count(target.id) == 1
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".release_parked_deliveries_task.apply_async"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async"
+    ".apply_async"
+)
+def test_release_parked_deliveries_task_schedules_next_batch(
+    mocked_send_webhook_task,
+    mocked_release_task,
+    async_breaker_storage,
+    event_delivery,
+):
+    # given
+    breaker_board = create_async_breaker_board(async_breaker_storage)
+    target = breaker_board.get_breaker_targets(event_delivery.webhook)[0]
+    for _ in range(PARKED_DELIVERIES_RELEASE_BATCH_SIZE + 1):
+        breaker_board.park_delivery(target, event_delivery)
+
+    # when
+    with patch(ASYNC_BREAKER_BOARD_PATH, breaker_board):
+        release_parked_deliveries_task(breaker_id=target.id, breaker_name=target.name)
+
+    # then
+    mocked_send_webhook_task.assert_called_once()
+    mocked_release_task.assert_called_once()
+    assert async_breaker_storage.get_parked_deliveries_count(target.id) == 1
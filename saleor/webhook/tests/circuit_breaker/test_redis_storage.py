@@ -77,3 +77,78 @@ def test_register_event_does_not_crash_on_redis_error(
     breaker_not_connected_storage,
 ):
     breaker_not_connected_storage.register_event(APP_ID, NAME, 5)
+
+
+def test_park_and_pop_deliveries(breaker_storage):
+    # given
+    key = "app-1"
+
+    # when
+    parked_counts = [
+        breaker_storage.park_delivery(key, pk, retries)
+        for pk, retries in [(10, 0), (11, 2), (12, 5)]
+    ]
+
+    # then
+    assert parked_counts == [1, 2, 3]
+    assert breaker_storage.pop_parked_deliveries(key, 2) == [(10, 0), (11, 2)]
+    assert breaker_storage.get_parked_deliveries_count(key) == 1
+    assert breaker_storage.pop_parked_deliveries(key, 2) == [(12, 5)]
+    assert breaker_storage.pop_parked_deliveries(key, 2) == []
+
+
+def test_pop_deliveries_parked_without_retry_count(breaker_storage):
+    # given
+    key = "app-1"
+    breaker_storage._client.rpush(f"bbrs-{key}-parked", 10)
+
+    # when
+    parked_deliveries = breaker_storage.pop_parked_deliveries(key, 2)
+
+    # then
+    assert parked_deliveries == [(10, 0)]
+
+
+def test_parked_deliveries_not_cleared_with_app_state(breaker_storage):
+    # given
+    breaker_storage.park_delivery(APP_ID, 10)
+
+    # when
+    breaker_storage.clear_state_for_app(APP_ID)
+
+    # then
+    assert breaker_storage.get_parked_deliveries_count(APP_ID) == 1
+
+
+def test_park_delivery_does_not_crash_on_redis_error(breaker_not_connected_storage):
+    assert breaker_not_connected_storage.park_delivery(APP_ID, 10) == 0
+    assert breaker_not_connected_storage.pop_parked_deliveries(APP_ID, 10) == []
+    assert breaker_not_connected_storage.get_parked_deliveries_count(APP_ID) == 0
+
+
+def test_get_parked_keys(breaker_storage):
+    # given
+    breaker_storage.park_delivery("app-1", 10)
+    breaker_storage.park_delivery("host-www.example.com", 11)
+    breaker_storage.set_app_state("app-2", CircuitBreakerState.OPEN, 100)
+
+    # when
+    parked_keys = breaker_storage.get_parked_keys()
+
+    # then
+    assert sorted(parked_keys) == ["app-1", "host-www.example.com"]
+
+
+def test_acquire_release_lock(breaker_storage):
+    # when
+    acquired = breaker_storage.acquire_release_lock("app-1", TTL_SECONDS)
+
+    # then
+    assert acquired is True
+    assert breaker_storage.acquire_release_lock("app-1", TTL_SECONDS) is False
+    assert breaker_storage.acquire_release_lock("app-2", TTL_SECONDS) is True
+
+
+def test_release_lock_does_not_crash_on_redis_error(breaker_not_connected_storage):
+    assert breaker_not_connected_storage.get_parked_keys() == []
+    assert breaker_not_connected_storage.acquire_release_lock(APP_ID, 10) is True
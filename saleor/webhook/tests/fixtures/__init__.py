@@ -1,4 +1,5 @@
 from .subscription_webhooks import *  # noqa: F403
+from .transport_clients import *  # noqa: F403
 from .webhook import *  # noqa: F403
 from .webhook_data import *  # noqa: F403
 from .webhook_event import *  # noqa: F403
@@ -0,0 +1,12 @@
+import pytest
+
+from ...transport.clients import clear_client_pools
+
+
+@pytest.fixture(autouse=True)
+def clear_transport_client_pools():
+    # Cloud transport clients are pooled per process; make sure that every test
+    # constructs its own (usually mocked) clients.
+    clear_client_pools()
+    yield
+    clear_client_pools()
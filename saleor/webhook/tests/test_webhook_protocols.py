@@ -35,7 +35,7 @@ def test_trigger_webhooks_with_aws_sqs(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.webhook.transport.utils.boto3.client",
+        "saleor.webhook.transport.clients.boto3.client",
         mocked_client_constructor,
     )
 
@@ -104,7 +104,7 @@ def test_trigger_webhooks_with_aws_sqs_and_secret_key(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.webhook.transport.utils.boto3.client",
+        "saleor.webhook.transport.clients.boto3.client",
         mocked_client_constructor,
     )
 
@@ -3,6 +3,7 @@ import json
 import logging
 from collections import defaultdict
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -26,6 +27,7 @@ from ....core.telemetry import (
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
 from ....core.utils.url import sanitize_url_for_logging
+from ....graphql.app.enums import CircuitBreakerState
 from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
@@ -35,9 +37,15 @@ from ....graphql.webhook.subscription_payload import (
 )
 from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
+from ...circuit_breaker.breaker_board import (
+    AsyncBreakerBoard,
+    BreakerTarget,
+    initialize_async_breaker_board,
+)
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...metrics import (
     record_async_webhooks_count,
+    record_async_webhooks_released,
     record_first_delivery_attempt_delay,
 )
 from ...observability import WebhookData
@@ -61,6 +69,7 @@ from ..utils import (
     handle_webhook_retry,
     prepare_deferred_payload_data,
     process_failed_deliveries,
+    send_webhook_batch_using_scheme_method,
     send_webhook_using_scheme_method,
 )
 
@@ -77,6 +86,14 @@ MAX_WEBHOOK_EVENTS_IN_DB_BULK = 100
 MAX_WEBHOOK_RETRIES = 5
 WEBHOOK_ASYNC_BATCH_SIZE = 100
 
+# Number of parked deliveries re-queued at once when the breaker goes half-open.
+PARKED_DELIVERIES_RELEASE_BATCH_SIZE = 100
+# Delay between releasing consecutive batches of parked deliveries, so the breaker
+# can evaluate responses of the released deliveries before the next batch is sent.
+PARKED_DELIVERIES_RELEASE_INTERVAL_SECONDS = 5
+
+async_breaker_board = initialize_async_breaker_board()
+
 
 @dataclass
 class WebhookPayloadData:
@@ -609,6 +626,11 @@ def send_webhook_request_async(
         return
 
     webhook = delivery.webhook
+    if async_breaker_board and park_delivery_if_breaker_open(
+        async_breaker_board, delivery, self.request.retries
+    ):
+        return
+
     domain = get_domain()
     attempt = create_attempt(delivery, self.request.id)
     response = WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
@@ -645,6 +667,10 @@ def send_webhook_request_async(
                 span.set_status(StatusCode.ERROR)
 
         record_async_webhooks_count(delivery, response.status)
+        if async_breaker_board:
+            async_breaker_board.register_delivery_result(
+                webhook, response.status == EventDeliveryStatus.SUCCESS
+            )
         if response.status == EventDeliveryStatus.FAILED:
             attempt_update(attempt, response)
             handle_webhook_retry(self, webhook, response, delivery, attempt)
@@ -671,6 +697,112 @@ def send_webhook_request_async(
     clear_successful_delivery(delivery)
 
 
+def park_delivery_if_breaker_open(
+    breaker_board: AsyncBreakerBoard, delivery: EventDelivery, retries: int = 0
+) -> bool:
+    """Park the delivery when the app's or target host's breaker is open.
+
+    The delivery is released with the given number of retries already made. Parking
+    schedules the release of all deliveries parked for the breaker after
+    the breaker cooldown, at most once per cooldown. Return `False` when the delivery
+    should be sent right away.
+    """
+    target = breaker_board.get_open_breaker_target(delivery.webhook)
+    if not target:
+        return False
+
+    parked_count = breaker_board.park_delivery(target, delivery, retries)
+    if not parked_count:
+        # Parking failed, send the delivery rather than lose it.
+        return False
+
+    if breaker_board.should_schedule_release(target):
+        release_parked_deliveries_task.apply_async(
+            kwargs={"breaker_id": target.id, "breaker_name": target.name},
+            countdown=breaker_board.cooldown_seconds,
+        )
+    task_logger.info(
+        "[Webhook ID:%r] Delivery %r parked, circuit breaker %r is open.",
+        delivery.webhook.id,
+        delivery.pk,
+        target.id,
+    )
+    return True
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME)
+@allow_writer()
+def release_parked_deliveries_task(breaker_id: str, breaker_name: str):
+    """Re-queue deliveries parked by the breaker once it is no longer open.
+
+    Deliveries are released in batches; the next batch is scheduled after a short
+    interval, so a breaker that re-opens stops the release.
+    """
+    if not async_breaker_board:
+        return
+
+    target = BreakerTarget(id=breaker_id, name=breaker_name)
+    task_kwargs = {"breaker_id": breaker_id, "breaker_name": breaker_name}
+    if async_breaker_board.update_breaker_state(target) == CircuitBreakerState.OPEN:
+        if async_breaker_board.storage.get_parked_deliveries_count(breaker_id):
+            release_parked_deliveries_task.apply_async(
+                kwargs=task_kwargs, countdown=async_breaker_board.cooldown_seconds
+            )
+        return
+
+    parked_deliveries = async_breaker_board.pop_parked_deliveries(
+        target, PARKED_DELIVERIES_RELEASE_BATCH_SIZE
+    )
+    if not parked_deliveries:
+        return
+
+    retries_by_delivery_id = dict(parked_deliveries)
+    deliveries = EventDelivery.objects.select_related("webhook").filter(
+        pk__in=retries_by_delivery_id.keys(), status=EventDeliveryStatus.PENDING
+    )
+    released_counts: defaultdict[int, int] = defaultdict(int)
+    for delivery in deliveries:
+        send_webhook_request_async.apply_async(
+            kwargs={
+                "event_delivery_id": delivery.pk,
+                "telemetry_context": get_task_context().to_dict(),
+            },
+            queue=get_queue_name_for_webhook(
+                delivery.webhook, default_queue=settings.WEBHOOK_CELERY_QUEUE_NAME
+            ),
+            # continue from the retry the delivery was parked at
+            retries=retries_by_delivery_id[delivery.pk],
+            bind=True,
+            retry_backoff=10,
+            retry_kwargs={"max_retries": 5},
+        )
+        released_counts[delivery.webhook.app_id] += 1
+    for app_id, released_count in released_counts.items():
+        record_async_webhooks_released(app_id, target.type, released_count)
+
+    if len(parked_deliveries) == PARKED_DELIVERIES_RELEASE_BATCH_SIZE:
+        release_parked_deliveries_task.apply_async(
+            kwargs=task_kwargs, countdown=PARKED_DELIVERIES_RELEASE_INTERVAL_SECONDS
+        )
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME)
+def release_parked_deliveries_sweep_task():
+    """Schedule the release of the deliveries parked by all breakers.
+
+    Parked deliveries don't expire, so the periodic sweep releases the ones whose
+    release task was lost.
+    """
+    if not async_breaker_board:
+        return
+
+    for target in async_breaker_board.get_parked_targets():
+        if async_breaker_board.should_schedule_release(target):
+            release_parked_deliveries_task.delay(
+                breaker_id=target.id, breaker_name=target.name
+            )
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -763,63 +895,116 @@ def send_webhooks_async_for_app(
     )
 
 
-def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
+OBSERVABILITY_GZIP_NDJSON_HEADERS = {
+    "Content-Type": "application/x-ndjson",
+    "Content-Encoding": "gzip",
+}
+
+observability_batch_sizes = observability.AdaptiveBatchSize()
+
+
+def _send_observability_events_using_http(
+    webhook: WebhookData, events: list[bytes]
+) -> tuple[int, WebhookResponse]:
+    """Send the events in batches adapted to the target response time.
+
+    Return the number of dropped events and the last response.
+    """
     event_type = WebhookEventAsyncType.OBSERVABILITY
-    for webhook in webhooks:
-        scheme = urlparse(webhook.target_url).scheme.lower()
-        failed = 0
-        extra = {
-            "webhook_id": webhook.id,
-            "webhook_target_url": webhook.target_url,
-            "events_count": len(events),
-        }
-        try:
-            if scheme in [WebhookSchemes.AWS_SQS, WebhookSchemes.GOOGLE_CLOUD_PUBSUB]:
-                for event in events:
-                    response = send_webhook_using_scheme_method(
-                        webhook.target_url,
-                        webhook.saleor_domain,
-                        webhook.secret_key,
-                        event_type,
-                        event,
-                    )
-                    if response.status == EventDeliveryStatus.FAILED:
-                        failed += 1
-            else:
-                response = send_webhook_using_scheme_method(
-                    webhook.target_url,
-                    webhook.saleor_domain,
-                    webhook.secret_key,
-                    event_type,
-                    observability.concatenate_json_events(events),
-                )
-                if response.status == EventDeliveryStatus.FAILED:
-                    failed = len(events)
-        except ValueError:
-            logger.error(
-                "Webhook ID: %r unknown webhook scheme: %r.",
-                webhook.id,
-                scheme,
-                extra={**extra, "dropped_events_count": len(events)},
+    sent = 0
+    while True:
+        batch_size = observability_batch_sizes.get(webhook.target_url)
+        batch = events[sent : sent + batch_size]
+        if settings.OBSERVABILITY_GZIP_NDJSON:
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                webhook.saleor_domain,
+                webhook.secret_key,
+                event_type,
+                observability.gzip_ndjson_events(batch),
+                custom_headers=OBSERVABILITY_GZIP_NDJSON_HEADERS,
             )
-            continue
-        if failed:
-            logger.info(
-                "Webhook ID: %r failed request to %r (%s/%s events dropped): %r.",
-                webhook.id,
-                sanitize_url_for_logging(webhook.target_url),
-                failed,
-                len(events),
-                response.content,
-                extra={**extra, "dropped_events_count": failed},
+        else:
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                webhook.saleor_domain,
+                webhook.secret_key,
+                event_type,
+                observability.concatenate_json_events(batch),
             )
-            continue
-        logger.debug(
-            "Successful delivered %s events to %r.",
-            len(events),
+        success = response.status != EventDeliveryStatus.FAILED
+        observability_batch_sizes.update(webhook.target_url, response.duration, success)
+        if not success:
+            # Drop the remaining events instead of waiting for every batch
+            # to fail against the unavailable target.
+            return len(events) - sent, response
+        sent += len(batch)
+        if sent >= len(events):
+            return 0, response
+
+
+def _send_observability_events_to_webhook(webhook: WebhookData, events: list[bytes]):
+    scheme = urlparse(webhook.target_url).scheme.lower()
+    failed = 0
+    extra = {
+        "webhook_id": webhook.id,
+        "webhook_target_url": webhook.target_url,
+        "events_count": len(events),
+    }
+    try:
+        if scheme in [WebhookSchemes.AWS_SQS, WebhookSchemes.GOOGLE_CLOUD_PUBSUB]:
+            responses = send_webhook_batch_using_scheme_method(
+                webhook.target_url,
+                webhook.saleor_domain,
+                webhook.secret_key,
+                WebhookEventAsyncType.OBSERVABILITY,
+                events,
+            )
+            for response in responses:
+                if response.status == EventDeliveryStatus.FAILED:
+                    failed += 1
+        else:
+            failed, response = _send_observability_events_using_http(webhook, events)
+    except ValueError:
+        logger.error(
+            "Webhook ID: %r unknown webhook scheme: %r.",
+            webhook.id,
+            scheme,
+            extra={**extra, "dropped_events_count": len(events)},
+        )
+        return
+    if failed:
+        logger.info(
+            "Webhook ID: %r failed request to %r (%s/%s events dropped): %r.",
+            webhook.id,
             sanitize_url_for_logging(webhook.target_url),
-            extra={**extra, "dropped_events_count": 0},
+            failed,
+            len(events),
+            response.content,
+            extra={**extra, "dropped_events_count": failed},
         )
+        return
+    logger.debug(
+        "Successful delivered %s events to %r.",
+        len(events),
+        sanitize_url_for_logging(webhook.target_url),
+        extra={**extra, "dropped_events_count": 0},
+    )
+
+
+def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
+    max_workers = min(len(webhooks), settings.OBSERVABILITY_WEBHOOKS_MAX_CONCURRENCY)
+    if max_workers <= 1:
+        for webhook in webhooks:
+            _send_observability_events_to_webhook(webhook, events)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_send_observability_events_to_webhook, webhook, events)
+            for webhook in webhooks
+        ]
+        for future in futures:
+            future.result()
 
 
 @app.task(queue=OBSERVABILITY_QUEUE_NAME)
@@ -0,0 +1,94 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import boto3
+from google.cloud import pubsub_v1
+
+# Maximum number of clients kept in a single pool; the least recently used client is
+# dropped when the limit is exceeded.
+CLIENT_POOL_MAX_SIZE = 64
+
+
+class ClientPool:
+    """Process-local pool of cloud transport clients, keyed by connection params.
+
+    Creating a client for every message costs tens of milliseconds, so clients are
+    reused across deliveries handled by the same worker. The pool is reset after
+    a fork, as the clients hold connections that must not be shared between
+    processes.
+    """
+
+    def __init__(self, factory: Callable[..., Any], max_size: int):
+        self._factory = factory
+        self._max_size = max_size
+        self._clients: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(self, key: Hashable, **kwargs) -> Any:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._clients.clear()
+                self._pid = os.getpid()
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key]
+
+            client = self._factory(**kwargs)
+            self._clients[key] = client
+            if len(self._clients) > self._max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+def _create_sqs_client(
+    region_name: str, aws_access_key_id: str | None, aws_secret_access_key: str | None
+):
+    return boto3.client(
+        "sqs",
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+    )
+
+
+def _create_pubsub_publisher():
+    # The publisher batches messages published within a short time window, so
+    # the messages sent in bulk are grouped in a single request.
+    return pubsub_v1.PublisherClient()
+
+
+sqs_client_pool = ClientPool(_create_sqs_client, CLIENT_POOL_MAX_SIZE)
+pubsub_publisher_pool = ClientPool(_create_pubsub_publisher, CLIENT_POOL_MAX_SIZE)
+
+
+def get_sqs_client(
+    region_name: str, aws_access_key_id: str | None, aws_secret_access_key: str | None
+):
+    return sqs_client_pool.get(
+        (region_name, aws_access_key_id, aws_secret_access_key),
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+    )
+
+
+def get_pubsub_publisher():
+    # Publishers use the default application credentials, so a single one per
+    # process serves all the topics.
+    return pubsub_publisher_pool.get("default")
+
+
+def clear_client_pools():
+    sqs_client_pool.clear()
+    pubsub_publisher_pool.clear()
@@ -2,7 +2,6 @@ import logging
 from typing import cast
 
 import graphene
-from django.core.cache import cache
 from pydantic import ValidationError
 
 from ...app.models import App
@@ -29,7 +28,11 @@ from ..response_schemas.payment import (
     StoredPaymentMethodDeleteRequestedSchema,
 )
 from ..response_schemas.utils.helpers import parse_validation_error
-from .utils import generate_cache_key_for_webhook, to_payment_app_id
+from .utils import (
+    generate_cache_key_for_webhook,
+    invalidate_webhook_cache,
+    to_payment_app_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +120,7 @@ def invalidate_cache_for_stored_payment_methods(
         cache_key = generate_cache_key_for_webhook(
             cache_data, webhook.target_url, event_type, webhook.app_id
         )
-        cache.delete(cache_key)
+        invalidate_webhook_cache(cache_key)
 
 
 def get_response_for_payment_gateway_initialize_tokenization(
@@ -1,18 +1,32 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.cache import cache
 from opentelemetry.trace import StatusCode
 
 from .....core.models import EventDeliveryStatus
 from .....core.telemetry import set_global_attributes
 from .....tests.utils import get_metric_data_point
+from ....event_types import WebhookEventSyncType
 from ...metrics import (
     METRIC_EXTERNAL_REQUEST_BODY_SIZE,
     METRIC_EXTERNAL_REQUEST_COUNT,
     METRIC_EXTERNAL_REQUEST_DURATION,
 )
-from ...utils import WebhookResponse
-from ..transport import _send_webhook_request_sync
+from ...utils import WebhookResponse, generate_cache_key_for_webhook
+from ..transport import (
+    _send_webhook_request_sync,
+    trigger_webhook_sync_if_not_cached,
+)
+
+CACHE_DATA = {"cache": "data"}
+EVENT_TYPE = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+
+
+def _get_cache_key(webhook):
+    return generate_cache_key_for_webhook(
+        CACHE_DATA, webhook.target_url, EVENT_TYPE, webhook.app_id
+    )
 
 
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
@@ -257,3 +271,261 @@ def test_send_webhook_request_sync_record_external_request_with_unknown_webhook_
     assert external_request_content_length.attributes == attributes
     assert external_request_content_length.count == 1
     assert external_request_content_length.sum == payload_size
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_sets_cache_and_releases_lock(
+    mocked_trigger_webhook_sync, webhook
+):
+    # given
+    response_data = {"response": "data"}
+    mocked_trigger_webhook_sync.return_value = response_data
+    cache_key = _get_cache_key(webhook)
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+    )
+
+    # then
+    assert response == response_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    assert cache.get(cache_key) == response_data
+    assert cache.get(f"{cache_key}:lock") is None
+    assert cache.get(f"{cache_key}:stale") is None
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_returns_cached_response(
+    mocked_trigger_webhook_sync, webhook
+):
+    # given
+    response_data = {"response": "data"}
+    cache.set(_get_cache_key(webhook), response_data)
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+    )
+
+    # then
+    assert response == response_data
+    mocked_trigger_webhook_sync.assert_not_called()
+
+
+@patch(
+    "saleor.webhook.transport.synchronous.transport.WEBHOOK_CACHE_LOCK_POLL_INTERVAL",
+    0,
+)
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_waits_for_lock_holder(
+    mocked_trigger_webhook_sync, webhook
+):
+    # given
+    response_data = {"response": "data"}
+    cache_key = _get_cache_key(webhook)
+    lock_key = f"{cache_key}:lock"
+    cache.add(lock_key, "other-worker")
+    original_cache_get = cache.get
+    calls = []
+
+    def cache_get(key, *args, **kwargs):
+        # Another worker stores the response after the first lookup.
+        calls.append(key)
+        if key == cache_key and len(calls) > 1:
+            return response_data
+        return original_cache_get(key, *args, **kwargs)
+
+    # when
+    with patch(
+        "saleor.webhook.transport.synchronous.transport.cache.get",
+        side_effect=cache_get,
+    ):
+        response = trigger_webhook_sync_if_not_cached(
+            EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+        )
+
+    # then
+    assert response == response_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    # the lock belongs to the other worker
+    assert cache.get(lock_key) == "other-worker"
+    cache.delete(lock_key)
+
+
+@patch(
+    "saleor.webhook.transport.synchronous.transport.WEBHOOK_CACHE_LOCK_POLL_INTERVAL",
+    0,
+)
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_lock_released_without_response(
+    mocked_trigger_webhook_sync, webhook
+):
+    # given
+    cache_key = _get_cache_key(webhook)
+    lock_key = f"{cache_key}:lock"
+    cache.add(lock_key, "other-worker")
+    original_cache_get = cache.get
+    lock_reads = []
+
+    def cache_get(key, *args, **kwargs):
+        # The other worker failed and released the lock after the first lookup.
+        if key == lock_key:
+            lock_reads.append(key)
+            if len(lock_reads) > 1:
+                return None
+        return original_cache_get(key, *args, **kwargs)
+
+    # when
+    with patch(
+        "saleor.webhook.transport.synchronous.transport.cache.get",
+        side_effect=cache_get,
+    ):
+        response = trigger_webhook_sync_if_not_cached(
+            EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+        )
+
+    # then
+    assert response is None
+    mocked_trigger_webhook_sync.assert_not_called()
+    cache.delete(lock_key)
+
+
+@patch(
+    "saleor.webhook.transport.synchronous.transport.WEBHOOK_CACHE_LOCK_POLL_INTERVAL",
+    0,
+)
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_serves_stale_response_after_failure(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TIMEOUT = 60
+    stale_data = {"response": "stale"}
+    cache_key = _get_cache_key(webhook)
+    lock_key = f"{cache_key}:lock"
+    cache.add(lock_key, "other-worker")
+    original_cache_get = cache.get
+    lock_reads = []
+
+    def cache_get(key, *args, **kwargs):
+        # The stale copy is stored and the lock released after the first lookup.
+        if key == lock_key:
+            lock_reads.append(key)
+            if len(lock_reads) > 1:
+                return None
+        if key == f"{cache_key}:stale" and lock_reads:
+            return stale_data
+        return original_cache_get(key, *args, **kwargs)
+
+    # when
+    with patch(
+        "saleor.webhook.transport.synchronous.transport.cache.get",
+        side_effect=cache_get,
+    ):
+        response = trigger_webhook_sync_if_not_cached(
+            EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+        )
+
+    # then
+    assert response == stale_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    cache.delete(lock_key)
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_keeps_lock_of_other_worker(
+    mocked_trigger_webhook_sync, webhook
+):
+    # given
+    cache_key = _get_cache_key(webhook)
+    lock_key = f"{cache_key}:lock"
+
+    def trigger_webhook_sync(*args, **kwargs):
+        # The lock expires during the app call and another worker acquires it.
+        cache.set(lock_key, "other-worker")
+        return {"response": "data"}
+
+    mocked_trigger_webhook_sync.side_effect = trigger_webhook_sync
+
+    # when
+    trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+    )
+
+    # then
+    assert cache.get(lock_key) == "other-worker"
+    cache.delete(lock_key)
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_serves_stale_response_when_locked(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TIMEOUT = 60
+    stale_data = {"response": "stale"}
+    cache_key = _get_cache_key(webhook)
+    cache.set(f"{cache_key}:stale", stale_data)
+    cache.add(f"{cache_key}:lock", "other-worker")
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+    )
+
+    # then
+    assert response == stale_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    cache.delete_many([f"{cache_key}:stale", f"{cache_key}:lock"])
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_stores_stale_copy(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TIMEOUT = 60
+    response_data = {"response": "data"}
+    mocked_trigger_webhook_sync.return_value = response_data
+    cache_key = _get_cache_key(webhook)
+
+    # when
+    with patch(
+        "saleor.webhook.transport.synchronous.transport.cache.set"
+    ) as mocked_cache_set:
+        trigger_webhook_sync_if_not_cached(
+            EVENT_TYPE,
+            "payload",
+            webhook,
+            CACHE_DATA,
+            allow_replica=False,
+            cache_timeout=10,
+        )
+
+    # then
+    mocked_cache_set.assert_any_call(cache_key, response_data, timeout=10)
+    mocked_cache_set.assert_any_call(f"{cache_key}:stale", response_data, timeout=70)
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_serves_stale_response_on_failure(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TIMEOUT = 60
+    mocked_trigger_webhook_sync.return_value = None
+    stale_data = {"response": "stale"}
+    cache_key = _get_cache_key(webhook)
+    cache.set(f"{cache_key}:stale", stale_data)
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, "payload", webhook, CACHE_DATA, allow_replica=False
+    )
+
+    # then
+    assert response == stale_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    assert cache.get(f"{cache_key}:lock") is None
+    cache.delete(f"{cache_key}:stale")
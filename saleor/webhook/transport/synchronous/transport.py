@@ -1,9 +1,11 @@
 import json
 import logging
+import time
 from collections.abc import Callable
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
+from uuid import uuid4
 
 from django.conf import settings
 from django.core.cache import cache
@@ -38,7 +40,11 @@ from ....webhook.circuit_breaker.breaker_board import (
     initialize_breaker_board,
 )
 from ... import observability
-from ...const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
+from ...const import (
+    WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+    WEBHOOK_CACHE_LOCK_POLL_INTERVAL,
+    WEBHOOK_CACHE_LOCK_TIMEOUT,
+)
 from ...event_types import WebhookEventSyncType
 from ...payloads import generate_transaction_action_request_payload
 from ...utils import get_webhooks_for_event
@@ -54,6 +60,8 @@ from ..utils import (
     delivery_update,
     generate_cache_key_for_webhook,
     get_delivery_for_webhook,
+    get_webhook_cache_lock_key,
+    get_webhook_stale_cache_key,
     handle_webhook_retry,
     save_unsuccessful_delivery_attempt,
     send_webhook_using_http,
@@ -187,6 +195,34 @@ def send_webhook_request_sync(
     return response_data if response.status == EventDeliveryStatus.SUCCESS else None
 
 
+def _wait_for_cached_response(cache_key: str, lock_key: str) -> dict | None:
+    """Wait for the response fetched by the worker holding the lock.
+
+    Return `None` when the lock holder released or lost the lock without caching
+    the response, or when it didn't finish in time.
+    """
+    lock_token = cache.get(lock_key)
+    deadline = time.monotonic() + WEBHOOK_CACHE_LOCK_TIMEOUT
+    while lock_token is not None and time.monotonic() < deadline:
+        time.sleep(WEBHOOK_CACHE_LOCK_POLL_INTERVAL)
+        response_data = cache.get(cache_key)
+        if response_data is not None:
+            return response_data
+        if cache.get(lock_key) != lock_token:
+            # The app call of the lock holder failed.
+            break
+    return cache.get(cache_key)
+
+
+def _release_cache_lock(lock_key: str, lock_token: str):
+    """Release the lock only when it's still owned by the given token.
+
+    The lock could expire during a slow app call and be acquired by another worker.
+    """
+    if cache.get(lock_key) == lock_token:
+        cache.delete(lock_key)
+
+
 def trigger_webhook_sync_if_not_cached(
     event_type: str,
     payload: str,
@@ -204,13 +240,36 @@ def trigger_webhook_sync_if_not_cached(
 
     - Send a synchronous webhook request if cache is expired.
     - Fetch response from cache if it is still valid.
+
+    Concurrent calls for the same cache key are coalesced: only the worker that
+    acquires the lock calls the app, the others wait for the cached response and
+    never call the app themselves. When `WEBHOOK_SYNC_CACHE_STALE_TIMEOUT` is set,
+    the expired response is returned to the waiting workers right away, and it's
+    also returned when the app call fails. Otherwise a failed app call returns
+    `None` to all of them.
     """
 
     cache_key = generate_cache_key_for_webhook(
         cache_data, webhook.target_url, event_type, webhook.app_id
     )
     response_data = cache.get(cache_key)
-    if response_data is None:
+    if response_data is not None:
+        return response_data
+
+    stale_timeout = settings.WEBHOOK_SYNC_CACHE_STALE_TIMEOUT
+    stale_cache_key = get_webhook_stale_cache_key(cache_key)
+    lock_key = get_webhook_cache_lock_key(cache_key)
+    lock_token = uuid4().hex
+    if not cache.add(lock_key, lock_token, timeout=WEBHOOK_CACHE_LOCK_TIMEOUT):
+        # Another worker is already calling the app for the same data.
+        if stale_timeout and (stale_data := cache.get(stale_cache_key)) is not None:
+            return stale_data
+        response_data = _wait_for_cached_response(cache_key, lock_key)
+        if response_data is None and stale_timeout:
+            response_data = cache.get(stale_cache_key)
+        return response_data
+
+    try:
         response_data = trigger_webhook_sync(
             event_type,
             payload,
@@ -223,11 +282,16 @@ def trigger_webhook_sync_if_not_cached(
             pregenerated_subscription_payload=pregenerated_subscription_payload,
         )
         if response_data is not None:
-            cache.set(
-                cache_key,
-                response_data,
-                timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
-            )
+            timeout = cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT
+            cache.set(cache_key, response_data, timeout=timeout)
+            if stale_timeout:
+                cache.set(
+                    stale_cache_key, response_data, timeout=timeout + stale_timeout
+                )
+        elif stale_timeout:
+            response_data = cache.get(stale_cache_key)
+    finally:
+        _release_cache_lock(lock_key, lock_token)
     return response_data
 
 
@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock, patch
+
+from ..clients import ClientPool, get_pubsub_publisher, get_sqs_client
+
+
+def test_client_pool_reuses_client_for_same_key():
+    # given
+    factory = MagicMock(side_effect=lambda **kwargs: object())
+    pool = ClientPool(factory, max_size=2)
+
+    # when
+    first_client = pool.get("key", param="value")
+    second_client = pool.get("key", param="value")
+
+    # then
+    assert first_client is second_client
+    factory.assert_called_once_with(param="value")
+
+
+def test_client_pool_drops_least_recently_used_client():
+    # given
+    factory = MagicMock(side_effect=lambda **kwargs: object())
+    pool = ClientPool(factory, max_size=2)
+    first_client = pool.get("first")
+    pool.get("second")
+    pool.get("first")
+
+    # when
+    pool.get("third")
+
+    # then
+    assert len(pool) == 2
+    assert pool.get("first") is first_client
+    assert factory.call_count == 3
+
+
+def test_client_pool_resets_after_fork():
+    # given
+    factory = MagicMock(side_effect=lambda **kwargs: object())
+    pool = ClientPool(factory, max_size=2)
+    client = pool.get("key")
+
+    # when
+    with patch("saleor.webhook.transport.clients.os.getpid", return_value=-1):
+        new_client = pool.get("key")
+
+    # then
+    assert new_client is not client
+    assert factory.call_count == 2
+
+
+@patch("saleor.webhook.transport.clients.boto3.client")
+def test_get_sqs_client_keyed_by_region_and_credentials(mocked_boto3_client):
+    # given
+    mocked_boto3_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    # when
+    client = get_sqs_client("us-east-1", "key", "secret")
+    same_client = get_sqs_client("us-east-1", "key", "secret")
+    other_region_client = get_sqs_client("eu-west-1", "key", "secret")
+    other_credentials_client = get_sqs_client("us-east-1", "key", "other-secret")
+
+    # then
+    assert client is same_client
+    assert client is not other_region_client
+    assert client is not other_credentials_client
+    assert mocked_boto3_client.call_count == 3
+
+
+@patch("saleor.webhook.transport.clients.pubsub_v1.PublisherClient")
+def test_get_pubsub_publisher_is_reused(mocked_publisher_client):
+    # when
+    publisher = get_pubsub_publisher()
+    same_publisher = get_pubsub_publisher()
+
+    # then
+    assert publisher is same_publisher
+    mocked_publisher_client.assert_called_once_with()
@@ -2,7 +2,7 @@ import datetime
 import hashlib
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -11,12 +11,12 @@ from typing import Optional
 from urllib.parse import unquote, urlparse, urlunparse
 from uuid import UUID
 
-import boto3
 from botocore.exceptions import ClientError
 from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Count
 from django.urls import reverse
 from google.cloud import pubsub_v1
@@ -41,6 +41,7 @@ from .. import observability
 from ..const import APP_ID_PREFIX
 from ..models import Webhook
 from . import signature_for_payload
+from .clients import get_pubsub_publisher, get_sqs_client
 
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
@@ -128,6 +129,29 @@ def generate_cache_key_for_webhook(
     )
 
 
+def get_webhook_stale_cache_key(cache_key: str) -> str:
+    return f"{cache_key}:stale"
+
+
+def get_webhook_cache_lock_key(cache_key: str) -> str:
+    return f"{cache_key}:lock"
+
+
+def invalidate_webhook_cache(cache_key: str):
+    """Delete the cached webhook response together with its stale copy and lock.
+
+    Removing the lock makes the next call fetch a fresh response instead of waiting
+    for the one requested before the invalidation.
+    """
+    cache.delete_many(
+        [
+            cache_key,
+            get_webhook_stale_cache_key(cache_key),
+            get_webhook_cache_lock_key(cache_key),
+        ]
+    )
+
+
 # TODO (PE-568): change typing of data to `bytes` to avoid unnecessary encoding.
 def send_webhook_using_http(
     target_url,
@@ -210,22 +234,32 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(
-    target_url, message, domain, signature, event_type, **kwargs
-) -> WebhookResponse:
+# Maximum number of messages accepted by a single SQS `SendMessageBatch` call.
+SQS_MAX_BATCH_SIZE = 10
+# Maximum total size of the messages, with their attributes, sent in a single
+# SQS `SendMessageBatch` call.
+SQS_MAX_BATCH_PAYLOAD_SIZE = 256 * 1024
+SQS_BATCH_REQUEST_TOO_LONG_ERROR_CODES = {
+    "AWS.SimpleQueueService.BatchRequestTooLong",
+    "BatchRequestTooLong",
+}
+
+
+@dataclass
+class SQSTarget:
+    region: str
+    access_key_id: str | None
+    secret_access_key: str | None
+    queue_url: str
+    is_fifo: bool
+
+
+def parse_aws_sqs_target_url(target_url) -> SQSTarget:
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=(
-            unquote(parts.password) if parts.password else parts.password
-        ),
-    )
     queue_url = urlunparse(
         (
             "https",
@@ -236,8 +270,18 @@ def send_webhook_using_aws_sqs(
             parts.fragment,
         )
     )
-    is_fifo = parts.path.endswith(".fifo")
+    return SQSTarget(
+        region=region,
+        access_key_id=parts.username,
+        secret_access_key=(
+            unquote(parts.password) if parts.password else parts.password
+        ),
+        queue_url=queue_url,
+        is_fifo=parts.path.endswith(".fifo"),
+    )
+
 
+def get_aws_sqs_message_attributes(domain, signature, event_type) -> dict:
     msg_attributes = {
         "SaleorDomain": {"DataType": "String", "StringValue": domain},
         "SaleorApiUrl": {
@@ -251,17 +295,34 @@ def send_webhook_using_aws_sqs(
             "DataType": "String",
             "StringValue": signature,
         }
+    return msg_attributes
+
+
+def send_webhook_using_aws_sqs(
+    target_url, message, domain, signature, event_type, **kwargs
+) -> WebhookResponse:
+    target = parse_aws_sqs_target_url(target_url)
+    client = get_sqs_client(
+        target.region, target.access_key_id, target.secret_access_key
+    )
 
     message_kwargs = {
-        "QueueUrl": queue_url,
-        "MessageAttributes": msg_attributes,
+        "MessageAttributes": get_aws_sqs_message_attributes(
+            domain, signature, event_type
+        ),
         "MessageBody": message.decode("utf-8"),
     }
-    if is_fifo:
+    if target.is_fifo:
         message_kwargs["MessageGroupId"] = domain
+    return _send_aws_sqs_message(client, target.queue_url, message_kwargs)
+
+
+def _send_aws_sqs_message(client, queue_url, message_kwargs) -> WebhookResponse:
     with catch_duration_time() as duration:
         try:
-            response = json.dumps(client.send_message(**message_kwargs))
+            response = json.dumps(
+                client.send_message(QueueUrl=queue_url, **message_kwargs)
+            )
         except ClientError as e:
             return WebhookResponse(
                 content=str(e), status=EventDeliveryStatus.FAILED, duration=duration()
@@ -269,33 +330,177 @@ def send_webhook_using_aws_sqs(
         return WebhookResponse(content=response, duration=duration())
 
 
+def _get_aws_sqs_entry_size(entry: dict) -> int:
+    size = len(entry["MessageBody"].encode("utf-8"))
+    for name, attribute in entry["MessageAttributes"].items():
+        size += len(name.encode("utf-8"))
+        size += len(attribute["DataType"].encode("utf-8"))
+        size += len(attribute["StringValue"].encode("utf-8"))
+    return size
+
+
+def _chunk_aws_sqs_entries(entries: list[dict]) -> Iterable[list[dict]]:
+    """Split the entries into chunks accepted by a single `SendMessageBatch` call.
+
+    A chunk holds up to `SQS_MAX_BATCH_SIZE` entries whose total size does not
+    exceed `SQS_MAX_BATCH_PAYLOAD_SIZE`. Entries exceeding the limit on their own
+    are sent in a separate chunk, to be rejected by SQS.
+    """
+    chunk: list[dict] = []
+    chunk_size = 0
+    for entry in entries:
+        entry_size = _get_aws_sqs_entry_size(entry)
+        if chunk and (
+            len(chunk) == SQS_MAX_BATCH_SIZE
+            or chunk_size + entry_size > SQS_MAX_BATCH_PAYLOAD_SIZE
+        ):
+            yield chunk
+            chunk, chunk_size = [], 0
+        chunk.append(entry)
+        chunk_size += entry_size
+    if chunk:
+        yield chunk
+
+
+def send_webhooks_using_aws_sqs_batch(
+    target_url, messages: list[tuple[bytes, str]], domain, event_type
+) -> list[WebhookResponse]:
+    """Send messages to the SQS queue using `SendMessageBatch` calls.
+
+    `messages` is a list of (message, signature) tuples. The batches are limited by
+    both the number of messages and their total size. Return a response for every
+    message, in the same order.
+    """
+    target = parse_aws_sqs_target_url(target_url)
+    client = get_sqs_client(
+        target.region, target.access_key_id, target.secret_access_key
+    )
+
+    entries = []
+    for message, signature in messages:
+        entry = {
+            "MessageAttributes": get_aws_sqs_message_attributes(
+                domain, signature, event_type
+            ),
+            "MessageBody": message.decode("utf-8"),
+        }
+        if target.is_fifo:
+            entry["MessageGroupId"] = domain
+        entries.append(entry)
+
+    responses: list[WebhookResponse] = []
+    for chunk in _chunk_aws_sqs_entries(entries):
+        chunk_entries = [
+            {"Id": str(index), **entry} for index, entry in enumerate(chunk)
+        ]
+        with catch_duration_time() as duration:
+            try:
+                batch_response = client.send_message_batch(
+                    QueueUrl=target.queue_url, Entries=chunk_entries
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in (
+                    SQS_BATCH_REQUEST_TOO_LONG_ERROR_CODES
+                ):
+                    # the size estimate was exceeded, send the messages one by one
+                    responses.extend(
+                        _send_aws_sqs_message(client, target.queue_url, entry)
+                        for entry in chunk
+                    )
+                    continue
+                responses.extend(
+                    WebhookResponse(
+                        content=str(e),
+                        status=EventDeliveryStatus.FAILED,
+                        duration=duration(),
+                    )
+                    for _ in chunk
+                )
+                continue
+            chunk_duration = duration()
+
+        results = {
+            result["Id"]: WebhookResponse(
+                content=json.dumps(result), duration=chunk_duration
+            )
+            for result in batch_response.get("Successful", [])
+        }
+        for result in batch_response.get("Failed", []):
+            results[result["Id"]] = WebhookResponse(
+                content=json.dumps(result),
+                status=EventDeliveryStatus.FAILED,
+                duration=chunk_duration,
+            )
+        responses.extend(
+            results.get(
+                str(index),
+                WebhookResponse(
+                    content="Missing response for the message.",
+                    status=EventDeliveryStatus.FAILED,
+                    duration=chunk_duration,
+                ),
+            )
+            for index in range(len(chunk))
+        )
+    return responses
+
+
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type, **kwargs
 ):
+    return send_webhooks_using_google_cloud_pubsub_batch(
+        target_url, [(message, signature)], domain, event_type
+    )[0]
+
+
+def send_webhooks_using_google_cloud_pubsub_batch(
+    target_url, messages: list[tuple[bytes, str]], domain, event_type
+) -> list[WebhookResponse]:
+    """Publish messages to the Pub/Sub topic and wait for all of them.
+
+    All messages are published before waiting for the results, so the publisher
+    groups them into batched requests. `messages` is a list of (message, signature)
+    tuples. Return a response for every message, in the same order.
+    """
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_publisher()
     topic_name = parts.path[1:]  # drop the leading slash
+    api_url = build_absolute_uri(reverse("api"), domain)
+    responses: list[WebhookResponse | None] = [None] * len(messages)
+    futures = []
     with catch_duration_time() as duration:
-        try:
-            future = client.publish(
-                topic_name,
-                message,
-                saleorDomain=domain,
-                saleorApiUrl=build_absolute_uri(reverse("api"), domain),
-                eventType=event_type,
-                signature=signature,
-            )
-            response = future.result(
-                timeout=settings.WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT
-            )
-        except (
-            pubsub_v1.publisher.exceptions.MessageTooLargeError,
-            RuntimeError,
-            TimeoutError,
-        ) as e:
-            return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
-        response_duration = duration()
-        return WebhookResponse(content=response, duration=response_duration)
+        for index, (message, signature) in enumerate(messages):
+            try:
+                future = client.publish(
+                    topic_name,
+                    message,
+                    saleorDomain=domain,
+                    saleorApiUrl=api_url,
+                    eventType=event_type,
+                    signature=signature,
+                )
+            except (
+                pubsub_v1.publisher.exceptions.MessageTooLargeError,
+                RuntimeError,
+            ) as e:
+                responses[index] = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+                continue
+            futures.append((index, future))
+
+        for index, future in futures:
+            try:
+                response = future.result(
+                    timeout=settings.WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT
+                )
+            except (RuntimeError, TimeoutError) as e:
+                responses[index] = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+                continue
+            responses[index] = WebhookResponse(content=response, duration=duration())
+    return [response for response in responses if response is not None]
 
 
 # TODO (PE-568): change typing of data to `bytes` to avoid unnecessary encoding.
@@ -330,6 +535,33 @@ def send_webhook_using_scheme_method(
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
 
+def send_webhook_batch_using_scheme_method(
+    target_url,
+    domain,
+    secret,
+    event_type,
+    data_list: list[bytes],
+) -> list[WebhookResponse]:
+    """Send multiple messages to the same target.
+
+    Queue targets (AWS SQS and Google Cloud Pub/Sub) use their native batch APIs,
+    other targets receive one request per message. Return a response for every
+    message, in the same order.
+    """
+    scheme = urlparse(target_url).scheme.lower()
+    batch_matrix: dict[WebhookSchemes, Callable] = {
+        WebhookSchemes.AWS_SQS: send_webhooks_using_aws_sqs_batch,
+        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: send_webhooks_using_google_cloud_pubsub_batch,
+    }
+    if send_batch_method := batch_matrix.get(scheme):
+        messages = [(data, signature_for_payload(data, secret)) for data in data_list]
+        return send_batch_method(target_url, messages, domain, event_type)
+    return [
+        send_webhook_using_scheme_method(target_url, domain, secret, event_type, data)
+        for data in data_list
+    ]
+
+
 def handle_webhook_retry(
     celery_task: Task,
     webhook: Webhook,
@@ -484,6 +716,24 @@ def create_attempt(
     return attempt
 
 
+def _truncate_value(value: str, limit: int) -> str:
+    if len(value) > limit:
+        return value[:limit] + "..."
+    return value
+
+
+def _serialize_attempt_headers(headers: dict | None) -> str:
+    if headers is None:
+        return json.dumps(headers)
+    limit = settings.EVENT_DELIVERY_ATTEMPT_HEADER_VALUE_SIZE_LIMIT
+    return json.dumps(
+        {
+            key: _truncate_value(value, limit) if isinstance(value, str) else value
+            for key, value in headers.items()
+        }
+    )
+
+
 @allow_writer()
 def attempt_update(
     attempt: "EventDeliveryAttempt",
@@ -492,16 +742,19 @@ def attempt_update(
 ):
     attempt.duration = webhook_response.duration
     if isinstance(webhook_response.content, str):
-        attempt.response = webhook_response.content[
-            : settings.EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT
-        ]
-        if attempt.response != webhook_response.content:
-            attempt.response += "..."
+        attempt.response = _truncate_value(
+            webhook_response.content,
+            settings.EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT,
+        )
     else:
         attempt.response = webhook_response.content
-    attempt.response_headers = json.dumps(webhook_response.response_headers)
+    attempt.response_headers = _serialize_attempt_headers(
+        webhook_response.response_headers
+    )
     attempt.response_status_code = webhook_response.response_status_code
-    attempt.request_headers = json.dumps(webhook_response.request_headers)
+    attempt.request_headers = _serialize_attempt_headers(
+        webhook_response.request_headers
+    )
     attempt.status = webhook_response.status
 
     if attempt.id and with_save: